@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+"""
+Import-time benchmark for the orchestrator CLI
+
+Runs `python -X importtime` in fresh interpreters and reports how long the
+CLI spends importing modules at startup, compared with importing every
+scraper up front (what the orchestrator did before the lazy registry).
+
+Usage:
+    python scripts/benchmark_import_time.py [--runs 5] [--top 10]
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+
+SCENARIOS = [
+    ('--help / startup', 'import src.orchestrator'),
+    ('--sources knco', 'import src.orchestrator; src.orchestrator.EventOrchestrator.AVAILABLE_SOURCES["knco"]'),
+    ('--sources county', 'import src.orchestrator; src.orchestrator.EventOrchestrator.AVAILABLE_SOURCES["county"]'),
+    ('all scrapers (eager)', 'import src.orchestrator, src.scrapers.knco, src.scrapers.library, src.scrapers.county'),
+]
+
+# import time: self [us] | cumulative | imported package
+LINE_RE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$')
+
+
+def import_times(code: str) -> List[Tuple[str, int, int]]:
+    """Run code under -X importtime; return (module, depth, cumulative us) rows"""
+    result = subprocess.run(
+        [sys.executable, '-X', 'importtime', '-c', code],
+        cwd=REPO_ROOT, capture_output=True, text=True, check=True
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        match = LINE_RE.match(line)
+        if match:
+            rows.append((match.group(4), len(match.group(3)) // 2, int(match.group(2))))
+    return rows
+
+
+def startup_modules() -> set:
+    """Modules every interpreter imports before running any code"""
+    return {name for name, depth, _ in import_times('pass') if depth == 0}
+
+
+def measure(code: str, baseline: set) -> float:
+    """Total milliseconds spent importing modules for code"""
+    return sum(
+        cumulative for name, depth, cumulative in import_times(code)
+        if depth == 0 and name not in baseline
+    ) / 1000
+
+
+def direct_imports(code: str) -> Dict[str, int]:
+    """Cumulative microseconds of each module imported directly by code's imports"""
+    return {name: cumulative for name, depth, cumulative in import_times(code) if depth == 1}
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark orchestrator import time')
+    parser.add_argument('--runs', type=int, default=5, help='Interpreter runs per scenario (median is reported)')
+    parser.add_argument('--top', type=int, default=10, help='Slowest top-level imports to show for the first scenario')
+    args = parser.parse_args()
+
+    baseline = startup_modules()
+
+    print(f"{'Scenario':<24} {'median ms':>10} {'min ms':>8}")
+    print('-' * 44)
+    for label, code in SCENARIOS:
+        runs = [measure(code, baseline) for _ in range(args.runs)]
+        print(f"{label:<24} {statistics.median(runs):>10.1f} {min(runs):>8.1f}")
+
+    label, code = SCENARIOS[0]
+    print(f"\nSlowest imports at startup ({label}):")
+    for name, cumulative in sorted(direct_imports(code).items(), key=lambda item: item[1], reverse=True)[:args.top]:
+        print(f"  {cumulative / 1000:8.1f} ms  {name}")
+
+
+if __name__ == '__main__':
+    main()
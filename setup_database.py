@@ -52,10 +52,39 @@ CREATE TABLE IF NOT EXISTS events (
 
 -- Critical indexes for performance
 CREATE UNIQUE INDEX IF NOT EXISTS idx_source_event_unique ON events(source_name, source_event_id);
-CREATE INDEX IF NOT EXISTS idx_events_date ON events(event_date);
-CREATE INDEX IF NOT EXISTS idx_events_source ON events(source_name);
+-- Date order with the id tiebreak of paged reads (keyset on (event_date, id)); replaces idx_events_date
+CREATE INDEX IF NOT EXISTS idx_events_date_id ON events(event_date, id);
+DROP INDEX IF EXISTS idx_events_date;
+-- Per-source reads in date order (and date windows); replaces idx_events_source
+CREATE INDEX IF NOT EXISTS idx_events_source_date ON events(source_name, event_date);
+DROP INDEX IF EXISTS idx_events_source;
+-- Filters pushed down by EventQuery (src/storage/query.py)
+CREATE INDEX IF NOT EXISTS idx_events_source_quality ON events(source_name, quality_score);
+CREATE INDEX IF NOT EXISTS idx_events_free ON events(source_name, event_date) WHERE is_free;
+CREATE INDEX IF NOT EXISTS idx_events_city_area ON events(city_area, event_date);
 CREATE INDEX IF NOT EXISTS idx_events_content_hash ON events(content_hash);
 CREATE INDEX IF NOT EXISTS idx_events_scraped_at ON events(scraped_at);
+
+-- Per-source outcome of every orchestrator run (see `python -m src.orchestrator report`)
+CREATE TABLE IF NOT EXISTS scrape_runs (
+  id BIGSERIAL PRIMARY KEY,
+  run_id TEXT NOT NULL,
+  started_at TIMESTAMP WITH TIME ZONE NOT NULL,
+  source_name TEXT NOT NULL,
+  status TEXT NOT NULL,
+  duration_seconds DOUBLE PRECISION,
+  event_count INTEGER NOT NULL DEFAULT 0,
+  cache_hit BOOLEAN NOT NULL DEFAULT FALSE
+);
+
+CREATE INDEX IF NOT EXISTS idx_scrape_runs_started_at ON scrape_runs(started_at);
+CREATE INDEX IF NOT EXISTS idx_scrape_runs_source_started ON scrape_runs(source_name, started_at);
+
+-- County iCal events were keyed by their UID (12345@nevadacountyca.gov) before
+-- they were keyed by EID like the list view; drop those rows, the next scrape
+-- stores them again under their EID
+DELETE FROM events
+WHERE source_name = 'county' AND source_event_id LIKE '%@%' AND lower(source_url) LIKE '%eid=%';
 """
 
 def main():
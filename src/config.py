@@ -6,6 +6,18 @@ from dotenv import load_dotenv
 # Load environment variables
 load_dotenv()
 
+
+def parse_source_map(raw: str, cast=str, sep: str = ',') -> dict:
+    """Parse a per-source setting like 'knco=300,library=900' into a dict"""
+    mapping = {}
+    for item in (raw or '').split(sep):
+        if '=' not in item:
+            continue
+        name, value = item.split('=', 1)
+        mapping[name.strip()] = cast(value.strip())
+    return mapping
+
+
 class Config:
     """Application configuration"""
 
@@ -13,13 +25,94 @@ class Config:
     SUPABASE_URL = os.getenv("SUPABASE_URL")
     SUPABASE_KEY = os.getenv("SUPABASE_KEY")
     SUPABASE_DB_PASSWORD = os.getenv("SUPABASE_DB_PASSWORD")
+    SUPABASE_POOL_SIZE = int(os.getenv("SUPABASE_POOL_SIZE", "12"))  # Max connections shared by threads (daemon workers, warmer, control socket)
 
     # Cache settings
     CACHE_TTL_HOURS = int(os.getenv("CACHE_TTL_HOURS", "6"))
+    CACHE_STALE_WHILE_REVALIDATE = os.getenv("CACHE_STALE_WHILE_REVALIDATE", "false").lower() == "true"
+    CACHE_MAX_STALE_HOURS = int(os.getenv("CACHE_MAX_STALE_HOURS", "24"))  # Hard expiry: never serve data older than this
+    CACHE_REFRESH_WORKERS = int(os.getenv("CACHE_REFRESH_WORKERS", "2"))  # Background refresh threads
+    CACHE_REFRESH_AHEAD_RATIO = float(os.getenv("CACHE_REFRESH_AHEAD_RATIO", "0.8"))  # Re-scrape once this much of the TTL has elapsed
+    CACHE_REFRESH_JITTER = float(os.getenv("CACHE_REFRESH_JITTER", "0.05"))  # +/- fraction of TTL added to each refresh time
+    CACHE_WARMER_POLL_SECONDS = int(os.getenv("CACHE_WARMER_POLL_SECONDS", "60"))
+    SOURCE_LOCK_TIMEOUT = int(os.getenv("SOURCE_LOCK_TIMEOUT", "120"))  # Max seconds to wait for another process scraping the same source
+
+    # Adaptive per-source TTL learned from how often each source's content changes
+    ADAPTIVE_TTL = os.getenv("ADAPTIVE_TTL", "false").lower() == "true"
+    ADAPTIVE_TTL_MIN_HOURS = float(os.getenv("ADAPTIVE_TTL_MIN_HOURS", "1"))
+    ADAPTIVE_TTL_MAX_HOURS = float(os.getenv("ADAPTIVE_TTL_MAX_HOURS", "48"))
+    ADAPTIVE_TTL_TARGET_CHANGE = float(os.getenv("ADAPTIVE_TTL_TARGET_CHANGE", "0.1"))  # Fraction of events allowed to change before re-scraping
+
+    # In-process (memory) cache tier in front of the database
+    MEMORY_CACHE_ENABLED = os.getenv("MEMORY_CACHE_ENABLED", "true").lower() == "true"
+    MEMORY_CACHE_TTL_SECONDS = int(os.getenv("MEMORY_CACHE_TTL_SECONDS", "300"))
+    MEMORY_CACHE_SOURCE_TTLS = parse_source_map(os.getenv("MEMORY_CACHE_SOURCE_TTLS", ""), int)  # e.g. "knco=120,library=900"
+    MEMORY_CACHE_MAX_EVENTS = int(os.getenv("MEMORY_CACHE_MAX_EVENTS", "5000"))  # LRU bound across all sources
+
+    # Storage settings
+    STORAGE_BACKEND = os.getenv("STORAGE_BACKEND", "supabase")  # "supabase" or "sqlite"
+    SQLITE_PATH = os.getenv("SQLITE_PATH", str(Path(__file__).parent.parent / "data" / "events.db"))
+    SQLITE_WAL = os.getenv("SQLITE_WAL", "true").lower() == "true"
+    SQLITE_BATCH_SIZE = int(os.getenv("SQLITE_BATCH_SIZE", "500"))  # Rows per executemany batch
+    STREAM_BATCH_SIZE = int(os.getenv("STREAM_BATCH_SIZE", "500"))  # Rows per server-side cursor round trip
+    PAGE_SIZE = int(os.getenv("PAGE_SIZE", "50"))  # Events per page of get_events_page
+    PAGE_SIZE_MAX = int(os.getenv("PAGE_SIZE_MAX", "500"))  # Larger requested pages are capped to this
+    RUN_HISTORY = os.getenv("RUN_HISTORY", "true").lower() == "true"  # Record each run's per-source outcome in scrape_runs
+    RUN_REPORT_DAYS = int(os.getenv("RUN_REPORT_DAYS", "7"))  # Default window of the `report` command
+    TIMEZONE = os.getenv("TIMEZONE", "America/Los_Angeles")  # Local time of event dates and date windows (IANA name)
 
     # Scraper settings
     REQUEST_TIMEOUT = int(os.getenv("REQUEST_TIMEOUT", "30"))
-    SCRAPER_TIMEOUT = int(os.getenv("SCRAPER_TIMEOUT", "30"))  # Per-source timeout for parallel execution
+    SCRAPER_TIMEOUT = int(os.getenv("SCRAPER_TIMEOUT", "30"))  # Per-source deadline; overrunning scrapers are cancelled
+    RUN_TIMEOUT = int(os.getenv("RUN_TIMEOUT", "120"))  # Deadline for a whole fetch run (0 for none)
+
+    # Per-source timeouts tuned from latency history (SCRAPER_TIMEOUT/REQUEST_TIMEOUT until there is enough)
+    AUTO_TIMEOUTS = os.getenv("AUTO_TIMEOUTS", "false").lower() == "true"
+    AUTO_TIMEOUT_PERCENTILE = float(os.getenv("AUTO_TIMEOUT_PERCENTILE", "99"))  # Latency percentile a timeout must cover
+    AUTO_TIMEOUT_MARGIN = float(os.getenv("AUTO_TIMEOUT_MARGIN", "1.5"))  # Timeout = percentile x margin
+    AUTO_TIMEOUT_MIN_SAMPLES = int(os.getenv("AUTO_TIMEOUT_MIN_SAMPLES", "5"))
+    SCRAPER_TIMEOUT_MIN = float(os.getenv("SCRAPER_TIMEOUT_MIN", "10"))
+    SCRAPER_TIMEOUT_MAX = float(os.getenv("SCRAPER_TIMEOUT_MAX", "300"))
+    REQUEST_TIMEOUT_MIN = float(os.getenv("REQUEST_TIMEOUT_MIN", "5"))
+    REQUEST_TIMEOUT_MAX = float(os.getenv("REQUEST_TIMEOUT_MAX", "60"))
+    LATENCY_REGRESSION_RATIO = float(os.getenv("LATENCY_REGRESSION_RATIO", "1.5"))  # Recent p95 / historical p95 flagged as a regression
+    TRUMBA_CALENDARS = parse_source_map(os.getenv("TRUMBA_CALENDARS", ""))  # Sub-source=calendar ID for the 'trumba' source, e.g. "arts=NevadaCountyArts"
+    CIVICENGAGE_CALENDARS = parse_source_map(os.getenv("CIVICENGAGE_CALENDARS", ""))  # Sub-source=category ID for the 'civicengage' source, e.g. "parks=32,fair=44"
+    CALENDAR_HORIZON_MONTHS = int(os.getenv("CALENDAR_HORIZON_MONTHS", "3"))  # Months of list views read when a calendar feed fails
+    CALENDAR_SOURCE_HORIZONS = parse_source_map(os.getenv("CALENDAR_SOURCE_HORIZONS", ""), int)  # Per-source overrides, e.g. "library=6"
+    CIVICENGAGE_BROWSER_FALLBACK = os.getenv("CIVICENGAGE_BROWSER_FALLBACK", "false").lower() == "true"  # Render calendars whose iCal feed fails
+    SCRAPER_PLUGINS = parse_source_map(os.getenv("SCRAPER_PLUGINS", ""))  # Extra sources, e.g. "market=my_pkg.scraper:MarketScraper"
+
+    # Politeness: shared limits on scraper concurrency and requests per host
+    SCRAPER_MAX_WORKERS = int(os.getenv("SCRAPER_MAX_WORKERS", "8"))  # Sources scraped at once, and HTTP requests in flight overall
+    HOST_MAX_CONNECTIONS = int(os.getenv("HOST_MAX_CONNECTIONS", "2"))  # HTTP requests in flight per host
+    HOST_QPS = float(os.getenv("HOST_QPS", "1"))  # Requests started per second per host (0 for unlimited)
+    HOST_BURST = int(os.getenv("HOST_BURST", "2"))  # Requests a host may start back to back after idling
+    HOST_QPS_LIMITS = parse_source_map(os.getenv("HOST_QPS_LIMITS", ""), float)  # Per-host overrides, e.g. "trumba.com=5"
+
+    # Resilience: retries, hedged requests and circuit breakers per source
+    RETRY_ATTEMPTS = int(os.getenv("RETRY_ATTEMPTS", "3"))  # Tries per request, including the first
+    RETRY_BASE_DELAY = float(os.getenv("RETRY_BASE_DELAY", "0.5"))  # Backoff before the first retry (doubles, with jitter)
+    RETRY_MAX_DELAY = float(os.getenv("RETRY_MAX_DELAY", "8"))
+    HEDGE_REQUESTS = os.getenv("HEDGE_REQUESTS", "false").lower() == "true"  # Send a second request once one outlasts the source's p95
+    CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("CIRCUIT_FAILURE_THRESHOLD", "3"))  # Consecutive failures that open a source's circuit
+    CIRCUIT_RESET_SECONDS = int(os.getenv("CIRCUIT_RESET_SECONDS", "300"))  # How long an open circuit serves the last good payload
+
+    # Pipelined execution (fetch -> parse -> normalize -> dedupe -> store)
+    PIPELINE_ENABLED = os.getenv("PIPELINE_ENABLED", "false").lower() == "true"
+    PIPELINE_QUEUE_SIZE = int(os.getenv("PIPELINE_QUEUE_SIZE", "2"))  # Sources buffered between stages before backpressure
+    PIPELINE_CPU_WORKERS = int(os.getenv("PIPELINE_CPU_WORKERS", str(min(4, os.cpu_count() or 1))))  # Parse/normalize workers
+    PIPELINE_CPU_EXECUTOR = os.getenv("PIPELINE_CPU_EXECUTOR", "process")  # "process" or "thread" for parse/normalize
+    PIPELINE_STORE_WORKERS = int(os.getenv("PIPELINE_STORE_WORKERS", "2"))
+
+    # Daemon mode
+    DAEMON_SCHEDULES = parse_source_map(os.getenv("DAEMON_SCHEDULES", ""), sep=';')  # e.g. "knco=30m;library=0 */6 * * *"
+    DAEMON_JITTER_SECONDS = int(os.getenv("DAEMON_JITTER_SECONDS", "60"))  # Random delay added to each scheduled refresh
+    DAEMON_SOCKET = os.getenv("DAEMON_SOCKET", str(Path(__file__).parent.parent / "data" / "daemon.sock"))
+
+    # Instrumentation
+    METRICS_DIR = os.getenv("METRICS_DIR")  # Write run metrics (JSON + Prometheus textfile) here when set
+    PROFILE_TOP_N = int(os.getenv("PROFILE_TOP_N", "20"))  # Hotspots and allocation sites logged by --profile/--trace-memory
 
     # Quality settings
     MIN_QUALITY_SCORE = int(os.getenv("MIN_QUALITY_SCORE", "0"))  # Minimum quality score to include events (0-100)
@@ -28,3 +121,5 @@ class Config:
     BASE_DIR = Path(__file__).parent.parent
     DATA_DIR = BASE_DIR / "data"
     SAMPLES_DIR = DATA_DIR / "samples"
+    STATE_DIR = Path(os.getenv("STATE_DIR", str(DATA_DIR / "state")))  # Run-to-run history files
+    PROFILE_DIR = Path(os.getenv("PROFILE_DIR", str(DATA_DIR / "profiles")))  # --profile / --trace-memory artifacts
@@ -0,0 +1,446 @@
+"""Long-running daemon that refreshes each source on its own schedule"""
+import os
+import uuid
+import json
+import time
+import random
+import signal
+import socket
+import logging
+import threading
+import socketserver
+from datetime import datetime, timezone
+from functools import partial
+from typing import List, Dict, Any, Optional
+
+from .config import Config
+from .scheduling.deadline import Deadline, DeadlineScheduler
+from .scheduling.schedule import IntervalSchedule, parse_schedule
+from .scheduling.timeouts import timeouts as timeout_tuner
+from .scrapers.base import ScraperCancelled
+from .storage.base import ScrapeRun
+
+logger = logging.getLogger(__name__)
+
+
+class EventDaemon:
+    """
+    Keep sources fresh from one long-lived process.
+
+    The orchestrator's database connection, each source's scraper (with
+    its HTTP session or browser) and the imports are created once and
+    reused for every refresh. Each source is refreshed on its own
+    interval or cron schedule, delayed by a random jitter so sources do
+    not all fire at once. SIGTERM and SIGINT stop the daemon after the
+    refreshes in progress finish or hit their deadline. A Unix control
+    socket accepts 'refresh [source ...]', 'status' and 'stop' commands.
+    """
+
+    COMMANDS = ('refresh', 'status', 'stop')
+
+    # Loop wake-up interval when nothing is scheduled
+    IDLE_POLL_SECONDS = 60
+
+    def __init__(
+        self,
+        orchestrator,
+        sources: Optional[List[str]] = None,
+        schedules: Optional[Dict[str, str]] = None,
+        jitter_seconds: Optional[float] = None,
+        socket_path: Optional[str] = None,
+        timeout: Optional[int] = None
+    ):
+        """
+        Initialize daemon.
+
+        Args:
+            orchestrator: EventOrchestrator providing the store, cache and scrapers
+            sources: Sources to keep fresh (default: all available sources)
+            schedules: Schedule spec per source, e.g. {'knco': '30m',
+                'library': '0 */6 * * *'} (default: Config.DAEMON_SCHEDULES;
+                unlisted sources refresh every Config.CACHE_TTL_HOURS)
+            jitter_seconds: Maximum random delay added to each scheduled run
+                (default: Config.DAEMON_JITTER_SECONDS)
+            socket_path: Control socket path, '' to disable (default: Config.DAEMON_SOCKET)
+            timeout: Per-refresh deadline in seconds (default: each source's
+                scrape timeout, see TimeoutTuner)
+        """
+        self.orchestrator = orchestrator
+        self.sources = list(sources or orchestrator.AVAILABLE_SOURCES)
+
+        unknown = [s for s in self.sources if s not in orchestrator.AVAILABLE_SOURCES]
+        if unknown:
+            raise ValueError(f"Unknown source: {', '.join(unknown)}")
+
+        schedules = Config.DAEMON_SCHEDULES if schedules is None else schedules
+        default_schedule = IntervalSchedule(Config.CACHE_TTL_HOURS * 3600)
+        self.schedules = {
+            source: parse_schedule(schedules[source]) if source in schedules else default_schedule
+            for source in self.sources
+        }
+
+        self.jitter_seconds = Config.DAEMON_JITTER_SECONDS if jitter_seconds is None else jitter_seconds
+        self.socket_path = Config.DAEMON_SOCKET if socket_path is None else socket_path
+        self.timeout = timeout
+
+        # source -> epoch seconds of the next scheduled refresh
+        self._next_run: Dict[str, float] = {}
+        self._status: Dict[str, Dict[str, Any]] = {source: {} for source in self.sources}
+        self._scrapers: Dict[str, Any] = {}
+        self._running = set()
+        # Sources asked for an on-demand refresh since their run started
+        self._requested = set()
+        self._lock = threading.Lock()
+
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._server: Optional[socketserver.BaseServer] = None
+        self._started_at = time.time()
+
+    def load_schedule(self, now: Optional[float] = None):
+        """Schedule each source's first refresh from its last scrape in the store"""
+        now = time.time() if now is None else now
+        last_scraped = self.orchestrator.db.get_last_scraped(self.sources)
+
+        with self._lock:
+            for source in self.sources:
+                scraped_at = last_scraped.get(source)
+                if scraped_at is None:
+                    self._next_run[source] = now
+                else:
+                    due = self.schedules[source].next_after(scraped_at.timestamp())
+                    self._next_run[source] = max(now, due + self._jitter())
+            logger.info(
+                "Daemon schedule: " + ', '.join(
+                    f"{s} ({self.schedules[s]}, next {self._format_time(self._next_run[s])})"
+                    for s in self.sources
+                )
+            )
+
+    def due_sources(self, now: Optional[float] = None) -> List[str]:
+        """Get sources due for refresh, most overdue first, skipping ones in progress"""
+        now = time.time() if now is None else now
+        with self._lock:
+            due = [
+                source for source in self.sources
+                if self._next_run.get(source, 0.0) <= now and source not in self._running
+            ]
+        return sorted(due, key=lambda source: self._next_run.get(source, 0.0))
+
+    def request_refresh(self, sources: Optional[List[str]] = None) -> List[str]:
+        """
+        Make sources due immediately and wake the scheduling loop.
+
+        Returns:
+            Sources queued for refresh
+        """
+        sources = list(sources or self.sources)
+        unknown = [s for s in sources if s not in self.schedules]
+        if unknown:
+            raise ValueError(f"Unknown source: {', '.join(unknown)}")
+
+        with self._lock:
+            for source in sources:
+                self._next_run[source] = 0.0
+            self._requested.update(sources)
+        self._wakeup.set()
+        return sources
+
+    def run_once(self, now: Optional[float] = None) -> List[str]:
+        """
+        Refresh every due source in parallel, each under its deadline.
+
+        Returns:
+            Sources that were refreshed (successfully or not)
+        """
+        due = self.due_sources(now)
+        if not due:
+            return []
+
+        with self._lock:
+            self._running.update(due)
+            self._requested.difference_update(due)
+
+        started_at = datetime.now(timezone.utc)
+        timeouts = timeout_tuner.scrape_timeouts(due, self.timeout)
+        try:
+            outcome = DeadlineScheduler(max_workers=Config.SCRAPER_MAX_WORKERS).run(
+                {source: self._refresh_task(source) for source in due},
+                timeouts=timeouts,
+                on_timeout=self._cancel
+            )
+            cancelled = [s for s, e in outcome.errors.items() if isinstance(e, ScraperCancelled)]
+            for source in outcome.timed_out + cancelled:
+                logger.warning(f"Scheduled refresh of {source} timed out and was cancelled")
+                self._set_status(source, error='timed out')
+
+            run = partial(ScrapeRun, uuid.uuid4().hex, started_at)
+            runs = []
+            for source in due:
+                if source in outcome.results:
+                    duration = self._status[source].get('last_duration')
+                    runs.append(run(source, 'success', duration, outcome.results[source], False))
+                elif source in outcome.timed_out or source in cancelled:
+                    runs.append(run(source, 'timed_out', timeouts[source], 0, False))
+                else:
+                    runs.append(run(source, 'failed', None, 0, False))
+            self.orchestrator.record_runs(runs)
+        finally:
+            timeout_tuner.flush()
+            finished = time.time()
+            with self._lock:
+                self._running.difference_update(due)
+                for source in due:
+                    if source in self._requested:
+                        # Refresh requested while this run was in progress
+                        continue
+                    self._next_run[source] = self.schedules[source].next_after(finished) + self._jitter()
+
+        return due
+
+    def status(self) -> Dict[str, Any]:
+        """Get the schedule and last refresh result of every source"""
+        with self._lock:
+            sources = {
+                source: {
+                    'schedule': str(self.schedules[source]),
+                    'next_run': self._format_time(self._next_run.get(source)),
+                    'running': source in self._running,
+                    **self._status[source],
+                }
+                for source in self.sources
+            }
+        return {'uptime_seconds': round(time.time() - self._started_at), 'sources': sources}
+
+    def handle_command(self, command: str) -> Dict[str, Any]:
+        """
+        Run a control command.
+
+        Args:
+            command: 'refresh [source ...]', 'status' or 'stop'
+
+        Returns:
+            JSON-serializable reply with an 'ok' flag
+        """
+        words = command.split()
+        if not words or words[0] not in self.COMMANDS:
+            return {'ok': False, 'error': f"Unknown command (expected one of: {', '.join(self.COMMANDS)})"}
+
+        name, args = words[0], words[1:]
+        try:
+            if name == 'refresh':
+                return {'ok': True, 'queued': self.request_refresh(args or None)}
+            if name == 'status':
+                return {'ok': True, **self.status()}
+            self.stop()
+            return {'ok': True, 'stopping': True}
+        except ValueError as e:
+            return {'ok': False, 'error': str(e)}
+
+    def start_control_server(self) -> bool:
+        """
+        Listen for control commands on the Unix socket.
+
+        Returns:
+            Whether the control socket is listening
+        """
+        if not self.socket_path:
+            return False
+        if not hasattr(socket, 'AF_UNIX'):
+            logger.warning("Control socket unavailable: Unix sockets are not supported on this platform")
+            return False
+
+        self._remove_stale_socket()
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self):
+                line = self.rfile.readline().decode('utf-8', errors='replace')
+                reply = daemon.handle_command(line)
+                self.wfile.write(json.dumps(reply).encode('utf-8') + b'\n')
+
+        self._server = _ControlServer(self.socket_path, Handler)
+        threading.Thread(
+            target=self._server.serve_forever, name='daemon-control', daemon=True
+        ).start()
+        logger.info(f"Control socket listening on {self.socket_path}")
+        return True
+
+    def run_forever(self):
+        """Run the scheduling loop until stopped by a signal or 'stop' command"""
+        previous_handlers = self._install_signal_handlers()
+        try:
+            self.load_schedule()
+            self.start_control_server()
+            logger.info(f"Daemon started for: {', '.join(self.sources)}")
+
+            while not self._stop.is_set():
+                self._wakeup.clear()
+                try:
+                    self.run_once()
+                except Exception as e:
+                    logger.error(f"Daemon loop error: {e}")
+                self._wakeup.wait(self._seconds_until_next())
+        finally:
+            self._shutdown()
+            for signum, handler in previous_handlers.items():
+                signal.signal(signum, handler)
+            logger.info("Daemon stopped")
+
+    def stop(self):
+        """Ask the scheduling loop to exit"""
+        self._stop.set()
+        self._wakeup.set()
+
+    def _refresh_task(self, source: str):
+        """Build the DeadlineScheduler task that refreshes one source"""
+        def run(deadline: Deadline):
+            return self._refresh(source, deadline)
+        return run
+
+    def _refresh(self, source: str, deadline: Deadline) -> int:
+        """Scrape and store a source with its warm scraper"""
+        start = time.time()
+        scraper = self._scraper(source)
+        if hasattr(scraper, 'deadline'):
+            scraper.deadline = deadline
+
+        try:
+            events = self.orchestrator.cache.refresh(
+                source, self.orchestrator._timed_fetch(source, scraper), Config.CACHE_TTL_HOURS
+            )
+        except ScraperCancelled:
+            # A cancelled scraper may have torn down its resources
+            self._discard_scraper(source)
+            raise
+        except Exception as e:
+            logger.error(f"Scheduled refresh of {source} failed: {e}")
+            self._set_status(source, last_run=self._format_time(start), error=str(e))
+            raise
+
+        duration = time.time() - start
+        logger.info(f"Scheduled refresh of {source}: {len(events)} events in {duration:.1f}s")
+        self._set_status(
+            source,
+            last_run=self._format_time(start),
+            last_duration=round(duration, 2),
+            last_events=len(events),
+            error=None
+        )
+        return len(events)
+
+    def _scraper(self, source: str):
+        """Get the source's long-lived scraper, creating it on first use"""
+        with self._lock:
+            scraper = self._scrapers.get(source)
+            if scraper is None:
+                scraper = self._scrapers[source] = self.orchestrator._create_scraper(source)
+            return scraper
+
+    def _cancel(self, source: str):
+        """Cancel an overrunning refresh and drop its scraper"""
+        self.orchestrator._cancel_scraper(self._discard_scraper(source))
+
+    def _discard_scraper(self, source: str):
+        """Forget a source's scraper so the next refresh creates a new one"""
+        with self._lock:
+            return self._scrapers.pop(source, None)
+
+    def _set_status(self, source: str, **fields):
+        """Record the outcome of a source's latest refresh"""
+        with self._lock:
+            self._status[source].update(fields)
+
+    def _jitter(self) -> float:
+        """Random delay added to a scheduled run"""
+        return random.uniform(0, self.jitter_seconds) if self.jitter_seconds > 0 else 0.0
+
+    def _seconds_until_next(self) -> float:
+        """Seconds until the earliest scheduled refresh"""
+        with self._lock:
+            pending = [t for s, t in self._next_run.items() if s not in self._running]
+        if not pending:
+            return self.IDLE_POLL_SECONDS
+        return max(0.0, min(pending) - time.time())
+
+    def _install_signal_handlers(self) -> Dict[int, Any]:
+        """Stop gracefully on SIGTERM/SIGINT (only possible from the main thread)"""
+        if threading.current_thread() is not threading.main_thread():
+            return {}
+
+        def handle(signum, frame):
+            logger.info(f"Received {signal.Signals(signum).name}, shutting down")
+            self.stop()
+
+        previous = {}
+        for signum in (signal.SIGTERM, signal.SIGINT):
+            previous[signum] = signal.signal(signum, handle)
+        return previous
+
+    def _remove_stale_socket(self):
+        """Remove a socket file left by a daemon that is no longer running"""
+        if not os.path.exists(self.socket_path):
+            return
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(self.socket_path)
+        except OSError:
+            os.unlink(self.socket_path)
+        else:
+            raise RuntimeError(f"Another daemon is already listening on {self.socket_path}")
+        finally:
+            probe.close()
+
+    def _shutdown(self):
+        """Close the control socket and release every scraper's resources"""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._server = None
+            try:
+                os.unlink(self.socket_path)
+            except OSError:
+                pass
+
+        with self._lock:
+            scrapers, self._scrapers = list(self._scrapers.values()), {}
+        for scraper in scrapers:
+            close = getattr(scraper, 'close', None)
+            if close is not None:
+                try:
+                    close()
+                except Exception as e:
+                    logger.debug(f"Error closing scraper: {e}")
+
+    @staticmethod
+    def _format_time(timestamp: Optional[float]) -> Optional[str]:
+        """Format an epoch timestamp for status output"""
+        if timestamp is None:
+            return None
+        return datetime.fromtimestamp(timestamp).isoformat(timespec='seconds')
+
+
+if hasattr(socketserver, 'UnixStreamServer'):
+    class _ControlServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+        """Threaded Unix socket server for daemon control commands"""
+        daemon_threads = True
+
+
+def send_command(command: str, socket_path: Optional[str] = None, timeout: float = 10) -> Dict[str, Any]:
+    """
+    Send a control command to a running daemon.
+
+    Args:
+        command: 'refresh [source ...]', 'status' or 'stop'
+        socket_path: Control socket path (default: Config.DAEMON_SOCKET)
+        timeout: Seconds to wait for the reply
+
+    Returns:
+        The daemon's reply
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+        client.settimeout(timeout)
+        client.connect(socket_path or Config.DAEMON_SOCKET)
+        client.sendall(command.strip().encode('utf-8') + b'\n')
+        reply = client.makefile('rb').readline()
+    return json.loads(reply)
@@ -0,0 +1,196 @@
+"""Timing spans and counters for scraper runs"""
+import os
+import re
+import json
+import time
+import logging
+import tempfile
+import threading
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Any, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+# Returned by span() when disabled, so a disabled span costs one attribute check
+_NOOP_SPAN = nullcontext()
+
+LabelKey = Tuple[str, Tuple[Tuple[str, str], ...]]
+
+
+class Instrumentation:
+    """
+    Collect per-stage timing spans and counters for a run.
+
+    Spans aggregate count, total and maximum seconds per name and label
+    set; counters aggregate a running total. While disabled, span() and
+    count() return immediately, so instrumented code pays almost nothing.
+    """
+
+    # Prefix for Prometheus metric names
+    NAMESPACE = 'events'
+
+    def __init__(self, enabled: bool = False):
+        self.enabled = enabled
+        self._spans: Dict[LabelKey, list] = {}
+        self._counters: Dict[LabelKey, float] = {}
+        self._lock = threading.Lock()
+        self._started_at = datetime.now()
+
+    def enable(self):
+        """Start recording"""
+        self.enabled = True
+
+    def disable(self):
+        """Stop recording (collected data is kept)"""
+        self.enabled = False
+
+    def reset(self):
+        """Discard everything recorded so far"""
+        with self._lock:
+            self._spans.clear()
+            self._counters.clear()
+            self._started_at = datetime.now()
+
+    def span(self, name: str, **labels):
+        """
+        Time a block of code.
+
+        Usage:
+            with metrics.span('normalize', source='knco'):
+                ...
+        """
+        if not self.enabled:
+            return _NOOP_SPAN
+        return self._timed(name, labels)
+
+    def observe(self, name: str, seconds: float, **labels):
+        """Record a duration measured elsewhere as a span"""
+        if not self.enabled:
+            return
+        key = self._key(name, labels)
+        with self._lock:
+            entry = self._spans.setdefault(key, [0, 0.0, 0.0])
+            entry[0] += 1
+            entry[1] += seconds
+            entry[2] = max(entry[2], seconds)
+
+    def count(self, name: str, value: float = 1, **labels):
+        """Add value to a counter"""
+        if not self.enabled:
+            return
+        key = self._key(name, labels)
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Get everything recorded as a JSON-serializable dictionary"""
+        with self._lock:
+            spans = [
+                {
+                    'name': name,
+                    'labels': dict(labels),
+                    'count': count,
+                    'total_seconds': round(total, 6),
+                    'max_seconds': round(peak, 6),
+                }
+                for (name, labels), (count, total, peak) in sorted(self._spans.items())
+            ]
+            counters = [
+                {'name': name, 'labels': dict(labels), 'value': value}
+                for (name, labels), value in sorted(self._counters.items())
+            ]
+        return {'started_at': self._started_at.isoformat(), 'spans': spans, 'counters': counters}
+
+    def to_prometheus(self) -> str:
+        """Render spans and counters in the Prometheus text exposition format"""
+        snapshot = self.snapshot()
+        lines = []
+
+        by_name: Dict[str, list] = {}
+        for span in snapshot['spans']:
+            by_name.setdefault(span['name'], []).append(span)
+        for name, spans in by_name.items():
+            metric = self._metric_name(name) + '_seconds'
+            lines.append(f"# HELP {metric} Time spent in {name}")
+            lines.append(f"# TYPE {metric} summary")
+            for span in spans:
+                labels = self._format_labels(span['labels'])
+                lines.append(f"{metric}_sum{labels} {span['total_seconds']}")
+                lines.append(f"{metric}_count{labels} {span['count']}")
+            lines.append(f"# TYPE {metric}_max gauge")
+            for span in spans:
+                lines.append(f"{metric}_max{self._format_labels(span['labels'])} {span['max_seconds']}")
+
+        by_name = {}
+        for counter in snapshot['counters']:
+            by_name.setdefault(counter['name'], []).append(counter)
+        for name, counters in by_name.items():
+            metric = self._metric_name(name) + '_total'
+            lines.append(f"# TYPE {metric} counter")
+            for counter in counters:
+                lines.append(f"{metric}{self._format_labels(counter['labels'])} {counter['value']}")
+
+        return '\n'.join(lines) + '\n'
+
+    def write(self, directory: Union[str, Path]) -> Tuple[Path, Path]:
+        """
+        Write this run's metrics as JSON and as a Prometheus textfile.
+
+        The JSON file is named after the run's start time; the .prom file
+        is replaced atomically so a textfile collector never reads half of it.
+
+        Returns:
+            Paths of the JSON and Prometheus files
+        """
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+
+        json_path = directory / f"metrics-{self._started_at.strftime('%Y%m%dT%H%M%S')}.json"
+        json_path.write_text(json.dumps(self.snapshot(), indent=2), encoding='utf-8')
+
+        prom_path = directory / f"{self.NAMESPACE}_scraper.prom"
+        fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=prom_path.name, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                f.write(self.to_prometheus())
+            os.replace(tmp_path, prom_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+        logger.info(f"Wrote metrics to {json_path} and {prom_path}")
+        return json_path, prom_path
+
+    @contextmanager
+    def _timed(self, name: str, labels: Dict[str, Any]):
+        """Context manager behind an enabled span()"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    @staticmethod
+    def _key(name: str, labels: Dict[str, Any]) -> LabelKey:
+        """Hashable key for a name and label set"""
+        return name, tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+    def _metric_name(self, name: str) -> str:
+        """Prometheus-safe metric name"""
+        return f"{self.NAMESPACE}_{re.sub(r'[^a-zA-Z0-9_]', '_', name)}"
+
+    @staticmethod
+    def _format_labels(labels: Dict[str, str]) -> str:
+        """Render a label set as {k="v",...}"""
+        if not labels:
+            return ''
+        def escape(value: str) -> str:
+            return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
+
+        return '{' + ','.join(f'{k}="{escape(v)}"' for k, v in labels.items()) + '}'
+
+
+# Process-wide instance; disabled until enabled (e.g. by --metrics-dir)
+metrics = Instrumentation()
@@ -1,17 +1,33 @@
 """Event orchestrator - coordinates scraping, normalization, and storage"""
 import sys
+import json
+import time
+import uuid
+import asyncio
 import argparse
 import logging
-from typing import List, Dict, Tuple
-from datetime import datetime
-from concurrent.futures import ThreadPoolExecutor, TimeoutError, as_completed
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from functools import partial
+from itertools import chain
+from typing import TYPE_CHECKING, List, Dict, Tuple, Iterator, AsyncIterator, NamedTuple, Optional
+from datetime import datetime, timedelta, timezone
 
 from .config import Config
-from .scrapers.knco import KNCOScraper
-from .scrapers.library import LibraryScraper
-from .scrapers.county import CountyScraper
-from .storage.supabase import SupabaseClient
+from .instrumentation import metrics
+from .processors.window import DateWindow
+from .profiling import profiler
+from .scheduling.deadline import Deadline, DeadlineScheduler
+from .scheduling.resilience import SourceUnavailable
+from .scheduling.timeouts import timeouts as timeout_tuner
+from .scrapers.base import BaseScraper, ScraperCancelled
+from .scrapers.registry import scrapers
+from .storage.base import EventStore, ScrapeRun
 from .storage.cache import CacheManager
+from .storage.query import EventPage, EventQuery
+
+if TYPE_CHECKING:
+    from .storage.warmer import CacheWarmer
 
 # Configure logging
 logging.basicConfig(
@@ -21,31 +37,101 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+class SourceBatch(NamedTuple):
+    """One source's outcome in a fetch run, yielded by iter_events"""
+
+    source: str
+    status: str  # 'success', 'failed' or 'timed_out'
+    events: List[dict]
+    cache_hit: bool = False
+    duration: Optional[float] = None
+    error: Optional[str] = None
+    # Timed out because the run's budget ran out, not the source's own
+    # timeout (duration is then the time it had, not a latency sample)
+    cut_off: bool = False
+
+
 class EventOrchestrator:
     """Orchestrate event scraping and storage"""
 
-    AVAILABLE_SOURCES = {
-        'knco': KNCOScraper,
-        'library': LibraryScraper,
-        'county': CountyScraper,
-    }
+    # Source name -> scraper class; each scraper module is imported only
+    # when its source is first used
+    AVAILABLE_SOURCES = scrapers
+
+    STORAGE_BACKENDS = ('supabase', 'sqlite')
+
+    def __init__(self, store: EventStore = None, backend: str = None):
+        """
+        Initialize orchestrator with database connection.
 
-    def __init__(self):
-        """Initialize orchestrator with database connection"""
+        Args:
+            store: Storage backend instance to use (overrides backend)
+            backend: Storage backend name, 'supabase' or 'sqlite'
+                (default: Config.STORAGE_BACKEND)
+        """
         try:
-            self.db = SupabaseClient()
+            self.db = store if store is not None else self._create_store(backend)
             self.cache = CacheManager(self.db)
+            self.warmer = None
             logger.info("Orchestrator initialized successfully")
         except Exception as e:
             logger.error(f"Failed to initialize orchestrator: {e}")
             raise
 
+    def _create_store(self, backend: str = None) -> EventStore:
+        """Create the configured storage backend"""
+        # Backends are imported on use, so the SQLite backend never loads psycopg2
+        backend = backend or Config.STORAGE_BACKEND
+        if backend == 'supabase':
+            from .storage.supabase import SupabaseClient
+            return SupabaseClient()
+        if backend == 'sqlite':
+            from .storage.sqlite import SQLiteClient
+            return SQLiteClient()
+        raise ValueError(
+            f"Unknown storage backend: {backend} "
+            f"(expected one of: {', '.join(self.STORAGE_BACKENDS)})"
+        )
+
+    def _scraper_func(self, source: str):
+        """Build a fetch callable that creates the scraper only when called"""
+        def fetch():
+            return self._timed_fetch(source, self.AVAILABLE_SOURCES[source]())()
+        return fetch
+
+    def _create_scraper(self, source: str, deadline: Deadline = None):
+        """
+        Create the scraper for a source.
+
+        Args:
+            source: Source name
+            deadline: Deadline the scrape must finish by (BaseScraper subclasses
+                cancel themselves once it passes)
+        """
+        scraper_class = self.AVAILABLE_SOURCES.get(source)
+        if not scraper_class:
+            raise ValueError(f"Unknown source: {source}")
+
+        scraper = scraper_class()
+        if isinstance(scraper, BaseScraper):
+            scraper.deadline = deadline
+        return scraper
+
+    def _cancel_scraper(self, scraper):
+        """Cancel a scraper that overran its deadline"""
+        if isinstance(scraper, BaseScraper):
+            scraper.cancel()
+
     def _fetch_single_source(
         self,
         source: str,
         use_cache: bool,
         timeout: int,
-        min_quality_score: int = None
+        min_quality_score: int = None,
+        check_cache: bool = True,
+        scraper=None,
+        deadline: Deadline = None,
+        query: EventQuery = None
     ) -> Tuple[str, List[dict], bool, float]:
         """
         Fetch events from a single source with timeout.
@@ -55,71 +141,89 @@ class EventOrchestrator:
             use_cache: Whether to use cache
             timeout: Timeout in seconds
             min_quality_score: Minimum quality score (0-100) to include events
+            check_cache: Whether the cache still needs to be checked (False when
+                fetch_events already resolved this source as a batched miss)
+            scraper: Scraper instance to use (default: a new one for source)
+            deadline: Deadline for the scrape (default: timeout from now)
+            query: Only return events matching this query. Through the cache
+                its predicates are pushed into the read, and a refresh still
+                scrapes everything; without it the date window is pushed into
+                the scraper and normalizer.
 
         Returns:
             Tuple of (source, events, is_cache_hit, duration)
+
+        Raises:
+            ScraperCancelled: If the scrape was cancelled or overran its deadline
         """
         source_start = datetime.now()
 
         if min_quality_score is None:
             min_quality_score = Config.MIN_QUALITY_SCORE
 
+        if deadline is None:
+            deadline = Deadline(timeout)
+
+        window = query.window if query is not None else None
+
         try:
-            scraper_class = self.AVAILABLE_SOURCES.get(source)
-            if not scraper_class:
-                raise ValueError(f"Unknown source: {source}")
+            if scraper is None:
+                scraper = self._create_scraper(source, deadline)
+            elif isinstance(scraper, BaseScraper):
+                scraper.deadline = deadline
 
-            scraper = scraper_class()
+            fetch = self._timed_fetch(source, scraper)
 
             if use_cache:
                 # Use cache manager
                 events = self.cache.get_or_fetch(
                     source,
-                    scraper.fetch,
-                    ttl_hours=Config.CACHE_TTL_HOURS
+                    fetch,
+                    ttl_hours=Config.CACHE_TTL_HOURS,
+                    check_cache=check_cache,
+                    query=query
                 )
                 # Check if it was a cache hit
-                is_cache_hit = events and len(events) > 0 and 'scraped_at' in events[0]
-
-                # If quality filtering is enabled and we have cached events, filter them
-                if min_quality_score > 0 and events:
-                    original_count = len(events)
-                    events = [e for e in events if e.get('quality_score', 0) >= min_quality_score]
-                    if len(events) < original_count:
-                        logger.info(
-                            f"Filtered {original_count - len(events)} cached events below quality score {min_quality_score}"
-                        )
+                is_cache_hit = check_cache and events and len(events) > 0 and 'scraped_at' in events[0]
             else:
                 # Bypass cache - scrape directly
                 logger.info(f"Bypassing cache for {source}")
-                raw_events = scraper.fetch()
+                if isinstance(scraper, BaseScraper):
+                    scraper.window = window
+                with profiler.section(stage='fetch'):
+                    try:
+                        raw_events = fetch()
+                        fresh = True
+                    except SourceUnavailable as e:
+                        logger.warning(f"{e}")
+                        raw_events, fresh = e.events, False
 
                 from .processors.normalizer import Normalizer
                 from .processors.deduplicator import Deduplicator
 
                 normalizer = Normalizer(source)
-                normalized = normalizer.normalize(
-                    raw_events,
-                    min_quality_score=min_quality_score,
-                    log_quality_stats=True
-                )
-
-                # Convert to dict format for deduplication
-                normalized_dicts = [e.to_dict() for e in normalized]
+                with profiler.section(stage='normalize'):
+                    normalized = normalizer.normalize(
+                        raw_events,
+                        min_quality_score=min_quality_score,
+                        log_quality_stats=True,
+                        window=window
+                    )
 
                 # Deduplicate events
                 deduplicator = Deduplicator()
-                deduplicated_dicts = deduplicator.deduplicate(normalized_dicts)
-
-                # Convert back to NormalizedEvent objects for storage
-                from .processors.normalizer import NormalizedEvent
-                deduplicated = [NormalizedEvent(**d) for d in deduplicated_dicts]
+                with profiler.section(stage='dedupe'):
+                    deduplicated = deduplicator.deduplicate_events(normalized)
+                deduplicated_dicts = [e.to_dict() for e in deduplicated]
 
-                # Store in database
-                self.db.upsert_events(deduplicated)
+                # Store in database (not events from last good payloads:
+                # storing them would mark stale content as just scraped)
+                if fresh:
+                    with profiler.section(stage='store'):
+                        self.db.upsert_events(deduplicated)
 
                 # Return dict format
-                events = deduplicated_dicts
+                events = query.filter(deduplicated_dicts) if query is not None else deduplicated_dicts
                 is_cache_hit = False
 
             duration = (datetime.now() - source_start).total_seconds()
@@ -129,126 +233,541 @@ class EventOrchestrator:
             duration = (datetime.now() - source_start).total_seconds()
             raise Exception(f"Error fetching from {source}: {e}")
 
+    def _timed_fetch(self, source: str, scraper):
+        """
+        Wrap a scraper's fetch to record how long successful scrapes take.
+
+        The wrapped fetch raises SourceUnavailable when the scraper had to
+        serve last good payloads, so they are not stored as a fresh scrape.
+        """
+        def timed():
+            if isinstance(scraper, BaseScraper):
+                scraper.served_last_good = False
+            start = time.monotonic()
+            events = scraper.fetch()
+            if getattr(scraper, 'served_last_good', False):
+                raise SourceUnavailable(source, events)
+            timeout_tuner.record_scrape(source, time.monotonic() - start)
+            return events
+        return timed
+
     def fetch_events(
         self,
         sources: List[str] = None,
         use_cache: bool = True,
         timeout: int = None,
         parallel: bool = True,
-        min_quality_score: int = None
+        min_quality_score: int = None,
+        run_timeout: int = None,
+        pipeline: bool = None,
+        window: DateWindow = None,
+        query: EventQuery = None
     ) -> List[dict]:
         """
         Fetch events from specified sources.
 
+        Collects every batch from iter_events; see it for the arguments.
+
+        Returns:
+            Combined list of event dictionaries
+        """
+        return [
+            event
+            for batch in self.iter_events(
+                sources, use_cache, timeout, parallel, min_quality_score, run_timeout, pipeline, window, query
+            )
+            for event in batch.events
+        ]
+
+    def iter_events(
+        self,
+        sources: List[str] = None,
+        use_cache: bool = True,
+        timeout: int = None,
+        parallel: bool = True,
+        min_quality_score: int = None,
+        run_timeout: int = None,
+        pipeline: bool = None,
+        window: DateWindow = None,
+        query: EventQuery = None
+    ) -> Iterator[SourceBatch]:
+        """
+        Fetch events from specified sources, yielding each source as soon as it is done.
+
+        Cache hits come first, then scraped sources in completion order, so
+        a slow source does not hold back the others. Every scrape gets a
+        deadline: the sooner of its per-source timeout and the run budget.
+        Sources that overrun are cancelled and yielded as timed out.
+        Closing the iterator early cancels the scrapes still running.
+
         Args:
             sources: List of source names (default: ['knco'])
             use_cache: Whether to use cache (default: True)
-            timeout: Per-source timeout in seconds (default: Config.SCRAPER_TIMEOUT)
+            timeout: Per-source timeout in seconds (default: Config.SCRAPER_TIMEOUT,
+                or tuned per source from its latency history with Config.AUTO_TIMEOUTS)
             parallel: Whether to scrape sources in parallel (default: True)
             min_quality_score: Minimum quality score (0-100) to include events (default: Config.MIN_QUALITY_SCORE)
+            run_timeout: Budget in seconds for the whole run, 0 for none (default: Config.RUN_TIMEOUT)
+            pipeline: Whether to scrape through the staged pipeline, overlapping one
+                source's fetch with another's normalize and store (default: Config.PIPELINE_ENABLED)
+            window: Only events dated in this window, e.g. DateWindow.upcoming(7)
+                (default: every event). Cached reads are bounded to it in SQL;
+                scrapes that bypass the cache drop other events while parsing.
+            query: Further predicates, e.g. EventQuery().free().in_city_areas('Grass Valley')
+                (default: none). min_quality_score and window are added to it,
+                and cached reads filter on all of them in SQL.
 
-        Returns:
-            Combined list of event dictionaries
+        Yields:
+            One SourceBatch per source, failed and timed out sources included
         """
         if sources is None:
             sources = ['knco']
 
-        if timeout is None:
-            timeout = Config.SCRAPER_TIMEOUT
+        # A fixed timeout if given, otherwise each source's tuned timeout
+        timeouts = timeout_tuner.scrape_timeouts(sources, timeout)
 
         if min_quality_score is None:
             min_quality_score = Config.MIN_QUALITY_SCORE
 
+        query = query or EventQuery()
+        if window is not None:
+            query = query.within(window)
+        query = query.at_least(max(query.min_quality_score, min_quality_score))
+        min_quality_score = query.min_quality_score
+
+        if run_timeout is None:
+            run_timeout = Config.RUN_TIMEOUT
+
+        if pipeline is None:
+            pipeline = Config.PIPELINE_ENABLED
+
         start_time = datetime.now()
-        all_events = []
-        cache_hits = 0
-        successful_sources = []
-        failed_sources = []
-        timed_out_sources = []
-
-        if parallel and len(sources) > 1:
-            logger.info(f"Scraping {len(sources)} sources in parallel...")
-
-            # Use ThreadPoolExecutor for parallel execution
-            with ThreadPoolExecutor(max_workers=len(sources)) as executor:
-                # Submit all scraping tasks
-                future_to_source = {
-                    executor.submit(
-                        self._fetch_single_source,
-                        source,
-                        use_cache,
-                        timeout,
-                        min_quality_score
-                    ): source
-                    for source in sources
-                }
-
-                # Process completed futures with timeout
-                for future in as_completed(future_to_source, timeout=timeout + 5):
-                    source = future_to_source[future]
-                    try:
-                        # Get result with timeout
-                        source_name, events, is_cache_hit, duration = future.result(timeout=timeout)
+        run_deadline = Deadline(run_timeout or None)
+        # Per-source outcomes, for the summary and the scrape_runs history
+        runs: List[ScrapeRun] = []
+        run = partial(ScrapeRun, uuid.uuid4().hex, datetime.now(timezone.utc))
 
-                        all_events.extend(events)
-                        successful_sources.append(source_name)
+        # Resolve every cache hit up front with one query, then only
+        # schedule scrapes for the misses
+        cached_by_source = {}
+        if use_cache:
+            self.cache.log_ttls(sources, Config.CACHE_TTL_HOURS)
+            cached_by_source = self.cache.get_cached_many(
+                sources,
+                Config.CACHE_TTL_HOURS,
+                scraper_funcs={s: self._scraper_func(s) for s in sources if s in self.AVAILABLE_SOURCES},
+                query=query
+            )
+        pending_sources = [s for s in sources if s not in cached_by_source]
 
-                        if is_cache_hit:
-                            cache_hits += 1
+        cached = (
+            SourceBatch(source, 'success', cached_by_source[source], True)
+            for source in sources if source in cached_by_source
+        )
 
-                        logger.info(f"{source_name} completed in {duration:.1f}s ({len(events)} events)")
+        # Misses were already checked by the batched read above
+        check_cache = not use_cache
 
-                    except TimeoutError:
-                        logger.warning(f"{source} timed out after {timeout}s (0 events)")
-                        timed_out_sources.append(source)
-                    except Exception as e:
-                        logger.error(f"{source} failed: {e}")
-                        failed_sources.append(source)
+        if pipeline and pending_sources:
+            logger.info(f"Scraping {len(pending_sources)} sources through the pipeline...")
+            scraped = self._iter_pipeline(pending_sources, use_cache, timeouts, min_quality_score, run_deadline, query)
+        elif parallel and len(pending_sources) > 1:
+            logger.info(f"Scraping {len(pending_sources)} sources in parallel...")
+            scraped = self._iter_parallel(
+                pending_sources, use_cache, timeouts, min_quality_score, check_cache, run_deadline, query
+            )
         else:
-            # Sequential execution (original behavior)
-            logger.info(f"Fetching events from: {', '.join(sources)}")
+            if pending_sources:
+                logger.info(f"Fetching events from: {', '.join(pending_sources)}")
+            scraped = self._iter_sequential(
+                pending_sources, use_cache, timeouts, min_quality_score, check_cache, run_deadline, run_timeout, query
+            )
+
+        try:
+            for batch in chain(cached, scraped):
+                runs.append(run(batch.source, batch.status, batch.duration, len(batch.events), batch.cache_hit))
+                if batch.status == 'timed_out' and batch.duration is not None and not batch.cut_off:
+                    timeout_tuner.record_timeout(batch.source, batch.duration)
+                yield batch
+        finally:
+            # Cancels the scrapes still running if the caller stopped early
+            scraped.close()
+            self._log_summary(sources, runs, (datetime.now() - start_time).total_seconds(), use_cache)
+            timeout_tuner.flush()
+            timeout_tuner.log_regressions(pending_sources)
+            self.record_runs(runs)
+
+    async def stream_events(self, sources: List[str] = None, **kwargs) -> AsyncIterator[SourceBatch]:
+        """
+        Async variant of iter_events for use inside an event loop.
+
+        The scrape runs in a worker thread; each SourceBatch is yielded to
+        the loop as soon as its source is done. Takes iter_events' arguments.
+        """
+        loop = asyncio.get_running_loop()
+        # One thread, so closing the iterator waits for a pending next()
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='stream-events')
+        batches = self.iter_events(sources, **kwargs)
+        try:
+            while True:
+                batch = await loop.run_in_executor(executor, next, batches, None)
+                if batch is None:
+                    break
+                yield batch
+        finally:
+            executor.submit(batches.close)
+            executor.shutdown(wait=False)
+
+    def _iter_pipeline(
+        self,
+        sources: List[str],
+        use_cache: bool,
+        timeouts: Dict[str, float],
+        min_quality_score: int,
+        run_deadline: Deadline,
+        query: EventQuery = None
+    ) -> Iterator[SourceBatch]:
+        """
+        Scrape sources through fetch -> parse -> normalize -> dedupe -> store stages.
+
+        Args:
+            sources: Sources to scrape
+            use_cache: Whether to store through the cache (otherwise straight to the store)
+            timeouts: Fetch timeout in seconds for each source
+            min_quality_score: Minimum quality score (0-100) to include events
+            run_deadline: Deadline for the whole pipeline run
+            query: Only events matching this query (its date window is
+                pushed into parse and normalize when the cache is bypassed)
+
+        Yields:
+            SourceBatch per source as it leaves the store stage
+        """
+        from .pipeline import Pipeline, PipelineResult, Stage, parse_stage, normalize_stage, dedupe_stage
+
+        scrapers = {}
+        for source in sources:
+            try:
+                scrapers[source] = self._create_scraper(source)
+            except Exception as e:
+                logger.error(f"{source} failed: {e}")
+                yield SourceBatch(source, 'failed', [], error=str(e))
+
+        def fetch(source, scraper):
+            if not isinstance(scraper, BaseScraper):
+                return None, scraper.fetch()
+            scraper.deadline = run_deadline.sooner(Deadline(timeouts[source]))
+            scraper.window = scrape_window
+            scraper.served_last_good = False
+            start = started[source] = time.monotonic()
+            payload = scraper.download()
+            if not scraper.served_last_good:
+                timeout_tuner.record_scrape(source, time.monotonic() - start)
+            return type(scraper), payload
+
+        def store(source, normalized):
+            if not normalized:
+                return []
+            if getattr(scrapers[source], 'served_last_good', False):
+                # Parsed from last good payloads: not a fresh scrape to store
+                logger.warning(f"{source} is unavailable; its events were parsed from last good payloads")
+                stored = (
+                    self.cache.serve_unavailable(source, normalized, Config.CACHE_TTL_HOURS)
+                    if use_cache else [e.to_dict() for e in normalized]
+                )
+            elif use_cache:
+                stored = self.cache.store_events(source, normalized, Config.CACHE_TTL_HOURS)
+            else:
+                self.db.upsert_events(normalized)
+                stored = [e.to_dict() for e in normalized]
+            return query.filter(stored) if query is not None else stored
+
+        # When each source's fetch (and its own timeout) started
+        started: Dict[str, float] = {}
+
+        cpu_kind = Config.PIPELINE_CPU_EXECUTOR
+        # The cache keeps every event and filters on read, like CacheManager
+        scrape_window = None if use_cache or query is None else query.window
+        parse = partial(parse_stage, window=scrape_window)
+        normalize = partial(
+            normalize_stage,
+            min_quality_score=0 if use_cache else min_quality_score,
+            window=scrape_window
+        )
+
+        pipeline = Pipeline([
+            Stage('fetch', fetch, workers=min(len(scrapers), Config.SCRAPER_MAX_WORKERS)),
+            Stage('parse', parse, Config.PIPELINE_CPU_WORKERS, cpu_kind),
+            Stage('normalize', normalize, Config.PIPELINE_CPU_WORKERS, cpu_kind),
+            Stage('dedupe', dedupe_stage),
+            Stage('store', store, Config.PIPELINE_STORE_WORKERS),
+        ])
+        result = PipelineResult()
+        completions = pipeline.as_completed(scrapers.items(), run_deadline, result)
+        try:
+            for source, status, value in completions:
+                if status == 'done':
+                    events = value
+                    logger.info(f"Retrieved {len(events)} events from {source}")
+                    yield SourceBatch(source, 'success', events, False, result.latencies.get(source))
+                elif status == 'error' and not isinstance(value, ScraperCancelled):
+                    logger.error(f"{source} failed: {value}")
+                    yield SourceBatch(source, 'failed', [], error=str(value))
+                else:
+                    self._cancel_scraper(scrapers[source])
+                    yield self._timed_out(source, started.get(source), timeouts[source], run_deadline)
+        finally:
+            completions.close()
+            for source, scraper in scrapers.items():
+                if source not in result.outputs and source not in result.errors:
+                    self._cancel_scraper(scraper)
+
+        Pipeline.log_stats(result.stats)
 
-            for source in sources:
-                try:
+    def _iter_parallel(
+        self,
+        sources: List[str],
+        use_cache: bool,
+        timeouts: Dict[str, float],
+        min_quality_score: int,
+        check_cache: bool,
+        run_deadline: Deadline,
+        query: EventQuery = None
+    ) -> Iterator[SourceBatch]:
+        """Scrape sources on parallel threads, yielding each as it completes"""
+        scrapers = {}
+        for source in sources:
+            try:
+                scrapers[source] = self._create_scraper(source)
+            except Exception as e:
+                logger.error(f"{source} failed: {e}")
+                yield SourceBatch(source, 'failed', [], error=str(e))
+
+        def task(source):
+            def run(deadline):
+                with profiler.section(source=source):
+                    return self._fetch_single_source(
+                        source, use_cache, timeouts[source], min_quality_score, check_cache,
+                        scraper=scrapers[source], deadline=deadline, query=query
+                    )
+            return run
+
+        # The scheduler starts every source's timeout when it submits the tasks
+        started = time.monotonic()
+        completions = DeadlineScheduler(run_deadline, max_workers=Config.SCRAPER_MAX_WORKERS).as_completed(
+            {source: task(source) for source in scrapers},
+            timeouts=timeouts,
+            on_timeout=lambda source: self._cancel_scraper(scrapers[source])
+        )
+        with closing(completions):
+            for source, status, value in completions:
+                if status == 'done':
+                    source_name, events, is_cache_hit, duration = value
+                    logger.info(f"{source_name} completed in {duration:.1f}s ({len(events)} events)")
+                    yield SourceBatch(source_name, 'success', events, bool(is_cache_hit), duration)
+                elif status == 'error' and not isinstance(value, ScraperCancelled):
+                    logger.error(f"{source} failed: {value}")
+                    yield SourceBatch(source, 'failed', [], error=str(value))
+                else:
+                    yield self._timed_out(source, started, timeouts[source], run_deadline)
+
+    def _iter_sequential(
+        self,
+        sources: List[str],
+        use_cache: bool,
+        timeouts: Dict[str, float],
+        min_quality_score: int,
+        check_cache: bool,
+        run_deadline: Deadline,
+        run_timeout: int,
+        query: EventQuery = None
+    ) -> Iterator[SourceBatch]:
+        """Scrape sources one at a time (original behavior)"""
+        for source in sources:
+            if run_deadline.expired():
+                logger.warning(f"{source} skipped: run budget of {run_timeout}s exhausted")
+                yield SourceBatch(source, 'timed_out', [], cut_off=True)
+                continue
+
+            started = time.monotonic()
+            try:
+                with profiler.section(source=source):
                     source_name, events, is_cache_hit, duration = self._fetch_single_source(
-                        source, use_cache, timeout, min_quality_score
+                        source, use_cache, timeouts[source], min_quality_score, check_cache,
+                        deadline=run_deadline.sooner(Deadline(timeouts[source])),
+                        query=query
                     )
+            except ScraperCancelled:
+                yield self._timed_out(source, started, timeouts[source], run_deadline)
+                continue
+            except Exception as e:
+                logger.error(str(e))
+                yield SourceBatch(source, 'failed', [], error=str(e))
+                continue
 
-                    all_events.extend(events)
-                    successful_sources.append(source_name)
+            logger.info(f"Retrieved {len(events)} events from {source_name}")
+            yield SourceBatch(source_name, 'success', events, bool(is_cache_hit), duration)
+
+    def _timed_out(self, source: str, started: Optional[float], timeout: float, run_deadline: Deadline) -> SourceBatch:
+        """
+        Batch for a source cancelled at its deadline.
 
-                    if is_cache_hit:
-                        cache_hits += 1
+        A source stopped by its own timeout is recorded at that timeout.
+        One the run's budget cut off first is tagged cut_off with the time
+        it actually had, so the timeout tuner does not take it for a slow
+        scrape.
 
-                    logger.info(f"Retrieved {len(events)} events from {source_name}")
+        Args:
+            source: Source name
+            started: time.monotonic() when the source's timeout started (None: never started)
+            timeout: The source's own timeout in seconds
+            run_deadline: Deadline for the whole run
+        """
+        elapsed = 0.0 if started is None else time.monotonic() - started
+        if run_deadline.expired() and elapsed < timeout:
+            logger.warning(f"{source} cut off by the run deadline after {elapsed:.1f}s and cancelled (0 events)")
+            return SourceBatch(source, 'timed_out', [], duration=elapsed, cut_off=True)
+        logger.warning(f"{source} timed out and was cancelled (0 events)")
+        return SourceBatch(source, 'timed_out', [], duration=timeout)
 
-                except Exception as e:
-                    logger.error(str(e))
-                    failed_sources.append(source)
+    def _log_summary(self, sources: List[str], runs: List[ScrapeRun], duration: float, use_cache: bool):
+        """Log and count the outcome of a fetch run"""
+        by_status = {status: [r.source_name for r in runs if r.status == status] for status in EventStore.RUN_STATUSES}
+        event_count = sum(r.event_count for r in runs)
+        cache_hits = sum(1 for r in runs if r.cache_hit)
 
-        # Calculate execution time
-        duration = (datetime.now() - start_time).total_seconds()
+        metrics.observe('run', duration)
+        metrics.count('events_returned', event_count)
+        for status, names in by_status.items():
+            metrics.count('sources', len(names), status=status)
 
-        # Log execution summary
         logger.info("=" * 50)
-        logger.info(f"[SUCCESS] Total: {len(all_events)} events from {len(successful_sources)}/{len(sources)} sources")
+        logger.info(f"[SUCCESS] Total: {event_count} events from {len(by_status['success'])}/{len(sources)} sources")
 
         if cache_hits > 0:
             logger.info(f"Cache hits: {cache_hits}")
 
-        if timed_out_sources:
-            logger.info(f"Timed out: {', '.join(timed_out_sources)}")
+        if use_cache:
+            self.cache.log_stats()
 
-        if failed_sources:
-            logger.info(f"Failed: {', '.join(failed_sources)}")
+        if by_status['timed_out']:
+            logger.info(f"Timed out: {', '.join(by_status['timed_out'])}")
+
+        if by_status['failed']:
+            logger.info(f"Failed: {', '.join(by_status['failed'])}")
 
         logger.info(f"Total execution time: {duration:.1f}s")
         logger.info("=" * 50)
 
-        return all_events
+    def record_runs(self, runs: List[ScrapeRun]):
+        """
+        Append a run's per-source outcomes to the store's scrape_runs history.
+
+        Run history is best effort: a store that keeps none, or a failed
+        write, is logged and never fails the run.
+        """
+        if not Config.RUN_HISTORY or not runs:
+            return
+        try:
+            self.db.record_runs(runs)
+        except Exception as e:
+            logger.warning(f"Could not record run history: {e}")
+
+    def start_cache_warmer(self, sources: List[str] = None) -> 'CacheWarmer':
+        """
+        Keep the cache for the given sources warm with refresh-ahead scraping.
+
+        Args:
+            sources: Sources to keep warm (default: all available sources)
+
+        Returns:
+            The running CacheWarmer (stopped automatically on close)
+        """
+        if sources is None:
+            sources = list(self.AVAILABLE_SOURCES)
+
+        unknown = [s for s in sources if s not in self.AVAILABLE_SOURCES]
+        if unknown:
+            raise ValueError(f"Unknown source: {', '.join(unknown)}")
+
+        if self.warmer is not None:
+            self.warmer.stop()
+
+        from .storage.warmer import CacheWarmer
+        self.warmer = CacheWarmer(self.cache, {s: self._scraper_func(s) for s in sources})
+        self.warmer.start()
+        return self.warmer
+
+    def invalidate_cache(self, sources: List[str] = None, event_id: str = None) -> int:
+        """
+        Invalidate cached events so the next fetch re-scrapes.
+
+        Args:
+            sources: Sources to invalidate (default: every source)
+            event_id: Single source_event_id to invalidate (requires exactly one source)
+
+        Returns:
+            Number of events invalidated
+        """
+        if event_id is not None and (not sources or len(sources) != 1):
+            raise ValueError("Invalidating a single event requires exactly one source")
+
+        if not sources:
+            return self.cache.invalidate_cache()
+
+        return sum(self.cache.invalidate_cache(source, event_id) for source in sources)
+
+    def events_page(
+        self,
+        cursor: str = None,
+        page_size: int = None,
+        sources: List[str] = None,
+        query: EventQuery = None,
+        min_quality_score: int = None
+    ) -> EventPage:
+        """
+        Read one page of stored upcoming events across sources, in date order.
+
+        Pages come straight from the store, keyset-paginated on
+        (event_date, id): pass each page's next_cursor to get the next one.
+        Nothing is scraped; run fetch_events (or the daemon) to fill the store.
+        Like cached reads, pages leave out invalidated events and events
+        older than Config.CACHE_TTL_HOURS (or the stale window, with
+        stale-while-revalidate).
+
+        Args:
+            cursor: next_cursor of the previous page (default: first page)
+            page_size: Events per page (default: Config.PAGE_SIZE, capped at Config.PAGE_SIZE_MAX)
+            sources: Only these sources (default: every source)
+            query: Further predicates (default: none). Without a date window
+                it is limited to events from today on.
+            min_quality_score: Minimum quality score (0-100) to include events (default: Config.MIN_QUALITY_SCORE)
+
+        Returns:
+            EventPage with the events and the next page's cursor (None on the last page)
+
+        Raises:
+            ValueError: The cursor is malformed
+        """
+        if min_quality_score is None:
+            min_quality_score = Config.MIN_QUALITY_SCORE
+
+        query = query or EventQuery()
+        if query.window is None:
+            query = query.within(DateWindow.upcoming(None))
+        query = query.at_least(max(query.min_quality_score, min_quality_score))
+
+        return self.db.get_events_page(
+            query, cursor, page_size, sources, ttl_hours=self.cache.read_window(Config.CACHE_TTL_HOURS)
+        )
 
     def close(self):
-        """Close database connection"""
+        """Wait for background cache refreshes, then close database connection"""
+        if getattr(self, 'warmer', None) is not None:
+            self.warmer.stop()
+        if hasattr(self, 'cache'):
+            self.cache.close()
+        # Background refreshes record latencies after the last run's flush
+        timeout_tuner.flush()
         if hasattr(self, 'db'):
             self.db.close()
 
@@ -261,14 +780,79 @@ class EventOrchestrator:
         self.close()
 
 
+def print_latency_report(sources: List[str] = None):
+    """Print the slow-source report from the scrape latency history"""
+    rows = timeout_tuner.report(sources)
+    if not rows:
+        print("No scrape latency history yet (enable AUTO_TIMEOUTS to record it)")
+        return
+
+    print(f"{'source':<12} {'runs':>5} {'p50':>7} {'p95':>7} {'p99':>7} {'timeout':>8}  trend")
+    for row in rows:
+        if row['regressed']:
+            trend = f"REGRESSED: recent p95 {row['recent_p95']:.1f}s vs {row['baseline_p95']:.1f}s"
+        elif row['baseline_p95'] is None:
+            trend = 'not enough history'
+        else:
+            trend = 'ok'
+        print(
+            f"{row['source']:<12} {row['samples']:>5} {row['p50']:>6.1f}s {row['p95']:>6.1f}s "
+            f"{row['p99']:>6.1f}s {row['timeout']:>7.1f}s  {trend}"
+        )
+
+
+def write_jsonl(events: List[dict], stream=None):
+    """Write events as JSON lines and flush, so readers see them right away"""
+    stream = stream or sys.stdout
+    for event in events:
+        stream.write(json.dumps(event, default=_json_default) + '\n')
+    stream.flush()
+
+
+def _json_default(value):
+    """Serialize datetimes (and anything else json can't) in event dictionaries"""
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+def print_run_report(store: EventStore, days: int = None, sources: List[str] = None):
+    """Print per-source run trends from the scrape_runs history"""
+    days = Config.RUN_REPORT_DAYS if days is None else days
+    rows = store.get_run_report(datetime.now(timezone.utc) - timedelta(days=days), sources)
+    if not rows:
+        print(f"No runs recorded in the last {days} days")
+        return
+
+    def seconds(value):
+        return f"{value:.1f}s" if value is not None else '-'
+
+    print(f"Runs in the last {days} days")
+    print(f"{'source':<12} {'runs':>5} {'success':>8} {'p50':>7} {'p95':>7} {'events':>7} {'cached':>7}  failures")
+    for row in rows:
+        print(
+            f"{row['source_name']:<12} {row['runs']:>5} {row['success_rate']:>8.0%} "
+            f"{seconds(row['p50_seconds']):>7} {seconds(row['p95_seconds']):>7} "
+            f"{row['events_per_run']:>7.1f} {row['cache_hit_ratio']:>7.0%}  "
+            f"{row['failures']} failed, {row['timeouts']} timed out"
+        )
+
+
 def main():
     """CLI entry point"""
     parser = argparse.ArgumentParser(
         description="Nevada County Kids Events - Event Orchestrator"
     )
+    parser.add_argument(
+        'command',
+        nargs='?',
+        choices=('fetch', 'report'),
+        default='fetch',
+        help="'fetch' events (default) or 'report' per-source run trends from the scrape_runs history"
+    )
     parser.add_argument(
         '--sources',
-        default='knco',
+        default=None,
         help='Comma-separated list of sources to scrape (default: knco)'
     )
     parser.add_argument(
@@ -276,6 +860,11 @@ def main():
         action='store_true',
         help='Bypass cache and force fresh scrape'
     )
+    parser.add_argument(
+        '--invalidate',
+        action='store_true',
+        help='Invalidate cached events for the selected sources before fetching'
+    )
     parser.add_argument(
         '--no-parallel',
         action='store_true',
@@ -287,29 +876,172 @@ def main():
         default=None,
         help=f'Per-source timeout in seconds (default: {Config.SCRAPER_TIMEOUT})'
     )
+    parser.add_argument(
+        '--run-timeout',
+        type=int,
+        default=None,
+        help=f'Budget in seconds for the whole run, 0 for none (default: {Config.RUN_TIMEOUT})'
+    )
+    parser.add_argument(
+        '--storage',
+        choices=EventOrchestrator.STORAGE_BACKENDS,
+        default=None,
+        help=f'Storage backend (default: {Config.STORAGE_BACKEND})'
+    )
     parser.add_argument(
         '--min-quality',
         type=int,
         default=None,
         help=f'Minimum quality score (0-100) to include events (default: {Config.MIN_QUALITY_SCORE})'
     )
+    parser.add_argument(
+        '--free-only',
+        action='store_true',
+        help='Only include free events'
+    )
+    parser.add_argument(
+        '--city-area',
+        default=None,
+        help='Comma-separated list of city areas to include (default: all)'
+    )
+
+    parser.add_argument(
+        '--pipeline',
+        action='store_true',
+        default=None,
+        help='Scrape through the staged pipeline (fetch, parse, normalize, dedupe, store)'
+    )
+    parser.add_argument(
+        '--metrics-dir',
+        default=Config.METRICS_DIR,
+        help='Write per-stage timings and counters for the run as JSON and a Prometheus textfile to this directory'
+    )
+    parser.add_argument(
+        '--profile',
+        nargs='?',
+        const=str(Config.PROFILE_DIR),
+        default=None,
+        metavar='DIR',
+        help=f'Profile the run with cProfile, writing per-source and per-stage .prof files (default DIR: {Config.PROFILE_DIR})'
+    )
+    parser.add_argument(
+        '--trace-memory',
+        action='store_true',
+        help='Trace allocations with tracemalloc and log the peak and top allocation sites'
+    )
+    parser.add_argument(
+        '--profile-top',
+        type=int,
+        default=Config.PROFILE_TOP_N,
+        help=f'Number of hotspots and allocation sites to log (default: {Config.PROFILE_TOP_N})'
+    )
+    parser.add_argument(
+        '--daemon',
+        action='store_true',
+        help='Run as a long-lived daemon refreshing each source on its schedule (see DAEMON_SCHEDULES)'
+    )
+    parser.add_argument(
+        '--control',
+        metavar='COMMAND',
+        help="Send a command to a running daemon: 'refresh [source ...]', 'status' or 'stop'"
+    )
+    parser.add_argument(
+        '--latency-report',
+        action='store_true',
+        help='Print each source\'s scrape latency percentiles and tuned timeout, flagging slowdowns'
+    )
+    parser.add_argument(
+        '--output',
+        choices=('none', 'jsonl'),
+        default='none',
+        help='jsonl: write events to stdout as JSON lines as soon as each source finishes'
+    )
+    parser.add_argument(
+        '--days',
+        type=int,
+        default=None,
+        help=f'fetch: only events in the next N days (default: all); '
+             f'report: days of run history (default: {Config.RUN_REPORT_DAYS})'
+    )
 
     args = parser.parse_args()
 
     # Parse sources
-    sources = [s.strip() for s in args.sources.split(',')]
+    sources = [s.strip() for s in (args.sources or 'knco').split(',')]
+
+    if args.control:
+        from .daemon import send_command
+        try:
+            reply = send_command(args.control)
+        except OSError as e:
+            logger.error(f"Could not reach daemon at {Config.DAEMON_SOCKET}: {e}")
+            sys.exit(1)
+        print(json.dumps(reply, indent=2))
+        sys.exit(0 if reply.get('ok') else 1)
+
+    # An explicit --sources narrows the reports and the daemon; by default
+    # they cover every source (only a one-shot run defaults to knco)
+    all_or_sources = sources if args.sources else None
+
+    if args.latency_report:
+        print_latency_report(all_or_sources)
+        sys.exit(0)
+
+    if args.command == 'report':
+        try:
+            with EventOrchestrator(backend=args.storage) as orchestrator:
+                print_run_report(
+                    orchestrator.db, args.days if args.days is not None else Config.RUN_REPORT_DAYS, all_or_sources
+                )
+        except Exception as e:
+            logger.error(f"Could not build run report: {e}")
+            sys.exit(1)
+        sys.exit(0)
+
+    if args.metrics_dir:
+        metrics.enable()
+
+    if args.profile or args.trace_memory:
+        profiler.start(profile_cpu=bool(args.profile), trace_memory=args.trace_memory)
 
     try:
-        with EventOrchestrator() as orchestrator:
-            events = orchestrator.fetch_events(
-                sources=sources,
-                use_cache=not args.no_cache,
-                parallel=not args.no_parallel,
-                timeout=args.timeout,
-                min_quality_score=args.min_quality
-            )
+        with EventOrchestrator(backend=args.storage) as orchestrator:
+            if args.invalidate:
+                orchestrator.invalidate_cache(sources)
+
+            if args.daemon:
+                from .daemon import EventDaemon
+                EventDaemon(orchestrator, all_or_sources, timeout=args.timeout).run_forever()
+                return
+
+            query = EventQuery().free(args.free_only)
+            if args.city_area:
+                query = query.in_city_areas(*(area.strip() for area in args.city_area.split(',')))
+
+            event_count = 0
+            with profiler.section():
+                for batch in orchestrator.iter_events(
+                    sources=sources,
+                    use_cache=not args.no_cache,
+                    parallel=not args.no_parallel,
+                    timeout=args.timeout,
+                    min_quality_score=args.min_quality,
+                    run_timeout=args.run_timeout,
+                    pipeline=args.pipeline,
+                    window=DateWindow.upcoming(args.days) if args.days is not None else None,
+                    query=query
+                ):
+                    event_count += len(batch.events)
+                    if args.output == 'jsonl':
+                        write_jsonl(batch.events)
+
+            if args.metrics_dir:
+                metrics.write(args.metrics_dir)
+
+            if profiler.enabled:
+                profiler.stop(args.profile or Config.PROFILE_DIR, args.profile_top)
 
-            if not events:
+            if not event_count:
                 logger.warning("No events retrieved")
                 sys.exit(1)
 
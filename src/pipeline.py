@@ -0,0 +1,314 @@
+"""Pipelined stage executor with bounded queues between stages"""
+import time
+import queue
+import logging
+import threading
+import multiprocessing
+from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Callable, Iterable, Iterator, Optional, Tuple
+
+from .config import Config
+from .processors.window import DateWindow
+from .profiling import profiler
+from .scheduling.deadline import Deadline
+
+logger = logging.getLogger(__name__)
+
+# Marks the end of a stage's input
+_DONE = object()
+
+
+class Stage:
+    """
+    One step of a pipeline.
+
+    func(key, payload) returns the payload handed to the next stage.
+    Thread stages run func on `workers` threads; process stages run it in
+    a pool of `workers` processes (func and payloads must be picklable),
+    for CPU-bound work that would otherwise contend for the GIL.
+    """
+
+    KINDS = ('thread', 'process')
+
+    def __init__(self, name: str, func: Callable[[str, Any], Any], workers: int = 1, kind: str = 'thread'):
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown stage kind: {kind} (expected one of: {', '.join(self.KINDS)})")
+        self.name = name
+        self.func = func
+        self.workers = max(1, workers)
+        self.kind = kind
+
+
+@dataclass
+class StageStats:
+    """Throughput, queue depth and utilization of one stage"""
+    name: str
+    workers: int
+    processed: int = 0
+    errors: int = 0
+    busy_seconds: float = 0.0
+    max_queue_depth: int = 0
+    queue_depth_total: int = 0
+    queue_samples: int = 0
+    elapsed_seconds: float = 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Items completed per second of pipeline run time"""
+        return self.processed / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def avg_queue_depth(self) -> float:
+        """Mean input queue depth seen by workers taking an item"""
+        return self.queue_depth_total / self.queue_samples if self.queue_samples else 0.0
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of the stage's worker time spent busy"""
+        capacity = self.elapsed_seconds * self.workers
+        return min(1.0, self.busy_seconds / capacity) if capacity else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert to dictionary"""
+        return {
+            'name': self.name,
+            'workers': self.workers,
+            'processed': self.processed,
+            'errors': self.errors,
+            'busy_seconds': round(self.busy_seconds, 3),
+            'throughput': round(self.throughput, 3),
+            'avg_queue_depth': round(self.avg_queue_depth, 2),
+            'max_queue_depth': self.max_queue_depth,
+            'utilization': round(self.utilization, 3),
+        }
+
+
+@dataclass
+class PipelineResult:
+    """Outputs of a pipeline run, keyed by item, in completion order"""
+    outputs: Dict[str, Any] = field(default_factory=dict)
+    errors: Dict[str, BaseException] = field(default_factory=dict)
+    timed_out: List[str] = field(default_factory=list)
+    stats: List[StageStats] = field(default_factory=list)
+    latencies: Dict[str, float] = field(default_factory=dict)  # Seconds from run start to each output
+
+
+class Pipeline:
+    """
+    Run keyed items through a chain of stages concurrently.
+
+    Each stage has its own workers and a bounded input queue, so while
+    one item is being stored the next can be normalized and a third
+    fetched. A full queue blocks the stage feeding it (backpressure)
+    instead of letting finished work pile up. An item whose stage raises
+    is dropped and its error reported; the other items carry on.
+    """
+
+    def __init__(self, stages: List[Stage], queue_size: Optional[int] = None):
+        """
+        Initialize pipeline.
+
+        Args:
+            stages: Stages in execution order
+            queue_size: Capacity of each queue between stages
+                (default: Config.PIPELINE_QUEUE_SIZE)
+        """
+        if not stages:
+            raise ValueError("A pipeline needs at least one stage")
+        self.stages = stages
+        self.queue_size = Config.PIPELINE_QUEUE_SIZE if queue_size is None else queue_size
+
+    def run(self, items: Iterable[Tuple[str, Any]], deadline: Optional[Deadline] = None) -> PipelineResult:
+        """
+        Push (key, payload) items through every stage.
+
+        Args:
+            items: Keyed inputs for the first stage
+            deadline: When to stop waiting; unfinished items are reported as timed out
+
+        Returns:
+            PipelineResult with the last stage's output for each key
+        """
+        result = PipelineResult()
+        for _ in self.as_completed(items, deadline, result):
+            pass
+        return result
+
+    def as_completed(
+        self,
+        items: Iterable[Tuple[str, Any]],
+        deadline: Optional[Deadline] = None,
+        result: Optional[PipelineResult] = None
+    ) -> Iterator[Tuple[str, str, Any]]:
+        """
+        Push items through every stage, yielding each one as it leaves the pipeline.
+
+        Args:
+            items: Keyed inputs for the first stage
+            deadline: When to stop waiting; unfinished items are reported as timed out
+            result: Filled in with outputs, errors, timed out keys and stage stats
+
+        Yields:
+            (key, status, value) where status is 'done' (value is the last
+            stage's output), 'error' (value is the exception) or 'timed_out'
+            (value is None)
+        """
+        deadline = deadline or Deadline()
+        result = result if result is not None else PipelineResult()
+        result.stats = [StageStats(s.name, s.workers) for s in self.stages]
+        queues = [queue.Queue(maxsize=self.queue_size) for _ in self.stages]
+        completed = queue.Queue()
+        lock = threading.Lock()
+        finished = threading.Event()
+        pools = {
+            i: ProcessPoolExecutor(max_workers=stage.workers, mp_context=self._process_context())
+            for i, stage in enumerate(self.stages) if stage.kind == 'process'
+        }
+        remaining_workers = [stage.workers for stage in self.stages]
+        pending_keys = []
+        start = time.monotonic()
+
+        def worker(index: int):
+            stage, stats, inbox = self.stages[index], result.stats[index], queues[index]
+            last = index == len(self.stages) - 1
+            while True:
+                depth = inbox.qsize()
+                item = inbox.get()
+                if item is _DONE:
+                    break
+                key, payload = item
+
+                with lock:
+                    stats.queue_depth_total += depth
+                    stats.queue_samples += 1
+                    stats.max_queue_depth = max(stats.max_queue_depth, depth)
+                if deadline.expired() or key in result.errors:
+                    continue
+
+                began = time.monotonic()
+                try:
+                    if index in pools:
+                        output = pools[index].submit(stage.func, key, payload).result()
+                    else:
+                        with profiler.section(source=key, stage=stage.name):
+                            output = stage.func(key, payload)
+                except BaseException as e:
+                    with lock:
+                        stats.errors += 1
+                        result.errors[key] = e
+                    completed.put((key, 'error', e))
+                    logger.debug(f"Pipeline stage {stage.name} failed for {key}: {e}")
+                    continue
+                finally:
+                    with lock:
+                        stats.busy_seconds += time.monotonic() - began
+
+                with lock:
+                    stats.processed += 1
+                    if last:
+                        result.outputs[key] = output
+                        result.latencies[key] = time.monotonic() - start
+                if last:
+                    completed.put((key, 'done', output))
+                else:
+                    queues[index + 1].put((key, output))
+
+            # The last worker out closes the next stage's input
+            with lock:
+                remaining_workers[index] -= 1
+                closing = remaining_workers[index] == 0
+            if closing:
+                if last:
+                    finished.set()
+                    completed.put(_DONE)
+                else:
+                    for _ in range(self.stages[index + 1].workers):
+                        queues[index + 1].put(_DONE)
+
+        threads = [
+            threading.Thread(target=worker, args=(i,), name=f'pipeline-{stage.name}', daemon=True)
+            for i, stage in enumerate(self.stages)
+            for _ in range(stage.workers)
+        ]
+        for thread in threads:
+            thread.start()
+
+        def feed():
+            for key, payload in items:
+                pending_keys.append(key)
+                if deadline.expired():
+                    break
+                queues[0].put((key, payload))
+            for _ in range(self.stages[0].workers):
+                queues[0].put(_DONE)
+
+        threading.Thread(target=feed, name='pipeline-feed', daemon=True).start()
+
+        try:
+            while True:
+                try:
+                    item = completed.get(timeout=deadline.remaining())
+                except queue.Empty:
+                    break
+                if item is _DONE:
+                    break
+                yield item
+        finally:
+            for pool in pools.values():
+                pool.shutdown(wait=finished.is_set(), cancel_futures=True)
+
+            elapsed = time.monotonic() - start
+            with lock:
+                for stats in result.stats:
+                    stats.elapsed_seconds = elapsed
+                result.timed_out = [
+                    key for key in pending_keys
+                    if key not in result.outputs and key not in result.errors
+                ]
+
+        for key in list(result.timed_out):
+            yield key, 'timed_out', None
+
+    @staticmethod
+    def _process_context():
+        """Start method for process stages (forking from worker threads is unsafe)"""
+        methods = multiprocessing.get_all_start_methods()
+        return multiprocessing.get_context('forkserver' if 'forkserver' in methods else 'spawn')
+
+    @staticmethod
+    def log_stats(stats: List[StageStats]):
+        """Log per-stage throughput, queue depth and utilization"""
+        for s in stats:
+            logger.info(
+                f"Stage {s.name}: {s.processed} items ({s.errors} errors), "
+                f"{s.throughput:.2f} items/s, queue avg {s.avg_queue_depth:.1f} / max {s.max_queue_depth}, "
+                f"utilization {s.utilization:.0%} of {s.workers} workers"
+            )
+
+
+def parse_stage(source: str, payload: Tuple[type, Any], window: Optional[DateWindow] = None) -> List[Dict[str, Any]]:
+    """Pipeline stage: parse a downloaded payload (module level so processes can run it)"""
+    scraper_class, raw = payload
+    if scraper_class is None:
+        return raw
+    scraper = scraper_class()
+    scraper.window = window
+    return scraper.parse_download(raw)
+
+
+def normalize_stage(
+    source: str,
+    events: List[Dict[str, Any]],
+    min_quality_score: int = 0,
+    window: Optional[DateWindow] = None
+) -> List[Any]:
+    """Pipeline stage: normalize parsed events (module level so processes can run it)"""
+    from .processors.normalizer import Normalizer
+    return Normalizer(source).normalize(events, min_quality_score=min_quality_score, window=window)
+
+
+def dedupe_stage(source: str, normalized: List[Any]) -> List[Any]:
+    """Pipeline stage: drop duplicate events within a source"""
+    from .processors.deduplicator import Deduplicator
+    return Deduplicator().deduplicate_events(normalized)
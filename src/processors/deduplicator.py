@@ -1,7 +1,13 @@
 """Cross-source event deduplication"""
+import time
 import logging
-from typing import List, Dict, Set
+from typing import TYPE_CHECKING, List, Dict, Set
+from dataclasses import replace
 from difflib import SequenceMatcher
+from ..instrumentation import metrics
+
+if TYPE_CHECKING:
+    from .normalizer import NormalizedEvent
 
 logger = logging.getLogger(__name__)
 
@@ -25,6 +31,12 @@ class Deduplicator:
 
     SIMILARITY_THRESHOLD = 0.85
 
+    # Fields _merge_metadata() may copy from a duplicate
+    MERGED_FIELDS = ('title', 'description', 'source_url', 'venue', 'age_range', 'price', 'time_range', 'categories')
+
+    # Fuzzy title comparisons made by the last deduplicate() call
+    comparisons = 0
+
     def deduplicate(self, events: List[Dict]) -> List[Dict]:
         """
         Deduplicate events list.
@@ -38,6 +50,9 @@ class Deduplicator:
         if not events:
             return []
 
+        start = time.perf_counter()
+        self.comparisons = 0
+
         # Track seen hashes and titles
         seen_hashes: Set[str] = set()
         seen_by_date: Dict[str, List[Dict]] = {}
@@ -79,8 +94,39 @@ class Deduplicator:
 
         logger.info(f"Deduplication: {len(events)} → {len(deduplicated)} ({duplicates_found} duplicates removed)")
 
+        metrics.observe('dedupe', time.perf_counter() - start)
+        metrics.count('dedup_comparisons', self.comparisons)
+        metrics.count('duplicates', duplicates_found)
+
         return deduplicated
 
+    def deduplicate_events(self, events: List['NormalizedEvent']) -> List['NormalizedEvent']:
+        """
+        Deduplicate NormalizedEvent objects, e.g. a scrape about to be stored.
+
+        The surviving objects are returned, not rebuilt from their
+        dictionaries (whose event_date is an ISO string), with any metadata
+        merged from their duplicates applied.
+
+        Args:
+            events: Normalized events
+
+        Returns:
+            Deduplicated NormalizedEvent objects with merged metadata
+        """
+        dicts = [event.to_dict() for event in events]
+        index = {id(d): i for i, d in enumerate(dicts)}
+
+        kept = []
+        for d in self.deduplicate(dicts):
+            event = events[index[id(d)]]
+            merged = {
+                field: d[field] for field in self.MERGED_FIELDS
+                if hasattr(event, field) and d.get(field) != getattr(event, field)
+            }
+            kept.append(replace(event, **merged) if merged else event)
+        return kept
+
     def _find_fuzzy_duplicate(self, event: Dict, candidates: List[Dict]) -> Dict:
         """
         Find fuzzy duplicate in candidates list.
@@ -92,6 +138,7 @@ class Deduplicator:
 
         for candidate in candidates:
             candidate_title = candidate.get('title', '').lower()
+            self.comparisons += 1
             similarity = SequenceMatcher(None, title, candidate_title).ratio()
 
             if similarity >= self.SIMILARITY_THRESHOLD:
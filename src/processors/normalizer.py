@@ -1,13 +1,20 @@
 """Data normalizer for event data"""
+import time
 import hashlib
 import logging
 from dataclasses import dataclass, asdict
 from datetime import datetime
 from typing import List, Dict, Any, Optional
+from ..instrumentation import metrics
+from .window import DateWindow
 
 logger = logging.getLogger(__name__)
 
 
+class _OutsideWindow(Exception):
+    """An event dated outside the requested window (skipped, not an error)"""
+
+
 @dataclass
 class NormalizedEvent:
     """Normalized event data structure matching database schema"""
@@ -30,6 +37,7 @@ class NormalizedEvent:
     age_range: Optional[str] = None
     price: Optional[str] = None
     is_free: bool = False
+    sub_source: Optional[str] = None  # Feed within a multi-feed source (not stored)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for database insertion"""
@@ -49,7 +57,8 @@ class Normalizer:
         self,
         events: List[Dict[str, Any]],
         min_quality_score: int = 0,
-        log_quality_stats: bool = True
+        log_quality_stats: bool = True,
+        window: Optional[DateWindow] = None
     ) -> List[NormalizedEvent]:
         """
         Normalize a list of raw event dictionaries.
@@ -58,17 +67,23 @@ class Normalizer:
             events: Raw event data from scraper
             min_quality_score: Minimum quality score (0-100) to include events (default: 0)
             log_quality_stats: Whether to log quality statistics (default: True)
+            window: Only keep events dated in this window; others are dropped
+                before they are hashed and scored (default: every event)
 
         Returns:
             List of NormalizedEvent objects
         """
+        start = time.perf_counter()
         normalized = []
         validation_errors = 0
         filtered_count = 0
+        outside_count = 0
+        if window is not None and not window.bounded:
+            window = None
 
         for event in events:
             try:
-                normalized_event = self._normalize_event(event)
+                normalized_event = self._normalize_event(event, window)
                 if normalized_event:
                     # Filter by quality score
                     if normalized_event.quality_score < min_quality_score:
@@ -79,6 +94,9 @@ class Normalizer:
                         continue
 
                     normalized.append(normalized_event)
+            except _OutsideWindow:
+                outside_count += 1
+                continue
             except Exception as e:
                 validation_errors += 1
                 logger.error(f"Validation error for event '{event.get('title', 'Unknown')}': {e}")
@@ -90,9 +108,18 @@ class Normalizer:
 
         logger.info(
             f"Normalized {len(normalized)} events "
-            f"({validation_errors} validation errors, {filtered_count} filtered by quality)"
+            f"({validation_errors} validation errors, {filtered_count} filtered by quality"
+            + (f", {outside_count} outside the date window" if outside_count else "")
+            + ")"
         )
 
+        metrics.observe('normalize', time.perf_counter() - start, source=self.source_name)
+        metrics.count('events_in', len(events), source=self.source_name)
+        metrics.count('events_out', len(normalized), source=self.source_name)
+        metrics.count('validation_errors', validation_errors, source=self.source_name)
+        metrics.count('quality_filtered', filtered_count, source=self.source_name)
+        metrics.count('window_filtered', outside_count, source=self.source_name)
+
         return normalized
 
     def _log_quality_stats(self, events: List[NormalizedEvent]) -> None:
@@ -120,8 +147,8 @@ class Normalizer:
             logger.warning(f"{low_quality} events below quality threshold (score < 50)")
         logger.info("=" * 50)
 
-    def _normalize_event(self, event: Dict[str, Any]) -> Optional[NormalizedEvent]:
-        """Normalize a single event."""
+    def _normalize_event(self, event: Dict[str, Any], window: Optional[DateWindow] = None) -> Optional[NormalizedEvent]:
+        """Normalize a single event (raises _OutsideWindow for events outside window)."""
 
         # Validate required fields
         title = event.get('title', '').strip()
@@ -134,6 +161,8 @@ class Normalizer:
         if not event_date:
             logger.warning(f"Event '{title}' missing valid event_date")
             return None
+        if window is not None and not window.contains(event_date):
+            raise _OutsideWindow()
 
         # Extract optional fields with defaults
         description = event.get('description', '')[:2000] if event.get('description') else None
@@ -144,6 +173,7 @@ class Normalizer:
         age_range = event.get('age_range', '')[:50] if event.get('age_range') else None
         price = event.get('price', '')[:100] if event.get('price') else None
         is_free = event.get('is_free', False)
+        sub_source = event.get('sub_source')
 
         # Generate content hash
         content_hash = self._generate_content_hash(title, event_date, description or '')
@@ -171,7 +201,8 @@ class Normalizer:
             source_event_id=source_event_id,
             age_range=age_range,
             price=price,
-            is_free=is_free
+            is_free=is_free,
+            sub_source=sub_source
         )
 
     def _parse_date(self, date_str: str) -> Optional[datetime]:
@@ -0,0 +1,93 @@
+"""Date windows for requests that only want some events"""
+from datetime import date, datetime, time, timedelta, tzinfo
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Union
+from zoneinfo import ZoneInfo
+
+from ..config import Config
+
+
+def _naive(value: Union[date, datetime, str]) -> datetime:
+    """Wall-clock datetime in Config.TIMEZONE for comparison (dates are midnight)"""
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if not isinstance(value, datetime):
+        return datetime.combine(value, time())
+    if value.tzinfo is not None:
+        value = value.astimezone(ZoneInfo(Config.TIMEZONE))
+    return value.replace(tzinfo=None)
+
+
+class DateWindow(NamedTuple):
+    """
+    Half-open [start, end) range of event dates.
+
+    Either side may be None to leave it open. Bounds and event dates are
+    compared as wall-clock times in Config.TIMEZONE, as the sources
+    publish them.
+    """
+
+    start: Optional[datetime] = None
+    end: Optional[datetime] = None
+
+    @classmethod
+    def upcoming(cls, days: Optional[int], now: Optional[datetime] = None) -> 'DateWindow':
+        """
+        Window from the start of today through the next days days.
+
+        Args:
+            days: Days covered, today included (None: open-ended)
+            now: Current time; aware times are converted to Config.TIMEZONE
+                (default: now there)
+        """
+        tz = ZoneInfo(Config.TIMEZONE)
+        now = datetime.now(tz) if now is None else now
+        if now.tzinfo is not None:
+            now = now.astimezone(tz)
+        today = _naive(now.date())
+        return cls(today, None if days is None else today + timedelta(days=days))
+
+    @property
+    def bounded(self) -> bool:
+        """Whether the window excludes anything"""
+        return self.start is not None or self.end is not None
+
+    def localized(self, tz: Optional[tzinfo] = None) -> 'DateWindow':
+        """
+        The window with aware bounds, for comparing against stored timestamps.
+
+        Naive bounds are wall-clock times in tz; aware ones are converted.
+
+        Args:
+            tz: Time zone (default: Config.TIMEZONE)
+        """
+        tz = tz or ZoneInfo(Config.TIMEZONE)
+
+        def pin(bound: Optional[datetime]) -> Optional[datetime]:
+            if bound is None:
+                return None
+            bound = datetime.combine(bound, time()) if not isinstance(bound, datetime) else bound
+            return bound.replace(tzinfo=tz) if bound.tzinfo is None else bound.astimezone(tz)
+
+        return DateWindow(pin(self.start), pin(self.end))
+
+    def contains(self, when: Union[date, datetime, str, None]) -> bool:
+        """Whether an event date falls in the window (undated events do not)"""
+        if when is None:
+            return not self.bounded
+        when = _naive(when)
+        if self.start is not None and when < _naive(self.start):
+            return False
+        if self.end is not None and when >= _naive(self.end):
+            return False
+        return True
+
+    def overlaps(self, start: Union[date, datetime], end: Union[date, datetime]) -> bool:
+        """Whether the window overlaps the range [start, end)"""
+        return (self.end is None or _naive(start) < _naive(self.end)) and \
+            (self.start is None or _naive(end) > _naive(self.start))
+
+    def filter(self, events: Iterable[Dict[str, Any]], field: str = 'event_date') -> List[Dict[str, Any]]:
+        """Events (dictionaries with datetime or ISO event dates) that fall in the window"""
+        if not self.bounded:
+            return list(events)
+        return [event for event in events if self.contains(event.get(field))]
@@ -0,0 +1,216 @@
+"""CPU and memory profiling for orchestrator runs"""
+import cProfile
+import pstats
+import logging
+import threading
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+logger = logging.getLogger(__name__)
+
+_NOOP_SECTION = nullcontext()
+
+# (source, stage) a profile was collected for; either may be None
+SectionKey = Tuple[Optional[str], Optional[str]]
+
+
+class Profiler:
+    """
+    Profile a run per source and per stage, across worker threads.
+
+    cProfile only sees the thread that enabled it, so every section()
+    runs its own profiler on the calling thread. Entering a nested
+    section pauses the enclosing one, so each call is counted once under
+    the innermost (source, stage). At the end the profiles are merged
+    into one .prof file per source, one per stage and one for the whole
+    run, and the top hotspots are logged.
+
+    Memory tracing uses tracemalloc, which covers every thread; it
+    reports the run's peak traced memory and the top allocation sites.
+    Work in pipeline process stages runs outside this process and is
+    not profiled.
+    """
+
+    def __init__(self):
+        self.profile_cpu = False
+        self.trace_memory = False
+        self._profiles: Dict[SectionKey, List[cProfile.Profile]] = {}
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._warned = False
+
+    @property
+    def enabled(self) -> bool:
+        """Whether any profiling is active"""
+        return self.profile_cpu or self.trace_memory
+
+    def start(self, profile_cpu: bool = True, trace_memory: bool = False):
+        """
+        Start profiling.
+
+        Args:
+            profile_cpu: Collect cProfile data in section()s
+            trace_memory: Trace allocations with tracemalloc
+        """
+        self._profiles.clear()
+        self.profile_cpu = profile_cpu
+        self.trace_memory = trace_memory
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    def section(self, source: Optional[str] = None, stage: Optional[str] = None):
+        """
+        Profile a block of code as part of a source and/or stage.
+
+        Labels not given are inherited from the enclosing section on the
+        same thread.
+
+        Usage:
+            with profiler.section(source='knco', stage='normalize'):
+                ...
+        """
+        if not self.profile_cpu:
+            return _NOOP_SECTION
+        return self._section(source, stage)
+
+    def stop(self, output_dir: Union[str, Path], top_n: int = 20) -> List[Path]:
+        """
+        Stop profiling, write the artifacts and log the summary.
+
+        Args:
+            output_dir: Directory for a new timestamped profile folder
+            top_n: Number of hotspots and allocation sites to log
+
+        Returns:
+            Paths of the files written
+        """
+        run_dir = Path(output_dir) / f"profile-{datetime.now().strftime('%Y%m%dT%H%M%S')}"
+        run_dir.mkdir(parents=True, exist_ok=True)
+        written = []
+
+        if self.profile_cpu:
+            self.profile_cpu = False
+            written.extend(self._write_cpu(run_dir, top_n))
+
+        if self.trace_memory:
+            self.trace_memory = False
+            written.extend(self._write_memory(run_dir, top_n))
+
+        logger.info(f"Wrote {len(written)} profile artifacts to {run_dir}")
+        return written
+
+    @contextmanager
+    def _section(self, source: Optional[str], stage: Optional[str]):
+        """Context manager behind an enabled section()"""
+        stack = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+
+        parent_key, parent = stack[-1] if stack else ((None, None), None)
+        key = (source or parent_key[0], stage or parent_key[1])
+
+        if parent is not None:
+            parent.disable()
+
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError as e:
+            # Another profiler already owns this thread (or, on Python
+            # 3.12+, the interpreter)
+            if not self._warned:
+                logger.warning(f"Profiling unavailable for part of the run: {e}")
+                self._warned = True
+            profile = None
+
+        stack.append((key, profile))
+        try:
+            yield
+        finally:
+            stack.pop()
+            if profile is not None:
+                profile.disable()
+                with self._lock:
+                    self._profiles.setdefault(key, []).append(profile)
+            if parent is not None:
+                parent.enable()
+
+    def _write_cpu(self, run_dir: Path, top_n: int) -> List[Path]:
+        """Merge and write per-source, per-stage and whole-run profiles"""
+        with self._lock:
+            profiles = dict(self._profiles)
+            self._profiles.clear()
+
+        groups: Dict[str, List[cProfile.Profile]] = {'run': []}
+        for (source, stage), section_profiles in profiles.items():
+            groups['run'].extend(section_profiles)
+            if source:
+                groups.setdefault(f'source-{source}', []).extend(section_profiles)
+            if stage:
+                groups.setdefault(f'stage-{stage}', []).extend(section_profiles)
+
+        written = []
+        for name, group in groups.items():
+            stats = self._merge(group)
+            if stats is None:
+                continue
+            path = run_dir / f"{name}.prof"
+            stats.dump_stats(str(path))
+            written.append(path)
+
+            if name == 'run':
+                self._log_hotspots(stats, top_n)
+            else:
+                logger.info(f"Profile {name}: {stats.total_tt:.3f}s CPU in profiled code")
+        return written
+
+    def _write_memory(self, run_dir: Path, top_n: int) -> List[Path]:
+        """Log peak memory and top allocation sites, and dump the snapshot"""
+        snapshot = tracemalloc.take_snapshot()
+        current, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        logger.info(f"Memory: peak {peak / 1024 / 1024:.1f} MiB traced, {current / 1024 / 1024:.1f} MiB at end of run")
+        snapshot = snapshot.filter_traces([
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, '<frozen importlib._bootstrap>'),
+        ])
+        for i, stat in enumerate(snapshot.statistics('lineno')[:top_n], 1):
+            frame = stat.traceback[0]
+            logger.info(f"  #{i} {stat.size / 1024:.1f} KiB in {stat.count} blocks: {frame.filename}:{frame.lineno}")
+
+        path = run_dir / 'memory.snapshot'
+        snapshot.dump(str(path))
+        return [path]
+
+    @staticmethod
+    def _merge(profiles: List[cProfile.Profile]) -> Optional[pstats.Stats]:
+        """Merge profiles into one Stats (None if nothing was recorded)"""
+        merged = None
+        for profile in profiles:
+            profile.create_stats()
+            if not profile.stats:
+                continue
+            if merged is None:
+                merged = pstats.Stats(profile)
+            else:
+                merged.add(profile)
+        return merged
+
+    @staticmethod
+    def _log_hotspots(stats: pstats.Stats, top_n: int):
+        """Log the functions with the most time spent in their own code"""
+        rows = sorted(stats.stats.items(), key=lambda item: item[1][2], reverse=True)[:top_n]
+        logger.info(f"Top {len(rows)} hotspots by own time ({stats.total_tt:.3f}s profiled):")
+        for (filename, lineno, function), (_, calls, own, cumulative, _) in rows:
+            logger.info(
+                f"  {own:8.3f}s own {cumulative:8.3f}s cum {calls:>8} calls  "
+                f"{pstats.func_std_string((filename, lineno, function))}"
+            )
+
+
+# Process-wide instance; idle until started (e.g. by --profile)
+profiler = Profiler()
@@ -0,0 +1 @@
+"""Scheduling of scraper runs"""
@@ -0,0 +1,189 @@
+"""Deadlines and deadline-bounded parallel execution"""
+import time
+import logging
+from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor, Future, FIRST_COMPLETED, wait
+from typing import List, Dict, Any, Callable, Iterator, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class Deadline:
+    """
+    A point in time by which work must finish.
+
+    Measured on the monotonic clock so wall-clock adjustments do not move
+    it. A deadline created with seconds=None never expires.
+    """
+
+    def __init__(self, seconds: Optional[float] = None):
+        """
+        Initialize deadline.
+
+        Args:
+            seconds: Budget from now in seconds (None for no deadline)
+        """
+        self.expires_at = None if seconds is None else time.monotonic() + seconds
+
+    def remaining(self) -> Optional[float]:
+        """Seconds left (never negative), or None if the deadline is unbounded"""
+        if self.expires_at is None:
+            return None
+        return max(0.0, self.expires_at - time.monotonic())
+
+    def expired(self) -> bool:
+        """Whether the deadline has passed"""
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    def sooner(self, other: 'Deadline') -> 'Deadline':
+        """Get whichever of this deadline and other expires first"""
+        if other.expires_at is None:
+            return self
+        if self.expires_at is None or other.expires_at < self.expires_at:
+            return other
+        return self
+
+    def cap(self, seconds: float) -> float:
+        """Limit a timeout in seconds to the time remaining"""
+        remaining = self.remaining()
+        return seconds if remaining is None else min(seconds, remaining)
+
+    def __repr__(self) -> str:
+        remaining = self.remaining()
+        return 'Deadline(unbounded)' if remaining is None else f'Deadline({remaining:.1f}s left)'
+
+
+@dataclass
+class ScheduleOutcome:
+    """Results of a DeadlineScheduler run, each in completion order"""
+    results: Dict[str, Any] = field(default_factory=dict)
+    errors: Dict[str, BaseException] = field(default_factory=dict)
+    timed_out: List[str] = field(default_factory=list)
+
+
+class DeadlineScheduler:
+    """
+    Run tasks in parallel under a global run budget and per-task budgets.
+
+    Each task is called with its Deadline: the sooner of the run deadline
+    and its own budget, counted from submission. Results that complete
+    in time are always kept. When a task's deadline passes the scheduler
+    stops waiting for it, reports it as timed out and calls on_timeout so
+    the caller can cancel the work; worker threads are never joined, so a
+    task that ignores cancellation cannot hold up the run.
+    """
+
+    def __init__(self, run_deadline: Optional[Deadline] = None, max_workers: Optional[int] = None):
+        """
+        Initialize scheduler.
+
+        Args:
+            run_deadline: Deadline for the whole run (default: unbounded)
+            max_workers: Worker threads (default: one per task)
+        """
+        self.run_deadline = run_deadline or Deadline()
+        self.max_workers = max_workers
+
+    def run(
+        self,
+        tasks: Dict[str, Callable[[Deadline], Any]],
+        timeout: Optional[float] = None,
+        on_timeout: Optional[Callable[[str], None]] = None,
+        timeouts: Optional[Dict[str, float]] = None
+    ) -> ScheduleOutcome:
+        """
+        Run tasks until they all finish or their deadlines pass.
+
+        Args:
+            tasks: Callable for each key, called with the task's Deadline
+            timeout: Per-task budget in seconds (None for only the run deadline)
+            on_timeout: Called with the key of each task that overruns
+            timeouts: Budgets for specific keys, overriding timeout
+
+        Returns:
+            ScheduleOutcome with results, errors and timed out keys
+        """
+        outcome = ScheduleOutcome()
+        for key, status, value in self.as_completed(tasks, timeout, on_timeout, timeouts):
+            if status == 'done':
+                outcome.results[key] = value
+            elif status == 'error':
+                outcome.errors[key] = value
+            else:
+                outcome.timed_out.append(key)
+        return outcome
+
+    def as_completed(
+        self,
+        tasks: Dict[str, Callable[[Deadline], Any]],
+        timeout: Optional[float] = None,
+        on_timeout: Optional[Callable[[str], None]] = None,
+        timeouts: Optional[Dict[str, float]] = None
+    ) -> Iterator[Tuple[str, str, Any]]:
+        """
+        Run tasks, yielding each one's outcome as soon as it is known.
+
+        Takes the same arguments as run(). Closing the iterator early
+        treats the unfinished tasks as timed out: on_timeout is called for
+        each, but they are not yielded.
+
+        Yields:
+            (key, status, value) where status is 'done' (value is the
+            task's result), 'error' (value is the exception it raised) or
+            'timed_out' (value is None)
+        """
+        if not tasks:
+            return
+
+        executor = ThreadPoolExecutor(
+            max_workers=self.max_workers or len(tasks),
+            thread_name_prefix='deadline'
+        )
+        keys: Dict[Future, str] = {}
+        deadlines: Dict[Future, Deadline] = {}
+        pending = set()
+
+        try:
+            for key, task in tasks.items():
+                budget = (timeouts or {}).get(key, timeout)
+                deadline = self.run_deadline.sooner(Deadline(budget))
+                future = executor.submit(task, deadline)
+                keys[future] = key
+                deadlines[future] = deadline
+                pending.add(future)
+
+            while pending:
+                remaining = [r for r in (deadlines[f].remaining() for f in pending) if r is not None]
+                done, pending = wait(
+                    pending,
+                    timeout=min(remaining) if remaining else None,
+                    return_when=FIRST_COMPLETED
+                )
+
+                for future in done:
+                    try:
+                        result = future.result()
+                    except BaseException as e:
+                        yield keys[future], 'error', e
+                    else:
+                        yield keys[future], 'done', result
+
+                for future in [f for f in pending if deadlines[f].expired()]:
+                    pending.discard(future)
+                    self._time_out(future, keys[future], on_timeout)
+                    yield keys[future], 'timed_out', None
+        finally:
+            # Tasks still pending here were abandoned by the caller
+            for future in pending:
+                self._time_out(future, keys[future], on_timeout)
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    @staticmethod
+    def _time_out(future: Future, key: str, on_timeout: Optional[Callable[[str], None]]):
+        """Stop waiting for a task and let the caller cancel its work"""
+        future.cancel()
+        if on_timeout is not None:
+            try:
+                on_timeout(key)
+            except Exception as e:
+                logger.error(f"Error cancelling {key}: {e}")
@@ -0,0 +1,240 @@
+"""Per-host politeness limits shared by every scraper"""
+import time
+import logging
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Deque, Dict, Optional
+from urllib.parse import urlsplit
+
+from ..config import Config
+from ..instrumentation import metrics
+
+logger = logging.getLogger(__name__)
+
+
+class TokenBucket:
+    """
+    Token bucket rate limiter.
+
+    Holds up to burst tokens and refills at rate tokens per second; each
+    request takes one. A rate of 0 or less means unlimited.
+    """
+
+    def __init__(self, rate: float, burst: float = 1):
+        """
+        Initialize bucket (full).
+
+        Args:
+            rate: Tokens added per second
+            burst: Maximum tokens held (at least 1)
+        """
+        self.rate = rate
+        self.burst = max(1.0, float(burst))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def delay(self) -> float:
+        """Seconds until a token is available (0 if one is now)"""
+        if self.rate <= 0:
+            return 0.0
+        with self._lock:
+            self._refill()
+            return 0.0 if self._tokens >= 1 else (1 - self._tokens) / self.rate
+
+    def try_take(self) -> bool:
+        """Take a token if one is available"""
+        if self.rate <= 0:
+            return True
+        with self._lock:
+            self._refill()
+            if self._tokens < 1:
+                return False
+            self._tokens -= 1
+            return True
+
+    def _refill(self):
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+
+class _Host:
+    """Limits and in-flight requests for one host"""
+
+    def __init__(self, connections: int, bucket: TokenBucket):
+        self.connections = connections
+        self.bucket = bucket
+        self.active = 0
+
+    def ready(self) -> bool:
+        return self.active < self.connections and self.bucket.delay() == 0
+
+
+class _Ticket:
+    """A request waiting for a slot"""
+
+    def __init__(self, source: str, host: _Host):
+        self.source = source
+        self.host = host
+
+
+class PolitenessScheduler:
+    """
+    Admit HTTP requests from all scrapers under global and per-host limits.
+
+    A request holds a slot for its duration. Slots are limited to
+    max_concurrency overall and host_connections per host, and each host
+    admits requests at up to host_qps (token bucket, bursting to
+    host_burst). Waiting requests are served round-robin by source, so a
+    source issuing many requests cannot starve the others; a request that
+    can't start yet because its host is busy does not block requests for
+    other hosts.
+
+    Hosts are keyed without a leading "www.", so nevadacountyca.gov and
+    www.nevadacountyca.gov share one set of limits.
+    """
+
+    # Longest single wait before re-checking for cancellation
+    POLL_SECONDS = 0.25
+
+    def __init__(
+        self,
+        max_concurrency: int = 8,
+        host_connections: int = 2,
+        host_qps: float = 1.0,
+        host_burst: int = 2,
+        host_qps_overrides: Dict[str, float] = None
+    ):
+        """
+        Initialize scheduler.
+
+        Args:
+            max_concurrency: Requests in flight across all hosts
+            host_connections: Requests in flight per host
+            host_qps: Requests started per second per host (0 for unlimited)
+            host_burst: Requests a host may start back to back after idling
+            host_qps_overrides: host_qps for specific hosts
+        """
+        self.max_concurrency = max_concurrency
+        self.host_connections = host_connections
+        self.host_qps = host_qps
+        self.host_burst = host_burst
+        self.host_qps_overrides = {self.host_key(h): qps for h, qps in (host_qps_overrides or {}).items()}
+
+        self._cond = threading.Condition()
+        self._active = 0
+        self._hosts: Dict[str, _Host] = {}
+        self._waiting: Dict[str, Deque[_Ticket]] = {}
+        self._turns: Deque[str] = deque()
+
+    @staticmethod
+    def host_key(url: str) -> str:
+        """Host a URL (or bare host name) is rate limited under"""
+        host = (urlsplit(url).hostname if '//' in url else url).lower()
+        return host[4:] if host.startswith('www.') else host
+
+    @contextmanager
+    def slot(self, url: str, source: Optional[str] = None, check: Optional[Callable[[], None]] = None):
+        """
+        Hold a request slot for url's host.
+
+        Usage:
+            with politeness.slot(url, source='county', check=self.check_cancelled):
+                response = session.get(url)
+
+        Args:
+            url: URL (or host) being requested
+            source: Source the request is for, for fair queuing
+            check: Called while waiting; raise from it to stop waiting
+                (e.g. when the scrape is cancelled)
+        """
+        key = self.host_key(url)
+        start = time.monotonic()
+        with self._cond:
+            host = self._host(key)
+            ticket = _Ticket(source or '', host)
+            self._enqueue(ticket)
+            try:
+                while self._next() is not ticket:
+                    self._cond.wait(self._wait_time(host))
+                    if check is not None:
+                        check()
+            except BaseException:
+                self._dequeue(ticket)
+                self._cond.notify_all()
+                raise
+            self._start(ticket)
+
+        waited = time.monotonic() - start
+        if waited > 0.01:
+            logger.debug(f"Waited {waited:.2f}s for a slot on {key}")
+        metrics.observe('politeness_wait', waited, host=key)
+
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._active -= 1
+                host.active -= 1
+                self._cond.notify_all()
+
+    def _host(self, key: str) -> _Host:
+        host = self._hosts.get(key)
+        if host is None:
+            rate = self.host_qps_overrides.get(key, self.host_qps)
+            host = self._hosts[key] = _Host(self.host_connections, TokenBucket(rate, self.host_burst))
+        return host
+
+    def _enqueue(self, ticket: _Ticket):
+        queue = self._waiting.setdefault(ticket.source, deque())
+        if not queue:
+            self._turns.append(ticket.source)
+        queue.append(ticket)
+
+    def _dequeue(self, ticket: _Ticket):
+        queue = self._waiting[ticket.source]
+        queue.remove(ticket)
+        if not queue:
+            del self._waiting[ticket.source]
+            self._turns.remove(ticket.source)
+
+    def _next(self) -> Optional[_Ticket]:
+        """Ticket to admit next: the first ready one in round-robin source order"""
+        if self._active >= self.max_concurrency:
+            return None
+        for source in self._turns:
+            for ticket in self._waiting[source]:
+                if ticket.host.ready():
+                    return ticket
+        return None
+
+    def _start(self, ticket: _Ticket):
+        """Admit a ticket and give its source's turn to the next source"""
+        self._dequeue(ticket)
+        if ticket.source in self._waiting:
+            self._turns.remove(ticket.source)
+            self._turns.append(ticket.source)
+        ticket.host.bucket.try_take()
+        ticket.host.active += 1
+        self._active += 1
+        # Another waiter may now be next in line
+        self._cond.notify_all()
+
+    def _wait_time(self, host: _Host) -> float:
+        """How long to sleep before re-checking (token refills don't notify)"""
+        delay = host.bucket.delay()
+        if delay > 0 and host.active < host.connections:
+            return min(self.POLL_SECONDS, delay)
+        return self.POLL_SECONDS
+
+
+# Process-wide scheduler shared by all scrapers
+politeness = PolitenessScheduler(
+    max_concurrency=Config.SCRAPER_MAX_WORKERS,
+    host_connections=Config.HOST_MAX_CONNECTIONS,
+    host_qps=Config.HOST_QPS,
+    host_burst=Config.HOST_BURST,
+    host_qps_overrides=Config.HOST_QPS_LIMITS,
+)
@@ -0,0 +1,362 @@
+"""Retries, hedged requests and circuit breakers for scraper fetches"""
+import time
+import random
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional, Sequence, Tuple, Type, Union
+
+from ..config import Config
+from ..instrumentation import metrics
+from ..storage.state import JsonStateFile
+from .deadline import Deadline
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling a source whose circuit breaker is open"""
+
+
+class SourceUnavailable(Exception):
+    """
+    Raised by a fetch that could only be answered from last good payloads.
+
+    The events parsed from those payloads are attached, but they are not
+    a fresh scrape: callers must not store them as one (that would reset
+    scraped_at and tell the adaptive TTL the content was unchanged).
+    """
+
+    def __init__(self, source: str, events: list):
+        super().__init__(f"{source} is unavailable; {len(events)} events parsed from last good payloads")
+        self.source = source
+        self.events = events
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """Nearest-rank q-th percentile (0-100) of a non-empty sequence"""
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(q / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+class RetryPolicy:
+    """Exponential backoff with full jitter"""
+
+    def __init__(self, attempts: int = 3, base_delay: float = 0.5, max_delay: float = 8.0):
+        """
+        Initialize policy.
+
+        Args:
+            attempts: Total tries, including the first
+            base_delay: Backoff ceiling in seconds before the first retry
+            max_delay: Largest backoff ceiling
+        """
+        self.attempts = max(1, attempts)
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+
+    def backoff(self, retry: int) -> float:
+        """Seconds to wait before the given retry (1 = first retry)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (retry - 1)))
+
+
+class LatencyTracker:
+    """
+    Recent latencies per key, kept across runs.
+
+    Samples are stored in a JsonStateFile so one-shot CLI runs build up
+    a history; only the newest window samples per key are kept. New
+    samples are buffered in memory and written by flush(), which the
+    orchestrator calls once per run, so a run does not rewrite the file
+    on every request.
+    """
+
+    def __init__(self, state_path: Union[str, Path, None] = None, window: int = 100):
+        """
+        Initialize tracker.
+
+        Args:
+            state_path: JSON file of samples (default: Config.STATE_DIR / 'latency.json')
+            window: Samples kept per key
+        """
+        self.state = JsonStateFile(state_path or Config.STATE_DIR / 'latency.json')
+        self.window = window
+        self._pending: Dict[str, list] = {}
+        self._pending_lock = threading.Lock()
+
+    def record(self, key: str, seconds: float):
+        """Add a latency sample (written on the next flush())"""
+        with self._pending_lock:
+            samples = self._pending.setdefault(key, [])
+            samples.append(round(seconds, 4))
+            del samples[:-self.window]
+
+    def flush(self):
+        """Write the buffered samples to the state file"""
+        with self._pending_lock:
+            pending, self._pending = self._pending, {}
+        if not pending:
+            return
+
+        def mutate(data: Dict[str, Any]):
+            for key, new_samples in pending.items():
+                samples = data.setdefault(key, [])
+                samples.extend(new_samples)
+                del samples[:-self.window]
+
+        self.state.update(mutate)
+
+    def samples(self, key: str) -> list:
+        """Recorded samples for key, oldest first"""
+        return self.history().get(key, [])
+
+    def history(self) -> Dict[str, list]:
+        """Recorded samples per key, oldest first (unflushed ones included)"""
+        with self._pending_lock:
+            pending = {key: list(samples) for key, samples in self._pending.items()}
+        history = {key: list(samples) for key, samples in self.state.load().items()}
+        for key, samples in pending.items():
+            history[key] = (history.get(key, []) + samples)[-self.window:]
+        return history
+
+    def percentile(self, key: str, q: float, min_samples: int = 1) -> Optional[float]:
+        """
+        Get the q-th percentile (0-100) of key's latencies.
+
+        Returns:
+            Latency in seconds, or None with fewer than min_samples samples
+        """
+        samples = self.samples(key)
+        if not samples or len(samples) < min_samples:
+            return None
+        return percentile(samples, q)
+
+
+class CircuitBreaker:
+    """
+    Per-key circuit breaker.
+
+    After failure_threshold consecutive failed calls the circuit opens
+    and calls are refused for reset_seconds. Then one trial call is let
+    through (half-open): success closes the circuit, failure reopens it.
+    State is kept in a JsonStateFile so an open circuit also holds off
+    the next CLI runs.
+    """
+
+    def __init__(
+        self,
+        state_path: Union[str, Path, None] = None,
+        failure_threshold: int = 3,
+        reset_seconds: float = 300
+    ):
+        """
+        Initialize breaker.
+
+        Args:
+            state_path: JSON file of circuit state (default: Config.STATE_DIR / 'circuits.json')
+            failure_threshold: Consecutive failures that open the circuit
+            reset_seconds: How long an open circuit refuses calls
+        """
+        self.state = JsonStateFile(state_path or Config.STATE_DIR / 'circuits.json')
+        self.failure_threshold = failure_threshold
+        self.reset_seconds = reset_seconds
+        self._lock = threading.Lock()
+        self._trials = set()
+
+    def allow(self, key: str, now: Optional[float] = None) -> bool:
+        """Whether a call for key may go ahead (claims the half-open trial)"""
+        now = time.time() if now is None else now
+        entry = self.state.load().get(key, {})
+        if entry.get('open_until', 0) <= now:
+            if entry.get('open_until'):
+                with self._lock:
+                    if key in self._trials:
+                        return False
+                    self._trials.add(key)
+            return True
+        return False
+
+    def state_of(self, key: str, now: Optional[float] = None) -> str:
+        """'closed', 'open' or 'half-open'"""
+        now = time.time() if now is None else now
+        open_until = self.state.load().get(key, {}).get('open_until')
+        if not open_until:
+            return 'closed'
+        return 'open' if open_until > now else 'half-open'
+
+    def release(self, key: str):
+        """Give up a half-open trial without recording an outcome"""
+        with self._lock:
+            self._trials.discard(key)
+
+    def success(self, key: str):
+        """Record a successful call"""
+        with self._lock:
+            self._trials.discard(key)
+        if self.state.load().get(key):
+            self.state.update(lambda data: data.pop(key, None))
+
+    def failure(self, key: str, now: Optional[float] = None):
+        """Record a failed call, opening the circuit at the threshold"""
+        now = time.time() if now is None else now
+        with self._lock:
+            trial = key in self._trials
+            self._trials.discard(key)
+
+        def mutate(data: Dict[str, Any]):
+            entry = data.setdefault(key, {'failures': 0})
+            entry['failures'] = entry.get('failures', 0) + 1
+            if trial or entry['failures'] >= self.failure_threshold:
+                entry['open_until'] = now + self.reset_seconds
+
+        entry = self.state.update(mutate)[key]
+        if entry.get('open_until', 0) > now:
+            logger.warning(f"Circuit for {key} open for {self.reset_seconds:.0f}s after {entry['failures']} failures")
+
+
+class Resilience:
+    """
+    Wrap fetches in retries, optional hedging and a circuit breaker.
+
+    call() retries failures with exponential backoff and jitter as long
+    as the deadline leaves room, optionally sends a second (hedged)
+    attempt when the first is slower than the key's historical p95, and
+    records the outcome with the circuit breaker. While the circuit is
+    open, or once every attempt has failed, the fallback is served
+    instead when one is given.
+    """
+
+    # Samples needed before hedging uses a key's p95
+    HEDGE_MIN_SAMPLES = 20
+
+    def __init__(
+        self,
+        policy: Optional[RetryPolicy] = None,
+        breaker: Optional[CircuitBreaker] = None,
+        latencies: Optional[LatencyTracker] = None,
+        hedge: bool = False
+    ):
+        """
+        Initialize resilience layer.
+
+        Args:
+            policy: Retry policy (default: from Config)
+            breaker: Circuit breaker (default: from Config)
+            latencies: Latency history used for hedging (default: Config.STATE_DIR)
+            hedge: Send hedged attempts for slow calls
+        """
+        self.policy = policy or RetryPolicy(Config.RETRY_ATTEMPTS, Config.RETRY_BASE_DELAY, Config.RETRY_MAX_DELAY)
+        self.breaker = breaker or CircuitBreaker(
+            failure_threshold=Config.CIRCUIT_FAILURE_THRESHOLD,
+            reset_seconds=Config.CIRCUIT_RESET_SECONDS
+        )
+        self.latencies = latencies or LatencyTracker()
+        self.hedge = hedge
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+    def call(
+        self,
+        key: str,
+        func: Callable[[], Any],
+        retry_on: Tuple[Type[BaseException], ...] = (Exception,),
+        deadline: Optional[Deadline] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        fallback: Optional[Callable[[], Any]] = None
+    ) -> Any:
+        """
+        Call func with retries, hedging and circuit breaking.
+
+        Args:
+            key: Circuit breaker and latency key (e.g. the source name)
+            func: The fetch to make
+            retry_on: Exceptions worth retrying; others propagate at once
+            deadline: No retry is started that would sleep past this
+            sleep: Backoff sleep (e.g. a scraper's cancellable sleep)
+            fallback: Called for a result when the circuit is open or
+                every attempt failed (e.g. serve the last good payload)
+
+        Returns:
+            func's result, or fallback's
+
+        Raises:
+            CircuitOpenError: The circuit is open and there is no fallback
+        """
+        deadline = deadline or Deadline()
+
+        if not self.breaker.allow(key):
+            metrics.count('circuit_open', key=key)
+            if fallback is not None:
+                return fallback()
+            raise CircuitOpenError(f"Circuit for {key} is open")
+
+        try:
+            return self._attempt(key, func, retry_on, deadline, sleep, fallback)
+        except BaseException:
+            # Cancelled, or an error not worth retrying: no verdict on the source
+            self.breaker.release(key)
+            raise
+
+    def _attempt(self, key, func, retry_on, deadline, sleep, fallback) -> Any:
+        """The retry loop behind call()"""
+        for attempt in range(1, self.policy.attempts + 1):
+            start = time.monotonic()
+            try:
+                result = self._hedged(key, func) if self.hedge else func()
+            except retry_on as e:
+                delay = self.policy.backoff(attempt)
+                remaining = deadline.remaining()
+                if attempt == self.policy.attempts or (remaining is not None and delay >= remaining):
+                    self.breaker.failure(key)
+                    if fallback is not None:
+                        logger.warning(f"{key} failed after {attempt} attempts ({e}); serving last good payload")
+                        return fallback()
+                    raise
+                logger.info(f"{key} attempt {attempt} failed ({e}); retrying in {delay:.1f}s")
+                metrics.count('retries', key=key)
+                sleep(delay)
+                continue
+
+            self.latencies.record(key, time.monotonic() - start)
+            self.breaker.success(key)
+            return result
+
+    def _hedged(self, key: str, func: Callable[[], Any]) -> Any:
+        """Call func, starting a second attempt if it outlasts the p95"""
+        hedge_after = self.latencies.percentile(key, 95, self.HEDGE_MIN_SAMPLES)
+        if hedge_after is None:
+            return func()
+
+        executor = self._get_executor()
+        first = executor.submit(func)
+        done, _ = wait([first], timeout=hedge_after)
+        if done:
+            return first.result()
+
+        logger.info(f"{key} slower than p95 ({hedge_after:.1f}s); sending hedged request")
+        metrics.count('hedged_requests', key=key)
+        pending = {first, executor.submit(func)}
+        error = None
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in done:
+                try:
+                    return future.result()
+                except BaseException as e:
+                    error = e
+        raise error
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        with self._executor_lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=2 * Config.SCRAPER_MAX_WORKERS,
+                    thread_name_prefix='hedge'
+                )
+            return self._executor
+
+
+# Process-wide instance used by scraper sessions
+resilience = Resilience(hedge=Config.HEDGE_REQUESTS)
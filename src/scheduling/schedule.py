@@ -0,0 +1,125 @@
+"""Interval and cron-style refresh schedules"""
+import re
+from datetime import datetime, timedelta
+from typing import Set
+
+
+class IntervalSchedule:
+    """Run every fixed number of seconds"""
+
+    UNITS = {'': 1, 's': 1, 'm': 60, 'h': 3600, 'd': 86400}
+
+    def __init__(self, seconds: float):
+        if seconds <= 0:
+            raise ValueError(f"Interval must be positive: {seconds}")
+        self.seconds = seconds
+
+    def next_after(self, timestamp: float) -> float:
+        """Get the next run time (epoch seconds) after timestamp"""
+        return timestamp + self.seconds
+
+    def __str__(self) -> str:
+        return f"every {self.seconds:g}s"
+
+
+class CronSchedule:
+    """
+    Run at times matching a five-field cron expression.
+
+    Fields are minute, hour, day of month, month and day of week (0 or 7
+    is Sunday), in local time. Each field accepts '*', numbers, ranges
+    (a-b), steps (*/n, a-b/n) and comma-separated lists. As in cron, when
+    both day fields are restricted a day matches if either one does.
+    """
+
+    FIELDS = (
+        ('minute', 0, 59),
+        ('hour', 0, 23),
+        ('day', 1, 31),
+        ('month', 1, 12),
+        ('weekday', 0, 7),
+    )
+
+    # Longest gap searched for a match (covers Feb 29 schedules)
+    SEARCH_YEARS = 5
+
+    def __init__(self, expression: str):
+        parts = expression.split()
+        if len(parts) != len(self.FIELDS):
+            raise ValueError(f"Cron expression needs {len(self.FIELDS)} fields: {expression}")
+
+        self.expression = expression
+        self.minutes, self.hours, self.days, self.months, weekdays = (
+            self._parse_field(part, low, high, name)
+            for part, (name, low, high) in zip(parts, self.FIELDS)
+        )
+        self.weekdays = {day % 7 for day in weekdays}
+        self._days_restricted = parts[2] != '*'
+        self._weekdays_restricted = parts[4] != '*'
+
+    def next_after(self, timestamp: float) -> float:
+        """Get the next matching minute (epoch seconds) after timestamp"""
+        dt = datetime.fromtimestamp(timestamp).replace(second=0, microsecond=0) + timedelta(minutes=1)
+        limit = dt + timedelta(days=366 * self.SEARCH_YEARS)
+
+        while dt < limit:
+            if dt.month not in self.months:
+                dt = (dt.replace(day=1, hour=0, minute=0) + timedelta(days=32)).replace(day=1)
+            elif not self._day_matches(dt):
+                dt = dt.replace(hour=0, minute=0) + timedelta(days=1)
+            elif dt.hour not in self.hours:
+                dt = dt.replace(minute=0) + timedelta(hours=1)
+            elif dt.minute not in self.minutes:
+                dt += timedelta(minutes=1)
+            else:
+                return dt.timestamp()
+
+        raise ValueError(f"Cron expression never matches: {self.expression}")
+
+    def _day_matches(self, dt: datetime) -> bool:
+        """Whether dt's date matches the day-of-month and day-of-week fields"""
+        day = dt.day in self.days
+        weekday = (dt.weekday() + 1) % 7 in self.weekdays
+        if self._days_restricted and self._weekdays_restricted:
+            return day or weekday
+        return day and weekday
+
+    @staticmethod
+    def _parse_field(expression: str, low: int, high: int, name: str) -> Set[int]:
+        """Expand one cron field into the set of values it matches"""
+        values = set()
+        for part in expression.split(','):
+            step = 1
+            if '/' in part:
+                part, step_text = part.split('/', 1)
+                step = int(step_text)
+
+            if part == '*':
+                start, end = low, high
+            elif '-' in part:
+                start, end = (int(v) for v in part.split('-', 1))
+            else:
+                start = int(part)
+                end = high if step > 1 else start
+
+            if step < 1 or start < low or end > high or start > end:
+                raise ValueError(f"Invalid cron {name} field: {expression}")
+            values.update(range(start, end + 1, step))
+        return values
+
+    def __str__(self) -> str:
+        return f"cron '{self.expression}'"
+
+
+def parse_schedule(spec: str):
+    """
+    Parse a schedule like '30m', '6h', '900' (seconds) or '0 */6 * * *'.
+
+    Returns:
+        IntervalSchedule or CronSchedule
+    """
+    spec = spec.strip()
+    match = re.fullmatch(r'(\d+(?:\.\d+)?)\s*([smhd]?)', spec)
+    if match:
+        return IntervalSchedule(float(match.group(1)) * IntervalSchedule.UNITS[match.group(2)])
+    return CronSchedule(spec)
@@ -0,0 +1,154 @@
+"""Per-source timeouts derived from latency history"""
+import logging
+from typing import Any, Dict, Iterable, List, Optional
+
+from ..config import Config
+from .resilience import LatencyTracker, percentile, resilience
+
+logger = logging.getLogger(__name__)
+
+
+class TimeoutTuner:
+    """
+    Set each source's scrape and request timeouts from its recent latencies.
+
+    A timeout is the source's recent p99 (by default) times a safety
+    margin, clamped to a floor and a ceiling. Until a source has
+    min_samples samples the configured fixed timeout is used. Scrapes
+    that time out are recorded at their timeout, so a source that keeps
+    timing out has its timeout raised (up to the ceiling) rather than
+    never learning.
+
+    Scrape durations are recorded by the orchestrator while enabled;
+    request latencies come from the resilience layer's history.
+    """
+
+    # Samples compared against the older history when looking for regressions
+    RECENT_SAMPLES = 10
+
+    def __init__(
+        self,
+        durations: Optional[LatencyTracker] = None,
+        request_latencies: Optional[LatencyTracker] = None,
+        enabled: Optional[bool] = None
+    ):
+        """
+        Initialize tuner.
+
+        Args:
+            durations: Scrape duration history (default: Config.STATE_DIR / 'scrape_durations.json')
+            request_latencies: Request latency history (default: the resilience layer's)
+            enabled: Derive timeouts from history (default: Config.AUTO_TIMEOUTS)
+        """
+        self.durations = durations or LatencyTracker(Config.STATE_DIR / 'scrape_durations.json')
+        self.request_latencies = request_latencies or resilience.latencies
+        self.enabled = Config.AUTO_TIMEOUTS if enabled is None else enabled
+
+    def record_scrape(self, source: str, seconds: float):
+        """Record how long a scrape took"""
+        if self.enabled:
+            self.durations.record(source, seconds)
+
+    def record_timeout(self, source: str, timeout: float):
+        """Record a scrape cancelled at its timeout (it took at least this long)"""
+        if self.enabled:
+            self.durations.record(source, timeout)
+
+    def flush(self):
+        """Write the scrape and request latencies recorded this run"""
+        self.durations.flush()
+        self.request_latencies.flush()
+
+    def scrape_timeout(self, source: str, default: Optional[float] = None) -> float:
+        """
+        Get the deadline in seconds for scraping a source.
+
+        Args:
+            source: Source name
+            default: Timeout without enough history (default: Config.SCRAPER_TIMEOUT)
+        """
+        default = Config.SCRAPER_TIMEOUT if default is None else default
+        return self._derive(self.durations, source, default, Config.SCRAPER_TIMEOUT_MIN, Config.SCRAPER_TIMEOUT_MAX)
+
+    def request_timeout(self, source: str, default: Optional[float] = None) -> float:
+        """
+        Get the timeout in seconds for one of a source's HTTP requests.
+
+        Args:
+            source: Source name
+            default: Timeout without enough history (default: Config.REQUEST_TIMEOUT)
+        """
+        default = Config.REQUEST_TIMEOUT if default is None else default
+        return self._derive(self.request_latencies, source, default, Config.REQUEST_TIMEOUT_MIN, Config.REQUEST_TIMEOUT_MAX)
+
+    def scrape_timeouts(self, sources: Iterable[str], timeout: Optional[float] = None) -> Dict[str, float]:
+        """
+        Get the scrape deadline of each source.
+
+        Args:
+            sources: Source names
+            timeout: Fixed timeout for every source (default: derived per source)
+        """
+        if timeout is not None:
+            return {source: timeout for source in sources}
+        return {source: self.scrape_timeout(source) for source in sources}
+
+    def report(self, sources: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """
+        Summarize each source's scrape latency and flag regressions.
+
+        A source has regressed when the p95 of its RECENT_SAMPLES newest
+        scrapes exceeds the p95 of the older history by more than
+        Config.LATENCY_REGRESSION_RATIO.
+
+        Args:
+            sources: Sources to report (default: every source with history)
+
+        Returns:
+            One row per source, slowest p95 first
+        """
+        history = self.durations.history()
+        rows = []
+        for source in (sources if sources is not None else sorted(history)):
+            samples = history.get(source, [])
+            if not samples:
+                continue
+
+            recent, baseline = samples[-self.RECENT_SAMPLES:], samples[:-self.RECENT_SAMPLES]
+            recent_p95 = percentile(recent, 95)
+            baseline_p95 = percentile(baseline, 95) if len(baseline) >= Config.AUTO_TIMEOUT_MIN_SAMPLES else None
+            rows.append({
+                'source': source,
+                'samples': len(samples),
+                'p50': percentile(samples, 50),
+                'p95': percentile(samples, 95),
+                'p99': percentile(samples, 99),
+                'timeout': self.scrape_timeout(source),
+                'recent_p95': recent_p95,
+                'baseline_p95': baseline_p95,
+                'regressed': baseline_p95 is not None and recent_p95 > baseline_p95 * Config.LATENCY_REGRESSION_RATIO,
+            })
+
+        return sorted(rows, key=lambda row: row['p95'], reverse=True)
+
+    def log_regressions(self, sources: Iterable[str]):
+        """Warn about sources whose recent scrapes are slower than their history"""
+        for row in self.report(sources):
+            if row['regressed']:
+                logger.warning(
+                    f"{row['source']} is slower than usual: recent p95 {row['recent_p95']:.1f}s "
+                    f"vs {row['baseline_p95']:.1f}s before"
+                )
+
+    def _derive(self, tracker: LatencyTracker, source: str, default: float, floor: float, ceiling: float) -> float:
+        """Timeout from a latency history, or default without enough of it"""
+        if not self.enabled:
+            return default
+        observed = tracker.percentile(source, Config.AUTO_TIMEOUT_PERCENTILE, Config.AUTO_TIMEOUT_MIN_SAMPLES)
+        if observed is None:
+            return default
+        return round(min(ceiling, max(floor, observed * Config.AUTO_TIMEOUT_MARGIN)), 1)
+
+
+# Process-wide tuner used by the orchestrator and scrapers
+timeouts = TimeoutTuner()
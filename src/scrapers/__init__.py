@@ -1,7 +1,23 @@
 """Event scrapers for various sources"""
+import importlib
 from .base import BaseScraper
-from .knco import KNCOScraper
-from .library import LibraryScraper
-from .county import CountyScraper
+from .registry import ScraperRegistry, scrapers
 
-__all__ = ['BaseScraper', 'KNCOScraper', 'LibraryScraper', 'CountyScraper']
+__all__ = ['BaseScraper', 'ScraperRegistry', 'scrapers', 'KNCOScraper', 'LibraryScraper', 'CountyScraper',
+           'TrumbaScraper', 'CivicEngageScraper']
+
+# Scraper classes are imported on first access so that importing the
+# package doesn't pull in selenium, icalendar, feedparser, ...
+_LAZY_SCRAPERS = {
+    'KNCOScraper': '.knco',
+    'LibraryScraper': '.library',
+    'CountyScraper': '.county',
+    'TrumbaScraper': '.trumba',
+    'CivicEngageScraper': '.civicengage',
+}
+
+
+def __getattr__(name):
+    if name in _LAZY_SCRAPERS:
+        return getattr(importlib.import_module(_LAZY_SCRAPERS[name], __name__), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
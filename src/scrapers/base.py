@@ -1,12 +1,199 @@
 """Base scraper interface"""
+import threading
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_EXCEPTION
+from typing import TYPE_CHECKING, Callable, Hashable, Iterable, List, Dict, Any, Optional, Tuple
+from ..config import Config
+from ..instrumentation import metrics
+from ..processors.window import DateWindow
+from ..scheduling.deadline import Deadline
+from ..scheduling.politeness import politeness
+from ..scheduling.timeouts import timeouts
+
+if TYPE_CHECKING:
+    import requests
+
+
+class ScraperCancelled(BaseException):
+    """
+    Raised inside a scraper when it has been cancelled or its deadline passed.
+
+    Derives from BaseException (like asyncio.CancelledError) so the broad
+    `except Exception` handlers scrapers use to skip bad entries do not
+    swallow it.
+    """
+
 
 class BaseScraper(ABC):
     """Abstract base class for all scrapers"""
 
     def __init__(self, source_name: str):
         self.source_name = source_name
+        self.deadline: Optional[Deadline] = None
+        # Only events dated in this window are wanted (None: every event)
+        self.window: Optional[DateWindow] = None
+        # Set when a request was answered from a last good payload, so the
+        # scrape is not stored as fresh
+        self.served_last_good = False
+        self._cancel_event = threading.Event()
+        self._session: Optional['requests.Session'] = None
+
+    @property
+    def session(self) -> 'requests.Session':
+        """
+        HTTP session reused across fetches so connections stay warm.
+
+        Requests go through the shared politeness limits (see polite()).
+        """
+        if self._session is None:
+            import requests
+            from .http import PoliteAdapter
+            self._session = requests.Session()
+            adapter = PoliteAdapter(self)
+            self._session.mount('https://', adapter)
+            self._session.mount('http://', adapter)
+            self._session.hooks['response'].append(self._record_response)
+        return self._session
+
+    def polite(self, url: str):
+        """
+        Hold a politeness slot for a request made outside session.
+
+        Usage:
+            with self.polite(url):
+                driver.get(url)
+        """
+        return politeness.slot(url, source=self.source_name, check=self.check_cancelled)
+
+    def _record_response(self, response: 'requests.Response', *args, **kwargs):
+        """Session hook: record request time and bytes downloaded"""
+        if metrics.enabled:
+            metrics.observe('http_fetch', response.elapsed.total_seconds(), source=self.source_name)
+            metrics.count('http_bytes', len(response.content), source=self.source_name)
+
+    def close(self):
+        """Release resources held between fetches"""
+        if self._session is not None:
+            self._session.close()
+            self._session = None
+
+    def cancel(self):
+        """
+        Ask the scraper to stop.
+
+        Cancellation is cooperative: the scrape stops with ScraperCancelled
+        at its next check_cancelled() or sleep(). Subclasses holding
+        blocking resources should override this to abort them too.
+        """
+        self._cancel_event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether the scraper was cancelled or its deadline has passed"""
+        return self._cancel_event.is_set() or (self.deadline is not None and self.deadline.expired())
+
+    def check_cancelled(self):
+        """Raise ScraperCancelled if the scraper should stop"""
+        if self.cancelled:
+            raise ScraperCancelled(f"{self.source_name} scrape cancelled")
+
+    def sleep(self, seconds: float):
+        """Sleep, waking early and raising ScraperCancelled on cancellation"""
+        if self.deadline is not None:
+            seconds = self.deadline.cap(seconds)
+        self._cancel_event.wait(seconds)
+        self.check_cancelled()
+
+    def in_window(self, event_date) -> bool:
+        """
+        Whether an event dated event_date is wanted.
+
+        Scrapers check this as soon as an entry's date is known, so
+        entries outside the window are dropped before the rest of them
+        is parsed. Undated entries are kept for the normalizer to reject.
+        """
+        if self.window is None or event_date is None:
+            return True
+        return self.window.contains(event_date)
+
+    def request_timeout(self) -> float:
+        """Timeout for the next network request, capped to the time remaining"""
+        self.check_cancelled()
+        timeout = timeouts.request_timeout(self.source_name)
+        if self.deadline is None:
+            return timeout
+        return self.deadline.cap(timeout)
+
+    def download(self) -> Any:
+        """
+        Download the raw payload for parse_download().
+
+        Scrapers that can separate network from parsing override both so
+        a pipeline can run them on different workers. The default does
+        the whole scrape here and passes the events through.
+
+        Returns:
+            Raw payload (picklable, so it can be parsed in another process)
+        """
+        return self.fetch()
+
+    def download_each(
+        self,
+        keys: Iterable[Hashable],
+        download_one: Callable[[Any], Any]
+    ) -> Tuple[Dict[Any, Any], Dict[Any, Exception]]:
+        """
+        Download several feeds of one source concurrently.
+
+        Downloads share the scraper's session, so they also share its
+        connection pool and politeness limits. A cancelled download stops
+        the rest at once.
+
+        Args:
+            keys: Feed names (e.g. sub-sources, or (sub-source, month) pairs)
+            download_one: Downloads the feed for a key
+
+        Returns:
+            (results, errors): payloads of the feeds that downloaded and the
+            error of each that failed, both in key order
+        """
+        keys = list(keys)
+        if not keys:
+            return {}, {}
+
+        workers = min(len(keys), Config.SCRAPER_MAX_WORKERS)
+        executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix=f'{self.source_name}-feed')
+        try:
+            futures = {key: executor.submit(download_one, key) for key in keys}
+            done, _ = wait(futures.values(), return_when=FIRST_EXCEPTION)
+            for future in done:
+                if isinstance(future.exception(), ScraperCancelled):
+                    raise future.exception()
+
+            results, errors = {}, {}
+            for key, future in futures.items():
+                error = future.exception()
+                if isinstance(error, ScraperCancelled):
+                    raise error
+                if error is not None:
+                    errors[key] = error
+                else:
+                    results[key] = future.result()
+            return results, errors
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def parse_download(self, payload: Any) -> List[Dict[str, Any]]:
+        """
+        Parse a payload returned by download() into event dictionaries.
+
+        Args:
+            payload: Result of download()
+
+        Returns:
+            List of parsed event dictionaries
+        """
+        return payload
 
     @abstractmethod
     def fetch(self) -> List[Dict[str, Any]]:
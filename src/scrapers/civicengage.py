@@ -0,0 +1,614 @@
+"""CivicEngage calendar scraper engine"""
+import re
+import time
+import hashlib
+import logging
+from typing import List, Dict, Any, Optional, Tuple, Union
+from datetime import date, datetime
+from .base import BaseScraper
+from ..config import Config
+from ..instrumentation import metrics
+from ..scheduling.resilience import resilience
+from ..storage.payloads import payloads
+
+logger = logging.getLogger(__name__)
+
+_TAG = re.compile(r'<[^>]+>')
+_WHITESPACE = re.compile(r'\s+')
+_EVENT_ID = re.compile(r'[?&]EID=(\d+)', re.IGNORECASE)
+_LIST_DATE = re.compile(r'(\w+\s+\d+,\s+\d{4})')
+_LIST_TIME = re.compile(r'(\d{1,2}:\d{2}\s+[AP]M\s*-\s*\d{1,2}:\d{2}\s+[AP]M)')
+
+
+def month_starts(months: int, today: Optional[date] = None) -> List[date]:
+    """
+    Plan a horizon of month windows.
+
+    Args:
+        months: Months in the horizon, including the current one
+        today: Day the horizon starts from (default: today)
+
+    Returns:
+        First day of each month in the horizon, in order
+    """
+    today = today or date.today()
+    year, month = today.year, today.month
+    starts = []
+    for _ in range(max(1, months)):
+        starts.append(date(year, month, 1))
+        year, month = (year + 1, 1) if month == 12 else (year, month + 1)
+    return starts
+
+
+def _clean_text(text: str) -> str:
+    """Strip HTML tags and collapse whitespace"""
+    return _WHITESPACE.sub(' ', _TAG.sub(' ', text)).strip()
+
+
+class CivicEngageScraper(BaseScraper):
+    """
+    Scraper for one or more CivicEngage calendars (nevadacountyca.gov).
+
+    Each calendar is a sub-source identified by its category ID (the
+    CID of calendar.aspx, which is also the catID of its iCalendar
+    feed). The iCal feeds are downloaded concurrently over the scraper's
+    shared session. A calendar whose feed fails is read from its list
+    view instead, one page per month of the source's horizon, all months
+    requested at once. Only months the server does not render are loaded
+    in browser tabs, as a last resort.
+
+    CivicEngage lists an event on every category it is tagged with, and
+    month pages overlap at their edges, so events are deduplicated by
+    their EID before they are normalized; the first page listing an
+    event keeps it.
+
+    Configure a source by subclassing with SOURCE_NAME and CALENDARS, or
+    use the generic 'civicengage' source with Config.CIVICENGAGE_CALENDARS.
+    """
+
+    SITE_URL = "https://www.nevadacountyca.gov"
+    ICAL_URL = SITE_URL + "/common/modules/iCalendar/iCalendar.aspx?catID={calendar_id}&feed=calendar"
+    CALENDAR_URL = SITE_URL + "/calendar.aspx?CID={calendar_id}"
+    MONTH_URL = SITE_URL + "/calendar.aspx?view=list&year={year}&month={month}&day=1&CID={calendar_id}"
+
+    SOURCE_NAME = "civicengage"
+
+    # Sub-source name -> category ID (default: Config.CIVICENGAGE_CALENDARS)
+    CALENDARS: Dict[str, str] = {}
+
+    # Render calendars whose iCal feed failed (default: Config.CIVICENGAGE_BROWSER_FALLBACK)
+    BROWSER_FALLBACK: Optional[bool] = None
+
+    def __init__(
+        self,
+        source_name: Optional[str] = None,
+        calendars: Union[Dict[str, str], List[str], None] = None,
+        browser_fallback: Optional[bool] = None,
+        horizon_months: Optional[int] = None
+    ):
+        """
+        Initialize scraper.
+
+        Args:
+            source_name: Source name (default: SOURCE_NAME)
+            calendars: Category IDs, or a mapping of sub-source name to
+                category ID (default: CALENDARS, else Config.CIVICENGAGE_CALENDARS)
+            browser_fallback: Render calendars whose feed failed (default:
+                BROWSER_FALLBACK, else Config.CIVICENGAGE_BROWSER_FALLBACK)
+            horizon_months: Months of list views read for a calendar whose
+                feed failed (default: Config.CALENDAR_SOURCE_HORIZONS, else
+                Config.CALENDAR_HORIZON_MONTHS)
+        """
+        super().__init__(source_name or self.SOURCE_NAME)
+        if calendars is None:
+            calendars = self.CALENDARS or Config.CIVICENGAGE_CALENDARS
+        if not isinstance(calendars, dict):
+            calendars = {f'cid{calendar_id}': calendar_id for calendar_id in calendars}
+        self.calendars = {sub_source: str(calendar_id) for sub_source, calendar_id in calendars.items()}
+
+        if browser_fallback is None:
+            browser_fallback = self.BROWSER_FALLBACK
+        self.browser_fallback = Config.CIVICENGAGE_BROWSER_FALLBACK if browser_fallback is None else browser_fallback
+        if horizon_months is None:
+            horizon_months = Config.CALENDAR_SOURCE_HORIZONS.get(self.source_name, Config.CALENDAR_HORIZON_MONTHS)
+        self.horizon_months = horizon_months
+        self._driver = None
+
+    def ical_url(self, sub_source: str) -> str:
+        """iCalendar feed URL of a sub-source's calendar"""
+        return self.ICAL_URL.format(calendar_id=self.calendars[sub_source])
+
+    def calendar_url(self, sub_source: str) -> str:
+        """Calendar page URL of a sub-source"""
+        return self.CALENDAR_URL.format(calendar_id=self.calendars[sub_source])
+
+    def month_url(self, sub_source: str, month_start: date) -> str:
+        """List view URL of one month of a sub-source's calendar"""
+        return self.MONTH_URL.format(
+            year=month_start.year,
+            month=month_start.month,
+            calendar_id=self.calendars[sub_source]
+        )
+
+    def fetch(self) -> List[Dict[str, Any]]:
+        """
+        Fetch and parse every calendar.
+
+        Returns:
+            List of parsed event dictionaries
+        """
+        try:
+            return self.parse_download(self.download())
+        except Exception as e:
+            # A cancelled scrape fails with whatever error the quit
+            # browser raised; report it as the cancellation it is
+            self.check_cancelled()
+            logger.error(f"Error fetching {self.source_name} calendars: {e}")
+            return []
+
+    def download(self) -> Dict[str, Union[bytes, List[str]]]:
+        """
+        Download every calendar, preferring its iCal feed.
+
+        Returns:
+            iCal bytes, or the list-view HTML of each month in the horizon
+            for calendars whose feed failed, per sub-source in calendar order
+
+        Raises:
+            Exception: Every calendar failed (the first error)
+        """
+        if not self.calendars:
+            logger.warning(f"No CivicEngage calendars configured for {self.source_name}")
+            return {}
+
+        feeds, errors = self.download_each(self.calendars, self._download_ical)
+        for sub_source, error in errors.items():
+            logger.warning(f"iCal feed for {sub_source} failed: {error}")
+
+        if errors:
+            pages = self._download_months(list(errors))
+            feeds.update(pages)
+            for sub_source in pages:
+                del errors[sub_source]
+
+        if errors and not feeds:
+            raise next(iter(errors.values()))
+        # Keep calendar order whichever way each one was downloaded
+        return {sub_source: feeds[sub_source] for sub_source in self.calendars if sub_source in feeds}
+
+    def _download_ical(self, sub_source: str) -> bytes:
+        """Download one calendar's iCal feed"""
+        url = self.ical_url(sub_source)
+        logger.info(f"Fetching iCal feed from {url}")
+        response = self.session.get(url, timeout=self.request_timeout())
+        response.raise_for_status()
+        if not self._is_ical(response.content):
+            raise ValueError(f"{url} did not return an iCalendar feed")
+        return response.content
+
+    @staticmethod
+    def _is_ical(content: Union[bytes, str]) -> bool:
+        """Whether a payload is an iCal feed (rather than a rendered page)"""
+        if isinstance(content, str):
+            content = content.encode('utf-8')
+        return content.lstrip(b'\xef\xbb\xbf \t\r\n').startswith(b'BEGIN:VCALENDAR')
+
+    def _download_months(self, sub_sources: List[str]) -> Dict[str, List[str]]:
+        """
+        Download the list view of every month in the horizon.
+
+        All months of all the given calendars are requested at once.
+        Months whose page the server did not render are then loaded in
+        browser tabs, when the browser fallback is enabled. Months outside
+        the scraper's window are not requested.
+
+        Args:
+            sub_sources: Calendars whose iCal feed failed
+
+        Returns:
+            Month pages per sub-source (those with at least one page)
+        """
+        months = month_starts(self.horizon_months + 1)
+        months = [
+            month for month, next_month in zip(months, months[1:])
+            if self.window is None or self.window.overlaps(month, next_month)
+        ]
+        urls = {
+            (sub_source, month): self.month_url(sub_source, month)
+            for sub_source in sub_sources
+            for month in months
+        }
+        logger.info(f"Fetching {len(months)} months of list views for {', '.join(sub_sources)}")
+
+        pages, errors = self.download_each(urls, self._download_list_view)
+        if errors and self.browser_fallback:
+            try:
+                rendered = self._download_rendered([urls[key] for key in errors])
+            except Exception as e:
+                self.check_cancelled()
+                logger.error(f"Error rendering {self.source_name} calendars: {e}")
+                rendered = {}
+            for key in list(errors):
+                if urls[key] in rendered:
+                    pages[key] = rendered[urls[key]]
+                    del errors[key]
+
+        for (sub_source, month), error in errors.items():
+            logger.error(f"Error fetching {sub_source} for {month:%Y-%m}: {error}")
+
+        by_source = {}
+        for sub_source, month in urls:
+            if (sub_source, month) in pages:
+                by_source.setdefault(sub_source, []).append(pages[(sub_source, month)])
+        return by_source
+
+    def _download_list_view(self, key: Tuple[str, date]) -> str:
+        """Download one month's list view, if the server renders it"""
+        sub_source, month = key
+        url = self.month_url(sub_source, month)
+        response = self.session.get(url, timeout=self.request_timeout())
+        response.raise_for_status()
+        if f'id="CID{self.calendars[sub_source]}"' not in response.text:
+            raise ValueError(f"{url} was not rendered by the server")
+        return response.text
+
+    def _download_rendered(self, urls: List[str]) -> Dict[str, str]:
+        """
+        Render calendar pages in a browser, retrying browser failures.
+
+        While the source's circuit is open, or once every attempt has
+        failed, the last pages rendered successfully are returned instead.
+
+        Returns:
+            Page HTML per URL
+        """
+        from selenium.common.exceptions import WebDriverException
+
+        def attempt():
+            try:
+                rendered = self._render(urls)
+            except WebDriverException:
+                # Retry with a fresh browser
+                self._quit_driver()
+                raise
+            for url, page_source in rendered.items():
+                payloads.put(url, page_source.encode('utf-8'), 'text/html; charset=utf-8')
+            return rendered
+
+        saved = [url for url in urls if payloads.has(url)]
+        return resilience.call(
+            self.source_name,
+            attempt,
+            retry_on=(WebDriverException,),
+            deadline=self.deadline,
+            sleep=self.sleep,
+            fallback=(lambda: self._last_good_pages(saved)) if saved else None
+        )
+
+    def _last_good_pages(self, urls: List[str]) -> Dict[str, str]:
+        """The last pages rendered successfully"""
+        self.served_last_good = True
+        pages = {}
+        for url in urls:
+            body, meta = payloads.get(url)
+            logger.warning(f"Serving last good {url} (saved {datetime.fromtimestamp(meta['saved_at']):%Y-%m-%d %H:%M})")
+            pages[url] = body.decode('utf-8')
+        return pages
+
+    def _get_driver(self):
+        """Get or create Selenium WebDriver instance."""
+        if self._driver is None:
+            # Imported here: selenium takes longer to import than the rest of the CLI
+            from selenium import webdriver
+            from selenium.webdriver.chrome.options import Options
+            from selenium.webdriver.chrome.service import Service
+            from webdriver_manager.chrome import ChromeDriverManager
+
+            chrome_options = Options()
+            chrome_options.add_argument('--headless')
+            chrome_options.add_argument('--no-sandbox')
+            chrome_options.add_argument('--disable-dev-shm-usage')
+            chrome_options.add_argument('--disable-gpu')
+            chrome_options.add_argument('--window-size=1920,1080')
+            chrome_options.add_argument('user-agent=Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36')
+
+            service = Service(ChromeDriverManager().install())
+            self._driver = webdriver.Chrome(service=service, options=chrome_options)
+        return self._driver
+
+    def cancel(self):
+        """Cancel the scrape, quitting the browser to abort any command in progress."""
+        super().cancel()
+        self._quit_driver()
+
+    def close(self):
+        """Quit the browser kept open between fetches."""
+        super().close()
+        self._quit_driver()
+
+    def _quit_driver(self):
+        """Quit the WebDriver, if one is running."""
+        driver, self._driver = self._driver, None
+        if driver:
+            try:
+                driver.quit()
+            except Exception as e:
+                logger.debug(f"Error quitting WebDriver: {e}")
+
+    def __del__(self):
+        """Clean up WebDriver on instance destruction."""
+        if getattr(self, '_driver', None):
+            try:
+                self._driver.quit()
+            except:
+                pass
+
+    def _render(self, urls: List[str]) -> Dict[str, str]:
+        """Load calendar list views in browser tabs at once and collect them"""
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support.ui import WebDriverWait
+        from selenium.webdriver.support import expected_conditions as EC
+
+        logger.info(f"Rendering {len(urls)} calendar pages (using Selenium)")
+        self.check_cancelled()
+        start = time.perf_counter()
+        driver = self._get_driver()
+        driver.set_page_load_timeout(self.request_timeout())
+        home = driver.current_window_handle
+
+        # window.open() returns at once, so the tabs load in parallel
+        tabs = {}
+        for url in urls:
+            known = set(driver.window_handles)
+            with self.polite(url):
+                driver.execute_script("window.open(arguments[0], '_blank');", url)
+            tabs[url] = (set(driver.window_handles) - known).pop()
+
+        pages = {}
+        try:
+            for url, handle in tabs.items():
+                driver.switch_to.window(handle)
+                try:
+                    WebDriverWait(driver, min(15, self.request_timeout())).until(
+                        EC.presence_of_element_located((By.TAG_NAME, "h3"))
+                    )
+                except Exception as e:
+                    self.check_cancelled()
+                    logger.warning(f"List view of {url} did not load: {e}")
+                    continue
+                pages[url] = driver.page_source
+        finally:
+            for handle in tabs.values():
+                try:
+                    driver.switch_to.window(handle)
+                    driver.close()
+                except Exception:
+                    pass
+            driver.switch_to.window(home)
+
+        metrics.observe('http_fetch', time.perf_counter() - start, source=self.source_name)
+        metrics.count('http_bytes', sum(len(page.encode('utf-8')) for page in pages.values()), source=self.source_name)
+        return pages
+
+    def parse_download(self, payload: Union[Dict[str, Union[bytes, List[str]]], bytes, str]) -> List[Dict[str, Any]]:
+        """
+        Parse downloaded calendars into event data.
+
+        Args:
+            payload: Result of download(), or one calendar's iCal feed or
+                list-view HTML (tagged with the first calendar's sub-source)
+
+        Returns:
+            List of event dictionaries, each event once
+        """
+        if not isinstance(payload, dict):
+            payload = {next(iter(self.calendars), self.source_name): payload}
+
+        events = []
+        seen = set()
+        with metrics.span('parse', source=self.source_name):
+            for sub_source, content in payload.items():
+                if isinstance(content, list):
+                    calendar_id = self.calendars.get(sub_source, '')
+                    parsed = [event for page in content for event in self._parse_list_view(page, calendar_id)]
+                elif self._is_ical(content):
+                    if isinstance(content, bytes):
+                        content = content.decode('utf-8', errors='replace')
+                    parsed = self._parse_ical(content)
+                else:
+                    parsed = self._parse_list_view(content, self.calendars.get(sub_source, ''))
+
+                for event in parsed:
+                    key = self._event_key(event)
+                    if key in seen:
+                        continue
+                    seen.add(key)
+                    event['sub_source'] = sub_source
+                    events.append(event)
+
+        logger.info(f"Successfully scraped {len(events)} events from {self.source_name} ({len(payload)} calendars)")
+        return events
+
+    def _event_key(self, event: Dict[str, Any]) -> str:
+        """Identity of an event across calendars: its EID when known"""
+        return self._extract_event_id(event.get('source_url', '')) or event['source_event_id']
+
+    def _extract_event_id(self, url: str) -> str:
+        """Extract event ID from URL."""
+        if not url:
+            return ""
+
+        # CivicEngage calendar URLs: calendar.aspx?EID=12345
+        match = _EVENT_ID.search(url)
+        if match:
+            return match.group(1)
+
+        return ""
+
+    def parse(self, raw_data: str) -> List[Dict[str, Any]]:
+        """
+        Parse an iCal feed into structured event data.
+
+        Args:
+            raw_data: iCalendar text
+
+        Returns:
+            List of event dictionaries
+        """
+        return self._parse_ical(raw_data)
+
+    def _parse_ical(self, ical_text: str) -> List[Dict[str, Any]]:
+        """Parse iCal format using icalendar library."""
+        from icalendar import Calendar
+
+        events = []
+
+        try:
+            cal = Calendar.from_ical(ical_text)
+
+            for component in cal.walk('VEVENT'):
+                self.check_cancelled()
+                try:
+                    event = self._parse_ical_event(component)
+                    if event and event.get('title'):
+                        events.append(event)
+                except Exception as e:
+                    logger.error(f"Error parsing iCal event: {e}")
+                    continue
+
+        except Exception as e:
+            logger.error(f"Error parsing iCal calendar: {e}")
+
+        return events
+
+    def _parse_ical_event(self, vevent) -> Dict[str, Any]:
+        """Parse a single iCal VEVENT component (empty if outside the window)."""
+        event_date = ''
+        dtstart = vevent.get('DTSTART')
+        if dtstart:
+            try:
+                dt = dtstart.dt
+                if not self.in_window(dt):
+                    return {}
+                if hasattr(dt, 'date'):
+                    event_date = dt.date().isoformat()
+                else:
+                    event_date = dt.isoformat()
+            except Exception as e:
+                logger.debug(f"Error parsing date: {e}")
+
+        title = str(vevent.get('SUMMARY', ''))
+        description = _clean_text(str(vevent.get('DESCRIPTION', '')))
+        location = _clean_text(str(vevent.get('LOCATION', '')))
+        uid = str(vevent.get('UID', ''))
+        source_url = str(vevent.get('URL', '')) or self.SITE_URL + "/Calendar.aspx"
+
+        event = {
+            'title': title,
+            'description': description[:500],  # Limit description length
+            'event_date': event_date,
+            'venue': location[:200],  # Limit venue length
+            'city_area': 'Nevada County',
+            'age_range': '',  # County calendars rarely specify age range
+            'price': None,
+            'is_free': True,  # County events are typically free
+            'source_url': source_url,
+            'source_event_id': uid,
+        }
+        # Keyed like the list view (EID, else UID) so both paths upsert the same row
+        event['source_event_id'] = self._event_key(event)
+        return event
+
+    def _parse_list_view(self, page_source: str, calendar_id: str) -> List[Dict[str, Any]]:
+        """Parse a rendered calendar's list view."""
+        from bs4 import BeautifulSoup
+
+        soup = BeautifulSoup(page_source, 'html.parser')
+
+        calendar_div = soup.find('div', id=f'CID{calendar_id}')
+        if not calendar_div:
+            logger.warning(f"Could not find calendar container (CID{calendar_id})")
+            return []
+
+        events = []
+        for element in calendar_div.find_all('li'):
+            self.check_cancelled()
+            try:
+                event = self._parse_list_element(element)
+                if event and event.get('title'):
+                    events.append(event)
+            except Exception as e:
+                logger.error(f"Error parsing event element: {e}")
+                continue
+
+        return events
+
+    def _parse_list_element(self, element: Any) -> Dict[str, Any]:
+        """
+        Parse a single event <li> element from a calendar's list view
+        (empty if outside the window).
+
+        Structure:
+        <li>
+          <h3><span>Event Title</span></h3>
+          <div class="subHeader">Date, Time @ Location</div>
+          <p class="icalDescription">Description...</p>
+        </li>
+        """
+        # Format: "October 7, 2025, 10:30 AM - 10:45 AM @ Grass Valley Library"
+        subheader_elem = element.find('div', class_='subHeader')
+        if not subheader_elem:
+            return {}
+
+        datetime_part, _, venue = subheader_elem.get_text(strip=True).partition('@')
+        datetime_part, venue = datetime_part.strip(), venue.strip()
+
+        event_date = ""
+        date_match = _LIST_DATE.search(datetime_part)
+        if date_match:
+            try:
+                day = datetime.strptime(date_match.group(1), "%B %d, %Y").date()
+            except ValueError:
+                pass
+            else:
+                if not self.in_window(day):
+                    return {}
+                event_date = day.isoformat()
+
+        title_elem = element.find('h3')
+        if not title_elem:
+            return {}
+
+        title = title_elem.get_text(strip=True)
+
+        desc_elem = element.find('p', class_='icalDescription')
+        description = desc_elem.get_text(strip=True) if desc_elem else ""
+
+        time_match = _LIST_TIME.search(datetime_part)
+        time_range = time_match.group(1) if time_match else ""
+
+        link_elem = element.find('a', href=True)
+        source_url = link_elem.get('href', '') if link_elem else ""
+        if source_url and not source_url.startswith('http'):
+            source_url = f"{self.SITE_URL}{source_url}"
+
+        # Without an EID in the URL, an ID generated from title + date + venue
+        unique_str = f"{title}_{event_date}_{venue}"
+        fallback_id = hashlib.md5(unique_str.encode()).hexdigest()[:16]
+
+        event = {
+            'title': title,
+            'description': description,
+            'event_date': event_date,
+            'time_range': time_range,
+            'venue': venue,
+            'city_area': 'Nevada County',
+            'age_range': '',
+            'price': None,
+            'is_free': True,
+            'source_url': source_url,
+            'source_event_id': fallback_id,
+            'categories': '',
+        }
+        event['source_event_id'] = self._event_key(event)
+        return event
@@ -0,0 +1,109 @@
+"""HTTP transport for scraper sessions"""
+import logging
+from datetime import datetime
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+from ..scheduling.politeness import politeness
+from ..scheduling.resilience import CircuitOpenError, resilience
+from ..storage.payloads import payloads
+
+logger = logging.getLogger(__name__)
+
+# Responses worth retrying: rate limited or a transient server error
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+
+class RetryableStatus(Exception):
+    """A response with a RETRY_STATUSES status"""
+
+    def __init__(self, response: requests.Response):
+        super().__init__(f"HTTP {response.status_code}")
+        self.response = response
+
+
+class PoliteAdapter(HTTPAdapter):
+    """
+    Transport adapter for scraper sessions.
+
+    Every request is sent inside a politeness slot, so all requests to a
+    host, from any scraper, share its connection and rate limits. GET
+    requests also go through the resilience layer: connection errors,
+    timeouts and 429/5xx responses are retried within the scraper's
+    deadline, and while the source's circuit is open (or every attempt
+    failed) the URL's last good payload is served instead.
+    """
+
+    def __init__(self, scraper, **kwargs):
+        """
+        Initialize adapter.
+
+        Args:
+            scraper: BaseScraper the session belongs to
+        """
+        super().__init__(**kwargs)
+        self.scraper = scraper
+
+    def send(self, request, timeout=None, **kwargs):
+        if request.method != 'GET':
+            return self._send(request, timeout=timeout, **kwargs)
+
+        def attempt():
+            response = self._send(request, timeout=timeout, **kwargs)
+            if response.status_code in RETRY_STATUSES:
+                raise RetryableStatus(response)
+            return response
+
+        fallback = None
+        if payloads.has(request.url):
+            fallback = lambda: self._last_good(request)
+
+        try:
+            response = resilience.call(
+                self.scraper.source_name,
+                attempt,
+                retry_on=(requests.ConnectionError, requests.Timeout, RetryableStatus),
+                deadline=self.scraper.deadline,
+                sleep=self.scraper.sleep,
+                fallback=fallback
+            )
+        except RetryableStatus as e:
+            return e.response
+        except CircuitOpenError as e:
+            raise requests.ConnectionError(str(e), request=request)
+
+        if response.ok and 'X-Served-From' not in response.headers and not kwargs.get('stream'):
+            payloads.put(request.url, response.content, response.headers.get('Content-Type'))
+        return response
+
+    def _send(self, request, timeout=None, **kwargs):
+        """Send one request inside a politeness slot"""
+        with politeness.slot(request.url, source=self.scraper.source_name, check=self.scraper.check_cancelled):
+            # Re-cap the timeout: it was computed before waiting for the slot
+            if isinstance(timeout, (int, float)) and self.scraper.deadline is not None:
+                timeout = self.scraper.deadline.cap(timeout)
+            return super().send(request, timeout=timeout, **kwargs)
+
+    def _last_good(self, request) -> requests.Response:
+        """Build a response from the URL's last good payload"""
+        saved = payloads.get(request.url)
+        if saved is None:
+            raise requests.ConnectionError(f"No saved payload for {request.url}", request=request)
+        body, meta = saved
+
+        saved_at = datetime.fromtimestamp(meta.get('saved_at', 0)).isoformat(timespec='minutes')
+        logger.warning(f"Serving last good payload for {request.url} (saved {saved_at})")
+        self.scraper.served_last_good = True
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.url = request.url
+        response.request = request
+        response.headers = CaseInsensitiveDict({'X-Served-From': 'last-good'})
+        if meta.get('content_type'):
+            response.headers['Content-Type'] = meta['content_type']
+        response.encoding = get_encoding_from_headers(response.headers)
+        response._content = body
+        response.connection = self
+        return response
@@ -0,0 +1,155 @@
+"""Lazy registry of scraper classes"""
+import logging
+import importlib
+from collections.abc import MutableMapping
+from typing import Dict, Iterator, Union
+
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+# Entry point group third-party packages can register scrapers under, e.g.
+#   [project.entry-points."nevada_county_events.scrapers"]
+#   farmers_market = "my_package.scraper:FarmersMarketScraper"
+ENTRY_POINT_GROUP = 'nevada_county_events.scrapers'
+
+# Built-in scrapers as "module:Class" so their dependencies (selenium,
+# icalendar, feedparser, ...) load only when the source is used
+BUILTIN_SCRAPERS = {
+    'knco': f'{__package__}.knco:KNCOScraper',
+    'library': f'{__package__}.library:LibraryScraper',
+    'county': f'{__package__}.county:CountyScraper',
+}
+
+# A registered scraper: a class, or a "module:Class" string imported on first use
+ScraperSpec = Union[str, type]
+
+
+def load_scraper_class(spec: str) -> type:
+    """
+    Import a scraper class from a "module:Class" string.
+
+    Args:
+        spec: Module path and attribute, e.g. "src.scrapers.knco:KNCOScraper"
+
+    Returns:
+        The scraper class
+    """
+    module_name, sep, attr = spec.partition(':')
+    if not sep or not module_name or not attr:
+        raise ValueError(f"Invalid scraper spec {spec!r} (expected 'module:Class')")
+    obj = importlib.import_module(module_name)
+    for part in attr.split('.'):
+        obj = getattr(obj, part)
+    return obj
+
+
+class ScraperRegistry(MutableMapping):
+    """
+    Map source names to scraper classes, importing each one on first lookup.
+
+    Scrapers come from, in increasing priority:
+        - the built-in sources
+        - the ENTRY_POINT_GROUP entry points of installed packages
+          (these may add sources but not replace built-in ones)
+        - Config.SCRAPER_PLUGINS ("name=module:Class,...")
+
+    Membership tests and listing never import a scraper module. Entry
+    points are only scanned when a name is not otherwise known or the
+    whole registry is listed.
+
+    Values may be assigned as classes or "module:Class" strings, and
+    copy() returns the unresolved entries, so mock.patch.dict() can patch
+    and restore the registry without importing anything.
+    """
+
+    def __init__(self, scrapers: Dict[str, ScraperSpec] = None, entry_point_group: str = None):
+        self._entries: Dict[str, ScraperSpec] = dict(scrapers or {})
+        self._entry_point_group = entry_point_group
+        self._discovered = entry_point_group is None
+
+    def __getitem__(self, source: str) -> type:
+        if source not in self:
+            raise KeyError(source)
+
+        entry = self._entries[source]
+        if isinstance(entry, str):
+            entry = load_scraper_class(entry)
+            self._entries[source] = entry
+        return entry
+
+    def __setitem__(self, source: str, scraper: ScraperSpec):
+        self._entries[source] = scraper
+
+    def __delitem__(self, source: str):
+        del self._entries[source]
+
+    def __contains__(self, source) -> bool:
+        if source not in self._entries:
+            self._discover()
+        return source in self._entries
+
+    def __iter__(self) -> Iterator[str]:
+        self._discover()
+        return iter(list(self._entries))
+
+    def __len__(self) -> int:
+        self._discover()
+        return len(self._entries)
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self._entries!r})"
+
+    def clear(self):
+        """Remove every entry (without importing them, as popitem() would)"""
+        self._discover()
+        self._entries.clear()
+
+    def copy(self) -> Dict[str, ScraperSpec]:
+        """Get the registered entries without importing any of them"""
+        self._discover()
+        return dict(self._entries)
+
+    def is_loaded(self, source: str) -> bool:
+        """Whether a source's scraper class has been imported"""
+        return not isinstance(self._entries.get(source), str)
+
+    def _discover(self):
+        """Add scrapers registered by installed packages (once)"""
+        if self._discovered:
+            return
+        self._discovered = True
+
+        from importlib.metadata import entry_points
+        try:
+            found = entry_points(group=self._entry_point_group)
+        except Exception as e:
+            logger.warning(f"Could not load scraper entry points: {e}")
+            return
+
+        for entry_point in found:
+            if entry_point.name in self._entries:
+                logger.warning(f"Ignoring scraper entry point {entry_point.value!r}: '{entry_point.name}' is already registered")
+                continue
+            self._entries[entry_point.name] = entry_point.value
+
+
+def default_registry() -> ScraperRegistry:
+    """
+    Registry of the built-in, installed and configured scrapers.
+
+    The generic 'trumba' and 'civicengage' sources are added when
+    Config.TRUMBA_CALENDARS or Config.CIVICENGAGE_CALENDARS list
+    calendars for them.
+    """
+    registry = ScraperRegistry(BUILTIN_SCRAPERS, ENTRY_POINT_GROUP)
+    if Config.TRUMBA_CALENDARS:
+        registry['trumba'] = f'{__package__}.trumba:TrumbaScraper'
+    if Config.CIVICENGAGE_CALENDARS:
+        registry['civicengage'] = f'{__package__}.civicengage:CivicEngageScraper'
+    registry.update(Config.SCRAPER_PLUGINS)
+    return registry
+
+
+# Process-wide registry used by the orchestrator
+scrapers = default_registry()
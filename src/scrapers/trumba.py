@@ -0,0 +1,293 @@
+"""Trumba calendar RSS scraper engine"""
+import re
+import html
+import logging
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Union
+from .base import BaseScraper
+from ..config import Config
+from ..instrumentation import metrics
+
+logger = logging.getLogger(__name__)
+
+# Precompiled once and shared by every Trumba feed
+_DROPPED_ELEMENTS = re.compile(r'<a\b[^>]*>.*?</a\s*>|<img\b[^>]*>', re.IGNORECASE | re.DOTALL)
+_TAG = re.compile(r'<[^>]*>')
+_WHITESPACE = re.compile(r'\s+')
+_NEXT_LABEL = re.compile(r'\s+(?:[A-Z][a-z]+(?:\s+[a-z]+)*\s*:)')
+_FIELDS = {
+    'city_area': re.compile(r'City/Area\s*:\s*([^<\n]+)', re.IGNORECASE),
+    'age_range': re.compile(r'Age range\s*:\s*([^<\n]+)', re.IGNORECASE),
+    'price': re.compile(r'Price\s*:\s*([^<\n]+)', re.IGNORECASE),
+    'venue': re.compile(r'Event location\s*:\s*([^<\n]+)', re.IGNORECASE),
+}
+_EVENT_ID = re.compile(r'event/(\d+)')
+_CATEGORY_DATE = re.compile(r'(\d{4}/\d{2}/\d{2})')
+_DESCRIPTION_DATES = [
+    re.compile(r'(\w+day,?\s+\w+\s+\d{1,2},?\s+\d{4})'),  # "Tuesday, October 7, 2025"
+    re.compile(r'(\w+\s+\d{1,2},?\s+\d{4})'),  # "October 7, 2025"
+]
+_DESCRIPTION_DATE_FORMATS = ['%A, %B %d, %Y', '%A %B %d, %Y', '%B %d, %Y', '%b %d, %Y']
+
+
+def extract_description(description_html: str) -> Dict[str, Any]:
+    """
+    Extract the text and labelled fields from a Trumba event description.
+
+    Trumba descriptions are a flat run of "<b>Label</b>:&nbsp;value<br/>"
+    lines, so tags are stripped with precompiled regexes rather than by
+    building a parse tree for every entry. Links and images are dropped
+    with their content.
+
+    Args:
+        description_html: HTML description of an RSS entry
+
+    Returns:
+        Dictionary with description, city_area, age_range, price, venue and is_free
+    """
+    text = _DROPPED_ELEMENTS.sub(' ', description_html or '')
+    text = html.unescape(_TAG.sub(' ', text)).replace('&nbsp;', ' ')
+    text = _WHITESPACE.sub(' ', text).strip()
+
+    data = {'description': text[:500]}
+    for name, pattern in _FIELDS.items():
+        data[name] = _extract_field(text, pattern)
+
+    price = data['price'].lower()
+    data['is_free'] = 'free' in price or '$0' in price
+    return data
+
+
+def _extract_field(text: str, pattern: re.Pattern) -> str:
+    """Value after a field label, up to the next label"""
+    match = pattern.search(text)
+    if not match:
+        return ""
+    value = _NEXT_LABEL.split(match.group(1).strip())[0]
+    return _WHITESPACE.sub(' ', value).strip()
+
+
+class TrumbaScraper(BaseScraper):
+    """
+    Scraper for one or more Trumba calendar RSS feeds.
+
+    Each calendar is a sub-source: its feed is downloaded concurrently
+    with the others over the scraper's shared session (and politeness
+    limits), and its events are tagged with the sub-source name. Events
+    listed on several calendars are kept once, for the first calendar
+    they appear on. A calendar that fails to download is skipped; the
+    scrape only fails if every calendar does.
+
+    Configure a source by subclassing with SOURCE_NAME and CALENDARS, or
+    use the generic 'trumba' source with Config.TRUMBA_CALENDARS.
+    """
+
+    FEED_URL = "https://www.trumba.com/calendars/{calendar_id}.rss"
+
+    SOURCE_NAME = "trumba"
+
+    # Sub-source name -> Trumba calendar ID (default: Config.TRUMBA_CALENDARS)
+    CALENDARS: Dict[str, str] = {}
+
+    def __init__(
+        self,
+        source_name: Optional[str] = None,
+        calendars: Union[Dict[str, str], List[str], None] = None
+    ):
+        """
+        Initialize scraper.
+
+        Args:
+            source_name: Source name (default: SOURCE_NAME)
+            calendars: Calendar IDs, or a mapping of sub-source name to
+                calendar ID (default: CALENDARS, else Config.TRUMBA_CALENDARS)
+        """
+        super().__init__(source_name or self.SOURCE_NAME)
+        if calendars is None:
+            calendars = self.CALENDARS or Config.TRUMBA_CALENDARS
+        if not isinstance(calendars, dict):
+            calendars = {calendar_id.lower(): calendar_id for calendar_id in calendars}
+        self.calendars = dict(calendars)
+
+    def feed_url(self, sub_source: str) -> str:
+        """RSS URL of a sub-source's calendar"""
+        return self.FEED_URL.format(calendar_id=self.calendars[sub_source])
+
+    def fetch(self) -> List[Dict[str, Any]]:
+        """
+        Fetch and parse every calendar.
+
+        Returns:
+            List of parsed event dictionaries
+        """
+        import requests
+
+        try:
+            return self.parse_download(self.download())
+        except requests.Timeout:
+            self.check_cancelled()
+            logger.error(f"Timeout fetching {self.source_name} feeds")
+            return []
+        except requests.RequestException as e:
+            logger.error(f"Error fetching RSS feed: {e}")
+            return []
+        except Exception as e:
+            logger.error(f"Unexpected error in fetch: {e}")
+            return []
+
+    def download(self) -> Dict[str, bytes]:
+        """
+        Download every calendar's feed concurrently.
+
+        Returns:
+            Feed XML bytes per sub-source, in calendar order
+
+        Raises:
+            Exception: Every calendar failed to download (the first error)
+        """
+        if not self.calendars:
+            logger.warning(f"No Trumba calendars configured for {self.source_name}")
+            return {}
+
+        feeds, errors = self.download_each(self.calendars, self._download_feed)
+        for sub_source, error in errors.items():
+            logger.error(f"Error fetching {sub_source} calendar: {error}")
+
+        if errors and not feeds:
+            raise next(iter(errors.values()))
+        return feeds
+
+    def _download_feed(self, sub_source: str) -> bytes:
+        """Download one calendar's RSS feed"""
+        url = self.feed_url(sub_source)
+        logger.info(f"Fetching RSS feed from {url}")
+        response = self.session.get(url, timeout=self.request_timeout())
+        response.raise_for_status()
+        return response.content
+
+    def parse_download(self, payload: Union[Dict[str, bytes], bytes, str]) -> List[Dict[str, Any]]:
+        """
+        Parse downloaded feeds into event data.
+
+        Args:
+            payload: Result of download(), or one feed's XML (tagged with
+                the first calendar's sub-source)
+
+        Returns:
+            List of event dictionaries
+        """
+        import feedparser
+
+        if not isinstance(payload, dict):
+            payload = {next(iter(self.calendars), self.source_name): payload}
+
+        events = []
+        seen_ids = set()
+        with metrics.span('parse', source=self.source_name):
+            for sub_source, content in payload.items():
+                feed = feedparser.parse(content)
+                if not feed.entries:
+                    logger.warning(f"No entries found in {sub_source} RSS feed")
+                    continue
+
+                for event in self.parse(feed.entries, sub_source):
+                    event_id = event['source_event_id']
+                    if event_id and event_id in seen_ids:
+                        continue
+                    seen_ids.add(event_id)
+                    events.append(event)
+
+        logger.info(f"Successfully scraped {len(events)} events from {self.source_name} ({len(payload)} calendars)")
+        return events
+
+    def parse(self, entries: List[Any], sub_source: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Parse RSS entries into structured event data.
+
+        Args:
+            entries: Feedparser entry objects
+            sub_source: Calendar the entries came from (default: the first calendar)
+
+        Returns:
+            List of event dictionaries
+        """
+        sub_source = sub_source or next(iter(self.calendars), self.source_name)
+        events = []
+
+        for entry in entries:
+            self.check_cancelled()
+            try:
+                # Dates are cheap to read; skip the description of unwanted entries
+                event_date = self._extract_date(entry)
+                if event_date and not self.in_window(datetime.fromisoformat(event_date)):
+                    continue
+
+                event = self._parse_entry(entry, event_date)
+                if event:
+                    event['sub_source'] = sub_source
+                    events.append(event)
+            except Exception as e:
+                logger.error(f"Error parsing entry '{entry.get('title', 'Unknown')}': {e}")
+                continue
+
+        return events
+
+    def _parse_entry(self, entry: Any, event_date: Optional[str] = None) -> Dict[str, Any]:
+        """Parse a single RSS entry (event_date: already extracted from it)."""
+        parsed_data = extract_description(entry.get('description', ''))
+
+        return {
+            'title': entry.get('title', '').strip(),
+            'description': parsed_data['description'],
+            'event_date': self._extract_date(entry) if event_date is None else event_date,
+            'venue': parsed_data['venue'],
+            'city_area': parsed_data['city_area'],
+            'age_range': parsed_data['age_range'],
+            'price': parsed_data['price'],
+            'is_free': parsed_data['is_free'],
+            'source_url': entry.get('link', ''),
+            'source_event_id': self._extract_event_id(entry.get('guid', '')),
+        }
+
+    def _extract_event_id(self, guid: str) -> str:
+        """Extract event ID from GUID like 'http://uid.trumba.com/event/177609910'"""
+        if not guid:
+            return ""
+
+        match = _EVENT_ID.search(guid)
+        if match:
+            return match.group(1)
+
+        return guid
+
+    def _extract_date(self, entry: Any) -> str:
+        """Extract event date from entry (use category field or description)"""
+        # Try published date first
+        if hasattr(entry, 'published_parsed') and entry.published_parsed:
+            return datetime(*entry.published_parsed[:6]).isoformat()
+
+        # Try category field (Trumba format: "2025/10/07 (Tue)")
+        date_match = _CATEGORY_DATE.search(entry.get('category', ''))
+        if date_match:
+            try:
+                return datetime.strptime(date_match.group(1), '%Y/%m/%d').isoformat()
+            except ValueError:
+                pass
+
+        # Try extracting from description (e.g., "Tuesday, October 7, 2025, 11am")
+        description = entry.get('description', '')
+        for pattern in _DESCRIPTION_DATES:
+            match = pattern.search(description)
+            if match:
+                for fmt in _DESCRIPTION_DATE_FORMATS:
+                    try:
+                        return datetime.strptime(match.group(1), fmt).isoformat()
+                    except ValueError:
+                        continue
+
+        # Fallback to empty string (normalizer will filter these out)
+        return ""
+
+    def _parse_description_html(self, description_html: str) -> Dict[str, Any]:
+        """Parse an HTML description (see extract_description)"""
+        return extract_description(description_html)
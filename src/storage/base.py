@@ -0,0 +1,311 @@
+"""Storage backend interface"""
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from datetime import datetime
+from typing import List, Dict, Any, Optional, Iterator, NamedTuple, Union
+from ..config import Config
+from ..processors.normalizer import NormalizedEvent
+from .query import EventPage, EventQuery, encode_cursor
+
+
+class EventRow(NamedTuple):
+    """Lightweight (slotted, tuple-backed) representation of a cached event row"""
+
+    id: int
+    title: str
+    description: Optional[str]
+    event_date: datetime
+    venue: Optional[str]
+    city_area: Optional[str]
+    source_name: str
+    source_url: Optional[str]
+    source_event_id: Optional[str]
+    content_hash: Optional[str]
+    age_range: Optional[str]
+    price: Optional[str]
+    is_free: Optional[bool]
+    quality_score: Optional[int]
+    scraped_at: datetime
+
+
+class ScrapeRun(NamedTuple):
+    """Outcome of one source in one orchestrator run (a scrape_runs row)"""
+
+    run_id: str
+    started_at: datetime
+    source_name: str
+    status: str
+    duration_seconds: Optional[float]
+    event_count: int
+    cache_hit: bool
+
+
+class EventStore(ABC):
+    """Abstract base class for event storage backends"""
+
+    # Columns returned by cached event reads, in SELECT order
+    EVENT_COLUMNS = EventRow._fields
+
+    # Row representations supported by iter_cached_events
+    ROW_FORMATS = ('dict', 'tuple', 'record')
+
+    # Values of ScrapeRun.status
+    RUN_STATUSES = ('success', 'failed', 'timed_out')
+
+    @abstractmethod
+    def upsert_events(self, events: List[NormalizedEvent]) -> int:
+        """
+        Insert or update events, keyed on (source_name, source_event_id).
+
+        Args:
+            events: List of NormalizedEvent objects
+
+        Returns:
+            Number of events upserted
+        """
+        pass
+
+    @abstractmethod
+    def get_cached_events(
+        self,
+        source_name: str,
+        ttl_hours: int = 6,
+        query: Optional[EventQuery] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get events for a source scraped within the TTL, ordered by event_date.
+
+        Args:
+            source_name: Source to query (e.g., 'knco')
+            ttl_hours: Time-to-live in hours (default 6)
+            query: Only events matching this query, filtered in SQL
+                (default: every event)
+
+        Returns:
+            List of event dictionaries
+        """
+        pass
+
+    def get_cached_events_many(
+        self,
+        source_names: List[str],
+        ttl_hours: int = 6,
+        query: Optional[EventQuery] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get cached events for several sources.
+
+        Backends should override this with a single query; the default
+        falls back to one get_cached_events call per source.
+
+        Returns:
+            Dictionary mapping each requested source to its event dictionaries
+        """
+        return {name: self.get_cached_events(name, ttl_hours, query) for name in source_names}
+
+    def get_last_scraped(self, source_names: List[str]) -> Dict[str, Optional[datetime]]:
+        """
+        Get the most recent scraped_at for each source.
+
+        The default implementation reads every source's rows; backends
+        should override it with an aggregate query.
+
+        Returns:
+            Dictionary mapping each source to its newest scraped_at (None if never scraped)
+        """
+        result: Dict[str, Optional[datetime]] = {}
+        for name, events in self.get_cached_events_many(source_names, ttl_hours=24 * 365).items():
+            stamps = [e['scraped_at'] for e in events if e.get('scraped_at')]
+            result[name] = max(stamps) if stamps else None
+        return result
+
+    def iter_cached_events(
+        self,
+        source_names: Union[str, List[str], None] = None,
+        ttl_hours: int = 6,
+        row_format: str = 'dict',
+        batch_size: int = None,
+        query: Optional[EventQuery] = None
+    ) -> Iterator[Union[Dict[str, Any], tuple, EventRow]]:
+        """
+        Stream cached events lazily in the requested row format.
+
+        The default implementation materializes get_cached_events results;
+        backends should override it with a cursor-based stream.
+        """
+        if row_format not in self.ROW_FORMATS:
+            raise ValueError(f"row_format must be one of {self.ROW_FORMATS}, got {row_format!r}")
+
+        if source_names is None:
+            raise NotImplementedError(f"{type(self).__name__} cannot stream all sources")
+        if isinstance(source_names, str):
+            source_names = [source_names]
+
+        for name in source_names:
+            for event in self.get_cached_events(name, ttl_hours, query):
+                row = tuple(event[column] for column in self.EVENT_COLUMNS)
+                yield self._convert_row(row, row_format)
+
+    def get_events_page(
+        self,
+        query: Optional[EventQuery] = None,
+        cursor: Optional[str] = None,
+        page_size: Optional[int] = None,
+        source_names: Optional[List[str]] = None,
+        ttl_hours: Optional[float] = None
+    ) -> EventPage:
+        """
+        Read one page of stored events ordered by (event_date, id), across sources.
+
+        Pages are keyset-paginated: each page starts after the sort key
+        in the cursor instead of skipping rows with OFFSET, so a deep page
+        costs the same index range read as the first, and rows added or
+        removed meanwhile never shift an event onto two pages or none.
+
+        Args:
+            query: Only events matching this query (default: every event)
+            cursor: next_cursor of the previous page (default: first page)
+            page_size: Events per page (default: Config.PAGE_SIZE, capped at
+                Config.PAGE_SIZE_MAX)
+            source_names: Only these sources (default: every source)
+            ttl_hours: Only events scraped within this many hours, like
+                get_cached_events (default: any age). Invalidated events
+                are never returned.
+
+        Returns:
+            EventPage with the events and the next page's cursor (None on the last page)
+
+        Raises:
+            ValueError: The cursor is malformed
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support paged reads")
+
+    def invalidate_events(
+        self,
+        source_name: Optional[str] = None,
+        source_event_id: Optional[str] = None
+    ) -> int:
+        """
+        Expire cached events so no TTL window (fresh or stale) will return them.
+
+        Rows are kept but their scraped_at is reset to the epoch.
+
+        Args:
+            source_name: Only expire this source (default: every source)
+            source_event_id: Only expire this event (requires source_name)
+
+        Returns:
+            Number of events invalidated
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support invalidation")
+
+    def record_runs(self, runs: List[ScrapeRun]) -> int:
+        """
+        Append per-source run outcomes to the scrape_runs history.
+
+        Args:
+            runs: One ScrapeRun per source of a run
+
+        Returns:
+            Number of rows written
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not keep run history")
+
+    def get_run_report(
+        self,
+        since: datetime,
+        source_names: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Aggregate run history per source since a point in time.
+
+        Duration percentiles only cover sources that were actually scraped
+        (successful, not served from cache).
+
+        Args:
+            since: Oldest run started_at to include
+            source_names: Only report these sources (default: every source)
+
+        Returns:
+            One dictionary per source, ordered by source name, with runs,
+            successes, failures, timeouts, success_rate, p50_seconds,
+            p95_seconds, events_per_run (mean over successful runs) and
+            cache_hit_ratio (fraction of runs served from cache)
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not keep run history")
+
+    @contextmanager
+    def source_lock(self, source_name: str, timeout: Optional[float] = None) -> Iterator[bool]:
+        """
+        Hold a cross-process lock while scraping and storing a source.
+
+        Other processes refreshing the same source wait for the holder, then
+        re-read the cache instead of scraping again. If the lock cannot be
+        taken within timeout, the caller proceeds without it.
+
+        The default implementation does no locking.
+
+        Yields:
+            True if another process held the lock when we asked for it
+        """
+        yield False
+
+    @abstractmethod
+    def close(self):
+        """Release the underlying connection"""
+        pass
+
+    def _page_size(self, page_size: Optional[int]) -> int:
+        """Requested page size, defaulted and clamped to 1..Config.PAGE_SIZE_MAX"""
+        if page_size is None:
+            page_size = Config.PAGE_SIZE
+        return max(1, min(page_size, Config.PAGE_SIZE_MAX))
+
+    def _make_page(self, events: List[Dict[str, Any]], page_size: int) -> EventPage:
+        """Page from up to page_size + 1 events (the extra one means there is a next page)"""
+        if len(events) <= page_size:
+            return EventPage(events, None)
+        events = events[:page_size]
+        last = events[-1]
+        return EventPage(events, encode_cursor(last['event_date'], last['id']))
+
+    def _convert_row(self, row: tuple, row_format: str):
+        """Convert a row in EVENT_COLUMNS order to the requested format"""
+        if row_format == 'dict':
+            return self._row_to_dict(row)
+        if row_format == 'record':
+            return EventRow._make(row)
+        return tuple(row)
+
+    def _row_to_dict(self, row: tuple) -> Dict[str, Any]:
+        """Convert an events row (in EVENT_COLUMNS order) to a dictionary"""
+        return dict(zip(self.EVENT_COLUMNS, row))
+
+    def _run_report_row(self, row: tuple) -> Dict[str, Any]:
+        """
+        Convert a run report row to a dictionary.
+
+        Expects (source_name, runs, successes, failures, timeouts,
+        cache_hits, events_per_run, p50, p95).
+        """
+        source_name, runs, successes, failures, timeouts, cache_hits, events_per_run, p50, p95 = row
+        return {
+            'source_name': source_name,
+            'runs': runs,
+            'successes': successes,
+            'failures': failures,
+            'timeouts': timeouts,
+            'success_rate': successes / runs if runs else 0.0,
+            'p50_seconds': p50,
+            'p95_seconds': p95,
+            'events_per_run': float(events_per_run) if events_per_run is not None else 0.0,
+            'cache_hit_ratio': cache_hits / runs if runs else 0.0,
+        }
+
+    def __enter__(self):
+        """Context manager entry"""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Context manager exit"""
+        self.close()
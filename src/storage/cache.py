@@ -1,29 +1,96 @@
 """Cache manager for event data"""
 import logging
-from typing import List, Dict, Any, Callable
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import List, Dict, Any, Callable, Optional, Tuple
 from datetime import datetime, timedelta
-from .supabase import SupabaseClient
+from ..config import Config
+from ..instrumentation import metrics
+from ..profiling import profiler
+from ..scheduling.resilience import SourceUnavailable
+from .base import EventStore
+from .memory import MemoryCache
+from .query import EventQuery
+from .ttl import AdaptiveTTL
+from .singleflight import SingleFlight
 
 logger = logging.getLogger(__name__)
 
 
 class CacheManager:
-    """Manage caching of event data with TTL"""
+    """
+    Manage caching of event data with TTL.
 
-    def __init__(self, db_client: SupabaseClient):
+    Two tiers: an optional in-process MemoryCache answers repeat lookups
+    without a network round trip, and the database tier holds everything
+    scraped within ttl_hours.
+
+    With stale_while_revalidate enabled, data past ttl_hours but within
+    max_stale_hours is returned immediately while a background refresh
+    re-scrapes the source.
+    """
+
+    TIERS = ('memory', 'db')
+
+    def __init__(
+        self,
+        db_client: EventStore,
+        memory_cache: Optional[MemoryCache] = None,
+        stale_while_revalidate: Optional[bool] = None,
+        max_stale_hours: Optional[int] = None,
+        ttl_policy: Optional[AdaptiveTTL] = None
+    ):
         """
         Initialize cache manager.
 
         Args:
-            db_client: Supabase client for database operations
+            db_client: Storage backend (SupabaseClient or SQLiteClient)
+            memory_cache: In-process cache tier (default: built from Config
+                when MEMORY_CACHE_ENABLED)
+            stale_while_revalidate: Serve expired data while refreshing in the
+                background (default: Config.CACHE_STALE_WHILE_REVALIDATE)
+            max_stale_hours: Hard expiry; older data is never served
+                (default: Config.CACHE_MAX_STALE_HOURS)
+            ttl_policy: Learns per-source TTLs that replace the ttl_hours
+                passed by callers (default: AdaptiveTTL when Config.ADAPTIVE_TTL)
         """
         self.db = db_client
 
+        if memory_cache is None and Config.MEMORY_CACHE_ENABLED:
+            memory_cache = MemoryCache.from_config()
+        self.memory = memory_cache
+
+        if stale_while_revalidate is None:
+            stale_while_revalidate = Config.CACHE_STALE_WHILE_REVALIDATE
+        if max_stale_hours is None:
+            max_stale_hours = Config.CACHE_MAX_STALE_HOURS
+        self.stale_while_revalidate = stale_while_revalidate
+        self.max_stale_hours = max_stale_hours
+
+        if ttl_policy is None and Config.ADAPTIVE_TTL:
+            ttl_policy = AdaptiveTTL()
+        self.ttl_policy = ttl_policy
+
+        self._invalidation_hooks: List[Callable[[Optional[str]], None]] = []
+        self._stats = {tier: {'hits': 0, 'misses': 0} for tier in self.TIERS}
+        self._stats['db']['stale'] = 0
+        self._stats_lock = threading.Lock()
+
+        # Concurrent refreshes of one source share a single scrape
+        self._singleflight = SingleFlight()
+
+        # Background refreshes, at most one in flight per source
+        self._refresh_executor: Optional[ThreadPoolExecutor] = None
+        self._refreshing: Dict[str, Future] = {}
+        self._refresh_lock = threading.Lock()
+
     def get_or_fetch(
         self,
         source_name: str,
         scraper_func: Callable[[], List[Dict[str, Any]]],
-        ttl_hours: int = 6
+        ttl_hours: int = 6,
+        check_cache: bool = True,
+        query: Optional[EventQuery] = None
     ) -> List[Dict[str, Any]]:
         """
         Get cached events or fetch fresh data if cache is stale.
@@ -32,28 +99,104 @@ class CacheManager:
             source_name: Source identifier (e.g., 'knco')
             scraper_func: Function to call if cache miss (returns raw event dicts)
             ttl_hours: Cache time-to-live in hours
+            check_cache: Whether to query the cache first. Pass False when the
+                caller already knows this source is a miss (e.g. from
+                get_cached_many) to skip the redundant lookup.
+            query: Only return events matching this query, read with its
+                predicates in SQL. A refresh still scrapes and caches the
+                whole source.
 
         Returns:
             List of event dictionaries
         """
+        ttl_hours = self.ttl_for(source_name, ttl_hours)
+        query = query if query is not None and query.bounded else None
+
         # Check cache first
-        cached = self.db.get_cached_events(source_name, ttl_hours)
-
-        if cached:
-            # Cache hit
-            age = datetime.now() - cached[0]['scraped_at']
-            logger.info(
-                f"Cache HIT for {source_name}: {len(cached)} events "
-                f"(age: {age.total_seconds() / 3600:.1f} hours)"
+        if check_cache:
+            cached = self._get_from_memory(source_name)
+            if cached is not None:
+                return query.filter(cached) if query else cached
+
+            read_hours = self.read_window(ttl_hours)
+            with metrics.span('cache_read', tier='db'):
+                cached_by_source = {source_name: self.db.get_cached_events(source_name, read_hours, **self._query_arg(query))}
+            hits = self._resolve_db_hits(
+                [source_name], cached_by_source, {source_name: ttl_hours}, read_hours,
+                {source_name: scraper_func}, query
             )
-            return cached
+            if source_name in hits:
+                return hits[source_name]
 
-        # Cache miss - fetch fresh data
+        fresh = self.refresh(source_name, scraper_func, ttl_hours)
+        return query.filter(fresh) if query else fresh
+
+    def refresh(
+        self,
+        source_name: str,
+        scraper_func: Callable[[], List[Dict[str, Any]]],
+        ttl_hours: int = 6
+    ) -> List[Dict[str, Any]]:
+        """
+        Scrape a source, store the results and return the fresh events.
+
+        Concurrent refreshes of the same source in this process share one
+        scrape. Across processes, the store's source lock makes later
+        callers wait for the first one and reuse its stored result.
+
+        Args:
+            source_name: Source identifier (e.g., 'knco')
+            scraper_func: Function returning raw event dicts
+            ttl_hours: Cache time-to-live in hours
+
+        Returns:
+            List of event dictionaries
+        """
+        ttl_hours = self.ttl_for(source_name, ttl_hours)
+        return self._singleflight.do(
+            source_name,
+            lambda: self._locked_refresh(source_name, scraper_func, ttl_hours)
+        )
+
+    def _locked_refresh(
+        self,
+        source_name: str,
+        scraper_func: Callable[[], List[Dict[str, Any]]],
+        ttl_hours: float
+    ) -> List[Dict[str, Any]]:
+        """Refresh under the store's cross-process source lock"""
+        with self.db.source_lock(source_name) as contended:
+            if contended:
+                # Another process held the lock, so it has probably just
+                # stored fresh events for this source
+                cached = self.db.get_cached_events(source_name, ttl_hours)
+                if cached:
+                    logger.info(f"Reusing {len(cached)} {source_name} events refreshed by another process")
+                    self._store_in_memory(source_name, cached, ttl_hours)
+                    return cached
+
+            return self._scrape_and_store(source_name, scraper_func, ttl_hours)
+
+    def _scrape_and_store(
+        self,
+        source_name: str,
+        scraper_func: Callable[[], List[Dict[str, Any]]],
+        ttl_hours: float
+    ) -> List[Dict[str, Any]]:
+        """Scrape, normalize and upsert a source, returning the stored events"""
         logger.info(f"Cache MISS for {source_name}, fetching fresh data...")
 
         try:
             # Call scraper function to get raw events
-            raw_events = scraper_func()
+            with profiler.section(source=source_name, stage='fetch'):
+                try:
+                    raw_events = scraper_func()
+                except SourceUnavailable as e:
+                    logger.warning(f"{e}")
+                    from ..processors.normalizer import Normalizer
+                    return self.serve_unavailable(
+                        source_name, Normalizer(source_name).normalize(e.events), ttl_hours
+                    )
 
             if not raw_events:
                 logger.warning(f"Scraper returned no events for {source_name}")
@@ -61,37 +204,437 @@ class CacheManager:
 
             # Import normalizer here to avoid circular dependency
             from ..processors.normalizer import Normalizer
+            from ..processors.deduplicator import Deduplicator
 
             # Normalize events
             normalizer = Normalizer(source_name)
-            normalized_events = normalizer.normalize(raw_events)
-
-            # Store in database
-            count = self.db.upsert_events(normalized_events)
-            logger.info(f"Cached {count} fresh events for {source_name}")
+            with profiler.section(source=source_name, stage='normalize'):
+                normalized_events = normalizer.normalize(raw_events)
 
-            # Convert back to dict format for return
-            # (re-query to get database IDs and timestamps)
-            return self.db.get_cached_events(source_name, ttl_hours)
+            # Deduplicate like the pipeline's dedupe stage, so a source
+            # stores the same rows whichever path scraped it
+            with profiler.section(source=source_name, stage='dedupe'):
+                normalized_events = Deduplicator().deduplicate_events(normalized_events)
+            return self._store_normalized(source_name, normalized_events, ttl_hours)
 
         except Exception as e:
             logger.error(f"Error during cache fetch for {source_name}: {e}")
             raise
 
-    def invalidate_cache(self, source_name: str):
+    def store_events(
+        self,
+        source_name: str,
+        normalized_events: List[Any],
+        ttl_hours: int = 6
+    ) -> List[Dict[str, Any]]:
+        """
+        Store events scraped and normalized outside the cache (e.g. by a pipeline).
+
+        Args:
+            source_name: Source identifier
+            normalized_events: NormalizedEvent objects from a fresh scrape
+            ttl_hours: Cache time-to-live in hours
+
+        Returns:
+            The stored events as dictionaries
+        """
+        return self._store_normalized(source_name, normalized_events, self.ttl_for(source_name, ttl_hours))
+
+    def serve_unavailable(
+        self,
+        source_name: str,
+        normalized_events: List[Any],
+        ttl_hours: float = 6
+    ) -> List[Dict[str, Any]]:
         """
-        Invalidate (clear) cache for a specific source.
+        Answer for a source whose scrape was served from last good payloads.
 
-        Useful for testing or forced refresh.
+        Nothing is stored: the events already in the database are served
+        (up to the hard stale limit), and the payload events only when
+        there are none. Neither cache tier nor the adaptive TTL sees the
+        scrape, so the source is retried on the next read.
 
         Args:
-            source_name: Source to invalidate
+            source_name: Source identifier
+            normalized_events: NormalizedEvent objects parsed from the last good payloads
+            ttl_hours: Cache time-to-live in hours
+
+        Returns:
+            Event dictionaries
         """
-        logger.info(f"Invalidating cache for {source_name}")
+        ttl_hours = self.ttl_for(source_name, ttl_hours)
+        stored = self.db.get_cached_events(source_name, max(ttl_hours, self.max_stale_hours))
+        if stored:
+            logger.info(f"{source_name} unavailable; serving {len(stored)} stored events")
+            return stored
+        logger.info(f"{source_name} unavailable and nothing stored; serving {len(normalized_events)} unstored events")
+        return [event.to_dict() for event in normalized_events]
+
+    def _store_normalized(
+        self,
+        source_name: str,
+        normalized_events: List[Any],
+        ttl_hours: float
+    ) -> List[Dict[str, Any]]:
+        """Upsert a fresh scrape and refresh both cache tiers"""
+        self._record_content(source_name, normalized_events)
 
-        # Delete events older than 0 hours (all events for this source)
-        # This is done by upserting with very old scraped_at timestamp
-        # In production, you might use a DELETE query instead
+        # Store in database
+        with profiler.section(source=source_name, stage='store'):
+            count = self.db.upsert_events(normalized_events)
+        logger.info(f"Cached {count} fresh events for {source_name}")
+        self._notify_invalidated(source_name)
+
+        # Convert back to dict format for return
+        # (re-query to get database IDs and timestamps)
+        fresh = self.db.get_cached_events(source_name, ttl_hours)
+        self._store_in_memory(source_name, fresh, ttl_hours)
+        return fresh
+
+    def refresh_in_background(
+        self,
+        source_name: str,
+        scraper_func: Callable[[], List[Dict[str, Any]]],
+        ttl_hours: int = 6
+    ) -> Future:
+        """
+        Schedule refresh() on a background thread.
+
+        Returns the already-running future if this source is being refreshed.
+        """
+        with self._refresh_lock:
+            in_flight = self._refreshing.get(source_name)
+            if in_flight is not None and not in_flight.done():
+                return in_flight
+
+            if self._refresh_executor is None:
+                self._refresh_executor = ThreadPoolExecutor(
+                    max_workers=Config.CACHE_REFRESH_WORKERS,
+                    thread_name_prefix='cache-refresh'
+                )
+
+            logger.info(f"Refreshing {source_name} in the background")
+            future = self._refresh_executor.submit(self.refresh, source_name, scraper_func, ttl_hours)
+            future.add_done_callback(lambda f: self._log_refresh_failure(source_name, f))
+            self._refreshing[source_name] = future
+            return future
+
+    def get_cached_many(
+        self,
+        source_names: List[str],
+        ttl_hours: int = 6,
+        scraper_funcs: Optional[Dict[str, Callable[[], List[Dict[str, Any]]]]] = None,
+        query: Optional[EventQuery] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Resolve cache hits for several sources with one database query.
+
+        Sources held in the memory tier are answered first; only the rest
+        go to the database.
+
+        Args:
+            source_names: Source identifiers to look up
+            ttl_hours: Cache time-to-live in hours
+            scraper_funcs: Scraper functions by source. With
+                stale_while_revalidate, stale sources that have one are
+                returned as hits and refreshed in the background.
+            query: Only return events matching this query. Its predicates
+                are pushed into the database read; a source freshly scraped
+                but with nothing matching is a hit with no events.
+
+        Returns:
+            Dictionary of cache hits (source -> events). Sources with no fresh
+            events are omitted, so anything missing is a cache miss.
+        """
+        query = query if query is not None and query.bounded else None
+
+        hits = {}
+        for source_name in source_names:
+            cached = self._get_from_memory(source_name)
+            if cached is not None:
+                hits[source_name] = query.filter(cached) if query else cached
+
+        remaining = [s for s in source_names if s not in hits]
+        if not remaining:
+            return hits
+
+        ttls = {s: self.ttl_for(s, ttl_hours) for s in remaining}
+        read_hours = max(self.read_window(t) for t in ttls.values())
+        with metrics.span('cache_read', tier='db'), profiler.section(stage='cache_read'):
+            cached_by_source = self.db.get_cached_events_many(remaining, read_hours, **self._query_arg(query))
+        hits.update(self._resolve_db_hits(remaining, cached_by_source, ttls, read_hours, scraper_funcs or {}, query))
+
+        return hits
+
+    def ttl_for(self, source_name: str, default_hours: float) -> float:
+        """Get the TTL (hours) for a source: learned if a TTL policy is set, else default_hours"""
+        if self.ttl_policy is None:
+            return default_hours
+        try:
+            return self.ttl_policy.ttl_for(source_name, default_hours)
+        except Exception as e:
+            logger.error(f"Could not get adaptive TTL for {source_name}: {e}")
+            return default_hours
+
+    def log_ttls(self, source_names: List[str], default_hours: float):
+        """Log the TTL chosen for each source when a TTL policy is active"""
+        if self.ttl_policy is None:
+            return
+        ttls = ', '.join(f"{s}={self.ttl_for(s, default_hours):.1f}h" for s in source_names)
+        logger.info(f"Adaptive cache TTLs: {ttls}")
+
+    def add_invalidation_hook(self, hook: Callable[[Optional[str]], None]):
+        """
+        Register a callback fired whenever cached data for a source changes.
+
+        The hook receives the source name, or None when everything was
+        invalidated. Hooks run synchronously and exceptions are logged.
+        """
+        self._invalidation_hooks.append(hook)
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Get hit/miss counts and hit rate for each cache tier.
+
+        Returns:
+            Dictionary like {'memory': {'hits': 3, 'misses': 1, 'hit_rate': 0.75}, 'db': {...}}
+        """
+        with self._stats_lock:
+            stats = {tier: dict(counts) for tier, counts in self._stats.items()}
+
+        for counts in stats.values():
+            lookups = counts['hits'] + counts['misses']
+            counts['hit_rate'] = counts['hits'] / lookups if lookups else 0.0
+
+        return stats
+
+    def log_stats(self):
+        """Log hit/miss rates for each cache tier"""
+        for tier, counts in self.get_stats().items():
+            if counts['hits'] or counts['misses'] or counts.get('stale'):
+                stale = f", {counts['stale']} served stale" if counts.get('stale') else ""
+                logger.info(
+                    f"Cache {tier} tier: {counts['hits']} hits, {counts['misses']} misses{stale} "
+                    f"({counts['hit_rate']:.0%} hit rate)"
+                )
+
+    def close(self, wait: bool = True):
+        """Stop the background refresh pool (waiting for refreshes by default)"""
+        with self._refresh_lock:
+            executor, self._refresh_executor = self._refresh_executor, None
+        if executor is not None:
+            executor.shutdown(wait=wait)
+
+    @staticmethod
+    def _query_arg(query: Optional[EventQuery]) -> Dict[str, EventQuery]:
+        """Keyword argument passing a query to a database read, if any"""
+        return {'query': query} if query else {}
+
+    def read_window(self, ttl_hours: int) -> int:
+        """Hours of data to read from the DB tier (includes the stale window)"""
+        if self.stale_while_revalidate:
+            return max(ttl_hours, self.max_stale_hours)
+        return ttl_hours
+
+    def _resolve_db_hits(
+        self,
+        source_names: List[str],
+        cached_by_source: Dict[str, List[Dict[str, Any]]],
+        ttls: Dict[str, float],
+        read_hours: float,
+        scraper_funcs: Dict[str, Callable[[], List[Dict[str, Any]]]],
+        query: Optional[EventQuery] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Turn DB tier rows into hits, serving stale rows when allowed.
+
+        Rows read for a query are only part of a source, so they are not
+        kept in the memory tier, and a source without fresh matching rows
+        is checked for a fresh scrape before it counts as a miss.
+
+        Args:
+            source_names: Sources that were read
+            cached_by_source: Rows read for each source
+            ttls: TTL (hours) for each source
+            read_hours: Window the rows were read with
+            scraper_funcs: Scraper functions for background revalidation
+            query: Query the rows were read with
+
+        Returns:
+            Dictionary of hits (source -> events); misses are omitted
+        """
+        fresh_elsewhere = set()
+        if query is not None:
+            fresh_elsewhere = self._fresh_sources(
+                [s for s in source_names if not self._has_fresh(cached_by_source.get(s) or [], ttls[s])],
+                ttls
+            )
+
+        hits = {}
+        for source_name in source_names:
+            rows = cached_by_source.get(source_name) or []
+            ttl_hours = ttls[source_name]
+
+            # Rows were read with a wider window than this source's TTL
+            if read_hours > ttl_hours:
+                fresh, stale = self._split_stale(rows, ttl_hours)
+                if not self.stale_while_revalidate:
+                    stale = []
+            else:
+                fresh, stale = rows, []
+
+            if fresh:
+                self._record('db', hit=True)
+                self._log_hit(source_name, fresh)
+                if query is None:
+                    self._store_in_memory(source_name, fresh, ttl_hours)
+                hits[source_name] = fresh
+            elif source_name in fresh_elsewhere:
+                self._record('db', hit=True)
+                logger.info(f"Cache HIT for {source_name}: no events match the query")
+                hits[source_name] = []
+            elif stale and source_name in scraper_funcs:
+                with self._stats_lock:
+                    self._stats['db']['stale'] += 1
+                logger.info(f"Cache STALE for {source_name}: serving {len(stale)} events while revalidating")
+                self.refresh_in_background(source_name, scraper_funcs[source_name], ttl_hours)
+                hits[source_name] = stale
+            else:
+                self._record('db', hit=False)
+
+        return hits
+
+    def _has_fresh(self, rows: List[Dict[str, Any]], ttl_hours: float) -> bool:
+        """Whether any row was scraped within ttl_hours"""
+        stamps = [r['scraped_at'] for r in rows if r.get('scraped_at')]
+        if not stamps:
+            return False
+        newest = max(stamps)
+        return newest > datetime.now(newest.tzinfo) - timedelta(hours=ttl_hours)
+
+    def _fresh_sources(self, source_names: List[str], ttls: Dict[str, float]) -> set:
+        """Sources scraped within their TTL, judged by their newest row (one aggregate query)"""
+        if not source_names:
+            return set()
+        fresh = set()
+        for source_name, scraped_at in self.db.get_last_scraped(source_names).items():
+            if scraped_at and scraped_at > datetime.now(scraped_at.tzinfo) - timedelta(hours=ttls[source_name]):
+                fresh.add(source_name)
+        return fresh
+
+    def _split_stale(
+        self,
+        rows: List[Dict[str, Any]],
+        ttl_hours: int
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Split rows read with the stale window into (fresh, stale).
+
+        Stale rows are only returned when nothing is fresh, and are limited
+        to the TTL window ending at the newest scrape - the same rows a
+        fresh read would have returned at that time.
+        """
+        rows = [r for r in rows if r.get('scraped_at')]
+        if not rows:
+            return [], []
+
+        ttl = timedelta(hours=ttl_hours)
+        newest = max(r['scraped_at'] for r in rows)
+        now = datetime.now(newest.tzinfo)
+
+        fresh = [r for r in rows if r['scraped_at'] > now - ttl]
+        if fresh:
+            return fresh, []
+
+        return [], [r for r in rows if r['scraped_at'] > newest - ttl]
+
+    def _record_content(self, source_name: str, normalized_events: List[Any]):
+        """Feed a scrape's content hashes to the TTL policy"""
+        if self.ttl_policy is None:
+            return
+        try:
+            self.ttl_policy.record_scrape(source_name, [e.content_hash for e in normalized_events])
+        except Exception as e:
+            logger.error(f"Could not record content changes for {source_name}: {e}")
+
+    def _log_refresh_failure(self, source_name: str, future: Future):
+        """Log errors from background refreshes (nobody waits on them)"""
+        if not future.cancelled() and future.exception() is not None:
+            logger.error(f"Background refresh failed for {source_name}: {future.exception()}")
+
+    def _get_from_memory(self, source_name: str) -> Optional[List[Dict[str, Any]]]:
+        """Look up the memory tier, recording the hit or miss"""
+        if self.memory is None:
+            return None
+
+        cached = self.memory.get(source_name)
+        self._record('memory', hit=cached is not None)
+        if cached is not None:
+            logger.info(f"Cache HIT (memory) for {source_name}: {len(cached)} events")
+        return cached
+
+    def _store_in_memory(self, source_name: str, events: List[Dict[str, Any]], ttl_hours: int):
+        """Populate the memory tier, never outliving the database TTL"""
+        if self.memory is None or not events:
+            return
+
+        ttl_seconds = ttl_hours * 3600
+        scraped = [e['scraped_at'] for e in events if e.get('scraped_at')]
+        if scraped:
+            oldest = min(scraped)
+            age = datetime.now(oldest.tzinfo) - oldest
+            ttl_seconds -= age.total_seconds()
+
+        self.memory.set(source_name, events, ttl_seconds=ttl_seconds)
+
+    def _notify_invalidated(self, source_name: Optional[str]):
+        """Drop the memory tier entry and fire invalidation hooks"""
+        if self.memory is not None:
+            self.memory.invalidate(source_name)
+
+        for hook in self._invalidation_hooks:
+            try:
+                hook(source_name)
+            except Exception as e:
+                logger.error(f"Cache invalidation hook failed: {e}")
+
+    def _record(self, tier: str, hit: bool):
+        """Count a hit or miss for a cache tier"""
+        with self._stats_lock:
+            self._stats[tier]['hits' if hit else 'misses'] += 1
+        metrics.count('cache_hits' if hit else 'cache_misses', tier=tier)
+
+    def _log_hit(self, source_name: str, cached: List[Dict[str, Any]]):
+        """Log a cache hit with the age of the cached data"""
+        scraped_at = cached[0]['scraped_at']
+        age = datetime.now(scraped_at.tzinfo) - scraped_at
+        logger.info(
+            f"Cache HIT for {source_name}: {len(cached)} events "
+            f"(age: {age.total_seconds() / 3600:.1f} hours)"
+        )
+
+    def invalidate_cache(
+        self,
+        source_name: Optional[str] = None,
+        source_event_id: Optional[str] = None
+    ) -> int:
+        """
+        Invalidate cached events so the next lookup re-scrapes.
+
+        Invalidated events are also excluded from stale-while-revalidate.
+
+        Args:
+            source_name: Source to invalidate (default: every source)
+            source_event_id: Single event to invalidate (requires source_name)
+
+        Returns:
+            Number of events invalidated
+        """
+        target = source_name or 'all sources'
+        if source_event_id is not None:
+            target = f"{source_name} event {source_event_id}"
+        logger.info(f"Invalidating cache for {target}")
 
-        # For now, we'll just log - actual implementation would delete from DB
-        logger.warning("Cache invalidation not fully implemented (requires DELETE query)")
+        count = self.db.invalidate_events(source_name, source_event_id)
+        self._notify_invalidated(source_name)
+        return count
@@ -0,0 +1,69 @@
+"""Cross-process file locks"""
+import os
+import time
+import logging
+from pathlib import Path
+from typing import Union
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+logger = logging.getLogger(__name__)
+
+
+class FileLock:
+    """
+    Exclusive advisory lock on a file, shared between processes.
+
+    Acquisition polls a non-blocking lock so callers can give up after a
+    timeout instead of hanging on a crashed holder (the OS releases the
+    lock when the holding process exits).
+    """
+
+    POLL_SECONDS = 0.2
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._fd = None
+
+    def acquire(self, timeout: float) -> bool:
+        """
+        Try to take the lock for up to timeout seconds.
+
+        Returns:
+            True if acquired, False on timeout
+        """
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+        deadline = time.monotonic() + timeout
+
+        while True:
+            try:
+                if fcntl is not None:
+                    fcntl.flock(fd, fcntl.LOCK_EX | fcntl.LOCK_NB)
+                else:
+                    msvcrt.locking(fd, msvcrt.LK_NBLCK, 1)
+                self._fd = fd
+                return True
+            except OSError:
+                if time.monotonic() >= deadline:
+                    os.close(fd)
+                    return False
+                time.sleep(self.POLL_SECONDS)
+
+    def release(self):
+        """Release the lock if held"""
+        if self._fd is None:
+            return
+        try:
+            if fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+            else:
+                os.lseek(self._fd, 0, os.SEEK_SET)
+                msvcrt.locking(self._fd, msvcrt.LK_UNLCK, 1)
+        finally:
+            os.close(self._fd)
+            self._fd = None
@@ -0,0 +1,134 @@
+"""In-process TTL/LRU cache tier for event data"""
+import time
+import logging
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryCache:
+    """
+    Thread-safe in-memory cache of event lists keyed by source.
+
+    Entries expire after a per-source TTL, and the least recently used
+    sources are evicted once the total number of cached events exceeds
+    max_events. Sits in front of the database tier in CacheManager.
+    """
+
+    def __init__(
+        self,
+        default_ttl_seconds: int = 300,
+        source_ttls: Optional[Dict[str, int]] = None,
+        max_events: int = 5000
+    ):
+        """
+        Initialize memory cache.
+
+        Args:
+            default_ttl_seconds: TTL for sources without an explicit override
+            source_ttls: Per-source TTL overrides in seconds (e.g. {'library': 900})
+            max_events: Maximum number of events held across all sources
+        """
+        self.default_ttl_seconds = default_ttl_seconds
+        self.source_ttls = dict(source_ttls or {})
+        self.max_events = max_events
+
+        # source -> (expires_at, events); ordered oldest-used first
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+        self.evictions = 0
+        self.expirations = 0
+
+    @classmethod
+    def from_config(cls) -> "MemoryCache":
+        """Create a memory cache using Config settings"""
+        return cls(
+            default_ttl_seconds=Config.MEMORY_CACHE_TTL_SECONDS,
+            source_ttls=Config.MEMORY_CACHE_SOURCE_TTLS,
+            max_events=Config.MEMORY_CACHE_MAX_EVENTS,
+        )
+
+    def ttl_for(self, source_name: str) -> int:
+        """Get the memory TTL (seconds) for a source"""
+        return self.source_ttls.get(source_name, self.default_ttl_seconds)
+
+    def get(self, source_name: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get cached events for a source.
+
+        Returns:
+            A new list of the cached event dicts, or None on miss/expiry
+        """
+        with self._lock:
+            entry = self._entries.get(source_name)
+            if entry is None:
+                return None
+
+            expires_at, events = entry
+            if time.monotonic() >= expires_at:
+                self._remove(source_name)
+                self.expirations += 1
+                return None
+
+            self._entries.move_to_end(source_name)
+            return list(events)
+
+    def set(
+        self,
+        source_name: str,
+        events: List[Dict[str, Any]],
+        ttl_seconds: Optional[float] = None
+    ):
+        """
+        Store events for a source.
+
+        Args:
+            source_name: Source identifier
+            events: Event dictionaries to cache
+            ttl_seconds: Override TTL; capped at the source's configured TTL
+        """
+        ttl = self.ttl_for(source_name)
+        if ttl_seconds is not None:
+            ttl = min(ttl, ttl_seconds)
+
+        if ttl <= 0 or not events or len(events) > self.max_events:
+            return
+
+        with self._lock:
+            if source_name in self._entries:
+                self._remove(source_name)
+
+            self._entries[source_name] = (time.monotonic() + ttl, list(events))
+            self._size += len(events)
+
+            # Evict least recently used sources until back under the bound
+            while self._size > self.max_events:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.evictions += 1
+                logger.debug(f"Evicted {oldest} from memory cache")
+
+    def invalidate(self, source_name: Optional[str] = None):
+        """
+        Drop cached events for one source, or everything if source_name is None.
+        """
+        with self._lock:
+            if source_name is None:
+                self._entries.clear()
+                self._size = 0
+            elif source_name in self._entries:
+                self._remove(source_name)
+
+    def __len__(self) -> int:
+        """Number of sources currently cached"""
+        return len(self._entries)
+
+    def _remove(self, source_name: str):
+        """Remove an entry (caller must hold the lock)"""
+        _, events = self._entries.pop(source_name)
+        self._size -= len(events)
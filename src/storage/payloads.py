@@ -0,0 +1,82 @@
+"""Last good raw payload per URL"""
+import os
+import json
+import time
+import hashlib
+import logging
+import tempfile
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple, Union
+from ..config import Config
+
+logger = logging.getLogger(__name__)
+
+
+class PayloadStore:
+    """
+    Keep the last successfully downloaded body of each URL on disk.
+
+    Served in place of a live response while a source's circuit breaker
+    is open, so a failing site doesn't empty the source. Each URL has a
+    body file and a small JSON metadata file, both replaced atomically.
+    """
+
+    def __init__(self, directory: Union[str, Path, None] = None):
+        """
+        Initialize store.
+
+        Args:
+            directory: Where payloads are kept (default: Config.STATE_DIR / 'payloads')
+        """
+        self.directory = Path(directory or Config.STATE_DIR / 'payloads')
+
+    def get(self, url: str) -> Optional[Tuple[bytes, Dict[str, Any]]]:
+        """
+        Get the last good payload for a URL.
+
+        Returns:
+            Tuple of (body, metadata), or None if nothing was saved
+        """
+        body_path, meta_path = self._paths(url)
+        try:
+            meta = json.loads(meta_path.read_text(encoding='utf-8'))
+            return body_path.read_bytes(), meta
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Ignoring unreadable payload for {url}: {e}")
+            return None
+
+    def has(self, url: str) -> bool:
+        """Whether a payload is saved for a URL"""
+        return all(path.exists() for path in self._paths(url))
+
+    def put(self, url: str, body: bytes, content_type: Optional[str] = None):
+        """Save a URL's body as its last good payload"""
+        body_path, meta_path = self._paths(url)
+        meta = {'url': url, 'content_type': content_type, 'saved_at': time.time()}
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._replace(body_path, body)
+            self._replace(meta_path, json.dumps(meta).encode('utf-8'))
+        except OSError as e:
+            logger.error(f"Could not save payload for {url}: {e}")
+
+    def _paths(self, url: str) -> Tuple[Path, Path]:
+        name = hashlib.sha256(url.encode('utf-8')).hexdigest()[:32]
+        return self.directory / f"{name}.body", self.directory / f"{name}.json"
+
+    def _replace(self, path: Path, data: bytes):
+        """Write via a temp file + rename so readers never see a partial file"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, prefix=path.name, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+
+
+# Process-wide store used by scraper sessions
+payloads = PayloadStore()
@@ -0,0 +1,151 @@
+"""Composable filters and keyset pagination for cached event reads"""
+import base64
+import json
+from datetime import datetime
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
+
+from ..processors.window import DateWindow
+
+
+class EventQuery(NamedTuple):
+    """
+    Predicates on cached events, pushed into each backend's WHERE clause.
+
+    Queries are immutable and built by chaining:
+
+        EventQuery().at_least(50).free().in_city_areas('Grass Valley')
+
+    Backends compile them with where(), so only matching rows leave the
+    database; matches() and filter() apply the same predicates to events
+    already in memory (memory-tier hits and fresh scrapes).
+    """
+
+    window: Optional[DateWindow] = None
+    min_quality_score: int = 0
+    free_only: bool = False
+    city_areas: Tuple[str, ...] = ()
+    age_ranges: Tuple[str, ...] = ()
+
+    def within(self, window: Optional[DateWindow]) -> 'EventQuery':
+        """Only events dated in window"""
+        return self._replace(window=window)
+
+    def at_least(self, min_quality_score: int) -> 'EventQuery':
+        """Only events scoring at least min_quality_score (0-100)"""
+        return self._replace(min_quality_score=min_quality_score or 0)
+
+    def free(self, free_only: bool = True) -> 'EventQuery':
+        """Only free events"""
+        return self._replace(free_only=free_only)
+
+    def in_city_areas(self, *city_areas: str) -> 'EventQuery':
+        """Only events in one of these city areas (exact match)"""
+        return self._replace(city_areas=tuple(city_areas))
+
+    def for_age_ranges(self, *age_ranges: str) -> 'EventQuery':
+        """Only events listed for one of these age ranges (exact match)"""
+        return self._replace(age_ranges=tuple(age_ranges))
+
+    @property
+    def bounded(self) -> bool:
+        """Whether the query excludes anything"""
+        return bool(
+            (self.window is not None and self.window.bounded) or self.min_quality_score > 0
+            or self.free_only or self.city_areas or self.age_ranges
+        )
+
+    def matches(self, event: Dict[str, Any]) -> bool:
+        """Whether an event dictionary satisfies every predicate"""
+        if self.window is not None and not self.window.contains(event.get('event_date')):
+            return False
+        if self.min_quality_score > 0 and (event.get('quality_score') or 0) < self.min_quality_score:
+            return False
+        if self.free_only and not event.get('is_free'):
+            return False
+        if self.city_areas and event.get('city_area') not in self.city_areas:
+            return False
+        if self.age_ranges and event.get('age_range') not in self.age_ranges:
+            return False
+        return True
+
+    def filter(self, events: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Events that satisfy every predicate"""
+        if not self.bounded:
+            return list(events)
+        return [event for event in events if self.matches(event)]
+
+    def where(
+        self,
+        placeholder: str = '?',
+        to_timestamp: Callable[[datetime], Any] = lambda value: value
+    ) -> Tuple[str, List[Any]]:
+        """
+        Compile the predicates to SQL for appending to a WHERE clause.
+
+        The SQL is the same on SQLite and Postgres, down to the bare
+        "is_free" term: partial indexes are only used when the query
+        repeats their WHERE expression exactly. Window bounds are pinned
+        to Config.TIMEZONE (see DateWindow.localized) before conversion.
+
+        Args:
+            placeholder: The driver's parameter marker ('?' or '%s')
+            to_timestamp: Converts aware window bounds to the stored representation
+
+        Returns:
+            Tuple of (" AND ..." clauses, parameters in order)
+        """
+        clauses: List[str] = []
+        params: List[Any] = []
+        window = self.window.localized() if self.window is not None else DateWindow()
+        if window.start is not None:
+            clauses.append(f"event_date >= {placeholder}")
+            params.append(to_timestamp(window.start))
+        if window.end is not None:
+            clauses.append(f"event_date < {placeholder}")
+            params.append(to_timestamp(window.end))
+        if self.min_quality_score > 0:
+            clauses.append(f"quality_score >= {placeholder}")
+            params.append(self.min_quality_score)
+        if self.free_only:
+            clauses.append("is_free")
+        for column, values in (('city_area', self.city_areas), ('age_range', self.age_ranges)):
+            if values:
+                clauses.append(f"{column} IN ({', '.join(placeholder for _ in values)})")
+                params.extend(values)
+
+        return ''.join(f" AND {clause}" for clause in clauses), params
+
+
+class EventPage(NamedTuple):
+    """One page of events, and the cursor of the next page (None on the last)"""
+
+    events: List[Dict[str, Any]]
+    next_cursor: Optional[str]
+
+
+def encode_cursor(event_date: datetime, event_id: int) -> str:
+    """
+    Opaque cursor for the page after an event.
+
+    Pages are keyset-paginated on (event_date, id), so a cursor is just the
+    sort key of the last event served. It stays valid while rows are
+    added or removed: the next page starts after that key, not at a
+    row offset.
+    """
+    key = json.dumps([event_date.isoformat(), event_id], separators=(',', ':'))
+    return base64.urlsafe_b64encode(key.encode('utf-8')).decode('ascii').rstrip('=')
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    """
+    Sort key (event_date, id) of a cursor from encode_cursor.
+
+    Raises:
+        ValueError: The cursor is malformed
+    """
+    try:
+        padded = cursor + '=' * (-len(cursor) % 4)
+        event_date, event_id = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')))
+        return datetime.fromisoformat(event_date), int(event_id)
+    except (TypeError, ValueError, UnicodeError) as e:
+        raise ValueError(f"Invalid page cursor {cursor!r}") from e
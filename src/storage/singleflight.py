@@ -0,0 +1,55 @@
+"""In-process request coalescing"""
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict
+
+logger = logging.getLogger(__name__)
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent calls for the same key into one execution.
+
+    The first caller for a key runs the function; callers arriving while
+    it is in flight wait for and share its result (or exception).
+    """
+
+    def __init__(self):
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: str, func: Callable[[], Any]) -> Any:
+        """
+        Run func() for key, or wait for the call already in flight.
+
+        Returns:
+            The result of the single shared execution
+        """
+        with self._lock:
+            future = self._in_flight.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._in_flight[key] = future
+
+        if not leader:
+            logger.info(f"Waiting for in-flight fetch of {key}")
+            return future.result()
+
+        try:
+            result = func()
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    def in_flight(self, key: str) -> bool:
+        """Whether a call for key is currently running"""
+        with self._lock:
+            return key in self._in_flight
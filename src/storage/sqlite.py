@@ -0,0 +1,703 @@
+"""Local SQLite storage backend"""
+import time
+import sqlite3
+import logging
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Iterator, Union
+from datetime import datetime, timedelta, timezone
+from zoneinfo import ZoneInfo
+from ..config import Config
+from ..instrumentation import metrics
+from ..processors.normalizer import NormalizedEvent
+from .base import EventStore, EventRow, ScrapeRun
+from .query import EventPage, EventQuery, decode_cursor
+from .locks import FileLock
+
+logger = logging.getLogger(__name__)
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+  id INTEGER PRIMARY KEY AUTOINCREMENT,
+
+  -- Core fields
+  title TEXT NOT NULL,
+  description TEXT,
+  event_date TEXT,
+
+  -- Location
+  venue TEXT,
+  city_area TEXT,
+
+  -- Source tracking
+  source_name TEXT NOT NULL,
+  source_url TEXT,
+  source_event_id TEXT,
+  scraped_at TEXT,
+
+  -- Deduplication
+  content_hash TEXT,
+
+  -- Metadata
+  event_types TEXT,
+  age_range TEXT,
+  price TEXT,
+  is_free INTEGER,
+
+  -- Quality/enrichment
+  kid_friendly_score INTEGER,
+  quality_score INTEGER,
+
+  created_at TEXT
+);
+
+CREATE UNIQUE INDEX IF NOT EXISTS idx_source_event_unique ON events(source_name, source_event_id);
+-- Also the (event_date, id) keyset of paged reads: SQLite appends the rowid to every index
+CREATE INDEX IF NOT EXISTS idx_events_date ON events(event_date);
+CREATE INDEX IF NOT EXISTS idx_events_source_date ON events(source_name, event_date);
+CREATE INDEX IF NOT EXISTS idx_events_source_quality ON events(source_name, quality_score);
+CREATE INDEX IF NOT EXISTS idx_events_free ON events(source_name, event_date) WHERE is_free;
+CREATE INDEX IF NOT EXISTS idx_events_city_area ON events(city_area, event_date);
+DROP INDEX IF EXISTS idx_events_source;
+CREATE INDEX IF NOT EXISTS idx_events_content_hash ON events(content_hash);
+CREATE INDEX IF NOT EXISTS idx_events_scraped_at ON events(scraped_at);
+
+CREATE TABLE IF NOT EXISTS scrape_runs (
+  id INTEGER PRIMARY KEY AUTOINCREMENT,
+  run_id TEXT NOT NULL,
+  started_at TEXT NOT NULL,
+  source_name TEXT NOT NULL,
+  status TEXT NOT NULL,
+  duration_seconds REAL,
+  event_count INTEGER NOT NULL DEFAULT 0,
+  cache_hit INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE INDEX IF NOT EXISTS idx_scrape_runs_started_at ON scrape_runs(started_at);
+CREATE INDEX IF NOT EXISTS idx_scrape_runs_source_started ON scrape_runs(source_name, started_at);
+
+-- Rewrite event dates stored without a fraction (by older versions) in _to_text's format
+UPDATE events SET event_date = substr(event_date, 1, 19) || '.000000' || substr(event_date, 20)
+WHERE length(event_date) >= 19 AND substr(event_date, 20, 1) <> '.';
+
+-- County iCal events were keyed by their UID (12345@nevadacountyca.gov) before
+-- they were keyed by EID like the list view; drop those rows, the next scrape
+-- stores them again under their EID
+DELETE FROM events
+WHERE source_name = 'county' AND source_event_id LIKE '%@%' AND lower(source_url) LIKE '%eid=%';
+"""
+
+
+# scraped_at value for invalidated rows (older than any TTL)
+EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _utc_now() -> datetime:
+    """Current time as an aware UTC datetime"""
+    return datetime.now(timezone.utc)
+
+
+def _to_text(value: Union[datetime, str, None]) -> Optional[str]:
+    """
+    Serialize a datetime so that string order matches time order.
+
+    ISO strings are parsed and rewritten in the same canonical format
+    (isoformat() drops a zero fraction, which would sort out of order).
+    """
+    if value is None:
+        return None
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return value
+    return value.isoformat(timespec='microseconds')
+
+
+def _event_date_text(value: Union[datetime, str, None]) -> Optional[str]:
+    """
+    Serialize an event date, converting aware ones to Config.TIMEZONE.
+
+    Their wall-clock prefix is then local time, like naive event dates
+    and window bounds (see _to_wall_clock), so text comparisons agree.
+    """
+    if isinstance(value, str):
+        try:
+            value = datetime.fromisoformat(value)
+        except ValueError:
+            return value
+    if value is not None and value.tzinfo is not None:
+        value = value.astimezone(ZoneInfo(Config.TIMEZONE))
+    return _to_text(value)
+
+
+def _to_wall_clock(value: datetime) -> str:
+    """
+    Serialize a window bound pinned to Config.TIMEZONE as local wall-clock text.
+
+    Event dates are stored as the sources publish them, in local time, so
+    bounds compare as text only without an offset of their own.
+    """
+    return _to_text(value.replace(tzinfo=None))
+
+
+def _from_text(value: Optional[str]) -> Optional[datetime]:
+    """Parse a timestamp stored by _to_text"""
+    if not value:
+        return None
+    return datetime.fromisoformat(value)
+
+
+class SQLiteClient(EventStore):
+    """
+    Local on-disk event store.
+
+    Mirrors the Supabase events table and indexes so it can stand in for
+    SupabaseClient in offline runs, edge deployments and tests. A single
+    connection is shared between threads behind a lock.
+    """
+
+    # Column positions that need decoding from their stored representation
+    _DATETIME_COLUMNS = (EventRow._fields.index('event_date'), EventRow._fields.index('scraped_at'))
+    _IS_FREE_COLUMN = EventRow._fields.index('is_free')
+
+    def __init__(self, path: Union[str, Path, None] = None, wal: Optional[bool] = None):
+        """
+        Open (and create if needed) the SQLite database.
+
+        Args:
+            path: Database file, or ':memory:' (default: Config.SQLITE_PATH)
+            wal: Enable write-ahead logging (default: Config.SQLITE_WAL)
+        """
+        self.path = str(path if path is not None else Config.SQLITE_PATH)
+        self.wal = Config.SQLITE_WAL if wal is None else wal
+        self._lock = threading.RLock()
+        self.conn = None
+        self._connect()
+
+    def _connect(self):
+        """Open the connection, apply pragmas and create the schema"""
+        try:
+            if self.path != ':memory:':
+                Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+
+            logger.info(f"Opening SQLite store at {self.path}")
+            self.conn = sqlite3.connect(self.path, check_same_thread=False)
+
+            if self.wal and self.path != ':memory:':
+                self.conn.execute("PRAGMA journal_mode=WAL")
+                self.conn.execute("PRAGMA synchronous=NORMAL")
+
+            self.conn.executescript(SCHEMA)
+            self.conn.commit()
+        except sqlite3.Error as e:
+            logger.error(f"Failed to open SQLite store: {e}")
+            raise ConnectionError(f"Could not open SQLite store at {self.path}: {e}")
+
+    def upsert_events(self, events: List[NormalizedEvent], batch_size: int = None) -> int:
+        """
+        Insert or update events in batches within a single transaction.
+
+        Args:
+            events: List of NormalizedEvent objects
+            batch_size: Rows per executemany call (default: Config.SQLITE_BATCH_SIZE)
+
+        Returns:
+            Number of events upserted
+        """
+        if not events:
+            logger.warning("No events to upsert")
+            return 0
+
+        if batch_size is None:
+            batch_size = Config.SQLITE_BATCH_SIZE
+
+        now = _to_text(_utc_now())
+        values = [
+            (
+                event.title,
+                event.description,
+                _event_date_text(event.event_date),
+                event.venue,
+                event.city_area,
+                event.source_name,
+                event.source_url,
+                event.source_event_id,
+                event.content_hash,
+                event.age_range,
+                event.price,
+                event.is_free,
+                event.quality_score,
+                now,
+                now,
+            )
+            for event in events
+        ]
+
+        query = """
+            INSERT INTO events (
+                title, description, event_date, venue, city_area,
+                source_name, source_url, source_event_id, content_hash,
+                age_range, price, is_free, quality_score, scraped_at, created_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT (source_name, source_event_id)
+            DO UPDATE SET
+                title = excluded.title,
+                description = excluded.description,
+                event_date = excluded.event_date,
+                venue = excluded.venue,
+                city_area = excluded.city_area,
+                age_range = excluded.age_range,
+                price = excluded.price,
+                is_free = excluded.is_free,
+                quality_score = excluded.quality_score,
+                scraped_at = excluded.scraped_at
+        """
+
+        with self._lock, metrics.span('db_write', backend='sqlite'):
+            try:
+                with self.conn:
+                    for i in range(0, len(values), batch_size):
+                        self.conn.executemany(query, values[i:i + batch_size])
+            except sqlite3.Error as e:
+                logger.error(f"Error upserting events: {e}")
+                raise
+
+        metrics.count('rows_written', len(events), backend='sqlite')
+        logger.info(f"Successfully upserted {len(events)} events")
+        return len(events)
+
+    def get_cached_events(
+        self,
+        source_name: str,
+        ttl_hours: int = 6,
+        query: Optional[EventQuery] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get cached events from database within TTL.
+
+        Args:
+            source_name: Source to query (e.g., 'knco')
+            ttl_hours: Time-to-live in hours (default 6)
+            query: Only events matching this query (default: every event)
+
+        Returns:
+            List of event dictionaries
+        """
+        events = self.get_cached_events_many([source_name], ttl_hours, query)[source_name]
+        logger.info(f"Retrieved {len(events)} cached events for {source_name}")
+        return events
+
+    def get_cached_events_many(
+        self,
+        source_names: List[str],
+        ttl_hours: int = 6,
+        query: Optional[EventQuery] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get cached events for several sources in a single query.
+
+        Returns:
+            Dictionary mapping each requested source to its event dictionaries
+        """
+        grouped: Dict[str, List[Dict[str, Any]]] = {name: [] for name in source_names}
+        if not source_names:
+            return grouped
+
+        sql, params = self._fresh_query(source_names, ttl_hours, query)
+
+        try:
+            with self._lock:
+                rows = self.conn.execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Error retrieving cached events: {e}")
+            return grouped
+
+        for row in rows:
+            event = self._row_to_dict(self._decode_row(row))
+            grouped.setdefault(event['source_name'], []).append(event)
+
+        counts = ', '.join(f"{name}={len(grouped[name])}" for name in source_names)
+        logger.debug(f"Retrieved cached events in one query ({counts})")
+        return grouped
+
+    def get_last_scraped(self, source_names: List[str]) -> Dict[str, Optional[datetime]]:
+        """
+        Get the most recent scraped_at for each source.
+
+        Returns:
+            Dictionary mapping each source to its newest scraped_at (None if never scraped)
+        """
+        result: Dict[str, Optional[datetime]] = {name: None for name in source_names}
+        if not source_names:
+            return result
+
+        placeholders = ', '.join('?' for _ in source_names)
+        query = f"""
+            SELECT source_name, MAX(scraped_at)
+            FROM events
+            WHERE source_name IN ({placeholders})
+            GROUP BY source_name
+        """
+        try:
+            with self._lock:
+                rows = self.conn.execute(query, list(source_names)).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Error retrieving last scrape times: {e}")
+            return result
+
+        for source_name, scraped_at in rows:
+            result[source_name] = _from_text(scraped_at)
+        return result
+
+    def iter_cached_events(
+        self,
+        source_names: Union[str, List[str], None] = None,
+        ttl_hours: int = 6,
+        row_format: str = 'dict',
+        batch_size: int = None,
+        query: Optional[EventQuery] = None
+    ) -> Iterator[Union[Dict[str, Any], tuple, EventRow]]:
+        """
+        Stream cached events with fetchmany, yielding rows lazily.
+
+        Args:
+            source_names: Source or list of sources to read (default: all sources)
+            ttl_hours: Time-to-live in hours (default 6)
+            row_format: 'dict', 'tuple' or 'record' (EventRow)
+            batch_size: Rows fetched per fetchmany call (default: Config.STREAM_BATCH_SIZE)
+            query: Only events matching this query (default: every event)
+
+        Yields:
+            One event per row in the requested representation
+        """
+        if row_format not in self.ROW_FORMATS:
+            raise ValueError(f"row_format must be one of {self.ROW_FORMATS}, got {row_format!r}")
+
+        if batch_size is None:
+            batch_size = Config.STREAM_BATCH_SIZE
+
+        if isinstance(source_names, str):
+            source_names = [source_names]
+
+        sql, params = self._fresh_query(source_names, ttl_hours, query)
+
+        start = time.perf_counter()
+        row_count = 0
+
+        # Separate cursor so other threads can keep using the connection
+        # between batches
+        with self._lock:
+            cur = self.conn.execute(sql, params)
+        try:
+            while True:
+                with self._lock:
+                    rows = cur.fetchmany(batch_size)
+                if not rows:
+                    break
+                for row in rows:
+                    row_count += 1
+                    yield self._convert_row(self._decode_row(row), row_format)
+        finally:
+            cur.close()
+            elapsed = time.perf_counter() - start
+            rate = row_count / elapsed if elapsed > 0 else 0.0
+            logger.info(f"Streamed {row_count} cached events in {elapsed:.2f}s ({rate:.0f} rows/s)")
+
+    def get_events_page(
+        self,
+        query: Optional[EventQuery] = None,
+        cursor: Optional[str] = None,
+        page_size: Optional[int] = None,
+        source_names: Optional[List[str]] = None,
+        ttl_hours: Optional[float] = None
+    ) -> EventPage:
+        """
+        Read one page of events ordered by (event_date, id), across sources.
+
+        The page is an index range read that stops after page_size + 1
+        rows: idx_events_date carries the rowid, so it is already in
+        (event_date, id) order. Several sources are matched with
+        +source_name so the planner walks that order instead of reading
+        and sorting every row of each source through idx_events_source_date;
+        +scraped_at likewise keeps it off idx_events_scraped_at.
+
+        Args:
+            query: Only events matching this query (default: every event)
+            cursor: next_cursor of the previous page (default: first page)
+            page_size: Events per page (default: Config.PAGE_SIZE, capped at Config.PAGE_SIZE_MAX)
+            source_names: Only these sources (default: every source)
+            ttl_hours: Only events scraped within this many hours, like
+                get_cached_events (default: any age). Invalidated events
+                are never returned.
+
+        Returns:
+            EventPage with the events and the next page's cursor (None on the last page)
+
+        Raises:
+            ValueError: The cursor is malformed
+        """
+        page_size = self._page_size(page_size)
+        cutoff = EPOCH if ttl_hours is None else _utc_now() - timedelta(hours=ttl_hours)
+
+        sql = f"""
+            SELECT {', '.join(self.EVENT_COLUMNS)}
+            FROM events
+            WHERE event_date IS NOT NULL AND +scraped_at > ?
+        """
+        params: List[Any] = [_to_text(cutoff)]
+        if source_names is not None:
+            column = 'source_name' if len(source_names) == 1 else '+source_name'
+            sql += f" AND {column} IN ({', '.join('?' for _ in source_names)})"
+            params.extend(source_names)
+        if query is not None:
+            where, where_params = query.where('?', _to_wall_clock)
+            sql += where
+            params.extend(where_params)
+        if cursor is not None:
+            event_date, event_id = decode_cursor(cursor)
+            sql += " AND (event_date, id) > (?, ?)"
+            params.extend([_to_text(event_date), event_id])
+        sql += " ORDER BY event_date ASC, id ASC LIMIT ?"
+        params.append(page_size + 1)
+
+        try:
+            with self._lock:
+                rows = self.conn.execute(sql, params).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Error reading events page: {e}")
+            raise
+
+        return self._make_page([self._row_to_dict(self._decode_row(row)) for row in rows], page_size)
+
+    def invalidate_events(
+        self,
+        source_name: Optional[str] = None,
+        source_event_id: Optional[str] = None
+    ) -> int:
+        """
+        Expire cached events by resetting scraped_at to the epoch.
+
+        Args:
+            source_name: Only expire this source (default: every source)
+            source_event_id: Only expire this event (requires source_name)
+
+        Returns:
+            Number of events invalidated
+        """
+        if source_event_id is not None and source_name is None:
+            raise ValueError("source_event_id requires source_name")
+
+        query = "UPDATE events SET scraped_at = ?"
+        params: List[Any] = [_to_text(EPOCH)]
+        if source_name is not None:
+            query += " WHERE source_name = ?"
+            params.append(source_name)
+            if source_event_id is not None:
+                query += " AND source_event_id = ?"
+                params.append(source_event_id)
+
+        with self._lock:
+            try:
+                with self.conn:
+                    count = self.conn.execute(query, params).rowcount
+            except sqlite3.Error as e:
+                logger.error(f"Error invalidating cached events: {e}")
+                raise
+
+        logger.info(f"Invalidated {count} cached events")
+        return count
+
+    def record_runs(self, runs: List[ScrapeRun]) -> int:
+        """
+        Append per-source run outcomes to scrape_runs.
+
+        Args:
+            runs: One ScrapeRun per source of a run
+
+        Returns:
+            Number of rows written
+        """
+        if not runs:
+            return 0
+
+        rows = [
+            (
+                run.run_id,
+                _to_text(run.started_at.astimezone(timezone.utc)),
+                run.source_name,
+                run.status,
+                run.duration_seconds,
+                run.event_count,
+                int(run.cache_hit),
+            )
+            for run in runs
+        ]
+        with self._lock:
+            try:
+                with self.conn:
+                    self.conn.executemany(
+                        """
+                        INSERT INTO scrape_runs (
+                            run_id, started_at, source_name, status,
+                            duration_seconds, event_count, cache_hit
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?)
+                        """,
+                        rows
+                    )
+            except sqlite3.Error as e:
+                logger.error(f"Error recording run history: {e}")
+                raise
+
+        logger.debug(f"Recorded {len(rows)} scrape runs")
+        return len(rows)
+
+    def get_run_report(
+        self,
+        since: datetime,
+        source_names: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Aggregate scrape_runs per source since a point in time.
+
+        The started_at range is read through idx_scrape_runs_started_at (or
+        idx_scrape_runs_source_started when filtering sources); percentiles
+        are nearest-rank, computed with window functions.
+
+        Args:
+            since: Oldest run started_at to include
+            source_names: Only report these sources (default: every source)
+
+        Returns:
+            One dictionary per source, ordered by source name
+        """
+        where = "started_at >= ?"
+        params: List[Any] = [_to_text(since.astimezone(timezone.utc))]
+        if source_names is not None:
+            where += f" AND source_name IN ({', '.join('?' for _ in source_names)})"
+            params.extend(source_names)
+
+        query = f"""
+            WITH recent AS (
+                SELECT source_name, status, duration_seconds, event_count, cache_hit
+                FROM scrape_runs
+                WHERE {where}
+            ),
+            scraped AS (
+                SELECT source_name, duration_seconds,
+                       ROW_NUMBER() OVER (PARTITION BY source_name ORDER BY duration_seconds) AS position,
+                       COUNT(*) OVER (PARTITION BY source_name) AS total
+                FROM recent
+                WHERE status = 'success' AND cache_hit = 0 AND duration_seconds IS NOT NULL
+            ),
+            latency AS (
+                SELECT source_name,
+                       MIN(CASE WHEN position >= 0.50 * total THEN duration_seconds END) AS p50,
+                       MIN(CASE WHEN position >= 0.95 * total THEN duration_seconds END) AS p95
+                FROM scraped
+                GROUP BY source_name
+            ),
+            totals AS (
+                SELECT source_name,
+                       COUNT(*) AS runs,
+                       SUM(status = 'success') AS successes,
+                       SUM(status = 'failed') AS failures,
+                       SUM(status = 'timed_out') AS timeouts,
+                       SUM(cache_hit) AS cache_hits,
+                       AVG(CASE WHEN status = 'success' THEN event_count END) AS events_per_run
+                FROM recent
+                GROUP BY source_name
+            )
+            SELECT t.source_name, t.runs, t.successes, t.failures, t.timeouts,
+                   t.cache_hits, t.events_per_run, l.p50, l.p95
+            FROM totals t
+            LEFT JOIN latency l ON l.source_name = t.source_name
+            ORDER BY t.source_name
+        """
+        try:
+            with self._lock:
+                rows = self.conn.execute(query, params).fetchall()
+        except sqlite3.Error as e:
+            logger.error(f"Error building run report: {e}")
+            raise
+
+        return [self._run_report_row(row) for row in rows]
+
+    @contextmanager
+    def source_lock(self, source_name: str, timeout: Optional[float] = None) -> Iterator[bool]:
+        """
+        Hold a file lock (next to the database file) while refreshing a source.
+
+        Yields:
+            True if another process held the lock when we asked for it
+        """
+        if self.path == ':memory:':
+            yield False
+            return
+
+        if timeout is None:
+            timeout = Config.SOURCE_LOCK_TIMEOUT
+
+        safe_name = ''.join(c if c.isalnum() or c in '-_' else '_' for c in source_name)
+        lock = FileLock(f"{self.path}.{safe_name}.lock")
+
+        contended = not lock.acquire(timeout=0)
+        if contended:
+            logger.info(f"Another process is refreshing {source_name}, waiting...")
+            if not lock.acquire(timeout=timeout):
+                logger.warning(f"Timed out waiting for {source_name} lock, proceeding without it")
+        try:
+            yield contended
+        finally:
+            lock.release()
+
+    def _fresh_query(
+        self,
+        source_names: Optional[List[str]],
+        ttl_hours: int,
+        query: Optional[EventQuery] = None
+    ):
+        """
+        Build the SELECT for events scraped within ttl_hours.
+
+        Per-source reads walk idx_events_source_date, which also bounds a
+        date window and returns rows in event_date order; the query's
+        other predicates can steer the planner to idx_events_free,
+        idx_events_source_quality or idx_events_city_area instead.
+        """
+        cutoff = _to_text(_utc_now() - timedelta(hours=ttl_hours))
+
+        sql = f"""
+            SELECT {', '.join(self.EVENT_COLUMNS)}
+            FROM events
+            WHERE scraped_at > ?
+        """
+        params: List[Any] = [cutoff]
+        if source_names is not None:
+            sql += f" AND source_name IN ({', '.join('?' for _ in source_names)})"
+            params.extend(source_names)
+        if query is not None:
+            where, where_params = query.where('?', _to_wall_clock)
+            sql += where
+            params.extend(where_params)
+        sql += " ORDER BY event_date ASC"
+
+        return sql, params
+
+    def _decode_row(self, row: tuple) -> tuple:
+        """Convert stored text/integer columns back to Python types"""
+        row = list(row)
+        for i in self._DATETIME_COLUMNS:
+            row[i] = _from_text(row[i])
+        if row[self._IS_FREE_COLUMN] is not None:
+            row[self._IS_FREE_COLUMN] = bool(row[self._IS_FREE_COLUMN])
+        return tuple(row)
+
+    def close(self):
+        """Close database connection"""
+        if self.conn:
+            self.conn.close()
+            self.conn = None
+            logger.info("SQLite store closed")
@@ -0,0 +1,84 @@
+"""Small JSON state files for run-to-run history"""
+import os
+import json
+import logging
+import tempfile
+import threading
+from pathlib import Path
+from typing import Any, Callable, Dict, Union
+
+from .locks import FileLock
+
+logger = logging.getLogger(__name__)
+
+
+class JsonStateFile:
+    """
+    A JSON document on disk that is read once and rewritten atomically.
+
+    Used for lightweight history (adaptive TTLs, latency samples) that
+    has to survive between one-shot CLI runs without a database table.
+    Updates re-read the file under a cross-process lock, so concurrent
+    processes (a daemon and a CLI run) do not overwrite each other.
+    """
+
+    # Max seconds to wait for another process's update
+    LOCK_TIMEOUT = 10
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._file_lock = FileLock(f"{self.path}.lock")
+        self._data: Dict[str, Any] = None
+
+    def load(self) -> Dict[str, Any]:
+        """Get the current document (empty if missing or unreadable)"""
+        with self._lock:
+            return self._load()
+
+    def update(self, mutate: Callable[[Dict[str, Any]], None]) -> Dict[str, Any]:
+        """
+        Apply mutate() to the latest document and write it back atomically.
+
+        The file is re-read under an exclusive FileLock first, so changes
+        another process wrote since our last read are kept.
+
+        Returns:
+            The updated document
+        """
+        with self._lock:
+            locked = self._file_lock.acquire(timeout=self.LOCK_TIMEOUT)
+            if not locked:
+                logger.warning(f"Timed out waiting for {self.path} lock, updating without it")
+            try:
+                self._data = None
+                data = self._load()
+                mutate(data)
+                self._write(data)
+                return data
+            finally:
+                self._file_lock.release()
+
+    def _load(self) -> Dict[str, Any]:
+        """Read the document on first use (caller must hold the lock)"""
+        if self._data is None:
+            try:
+                with open(self.path, 'r', encoding='utf-8') as f:
+                    self._data = json.load(f)
+            except FileNotFoundError:
+                self._data = {}
+            except (OSError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable state file {self.path}: {e}")
+                self._data = {}
+        return self._data
+
+    def _write(self, data: Dict[str, Any]):
+        """Write via a temp file + rename so readers never see a partial file"""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path.parent, prefix=self.path.name, suffix='.tmp')
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, sort_keys=True, default=str)
+            os.replace(tmp_path, self.path)
+        except OSError as e:
+            logger.error(f"Could not write state file {self.path}: {e}")
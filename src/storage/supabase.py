@@ -1,22 +1,38 @@
 """Supabase Postgres storage client"""
+import time
+import uuid
 import logging
-from typing import List, Dict, Any, Optional
+from contextlib import contextmanager
+from typing import List, Dict, Any, Optional, Iterator, Union
 from datetime import datetime, timedelta
 import psycopg2
 from psycopg2.extras import execute_values
+from psycopg2.pool import ThreadedConnectionPool
 from ..config import Config
+from ..instrumentation import metrics
 from ..processors.normalizer import NormalizedEvent
+from .base import EventStore, EventRow, ScrapeRun
+from .query import EventPage, EventQuery, decode_cursor
 
 logger = logging.getLogger(__name__)
 
 
-class SupabaseClient:
-    """Client for Supabase Postgres database"""
+class SupabaseClient(EventStore):
+    """
+    Client for Supabase Postgres database.
+
+    Each call borrows its own connection from a thread-safe pool, so the
+    daemon's refresh threads, the cache warmer and the control socket
+    never share a transaction. A connection handed back with a
+    transaction open (a read, or a failed write) is rolled back, so none
+    sits idle in transaction with NOW() frozen at its first query.
+    """
 
     def __init__(self):
-        """Initialize database connection"""
+        """Initialize database connection pool"""
         self.connection_string = self._build_connection_string()
-        self.conn = None
+        self.pool = None
+        self._lock_conn = None
         self._connect()
 
     def _build_connection_string(self) -> str:
@@ -46,15 +62,24 @@ class SupabaseClient:
         return conn_str
 
     def _connect(self):
-        """Establish database connection with error handling"""
+        """Open the connection pool with error handling"""
         try:
             logger.info("Connecting to Supabase Postgres...")
-            self.conn = psycopg2.connect(self.connection_string)
+            self.pool = ThreadedConnectionPool(1, Config.SUPABASE_POOL_SIZE, self.connection_string)
             logger.info("Successfully connected to Supabase")
         except psycopg2.Error as e:
             logger.error(f"Failed to connect to Supabase: {e}")
             raise ConnectionError(f"Could not connect to Supabase: {e}")
 
+    @contextmanager
+    def _connection(self) -> Iterator[Any]:
+        """Borrow a pooled connection (the pool rolls back its open transaction on return)"""
+        conn = self.pool.getconn()
+        try:
+            yield conn
+        finally:
+            self.pool.putconn(conn)
+
     def upsert_events(self, events: List[NormalizedEvent]) -> int:
         """
         Insert or update events in the database.
@@ -72,7 +97,7 @@ class SupabaseClient:
             return 0
 
         try:
-            with self.conn.cursor() as cur:
+            with self._connection() as conn, conn.cursor() as cur:
                 # Prepare data for batch insert
                 values = []
                 for event in events:
@@ -114,27 +139,29 @@ class SupabaseClient:
                 """
 
                 # Use execute_values for efficient batch insert
-                execute_values(
-                    cur,
-                    query,
-                    values,
-                    template="(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW())"
-                )
-
-                self.conn.commit()
+                with metrics.span('db_write', backend='supabase'):
+                    execute_values(
+                        cur,
+                        query,
+                        values,
+                        template="(%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, NOW())"
+                    )
+
+                    conn.commit()
+                metrics.count('rows_written', len(events), backend='supabase')
                 logger.info(f"Successfully upserted {len(events)} events")
 
                 return len(events)
 
         except psycopg2.Error as e:
-            self.conn.rollback()
             logger.error(f"Error upserting events: {e}")
             raise
 
     def get_cached_events(
         self,
         source_name: str,
-        ttl_hours: int = 6
+        ttl_hours: int = 6,
+        query: Optional[EventQuery] = None
     ) -> List[Dict[str, Any]]:
         """
         Get cached events from database within TTL.
@@ -142,46 +169,27 @@ class SupabaseClient:
         Args:
             source_name: Source to query (e.g., 'knco')
             ttl_hours: Time-to-live in hours (default 6)
+            query: Only events matching this query (default: every event)
 
         Returns:
             List of event dictionaries
         """
+        where, where_params = self._where(query)
         try:
-            with self.conn.cursor() as cur:
-                query = """
-                    SELECT
-                        id, title, description, event_date, venue, city_area,
-                        source_name, source_url, source_event_id, content_hash,
-                        age_range, price, is_free, quality_score, scraped_at
+            with self._connection() as conn, conn.cursor() as cur:
+                sql = f"""
+                    SELECT {', '.join(self.EVENT_COLUMNS)}
                     FROM events
                     WHERE source_name = %s
-                      AND scraped_at > NOW() - INTERVAL '%s hours'
+                      AND scraped_at > NOW() - INTERVAL '%s hours'{where}
                     ORDER BY event_date ASC
                 """
 
-                cur.execute(query, (source_name, ttl_hours))
+                cur.execute(sql, (source_name, ttl_hours, *where_params))
                 rows = cur.fetchall()
 
                 # Convert to list of dicts
-                events = []
-                for row in rows:
-                    events.append({
-                        'id': row[0],
-                        'title': row[1],
-                        'description': row[2],
-                        'event_date': row[3],
-                        'venue': row[4],
-                        'city_area': row[5],
-                        'source_name': row[6],
-                        'source_url': row[7],
-                        'source_event_id': row[8],
-                        'content_hash': row[9],
-                        'age_range': row[10],
-                        'price': row[11],
-                        'is_free': row[12],
-                        'quality_score': row[13],
-                        'scraped_at': row[14],
-                    })
+                events = [self._row_to_dict(row) for row in rows]
 
                 logger.info(f"Retrieved {len(events)} cached events for {source_name}")
                 return events
@@ -190,16 +198,419 @@ class SupabaseClient:
             logger.error(f"Error retrieving cached events: {e}")
             return []
 
+    def get_cached_events_many(
+        self,
+        source_names: List[str],
+        ttl_hours: int = 6,
+        query: Optional[EventQuery] = None
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Get cached events for several sources in a single query.
+
+        Rows are grouped by source client-side, so callers resolving many
+        sources pay for one round trip instead of one per source.
+
+        Args:
+            source_names: Sources to query (e.g., ['knco', 'library'])
+            ttl_hours: Time-to-live in hours (default 6)
+            query: Only events matching this query (default: every event)
+
+        Returns:
+            Dictionary mapping each requested source to its event dictionaries
+            (empty list for sources with no fresh events)
+        """
+        grouped: Dict[str, List[Dict[str, Any]]] = {name: [] for name in source_names}
+        if not source_names:
+            return grouped
+
+        where, where_params = self._where(query)
+        try:
+            with self._connection() as conn, conn.cursor() as cur:
+                sql = f"""
+                    SELECT {', '.join(self.EVENT_COLUMNS)}
+                    FROM events
+                    WHERE source_name = ANY(%s)
+                      AND scraped_at > NOW() - %s * INTERVAL '1 hour'{where}
+                    ORDER BY event_date ASC
+                """
+
+                cur.execute(sql, (list(source_names), ttl_hours, *where_params))
+
+                for row in cur.fetchall():
+                    event = self._row_to_dict(row)
+                    grouped.setdefault(event['source_name'], []).append(event)
+
+                counts = ', '.join(f"{name}={len(grouped[name])}" for name in source_names)
+                logger.info(f"Retrieved cached events in one query ({counts})")
+                return grouped
+
+        except psycopg2.Error as e:
+            logger.error(f"Error retrieving cached events: {e}")
+            return {name: [] for name in source_names}
+
+    def get_last_scraped(self, source_names: List[str]) -> Dict[str, Optional[datetime]]:
+        """
+        Get the most recent scraped_at for each source (uses idx_events_source_date).
+
+        Returns:
+            Dictionary mapping each source to its newest scraped_at (None if never scraped)
+        """
+        result: Dict[str, Optional[datetime]] = {name: None for name in source_names}
+        if not source_names:
+            return result
+
+        try:
+            with self._connection() as conn, conn.cursor() as cur:
+                cur.execute(
+                    """
+                    SELECT source_name, MAX(scraped_at)
+                    FROM events
+                    WHERE source_name = ANY(%s)
+                    GROUP BY source_name
+                    """,
+                    (list(source_names),)
+                )
+                for source_name, scraped_at in cur.fetchall():
+                    result[source_name] = scraped_at
+            return result
+
+        except psycopg2.Error as e:
+            logger.error(f"Error retrieving last scrape times: {e}")
+            return result
+
+    def iter_cached_events(
+        self,
+        source_names: Union[str, List[str], None] = None,
+        ttl_hours: int = 6,
+        row_format: str = 'dict',
+        batch_size: int = None,
+        query: Optional[EventQuery] = None
+    ) -> Iterator[Union[Dict[str, Any], tuple, EventRow]]:
+        """
+        Stream cached events using a server-side (named) cursor.
+
+        Rows are pulled from Postgres batch_size at a time and yielded
+        lazily, so memory stays flat regardless of how many rows match.
+
+        Args:
+            source_names: Source or list of sources to read (default: all sources)
+            ttl_hours: Time-to-live in hours (default 6)
+            row_format: 'dict' (same shape as get_cached_events), 'tuple'
+                (raw row in EVENT_COLUMNS order) or 'record' (EventRow)
+            batch_size: Rows fetched per round trip (default: Config.STREAM_BATCH_SIZE)
+            query: Only events matching this query (default: every event)
+
+        Yields:
+            One event per row in the requested representation
+        """
+        if row_format not in self.ROW_FORMATS:
+            raise ValueError(f"row_format must be one of {self.ROW_FORMATS}, got {row_format!r}")
+
+        if batch_size is None:
+            batch_size = Config.STREAM_BATCH_SIZE
+
+        if isinstance(source_names, str):
+            source_names = [source_names]
+
+        sql = f"""
+            SELECT {', '.join(self.EVENT_COLUMNS)}
+            FROM events
+            WHERE scraped_at > NOW() - %s * INTERVAL '1 hour'
+        """
+        params: List[Any] = [ttl_hours]
+        if source_names is not None:
+            sql += " AND source_name = ANY(%s)"
+            params.append(list(source_names))
+        where, where_params = self._where(query)
+        sql += where
+        params.extend(where_params)
+        sql += " ORDER BY event_date ASC"
+
+        start = time.perf_counter()
+        row_count = 0
+
+        # Named cursors are declared server-side; Postgres only ships
+        # batch_size rows per fetchmany() call. The stream holds its own
+        # pooled connection until it is exhausted or closed, so a write
+        # committing elsewhere never ends its transaction (and cursor).
+        with self._connection() as conn:
+            cur = conn.cursor(name=f"events_stream_{uuid.uuid4().hex}")
+            cur.itersize = batch_size
+            try:
+                cur.execute(sql, params)
+                while True:
+                    rows = cur.fetchmany(batch_size)
+                    if not rows:
+                        break
+                    for row in rows:
+                        row_count += 1
+                        yield self._convert_row(row, row_format)
+            except psycopg2.Error as e:
+                conn.rollback()
+                logger.error(f"Error streaming cached events: {e}")
+                raise
+            finally:
+                cur.close()
+                elapsed = time.perf_counter() - start
+                rate = row_count / elapsed if elapsed > 0 else 0.0
+                logger.info(f"Streamed {row_count} cached events in {elapsed:.2f}s ({rate:.0f} rows/s)")
+
+    def get_events_page(
+        self,
+        query: Optional[EventQuery] = None,
+        cursor: Optional[str] = None,
+        page_size: Optional[int] = None,
+        source_names: Optional[List[str]] = None,
+        ttl_hours: Optional[float] = None
+    ) -> EventPage:
+        """
+        Read one page of events ordered by (event_date, id), across sources.
+
+        The row comparison on (event_date, id) is an index condition on
+        idx_events_date_id, so every page is a range read that stops after
+        page_size + 1 rows, however deep it is.
+
+        Args:
+            query: Only events matching this query (default: every event)
+            cursor: next_cursor of the previous page (default: first page)
+            page_size: Events per page (default: Config.PAGE_SIZE, capped at Config.PAGE_SIZE_MAX)
+            source_names: Only these sources (default: every source)
+            ttl_hours: Only events scraped within this many hours, like
+                get_cached_events (default: any age). Invalidated events
+                are never returned.
+
+        Returns:
+            EventPage with the events and the next page's cursor (None on the last page)
+
+        Raises:
+            ValueError: The cursor is malformed
+        """
+        page_size = self._page_size(page_size)
+
+        sql = f"""
+            SELECT {', '.join(self.EVENT_COLUMNS)}
+            FROM events
+            WHERE event_date IS NOT NULL AND scraped_at > 'epoch'
+        """
+        params: List[Any] = []
+        if ttl_hours is not None:
+            sql += " AND scraped_at > NOW() - %s * INTERVAL '1 hour'"
+            params.append(ttl_hours)
+        if source_names is not None:
+            sql += " AND source_name = ANY(%s)"
+            params.append(list(source_names))
+        where, where_params = self._where(query)
+        sql += where
+        params.extend(where_params)
+        if cursor is not None:
+            sql += " AND (event_date, id) > (%s, %s)"
+            params.extend(decode_cursor(cursor))
+        sql += " ORDER BY event_date ASC, id ASC LIMIT %s"
+        params.append(page_size + 1)
+
+        try:
+            with self._connection() as conn, conn.cursor() as cur:
+                cur.execute(sql, params)
+                rows = cur.fetchall()
+            return self._make_page([self._row_to_dict(row) for row in rows], page_size)
+
+        except psycopg2.Error as e:
+            logger.error(f"Error reading events page: {e}")
+            raise
+
+    def invalidate_events(
+        self,
+        source_name: Optional[str] = None,
+        source_event_id: Optional[str] = None
+    ) -> int:
+        """
+        Expire cached events by resetting scraped_at to the epoch.
+
+        Args:
+            source_name: Only expire this source (default: every source)
+            source_event_id: Only expire this event (requires source_name)
+
+        Returns:
+            Number of events invalidated
+        """
+        if source_event_id is not None and source_name is None:
+            raise ValueError("source_event_id requires source_name")
+
+        query = "UPDATE events SET scraped_at = 'epoch'"
+        params: List[Any] = []
+        if source_name is not None:
+            query += " WHERE source_name = %s"
+            params.append(source_name)
+            if source_event_id is not None:
+                query += " AND source_event_id = %s"
+                params.append(source_event_id)
+
+        try:
+            with self._connection() as conn:
+                with conn.cursor() as cur:
+                    cur.execute(query, params)
+                    count = cur.rowcount
+                conn.commit()
+            logger.info(f"Invalidated {count} cached events")
+            return count
+
+        except psycopg2.Error as e:
+            logger.error(f"Error invalidating cached events: {e}")
+            raise
+
+    def record_runs(self, runs: List[ScrapeRun]) -> int:
+        """
+        Append per-source run outcomes to scrape_runs.
+
+        Args:
+            runs: One ScrapeRun per source of a run
+
+        Returns:
+            Number of rows written
+        """
+        if not runs:
+            return 0
+
+        try:
+            with self._connection() as conn:
+                with conn.cursor() as cur:
+                    execute_values(
+                        cur,
+                        """
+                        INSERT INTO scrape_runs (
+                            run_id, started_at, source_name, status,
+                            duration_seconds, event_count, cache_hit
+                        ) VALUES %s
+                        """,
+                        [tuple(run) for run in runs]
+                    )
+                conn.commit()
+            logger.debug(f"Recorded {len(runs)} scrape runs")
+            return len(runs)
+
+        except psycopg2.Error as e:
+            logger.error(f"Error recording run history: {e}")
+            raise
+
+    def get_run_report(
+        self,
+        since: datetime,
+        source_names: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Aggregate scrape_runs per source since a point in time.
+
+        A single GROUP BY over the idx_scrape_runs_started_at range (or
+        idx_scrape_runs_source_started when filtering sources); percentiles
+        are nearest-rank (percentile_disc).
+
+        Args:
+            since: Oldest run started_at to include
+            source_names: Only report these sources (default: every source)
+
+        Returns:
+            One dictionary per source, ordered by source name
+        """
+        query = """
+            SELECT source_name,
+                   COUNT(*),
+                   COUNT(*) FILTER (WHERE status = 'success'),
+                   COUNT(*) FILTER (WHERE status = 'failed'),
+                   COUNT(*) FILTER (WHERE status = 'timed_out'),
+                   COUNT(*) FILTER (WHERE cache_hit),
+                   AVG(event_count) FILTER (WHERE status = 'success'),
+                   percentile_disc(0.50) WITHIN GROUP (ORDER BY duration_seconds)
+                       FILTER (WHERE status = 'success' AND NOT cache_hit),
+                   percentile_disc(0.95) WITHIN GROUP (ORDER BY duration_seconds)
+                       FILTER (WHERE status = 'success' AND NOT cache_hit)
+            FROM scrape_runs
+            WHERE started_at >= %s
+        """
+        params: List[Any] = [since]
+        if source_names is not None:
+            query += " AND source_name = ANY(%s)"
+            params.append(list(source_names))
+        query += " GROUP BY source_name ORDER BY source_name"
+
+        try:
+            with self._connection() as conn, conn.cursor() as cur:
+                cur.execute(query, params)
+                rows = cur.fetchall()
+            return [self._run_report_row(row) for row in rows]
+
+        except psycopg2.Error as e:
+            logger.error(f"Error building run report: {e}")
+            raise
+
+    # Poll interval while waiting for another session's advisory lock
+    LOCK_POLL_SECONDS = 0.5
+
+    @contextmanager
+    def source_lock(self, source_name: str, timeout: Optional[float] = None) -> Iterator[bool]:
+        """
+        Hold a Postgres advisory lock while refreshing a source.
+
+        Uses a separate autocommit connection so waiting never blocks
+        queries on the main connection.
+
+        Yields:
+            True if another session held the lock when we asked for it
+        """
+        if timeout is None:
+            timeout = Config.SOURCE_LOCK_TIMEOUT
+
+        key = f"events-source:{source_name}"
+        acquired = False
+        contended = False
+
+        try:
+            if self._lock_conn is None or self._lock_conn.closed:
+                self._lock_conn = psycopg2.connect(self.connection_string)
+                self._lock_conn.autocommit = True
+
+            deadline = time.monotonic() + timeout
+            with self._lock_conn.cursor() as cur:
+                while True:
+                    cur.execute("SELECT pg_try_advisory_lock(hashtext(%s))", (key,))
+                    acquired = cur.fetchone()[0]
+                    if acquired or time.monotonic() >= deadline:
+                        break
+                    if not contended:
+                        contended = True
+                        logger.info(f"Another process is refreshing {source_name}, waiting...")
+                    time.sleep(self.LOCK_POLL_SECONDS)
+
+            if not acquired:
+                logger.warning(f"Timed out waiting for {source_name} lock, proceeding without it")
+        except psycopg2.Error as e:
+            logger.warning(f"Could not take advisory lock for {source_name}, proceeding without it: {e}")
+
+        try:
+            yield contended
+        finally:
+            if acquired:
+                try:
+                    with self._lock_conn.cursor() as cur:
+                        cur.execute("SELECT pg_advisory_unlock(hashtext(%s))", (key,))
+                except psycopg2.Error as e:
+                    logger.error(f"Error releasing advisory lock for {source_name}: {e}")
+
+    @staticmethod
+    def _where(query: Optional[EventQuery]):
+        """
+        SQL (and params) for a query's predicates.
+
+        Served by idx_events_source_date (date windows), idx_events_free,
+        idx_events_source_quality and idx_events_city_area.
+        """
+        if query is None:
+            return '', []
+        return query.where('%s')
+
     def close(self):
         """Close database connection"""
-        if self.conn:
-            self.conn.close()
+        if self._lock_conn is not None and not self._lock_conn.closed:
+            self._lock_conn.close()
+        if self.pool is not None and not self.pool.closed:
+            self.pool.closeall()
             logger.info("Database connection closed")
-
-    def __enter__(self):
-        """Context manager entry"""
-        return self
-
-    def __exit__(self, exc_type, exc_val, exc_tb):
-        """Context manager exit"""
-        self.close()
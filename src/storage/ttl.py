@@ -0,0 +1,133 @@
+"""Adaptive per-source cache TTL"""
+import time
+import logging
+from pathlib import Path
+from typing import Dict, Any, Iterable, Optional, Union
+from ..config import Config
+from .state import JsonStateFile
+
+logger = logging.getLogger(__name__)
+
+
+class AdaptiveTTL:
+    """
+    Learn a cache TTL for each source from how fast its content changes.
+
+    After every scrape the source's set of content hashes is compared with
+    the previous scrape. The fraction of events added or removed, divided
+    by the hours between scrapes, gives a change rate that is smoothed
+    with an exponentially weighted moving average. The TTL is the time it
+    takes to accumulate target_change worth of churn at that rate, clamped
+    to [min_hours, max_hours].
+    """
+
+    # Weight of the newest observation in the moving average
+    SMOOTHING = 0.3
+
+    # Scrapes closer together than this are treated as this far apart,
+    # so back-to-back runs do not produce extreme rates
+    MIN_INTERVAL_HOURS = 0.25
+
+    # Observations kept per source for reporting
+    HISTORY_LENGTH = 20
+
+    def __init__(
+        self,
+        state_path: Union[str, Path, None] = None,
+        min_hours: Optional[float] = None,
+        max_hours: Optional[float] = None,
+        target_change: Optional[float] = None
+    ):
+        """
+        Initialize adaptive TTL policy.
+
+        Args:
+            state_path: JSON file holding per-source history
+                (default: Config.STATE_DIR / 'adaptive_ttl.json')
+            min_hours: Lower TTL bound (default: Config.ADAPTIVE_TTL_MIN_HOURS)
+            max_hours: Upper TTL bound (default: Config.ADAPTIVE_TTL_MAX_HOURS)
+            target_change: Fraction of a source's events that may change
+                before it is re-scraped (default: Config.ADAPTIVE_TTL_TARGET_CHANGE)
+        """
+        self.state = JsonStateFile(state_path or Config.STATE_DIR / 'adaptive_ttl.json')
+        self.min_hours = Config.ADAPTIVE_TTL_MIN_HOURS if min_hours is None else min_hours
+        self.max_hours = Config.ADAPTIVE_TTL_MAX_HOURS if max_hours is None else max_hours
+        self.target_change = Config.ADAPTIVE_TTL_TARGET_CHANGE if target_change is None else target_change
+
+    def record_scrape(
+        self,
+        source_name: str,
+        content_hashes: Iterable[str],
+        now: Optional[float] = None
+    ) -> Optional[float]:
+        """
+        Record a scrape's content hashes and update the source's change rate.
+
+        Args:
+            source_name: Source identifier
+            content_hashes: content_hash of every event in the scrape
+            now: Scrape time in epoch seconds (default: now)
+
+        Returns:
+            Fraction of events that changed since the previous scrape
+            (None for the first recorded scrape)
+        """
+        now = time.time() if now is None else now
+        hashes = set(h for h in content_hashes if h)
+        result = {}
+
+        def mutate(data: Dict[str, Any]):
+            entry = data.setdefault(source_name, {})
+            previous = set(entry.get('hashes', []))
+            previous_at = entry.get('scraped_at')
+
+            if previous_at is not None and (previous or hashes):
+                hours = max((now - previous_at) / 3600, self.MIN_INTERVAL_HOURS)
+                changed = len(previous ^ hashes) / len(previous | hashes)
+                rate = changed / hours
+
+                old_rate = entry.get('change_rate')
+                if old_rate is not None:
+                    rate = self.SMOOTHING * rate + (1 - self.SMOOTHING) * old_rate
+
+                entry['change_rate'] = rate
+                history = entry.setdefault('history', [])
+                history.append({'at': now, 'changed': round(changed, 4), 'hours': round(hours, 3)})
+                del history[:-self.HISTORY_LENGTH]
+                result['changed'] = changed
+
+            entry['hashes'] = sorted(hashes)
+            entry['scraped_at'] = now
+
+        self.state.update(mutate)
+
+        changed = result.get('changed')
+        if changed is not None:
+            logger.info(
+                f"{source_name}: {changed:.0%} of events changed since last scrape "
+                f"(TTL now {self.ttl_for(source_name, self.max_hours):.1f}h)"
+            )
+        return changed
+
+    def ttl_for(self, source_name: str, default_hours: float) -> float:
+        """
+        Get the learned TTL for a source.
+
+        Args:
+            source_name: Source identifier
+            default_hours: TTL to use until a change rate has been observed
+
+        Returns:
+            TTL in hours within [min_hours, max_hours]
+        """
+        rate = self.state.load().get(source_name, {}).get('change_rate')
+        if rate is None:
+            return default_hours
+        if rate <= 0:
+            return self.max_hours
+
+        return min(self.max_hours, max(self.min_hours, self.target_change / rate))
+
+    def get_ttls(self, source_names: Iterable[str], default_hours: float) -> Dict[str, float]:
+        """Get the learned TTL for several sources"""
+        return {name: self.ttl_for(name, default_hours) for name in source_names}
@@ -0,0 +1,167 @@
+"""Refresh-ahead cache warming"""
+import time
+import random
+import logging
+import threading
+from concurrent.futures import Future
+from typing import List, Dict, Any, Callable, Optional
+from ..config import Config
+from .cache import CacheManager
+
+logger = logging.getLogger(__name__)
+
+
+class CacheWarmer:
+    """
+    Proactively re-scrape sources before their cache expires.
+
+    Each source is refreshed once refresh_ratio of its TTL has elapsed
+    since the last scrape, plus or minus a random jitter so sources that
+    were scraped together do not all refresh at the same moment. At most
+    max_concurrent refreshes run at once.
+    """
+
+    def __init__(
+        self,
+        cache: CacheManager,
+        scraper_funcs: Dict[str, Callable[[], List[Dict[str, Any]]]],
+        ttl_hours: Optional[float] = None,
+        refresh_ratio: Optional[float] = None,
+        jitter_ratio: Optional[float] = None,
+        max_concurrent: Optional[int] = None,
+        poll_seconds: Optional[float] = None
+    ):
+        """
+        Initialize cache warmer.
+
+        Args:
+            cache: Cache manager to refresh through
+            scraper_funcs: Scraper function for each source to keep warm
+            ttl_hours: Cache TTL (default: Config.CACHE_TTL_HOURS)
+            refresh_ratio: Fraction of the TTL after which to refresh
+                (default: Config.CACHE_REFRESH_AHEAD_RATIO)
+            jitter_ratio: Random +/- fraction of the TTL added to each refresh
+                time (default: Config.CACHE_REFRESH_JITTER)
+            max_concurrent: Maximum refreshes in flight (default: Config.CACHE_REFRESH_WORKERS)
+            poll_seconds: How often the background loop checks for due sources
+                (default: Config.CACHE_WARMER_POLL_SECONDS)
+        """
+        self.cache = cache
+        self.scraper_funcs = dict(scraper_funcs)
+        self.ttl_hours = Config.CACHE_TTL_HOURS if ttl_hours is None else ttl_hours
+        self.refresh_ratio = Config.CACHE_REFRESH_AHEAD_RATIO if refresh_ratio is None else refresh_ratio
+        self.jitter_ratio = Config.CACHE_REFRESH_JITTER if jitter_ratio is None else jitter_ratio
+        self.max_concurrent = Config.CACHE_REFRESH_WORKERS if max_concurrent is None else max_concurrent
+        self.poll_seconds = Config.CACHE_WARMER_POLL_SECONDS if poll_seconds is None else poll_seconds
+
+        # source -> epoch seconds when the next refresh is due
+        self._refresh_at: Dict[str, float] = {}
+        self._in_flight: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+        # Fresh writes and invalidations (from any caller) reschedule the source
+        self.cache.add_invalidation_hook(self._on_cache_changed)
+
+    def load_expiry(self, source_names: Optional[List[str]] = None):
+        """Set refresh times from each source's last scrape in the store"""
+        last_scraped = self.cache.db.get_last_scraped(source_names or list(self.scraper_funcs))
+        with self._lock:
+            for source_name, scraped_at in last_scraped.items():
+                scraped = scraped_at.timestamp() if scraped_at else 0.0
+                self._refresh_at[source_name] = self._next_refresh(scraped, source_name)
+
+    def refresh_times(self) -> Dict[str, float]:
+        """Get the epoch time each source is next due for refresh"""
+        with self._lock:
+            return dict(self._refresh_at)
+
+    def due_sources(self, now: Optional[float] = None) -> List[str]:
+        """
+        Get sources whose refresh time has passed, most overdue first.
+
+        Sources with a refresh already in flight are skipped.
+        """
+        now = time.time() if now is None else now
+        with self._lock:
+            due = [
+                source for source in self.scraper_funcs
+                if self._refresh_at.get(source, 0.0) <= now and not self._is_running(source)
+            ]
+            due.sort(key=lambda source: self._refresh_at.get(source, 0.0))
+        return due
+
+    def run_once(self, now: Optional[float] = None) -> List[str]:
+        """
+        Start refreshes for due sources, up to max_concurrent in flight.
+
+        Returns:
+            Sources whose refresh was started
+        """
+        started = []
+        for source_name in self.due_sources(now):
+            with self._lock:
+                running = sum(1 for s in self._in_flight if self._is_running(s))
+                if running >= self.max_concurrent:
+                    break
+
+            logger.info(f"Refresh-ahead: warming {source_name}")
+            future = self.cache.refresh_in_background(
+                source_name, self.scraper_funcs[source_name], self.ttl_hours
+            )
+            with self._lock:
+                self._in_flight[source_name] = future
+                # Until the write lands, retry after a full TTL at the latest
+                self._refresh_at[source_name] = self._next_refresh(time.time(), source_name)
+            started.append(source_name)
+
+        return started
+
+    def start(self):
+        """Start the background warming loop"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+
+        self.load_expiry()
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name='cache-warmer', daemon=True)
+        self._thread.start()
+        logger.info(f"Cache warmer started for: {', '.join(self.scraper_funcs)}")
+
+    def stop(self, timeout: Optional[float] = None):
+        """Stop the background warming loop"""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def _run(self):
+        """Background loop: refresh due sources, then sleep until the next check"""
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                logger.error(f"Cache warmer error: {e}")
+            self._stop.wait(self.poll_seconds)
+
+    def _next_refresh(self, scraped: float, source_name: str) -> float:
+        """Refresh time for data scraped at `scraped` (epoch seconds)"""
+        ttl_seconds = self.cache.ttl_for(source_name, self.ttl_hours) * 3600
+        jitter = random.uniform(-self.jitter_ratio, self.jitter_ratio) * ttl_seconds
+        return scraped + self.refresh_ratio * ttl_seconds + jitter
+
+    def _is_running(self, source_name: str) -> bool:
+        """Whether a refresh is in flight (caller must hold the lock)"""
+        future = self._in_flight.get(source_name)
+        return future is not None and not future.done()
+
+    def _on_cache_changed(self, source_name: Optional[str]):
+        """Invalidation hook: re-read the source's scrape time after a write or invalidation"""
+        if source_name is not None and source_name not in self.scraper_funcs:
+            return
+        try:
+            self.load_expiry([source_name] if source_name else None)
+        except Exception as e:
+            logger.error(f"Could not reschedule {source_name or 'sources'}: {e}")
@@ -0,0 +1,89 @@
+"""Unit tests for adaptive per-source TTL"""
+import json
+import unittest
+import tempfile
+from pathlib import Path
+from unittest.mock import Mock
+from datetime import datetime
+from src.storage.ttl import AdaptiveTTL
+from src.storage.cache import CacheManager
+from src.storage.memory import MemoryCache
+from src.storage.sqlite import SQLiteClient
+
+HOUR = 3600
+
+
+class TestAdaptiveTTL(unittest.TestCase):
+    """Test TTLs learned from content change history"""
+
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.state_path = Path(self.tmp.name) / 'ttl.json'
+        self.policy = AdaptiveTTL(self.state_path, min_hours=1, max_hours=48, target_change=0.1)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_default_until_observed(self):
+        """Test the default TTL is used before any change rate is known"""
+        self.assertEqual(self.policy.ttl_for('knco', 6), 6)
+
+        self.policy.record_scrape('knco', ['a', 'b'], now=0)
+        self.assertEqual(self.policy.ttl_for('knco', 6), 6)
+
+    def test_stable_source_gets_max_ttl(self):
+        """Test a source whose content never changes is scraped rarely"""
+        self.policy.record_scrape('county', ['a', 'b'], now=0)
+        changed = self.policy.record_scrape('county', ['a', 'b'], now=6 * HOUR)
+
+        self.assertEqual(changed, 0)
+        self.assertEqual(self.policy.ttl_for('county', 6), 48)
+
+    def test_volatile_source_gets_short_ttl(self):
+        """Test a source with heavy churn is scraped often"""
+        self.policy.record_scrape('knco', ['a', 'b', 'c', 'd'], now=0)
+        changed = self.policy.record_scrape('knco', ['a', 'b', 'e', 'f'], now=2 * HOUR)
+
+        # 4 of 6 distinct events changed over 2 hours -> 1/3 per hour -> 0.3h, clamped to 1h
+        self.assertAlmostEqual(changed, 4 / 6)
+        self.assertEqual(self.policy.ttl_for('knco', 6), 1)
+
+    def test_moderate_source_within_bounds(self):
+        """Test a TTL between the bounds is derived from the change rate"""
+        hashes = [str(i) for i in range(10)]
+        self.policy.record_scrape('library', hashes, now=0)
+        self.policy.record_scrape('library', hashes[1:] + ['new'], now=10 * HOUR)
+
+        # 2 of 11 changed over 10h -> rate 0.01818/h -> TTL 5.5h
+        self.assertAlmostEqual(self.policy.ttl_for('library', 6), 5.5, places=1)
+
+    def test_history_persists(self):
+        """Test change history is written to disk and reloaded"""
+        self.policy.record_scrape('knco', ['a'], now=0)
+        self.policy.record_scrape('knco', ['a'], now=HOUR)
+
+        data = json.loads(self.state_path.read_text())
+        self.assertEqual(len(data['knco']['history']), 1)
+
+        reloaded = AdaptiveTTL(self.state_path, min_hours=1, max_hours=48)
+        self.assertEqual(reloaded.ttl_for('knco', 6), 48)
+
+    def test_cache_manager_uses_learned_ttl(self):
+        """Test the cache manager records scrapes and reads with the learned TTL"""
+        self.policy.record_scrape('test', ['x'], now=0)
+        self.policy.record_scrape('test', ['x'], now=HOUR)
+
+        store = SQLiteClient(':memory:')
+        store.get_cached_events = Mock(wraps=store.get_cached_events)
+        cache = CacheManager(store, memory_cache=MemoryCache(default_ttl_seconds=0), ttl_policy=self.policy)
+        scraper_func = Mock(return_value=[{'title': 'Event', 'event_date': '2025-10-15', 'source_event_id': '1'}])
+
+        cache.get_or_fetch('test', scraper_func, ttl_hours=6)
+
+        store.get_cached_events.assert_any_call('test', 48)
+        self.assertEqual(len(self.policy.state.load()['test']['history']), 2)
+        store.close()
+
+
+if __name__ == '__main__':
+    unittest.main()
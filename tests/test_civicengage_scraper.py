@@ -0,0 +1,157 @@
+"""Tests for the CivicEngage multi-calendar scraper engine"""
+import threading
+import unittest
+from datetime import date
+from pathlib import Path
+from unittest.mock import patch
+import requests
+from src.scrapers.civicengage import CivicEngageScraper, month_starts
+from src.scrapers.county import CountyScraper
+from src.scrapers.library import LibraryScraper
+
+
+def ical(*event_ids):
+    """Minimal CivicEngage iCal feed with one event per EID"""
+    events = ''.join(
+        f"BEGIN:VEVENT\r\nUID:{event_id}@nevadacountyca.gov\r\nDTSTART:20251015T100000\r\n"
+        f"SUMMARY:Event {event_id}\r\nURL:https://www.nevadacountyca.gov/calendar.aspx?EID={event_id}\r\n"
+        f"END:VEVENT\r\n"
+        for event_id in event_ids
+    )
+    return f"BEGIN:VCALENDAR\r\nVERSION:2.0\r\n{events}END:VCALENDAR\r\n".encode('utf-8')
+
+
+LIST_VIEW = """
+<div id="CID32"><ol>
+  <li><h3><span>Event 2</span></h3>
+    <div class="subHeader">October 15, 2025, 10:00 AM - 11:00 AM @ Pioneer Park</div>
+    <a href="/calendar.aspx?EID=2">More Details</a></li>
+  <li><h3><span>Event 4</span></h3>
+    <div class="subHeader">October 16, 2025 @ Western Gateway Park</div>
+    <a href="/calendar.aspx?EID=4">More Details</a></li>
+</ol></div>
+"""
+
+
+class TestCivicEngageScraper(unittest.TestCase):
+    """Test CivicEngageScraper against canned feeds"""
+
+    def test_feeds_fetched_concurrently(self):
+        """Test every calendar's iCal feed downloads at the same time"""
+        scraper = CivicEngageScraper('county_depts', {'library': '81', 'parks': '32', 'fair': '44'})
+        barrier = threading.Barrier(3, timeout=2)
+
+        def download(sub_source):
+            barrier.wait()  # Breaks (and fails the test) unless all three are in flight
+            return ical(sub_source)
+
+        with patch.object(scraper, '_download_ical', side_effect=download):
+            feeds = scraper.download()
+
+        self.assertEqual(list(feeds), ['library', 'parks', 'fair'])
+
+    def test_events_deduplicated_across_categories(self):
+        """Test an event listed in several categories is kept once, for the first"""
+        scraper = CivicEngageScraper('county_depts', {'library': '81', 'parks': '32'})
+
+        events = scraper.parse_download({'library': ical('1', '2'), 'parks': ical('2', '3')})
+
+        self.assertEqual(
+            [(e['source_event_id'], e['sub_source']) for e in events],
+            [('1', 'library'), ('2', 'library'), ('3', 'parks')]
+        )
+        self.assertEqual(events[0]['event_date'], '2025-10-15')
+
+    def test_failed_feed_read_from_month_views(self):
+        """Test a failed feed falls back to every month of the horizon, fetched at once"""
+        scraper = CivicEngageScraper('county_depts', {'library': '81', 'parks': '32'},
+                                     browser_fallback=False, horizon_months=3)
+        barrier = threading.Barrier(3, timeout=2)
+
+        def download(sub_source):
+            if sub_source == 'parks':
+                raise requests.ConnectionError('down')
+            return ical('1', '2')
+
+        def list_view(key):
+            barrier.wait()  # All three months are in flight together
+            return LIST_VIEW
+
+        with patch.object(scraper, '_download_ical', side_effect=download), \
+                patch.object(scraper, '_download_list_view', side_effect=list_view) as fetch_month, \
+                patch.object(scraper, '_download_rendered') as render:
+            feeds = scraper.download()
+
+        render.assert_not_called()
+        self.assertEqual(sorted(call.args[0] for call in fetch_month.call_args_list), sorted(
+            ('parks', month) for month in month_starts(3)
+        ))
+        self.assertEqual(list(feeds), ['library', 'parks'])
+        self.assertEqual(len(feeds['parks']), 3)
+
+        # Overlapping months and the library's copy of EID 2 are merged away
+        events = scraper.parse_download(feeds)
+        self.assertEqual([e['title'] for e in events], ['Event 1', 'Event 2', 'Event 4'])
+        self.assertEqual(events[2]['source_event_id'], '4')
+        self.assertEqual(events[2]['venue'], 'Western Gateway Park')
+
+    def test_same_key_from_ical_and_list_view(self):
+        """Test an event parsed from the iCal feed and the list view upserts as one row"""
+        scraper = CivicEngageScraper('county_depts', {'parks': '32'})
+
+        from_ical = scraper.parse_download({'parks': ical('2')})
+        from_list = scraper.parse_download({'parks': [LIST_VIEW]})
+
+        self.assertEqual(from_ical[0]['source_event_id'], '2')
+        self.assertEqual(from_list[0]['source_event_id'], from_ical[0]['source_event_id'])
+
+    def test_browser_only_for_unrendered_months(self):
+        """Test only months the server did not render are loaded in the browser"""
+        scraper = CivicEngageScraper('county_depts', {'parks': '32'}, browser_fallback=True, horizon_months=2)
+        months = month_starts(2)
+
+        def list_view(key):
+            if key[1] == months[1]:
+                raise ValueError('not rendered')
+            return LIST_VIEW
+
+        with patch.object(scraper, '_download_ical', side_effect=requests.ConnectionError('down')), \
+                patch.object(scraper, '_download_list_view', side_effect=list_view), \
+                patch.object(scraper, '_download_rendered',
+                             side_effect=lambda urls: {url: LIST_VIEW for url in urls}) as render:
+            feeds = scraper.download()
+
+        render.assert_called_once_with([scraper.month_url('parks', months[1])])
+        self.assertEqual(len(feeds['parks']), 2)
+
+    def test_nothing_downloaded_raises(self):
+        """Test a failed feed with no month views either fails the download"""
+        scraper = CivicEngageScraper('county_depts', {'parks': '32'}, browser_fallback=False, horizon_months=2)
+
+        with patch.object(scraper, '_download_ical', side_effect=requests.ConnectionError('down')), \
+                patch.object(scraper, '_download_list_view', side_effect=ValueError('not rendered')):
+            with self.assertRaises(requests.ConnectionError):
+                scraper.download()
+
+    def test_month_starts(self):
+        """Test the horizon plan rolls over the year"""
+        self.assertEqual(
+            month_starts(3, date(2025, 11, 20)),
+            [date(2025, 11, 1), date(2025, 12, 1), date(2026, 1, 1)]
+        )
+
+    def test_library_and_county_are_single_calendars(self):
+        """Test the library and county sources are single-calendar cases of the engine"""
+        library, county = LibraryScraper(), CountyScraper()
+        self.assertEqual(library.ical_url('library'), CivicEngageScraper.ICAL_URL.format(calendar_id='81'))
+        self.assertTrue(library.browser_fallback)
+        self.assertIn('catID=14', county.ical_url('county'))
+
+        sample_path = Path(__file__).parent.parent / "data" / "samples" / "county_sample.ics"
+        events = county.parse_download(sample_path.read_bytes())
+        self.assertEqual(len(events), 3)
+        self.assertEqual({e['sub_source'] for e in events}, {'county'})
+
+
+if __name__ == '__main__':
+    unittest.main()
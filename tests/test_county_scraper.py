@@ -28,7 +28,7 @@ class TestCountyScraper(unittest.TestCase):
         self.assertIn('Grass Valley Library', event['description'])
         self.assertEqual(event['event_date'], '2025-10-15')
         self.assertEqual(event['venue'], 'Grass Valley Library')
-        self.assertEqual(event['source_event_id'], '12345@nevadacountyca.gov')
+        self.assertEqual(event['source_event_id'], '12345')  # EID from the URL, as the list view stores it
 
     def test_extract_ical_field(self):
         """Test iCal field extraction"""
@@ -0,0 +1,175 @@
+"""Tests for the long-running event daemon"""
+import os
+import time
+import socket
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+from src.daemon import EventDaemon, send_command
+from src.orchestrator import EventOrchestrator
+from src.scheduling.resilience import LatencyTracker
+from src.scheduling.timeouts import TimeoutTuner
+from src.scrapers.base import BaseScraper
+from src.storage.sqlite import SQLiteClient
+
+
+class CountingScraper(BaseScraper):
+    """Scraper that records each instance and fetch"""
+    instances = []
+
+    def __init__(self):
+        super().__init__('fake')
+        self.fetches = 0
+        self.closed = False
+        CountingScraper.instances.append(self)
+
+    def fetch(self):
+        self.fetches += 1
+        return [{'title': 'Story Time', 'event_date': '2025-10-15', 'source_event_id': '1'}]
+
+    def parse(self, raw_data):
+        return raw_data
+
+    def close(self):
+        super().close()
+        self.closed = True
+
+
+class LastGoodScraper(CountingScraper):
+    """Scraper whose site is down, serving its last good payload"""
+
+    def fetch(self):
+        self.fetches += 1
+        self.served_last_good = True
+        return [{'title': 'Old Story Time', 'event_date': '2025-10-15', 'source_event_id': '1'}]
+
+
+class TestEventDaemon(unittest.TestCase):
+    """Test cases for EventDaemon"""
+
+    def setUp(self):
+        CountingScraper.instances = []
+        patcher = patch.dict(EventOrchestrator.AVAILABLE_SOURCES, {'fake': CountingScraper})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.tuner = TimeoutTuner(
+            LatencyTracker(Path(tmp.name) / 'durations.json'),
+            LatencyTracker(Path(tmp.name) / 'requests.json'),
+            enabled=True
+        )
+        for target in ('src.daemon.timeout_tuner', 'src.orchestrator.timeout_tuner'):
+            patcher = patch(target, self.tuner)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.orchestrator = EventOrchestrator(store=SQLiteClient(':memory:'))
+        self.addCleanup(self.orchestrator.close)
+
+    def make_daemon(self, **kwargs):
+        kwargs.setdefault('schedules', {'fake': '1h'})
+        kwargs.setdefault('jitter_seconds', 0)
+        kwargs.setdefault('socket_path', '')
+        return EventDaemon(self.orchestrator, ['fake'], **kwargs)
+
+    def test_unknown_source(self):
+        """Test unknown sources are rejected"""
+        with self.assertRaises(ValueError):
+            EventDaemon(self.orchestrator, ['nope'], socket_path='')
+
+    def test_run_once_refreshes_and_reschedules(self):
+        """Test a due source is refreshed and scheduled one interval later"""
+        daemon = self.make_daemon()
+        daemon.load_schedule(now=1000)
+
+        self.assertEqual(daemon.run_once(now=1000), ['fake'])
+        self.assertEqual(daemon.due_sources(now=time.time()), [])
+        self.assertEqual(daemon.status()['sources']['fake']['last_events'], 1)
+        self.assertIsNone(daemon.status()['sources']['fake']['error'])
+
+    def test_refresh_records_scrape_duration(self):
+        """Test scheduled refreshes feed the timeout tuner"""
+        self.make_daemon().run_once(now=0)
+
+        self.assertEqual(len(self.tuner.durations.samples('fake')), 1)
+
+    def test_last_good_payload_not_stored_as_fresh(self):
+        """Test a refresh served from last good payloads keeps the stored rows"""
+        self.make_daemon().run_once(now=0)
+        stored = self.orchestrator.db.get_cached_events('fake', 1)
+
+        with patch.dict(EventOrchestrator.AVAILABLE_SOURCES, {'fake': LastGoodScraper}):
+            daemon = self.make_daemon()
+            daemon.request_refresh(['fake'])
+            self.assertEqual(daemon.run_once(), ['fake'])
+
+        self.assertEqual(self.orchestrator.db.get_cached_events('fake', 1), stored)
+        self.assertEqual(stored[0]['title'], 'Story Time')
+        self.assertEqual(len(self.tuner.durations.samples('fake')), 1)
+
+    def test_first_run_waits_for_interval_after_last_scrape(self):
+        """Test a recently scraped source is not refreshed on startup"""
+        self.make_daemon().run_once(now=0)
+
+        daemon = self.make_daemon()
+        daemon.load_schedule()
+        self.assertEqual(daemon.due_sources(), [])
+
+    def test_scraper_reused_across_refreshes(self):
+        """Test refreshes reuse one warm scraper, closed at shutdown"""
+        daemon = self.make_daemon()
+        daemon.request_refresh()
+        daemon.run_once()
+        daemon.request_refresh(['fake'])
+        daemon.run_once()
+
+        self.assertEqual(len(CountingScraper.instances), 1)
+        self.assertEqual(CountingScraper.instances[0].fetches, 2)
+
+        daemon._shutdown()
+        self.assertTrue(CountingScraper.instances[0].closed)
+
+    def test_handle_command(self):
+        """Test control commands"""
+        daemon = self.make_daemon()
+
+        self.assertEqual(daemon.handle_command('refresh fake'), {'ok': True, 'queued': ['fake']})
+        self.assertFalse(daemon.handle_command('refresh nope')['ok'])
+        self.assertFalse(daemon.handle_command('explode')['ok'])
+        self.assertIn('fake', daemon.handle_command('status')['sources'])
+
+        self.assertTrue(daemon.handle_command('stop')['stopping'])
+        self.assertTrue(daemon._stop.is_set())
+
+    @unittest.skipUnless(hasattr(socket, 'AF_UNIX'), "Unix sockets not supported")
+    def test_control_socket(self):
+        """Test the daemon loop serves commands over its socket and stops on request"""
+        socket_path = os.path.join(tempfile.mkdtemp(), 'daemon.sock')
+        daemon = self.make_daemon(socket_path=socket_path)
+
+        thread = threading.Thread(target=daemon.run_forever)
+        thread.start()
+        try:
+            for _ in range(50):
+                if os.path.exists(socket_path):
+                    break
+                time.sleep(0.05)
+
+            self.assertEqual(send_command('refresh', socket_path)['queued'], ['fake'])
+            self.assertEqual(send_command('status', socket_path)['sources']['fake']['schedule'], 'every 3600s')
+            self.assertTrue(send_command('stop', socket_path)['ok'])
+        finally:
+            daemon.stop()
+            thread.join(5)
+
+        self.assertFalse(thread.is_alive())
+        self.assertFalse(os.path.exists(socket_path))
+        self.assertGreaterEqual(CountingScraper.instances[0].fetches, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
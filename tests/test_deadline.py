@@ -0,0 +1,173 @@
+"""Tests for deadlines, the deadline scheduler and scraper cancellation"""
+import time
+import threading
+import unittest
+from src.scheduling.deadline import Deadline, DeadlineScheduler
+from src.scrapers.base import BaseScraper, ScraperCancelled
+
+
+class SlowScraper(BaseScraper):
+    """Scraper that parses one item per 0.05s until cancelled"""
+
+    def __init__(self, items=100):
+        super().__init__('slow')
+        self.items = items
+
+    def fetch(self):
+        return self.parse(range(self.items))
+
+    def parse(self, items):
+        events = []
+        for item in items:
+            try:
+                self.sleep(0.05)
+                events.append({'title': f'Event {item}'})
+            except Exception:
+                continue
+        return events
+
+
+class TestDeadline(unittest.TestCase):
+    """Test cases for Deadline"""
+
+    def test_unbounded(self):
+        """Test a deadline without a budget never expires"""
+        deadline = Deadline()
+        self.assertIsNone(deadline.remaining())
+        self.assertFalse(deadline.expired())
+        self.assertEqual(deadline.cap(30), 30)
+
+    def test_expiry_and_cap(self):
+        """Test remaining time shrinks to zero and caps timeouts"""
+        deadline = Deadline(0.05)
+        self.assertLessEqual(deadline.cap(30), 0.05)
+        time.sleep(0.06)
+        self.assertTrue(deadline.expired())
+        self.assertEqual(deadline.remaining(), 0.0)
+
+    def test_sooner(self):
+        """Test the earlier of two deadlines is chosen"""
+        short, long, unbounded = Deadline(1), Deadline(10), Deadline()
+        self.assertIs(short.sooner(long), short)
+        self.assertIs(long.sooner(short), short)
+        self.assertIs(unbounded.sooner(short), short)
+        self.assertIs(short.sooner(unbounded), short)
+
+
+class TestDeadlineScheduler(unittest.TestCase):
+    """Test cases for DeadlineScheduler"""
+
+    def test_partial_results_on_timeout(self):
+        """Test completed results are kept when another task overruns"""
+        release = threading.Event()
+        cancelled = []
+
+        def slow(deadline):
+            release.wait(5)
+            return 'slow'
+
+        start = time.monotonic()
+        outcome = DeadlineScheduler().run(
+            {'fast': lambda deadline: 'fast', 'slow': slow},
+            timeout=0.2,
+            on_timeout=cancelled.append
+        )
+        elapsed = time.monotonic() - start
+        release.set()
+
+        self.assertEqual(outcome.results, {'fast': 'fast'})
+        self.assertEqual(outcome.timed_out, ['slow'])
+        self.assertEqual(cancelled, ['slow'])
+        self.assertLess(elapsed, 2)
+
+    def test_run_deadline_caps_task_budget(self):
+        """Test tasks receive the sooner of the run deadline and their own budget"""
+        received = {}
+
+        def task(deadline):
+            received['remaining'] = deadline.remaining()
+
+        DeadlineScheduler(Deadline(1)).run({'a': task}, timeout=60)
+        self.assertLessEqual(received['remaining'], 1)
+
+    def test_per_key_timeouts(self):
+        """Test per-key budgets override the shared timeout"""
+        received = {}
+
+        def task(key):
+            def run(deadline):
+                received[key] = deadline.remaining()
+            return run
+
+        DeadlineScheduler().run({'a': task('a'), 'b': task('b')}, timeout=60, timeouts={'b': 5})
+        self.assertGreater(received['a'], 50)
+        self.assertLessEqual(received['b'], 5)
+
+    def test_errors_collected(self):
+        """Test task exceptions are reported per key"""
+        def fail(deadline):
+            raise ValueError('boom')
+
+        outcome = DeadlineScheduler().run({'ok': lambda d: 1, 'bad': fail})
+
+        self.assertEqual(outcome.results, {'ok': 1})
+        self.assertIsInstance(outcome.errors['bad'], ValueError)
+        self.assertEqual(outcome.timed_out, [])
+
+    def test_as_completed_yields_before_slow_task(self):
+        """Test a finished task is yielded while another is still running"""
+        release = threading.Event()
+        self.addCleanup(release.set)
+        cancelled = []
+
+        def slow(deadline):
+            release.wait(5)
+            return 'slow'
+
+        completions = DeadlineScheduler().as_completed(
+            {'fast': lambda deadline: 'fast', 'slow': slow},
+            on_timeout=cancelled.append
+        )
+        self.assertEqual(next(completions), ('fast', 'done', 'fast'))
+        self.assertFalse(release.is_set())
+
+        # Abandoning the iterator cancels the task still running
+        completions.close()
+        self.assertEqual(cancelled, ['slow'])
+
+
+class TestScraperCancellation(unittest.TestCase):
+    """Test cases for cooperative cancellation in BaseScraper"""
+
+    def test_deadline_cancels_scrape(self):
+        """Test a scraper stops once its deadline passes, despite broad except handlers"""
+        scraper = SlowScraper()
+        scraper.deadline = Deadline(0.2)
+
+        start = time.monotonic()
+        with self.assertRaises(ScraperCancelled):
+            scraper.fetch()
+        self.assertLess(time.monotonic() - start, 1)
+
+    def test_cancel_from_another_thread(self):
+        """Test cancel() wakes a sleeping scraper"""
+        scraper = SlowScraper()
+        threading.Timer(0.1, scraper.cancel).start()
+
+        with self.assertRaises(ScraperCancelled):
+            scraper.fetch()
+        self.assertTrue(scraper.cancelled)
+
+    def test_request_timeout_capped(self):
+        """Test request timeouts never exceed the time remaining"""
+        scraper = SlowScraper()
+        scraper.deadline = Deadline(0.5)
+        self.assertLessEqual(scraper.request_timeout(), 0.5)
+
+        scraper.cancel()
+        with self.assertRaises(ScraperCancelled):
+            scraper.request_timeout()
+
+
+if __name__ == '__main__':
+    unittest.main()
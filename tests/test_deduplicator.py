@@ -1,6 +1,8 @@
 """Unit tests for Deduplicator"""
 import unittest
+from datetime import datetime
 from src.processors.deduplicator import Deduplicator
+from src.processors.normalizer import NormalizedEvent
 
 
 class TestDeduplicator(unittest.TestCase):
@@ -122,6 +124,23 @@ class TestDeduplicator(unittest.TestCase):
         # Not similar enough - keep both
         self.assertEqual(len(result), 2)
 
+    def test_deduplicate_events_keeps_objects(self):
+        """Test NormalizedEvents come back as themselves (datetime dates), with merged metadata"""
+        def event(title, event_hash, venue=None):
+            return NormalizedEvent(
+                title=title, event_date=datetime(2025, 10, 15, 10), source_name='library',
+                content_hash=event_hash, quality_score=80, venue=venue,
+            )
+
+        lego, lego_again, books = event('LEGO Club', 'a'), event('LEGO Club!', 'b', 'Library'), event('Book Club', 'c')
+
+        result = Deduplicator().deduplicate_events([lego, lego_again, books])
+
+        self.assertEqual([e.title for e in result], ['LEGO Club', 'Book Club'])
+        self.assertIs(result[1], books)
+        self.assertEqual(result[0].venue, 'Library')
+        self.assertEqual(result[0].event_date, datetime(2025, 10, 15, 10))
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,119 @@
+"""Tests for run instrumentation"""
+import json
+import tempfile
+import unittest
+from pathlib import Path
+from src.instrumentation import Instrumentation, metrics
+from src.processors.normalizer import Normalizer
+from src.processors.deduplicator import Deduplicator
+
+
+class TestInstrumentation(unittest.TestCase):
+    """Test cases for Instrumentation"""
+
+    def test_disabled_records_nothing(self):
+        """Test disabled spans and counters are no-ops"""
+        instr = Instrumentation()
+        with instr.span('parse', source='knco'):
+            pass
+        instr.count('events_in', 5)
+        instr.observe('http_fetch', 1.0)
+
+        self.assertIs(instr.span('a'), instr.span('b'))
+        self.assertEqual(instr.snapshot()['spans'], [])
+        self.assertEqual(instr.snapshot()['counters'], [])
+
+    def test_spans_and_counters_aggregate(self):
+        """Test spans and counters aggregate per name and label set"""
+        instr = Instrumentation(enabled=True)
+        instr.observe('parse', 0.5, source='knco')
+        instr.observe('parse', 1.5, source='knco')
+        instr.observe('parse', 1.0, source='county')
+        instr.count('events_in', 3, source='knco')
+        instr.count('events_in', 2, source='knco')
+
+        snapshot = instr.snapshot()
+        knco = next(s for s in snapshot['spans'] if s['labels'] == {'source': 'knco'})
+        self.assertEqual(knco['count'], 2)
+        self.assertEqual(knco['total_seconds'], 2.0)
+        self.assertEqual(knco['max_seconds'], 1.5)
+        self.assertEqual(snapshot['counters'], [{'name': 'events_in', 'labels': {'source': 'knco'}, 'value': 5}])
+
+    def test_span_context_manager(self):
+        """Test a span records its block even when it raises"""
+        instr = Instrumentation(enabled=True)
+        with self.assertRaises(ValueError):
+            with instr.span('store'):
+                raise ValueError('boom')
+
+        self.assertEqual(instr.snapshot()['spans'][0]['count'], 1)
+
+    def test_prometheus_format(self):
+        """Test the Prometheus text rendering"""
+        instr = Instrumentation(enabled=True)
+        instr.observe('db_write', 0.25, backend='sqlite')
+        instr.count('cache_hits', 2, tier='memory')
+        instr.count('odd', 1, label='say "hi"')
+
+        text = instr.to_prometheus()
+        self.assertIn('# TYPE events_db_write_seconds summary', text)
+        self.assertIn('events_db_write_seconds_sum{backend="sqlite"} 0.25', text)
+        self.assertIn('events_db_write_seconds_count{backend="sqlite"} 1', text)
+        self.assertIn('events_cache_hits_total{tier="memory"} 2', text)
+        self.assertIn('events_odd_total{label="say \\"hi\\""} 1', text)
+
+    def test_write(self):
+        """Test JSON and textfile output"""
+        instr = Instrumentation(enabled=True)
+        instr.count('events_in', 1)
+
+        with tempfile.TemporaryDirectory() as directory:
+            json_path, prom_path = instr.write(directory)
+
+            self.assertEqual(json.loads(Path(json_path).read_text())['counters'][0]['value'], 1)
+            self.assertIn('events_events_in_total 1', Path(prom_path).read_text())
+            self.assertEqual(sorted(p.name for p in Path(directory).iterdir()), sorted([json_path.name, prom_path.name]))
+
+
+class TestStageInstrumentation(unittest.TestCase):
+    """Test the processors report to the global instrumentation"""
+
+    def setUp(self):
+        metrics.reset()
+        metrics.enable()
+        self.addCleanup(metrics.reset)
+        self.addCleanup(metrics.disable)
+
+    def counter(self, name, **labels):
+        return sum(
+            c['value'] for c in metrics.snapshot()['counters']
+            if c['name'] == name and all(c['labels'].get(k) == v for k, v in labels.items())
+        )
+
+    def test_normalize_counters(self):
+        """Test normalize records its span, events in/out and validation errors"""
+        events = [
+            {'title': 'Story Time', 'event_date': '2025-10-15', 'source_event_id': '1'},
+            {'title': 'No date', 'event_date': 'whenever', 'source_event_id': '2'},
+        ]
+        normalized = Normalizer('knco').normalize(events)
+
+        self.assertEqual(self.counter('events_in', source='knco'), 2)
+        self.assertEqual(self.counter('events_out', source='knco'), len(normalized))
+        self.assertTrue(any(s['name'] == 'normalize' for s in metrics.snapshot()['spans']))
+
+    def test_dedupe_counters(self):
+        """Test dedupe counts fuzzy comparisons and duplicates"""
+        events = [
+            {'title': 'Story Time', 'event_date': '2025-10-15', 'content_hash': 'a', 'source_name': 'knco'},
+            {'title': 'Story Time!', 'event_date': '2025-10-15', 'content_hash': 'b', 'source_name': 'library'},
+            {'title': 'Story Time', 'event_date': '2025-10-15', 'content_hash': 'a', 'source_name': 'knco'},
+        ]
+        Deduplicator().deduplicate(events)
+
+        self.assertEqual(self.counter('dedup_comparisons'), 1)
+        self.assertEqual(self.counter('duplicates'), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
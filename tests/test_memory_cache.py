@@ -0,0 +1,78 @@
+"""Unit tests for in-process memory cache tier"""
+import unittest
+from unittest.mock import patch
+from src.storage.memory import MemoryCache
+
+
+class TestMemoryCache(unittest.TestCase):
+    """Test memory cache TTL and LRU behavior"""
+
+    def test_set_and_get(self):
+        """Test cached events are returned as a copy"""
+        cache = MemoryCache(default_ttl_seconds=60)
+        events = [{'id': 1}, {'id': 2}]
+
+        cache.set('knco', events)
+        result = cache.get('knco')
+
+        self.assertEqual(result, events)
+        self.assertIsNot(result, events)
+        self.assertIsNone(cache.get('library'))
+
+    @patch('src.storage.memory.time.monotonic')
+    def test_per_source_ttl(self, mock_monotonic):
+        """Test entries expire according to per-source TTLs"""
+        mock_monotonic.return_value = 1000.0
+        cache = MemoryCache(default_ttl_seconds=60, source_ttls={'library': 600})
+
+        cache.set('knco', [{'id': 1}])
+        cache.set('library', [{'id': 2}])
+
+        mock_monotonic.return_value = 1061.0
+        self.assertIsNone(cache.get('knco'))
+        self.assertIsNotNone(cache.get('library'))
+        self.assertEqual(cache.expirations, 1)
+
+    @patch('src.storage.memory.time.monotonic')
+    def test_ttl_override_is_capped(self, mock_monotonic):
+        """Test a TTL override can shorten but never extend the source TTL"""
+        mock_monotonic.return_value = 0.0
+        cache = MemoryCache(default_ttl_seconds=60)
+
+        cache.set('knco', [{'id': 1}], ttl_seconds=3600)
+        mock_monotonic.return_value = 61.0
+        self.assertIsNone(cache.get('knco'))
+
+        cache.set('knco', [{'id': 1}], ttl_seconds=-5)
+        self.assertIsNone(cache.get('knco'))
+
+    def test_lru_eviction(self):
+        """Test least recently used sources are evicted past max_events"""
+        cache = MemoryCache(default_ttl_seconds=60, max_events=4)
+
+        cache.set('knco', [{'id': 1}, {'id': 2}])
+        cache.set('library', [{'id': 3}, {'id': 4}])
+        cache.get('knco')  # knco is now most recently used
+        cache.set('county', [{'id': 5}])
+
+        self.assertIsNotNone(cache.get('knco'))
+        self.assertIsNone(cache.get('library'))
+        self.assertIsNotNone(cache.get('county'))
+        self.assertEqual(cache.evictions, 1)
+
+    def test_invalidate(self):
+        """Test per-source and global invalidation"""
+        cache = MemoryCache(default_ttl_seconds=60)
+        cache.set('knco', [{'id': 1}])
+        cache.set('library', [{'id': 2}])
+
+        cache.invalidate('knco')
+        self.assertIsNone(cache.get('knco'))
+        self.assertEqual(len(cache), 1)
+
+        cache.invalidate()
+        self.assertEqual(len(cache), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,7 +1,9 @@
 """Unit tests for data normalizer"""
 import unittest
+from unittest.mock import patch
 from datetime import datetime
 from src.processors.normalizer import Normalizer, NormalizedEvent
+from src.processors.window import DateWindow
 
 
 class TestNormalizer(unittest.TestCase):
@@ -197,6 +199,20 @@ class TestNormalizer(unittest.TestCase):
         self.assertEqual(len(normalized), 1)
         self.assertEqual(normalized[0].title, 'High Quality Event')
 
+    def test_window_filtering(self):
+        """Test events outside the date window are dropped before scoring"""
+        events = [
+            {'title': 'This Week', 'event_date': '2025-10-15'},
+            {'title': 'Next Month', 'event_date': '2025-11-15'},
+        ]
+        window = DateWindow(datetime(2025, 10, 13), datetime(2025, 10, 20))
+
+        with patch.object(self.normalizer, '_calculate_quality_score', return_value=50) as score:
+            normalized = self.normalizer.normalize(events, log_quality_stats=False, window=window)
+
+        self.assertEqual([e.title for e in normalized], ['This Week'])
+        score.assert_called_once()
+
     def test_quality_stats_logging(self):
         """Test quality statistics logging"""
         events = [
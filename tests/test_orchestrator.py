@@ -3,14 +3,16 @@ import unittest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
 import time
+import threading
 from concurrent.futures import TimeoutError
-from src.orchestrator import EventOrchestrator
+from src.orchestrator import EventOrchestrator, main
+from src.storage.query import EventQuery
 
 
 class TestOrchestrator(unittest.TestCase):
     """Test event orchestrator"""
 
-    @patch('src.orchestrator.SupabaseClient')
+    @patch('src.storage.supabase.SupabaseClient')
     @patch('src.orchestrator.CacheManager')
     def test_initialization(self, mock_cache_mgr, mock_db):
         """Test orchestrator initialization"""
@@ -19,12 +21,13 @@ class TestOrchestrator(unittest.TestCase):
         self.assertIsNotNone(orchestrator.db)
         self.assertIsNotNone(orchestrator.cache)
 
-    @patch('src.orchestrator.SupabaseClient')
+    @patch('src.storage.supabase.SupabaseClient')
     @patch('src.orchestrator.CacheManager')
     def test_fetch_events_with_cache(self, mock_cache_mgr_class, mock_db_class):
         """Test fetching events with cache enabled"""
         mock_db = Mock()
         mock_cache = Mock()
+        mock_cache.get_cached_many.return_value = {}
         mock_db_class.return_value = mock_db
         mock_cache_mgr_class.return_value = mock_cache
 
@@ -47,12 +50,13 @@ class TestOrchestrator(unittest.TestCase):
         # Verify we got events
         self.assertEqual(len(events), 1)
 
-    @patch('src.orchestrator.SupabaseClient')
+    @patch('src.storage.supabase.SupabaseClient')
     @patch('src.orchestrator.CacheManager')
     def test_available_sources(self, mock_cache_mgr_class, mock_db_class):
         """Test available sources are registered"""
         mock_db = Mock()
         mock_cache = Mock()
+        mock_cache.get_cached_many.return_value = {}
         mock_db_class.return_value = mock_db
         mock_cache_mgr_class.return_value = mock_cache
 
@@ -61,12 +65,13 @@ class TestOrchestrator(unittest.TestCase):
         # Verify KNCO is available
         self.assertIn('knco', orchestrator.AVAILABLE_SOURCES)
 
-    @patch('src.orchestrator.SupabaseClient')
+    @patch('src.storage.supabase.SupabaseClient')
     @patch('src.orchestrator.CacheManager')
     def test_unknown_source(self, mock_cache_mgr_class, mock_db_class):
         """Test handling of unknown source"""
         mock_db = Mock()
         mock_cache = Mock()
+        mock_cache.get_cached_many.return_value = {}
         mock_db_class.return_value = mock_db
         mock_cache_mgr_class.return_value = mock_cache
 
@@ -76,12 +81,13 @@ class TestOrchestrator(unittest.TestCase):
         # Should handle error gracefully and return empty list
         self.assertEqual(len(events), 0)
 
-    @patch('src.orchestrator.SupabaseClient')
+    @patch('src.storage.supabase.SupabaseClient')
     @patch('src.orchestrator.CacheManager')
     def test_context_manager(self, mock_cache_mgr_class, mock_db_class):
         """Test using orchestrator as context manager"""
         mock_db = Mock()
         mock_cache = Mock()
+        mock_cache.get_cached_many.return_value = {}
         mock_db_class.return_value = mock_db
         mock_cache_mgr_class.return_value = mock_cache
 
@@ -91,17 +97,18 @@ class TestOrchestrator(unittest.TestCase):
         # Verify cleanup
         mock_db.close.assert_called_once()
 
-    @patch('src.orchestrator.SupabaseClient')
+    @patch('src.storage.supabase.SupabaseClient')
     @patch('src.orchestrator.CacheManager')
     def test_parallel_scraping(self, mock_cache_mgr_class, mock_db_class):
         """Test parallel scraping of multiple sources"""
         mock_db = Mock()
         mock_cache = Mock()
+        mock_cache.get_cached_many.return_value = {}
         mock_db_class.return_value = mock_db
         mock_cache_mgr_class.return_value = mock_cache
 
         # Mock events for different sources
-        def mock_get_or_fetch(source, fetch_fn, ttl_hours):
+        def mock_get_or_fetch(source, fetch_fn, ttl_hours, **kwargs):
             return [
                 {
                     'id': f'{source}_1',
@@ -129,17 +136,18 @@ class TestOrchestrator(unittest.TestCase):
         # With 3 sources, should complete in under 2 seconds even with mock overhead
         self.assertLess(duration, 5)
 
-    @patch('src.orchestrator.SupabaseClient')
+    @patch('src.storage.supabase.SupabaseClient')
     @patch('src.orchestrator.CacheManager')
     def test_timeout_handling(self, mock_cache_mgr_class, mock_db_class):
         """Test timeout handling for slow sources"""
         mock_db = Mock()
         mock_cache = Mock()
+        mock_cache.get_cached_many.return_value = {}
         mock_db_class.return_value = mock_db
         mock_cache_mgr_class.return_value = mock_cache
 
         # Mock a slow source that times out
-        def slow_fetch(source, fetch_fn, ttl_hours):
+        def slow_fetch(source, fetch_fn, ttl_hours, **kwargs):
             if source == 'county':
                 # Simulate a slow source
                 time.sleep(3)
@@ -166,17 +174,18 @@ class TestOrchestrator(unittest.TestCase):
         # Due to the way futures work, we may get some events
         self.assertGreaterEqual(len(events), 0)
 
-    @patch('src.orchestrator.SupabaseClient')
+    @patch('src.storage.supabase.SupabaseClient')
     @patch('src.orchestrator.CacheManager')
     def test_sequential_scraping(self, mock_cache_mgr_class, mock_db_class):
         """Test sequential scraping when parallel is disabled"""
         mock_db = Mock()
         mock_cache = Mock()
+        mock_cache.get_cached_many.return_value = {}
         mock_db_class.return_value = mock_db
         mock_cache_mgr_class.return_value = mock_cache
 
         # Mock events for different sources
-        def mock_get_or_fetch(source, fetch_fn, ttl_hours):
+        def mock_get_or_fetch(source, fetch_fn, ttl_hours, **kwargs):
             return [
                 {
                     'id': f'{source}_1',
@@ -198,17 +207,18 @@ class TestOrchestrator(unittest.TestCase):
         # Should get events from all sources
         self.assertEqual(len(events), 2)
 
-    @patch('src.orchestrator.SupabaseClient')
+    @patch('src.storage.supabase.SupabaseClient')
     @patch('src.orchestrator.CacheManager')
     def test_graceful_failure(self, mock_cache_mgr_class, mock_db_class):
         """Test graceful failure when one source fails"""
         mock_db = Mock()
         mock_cache = Mock()
+        mock_cache.get_cached_many.return_value = {}
         mock_db_class.return_value = mock_db
         mock_cache_mgr_class.return_value = mock_cache
 
         # Mock one source to fail
-        def mock_get_or_fetch(source, fetch_fn, ttl_hours):
+        def mock_get_or_fetch(source, fetch_fn, ttl_hours, **kwargs):
             if source == 'library':
                 raise Exception("Library source unavailable")
             return [
@@ -233,6 +243,321 @@ class TestOrchestrator(unittest.TestCase):
         self.assertGreaterEqual(len(events), 1)
         self.assertLessEqual(len(events), 2)
 
+    @patch('src.storage.supabase.SupabaseClient')
+    @patch('src.orchestrator.CacheManager')
+    def test_batched_cache_hits_skip_scraping(self, mock_cache_mgr_class, mock_db_class):
+        """Test cache hits are resolved up front and only misses are scraped"""
+        mock_db = Mock()
+        mock_cache = Mock()
+        mock_db_class.return_value = mock_db
+        mock_cache_mgr_class.return_value = mock_cache
+
+        mock_cache.get_cached_many.return_value = {
+            'knco': [{'id': 1, 'title': 'Cached', 'source_name': 'knco', 'scraped_at': datetime.now()}],
+            'county': [{'id': 2, 'title': 'Cached', 'source_name': 'county', 'scraped_at': datetime.now()}],
+        }
+        mock_cache.get_or_fetch.return_value = [
+            {'id': 3, 'title': 'Fresh', 'source_name': 'library', 'scraped_at': datetime.now()}
+        ]
+
+        orchestrator = EventOrchestrator()
+        events = orchestrator.fetch_events(
+            sources=['knco', 'library', 'county'],
+            use_cache=True,
+            parallel=True
+        )
+
+        self.assertEqual(len(events), 3)
+        mock_cache.get_cached_many.assert_called_once()
+        self.assertEqual(mock_cache.get_cached_many.call_args[0][0], ['knco', 'library', 'county'])
+
+        # Only the miss is scraped, and it does not re-check the cache
+        mock_cache.get_or_fetch.assert_called_once()
+        self.assertEqual(mock_cache.get_or_fetch.call_args[0][0], 'library')
+        self.assertFalse(mock_cache.get_or_fetch.call_args[1]['check_cache'])
+
+    @patch('src.storage.supabase.SupabaseClient')
+    @patch('src.orchestrator.CacheManager')
+    def test_batched_cache_hits_quality_filter(self, mock_cache_mgr_class, mock_db_class):
+        """Test the quality threshold and other filters are pushed into the batched cache read"""
+        mock_db = Mock()
+        mock_cache = Mock()
+        mock_db_class.return_value = mock_db
+        mock_cache_mgr_class.return_value = mock_cache
+
+        mock_cache.get_cached_many.return_value = {
+            'knco': [
+                {'id': 1, 'title': 'Good', 'source_name': 'knco', 'quality_score': 90, 'scraped_at': datetime.now()},
+            ]
+        }
+
+        orchestrator = EventOrchestrator()
+        events = orchestrator.fetch_events(
+            sources=['knco'], use_cache=True, min_quality_score=50, query=EventQuery().free()
+        )
+
+        self.assertEqual([e['title'] for e in events], ['Good'])
+        self.assertEqual(
+            mock_cache.get_cached_many.call_args.kwargs['query'],
+            EventQuery(min_quality_score=50, free_only=True)
+        )
+        mock_cache.get_or_fetch.assert_not_called()
+
+    def test_overrunning_scraper_cancelled(self):
+        """Test an overrunning scraper is cancelled and finished sources are still returned"""
+        from src.storage.sqlite import SQLiteClient
+        from src.scrapers.base import BaseScraper
+
+        class FastScraper(BaseScraper):
+            def __init__(self):
+                super().__init__('fast')
+
+            def fetch(self):
+                return [{'title': 'Story Time', 'event_date': '2025-10-15', 'source_event_id': '1'}]
+
+            def parse(self, raw_data):
+                return raw_data
+
+        class HungScraper(BaseScraper):
+            instances = []
+
+            def __init__(self):
+                super().__init__('hung')
+                HungScraper.instances.append(self)
+
+            def fetch(self):
+                while True:
+                    self.sleep(0.05)
+
+            def parse(self, raw_data):
+                return raw_data
+
+        sources = {'fast': FastScraper, 'hung': HungScraper}
+        with patch.dict(EventOrchestrator.AVAILABLE_SOURCES, sources):
+            with EventOrchestrator(store=SQLiteClient(':memory:')) as orchestrator:
+                start = time.time()
+                events = orchestrator.fetch_events(sources=['fast', 'hung'], timeout=1)
+                duration = time.time() - start
+
+        self.assertEqual([e['title'] for e in events], ['Story Time'])
+        self.assertTrue(HungScraper.instances[0].cancelled)
+        self.assertLess(duration, 5)
+
+    def test_run_deadline_cut_off_tagged(self):
+        """Test a source cut off by the run budget is tagged and not recorded as a timeout"""
+        from src.storage.sqlite import SQLiteClient
+        from src.scrapers.base import BaseScraper
+
+        class HungScraper(BaseScraper):
+            def __init__(self):
+                super().__init__('hung')
+
+            def fetch(self):
+                while True:
+                    self.sleep(0.05)
+
+            def parse(self, raw_data):
+                return raw_data
+
+        for kwargs in ({'parallel': True}, {'parallel': False}, {'pipeline': True}):
+            with patch.dict(EventOrchestrator.AVAILABLE_SOURCES, {'hung': HungScraper, 'hung2': HungScraper}), \
+                    patch('src.orchestrator.timeout_tuner') as tuner:
+                tuner.scrape_timeouts.side_effect = lambda sources, timeout: {s: timeout for s in sources}
+                with EventOrchestrator(store=SQLiteClient(':memory:')) as orchestrator:
+                    batches = list(orchestrator.iter_events(
+                        sources=['hung', 'hung2'], use_cache=False, timeout=30, run_timeout=0.5, **kwargs
+                    ))
+
+            self.assertEqual([b.status for b in batches], ['timed_out', 'timed_out'], kwargs)
+            self.assertTrue(all(b.cut_off for b in batches), kwargs)
+            self.assertTrue(all(b.duration is None or b.duration < 30 for b in batches), kwargs)
+            tuner.record_timeout.assert_not_called()
+
+    def test_iter_events_streams_fast_source_first(self):
+        """Test a finished source is yielded while a slower one is still scraping"""
+        from src.storage.sqlite import SQLiteClient
+
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        class FastScraper:
+            def fetch(self):
+                return [{'title': 'Story Time', 'event_date': '2025-10-15', 'source_event_id': '1'}]
+
+        class SlowScraper:
+            def fetch(self):
+                release.wait(5)
+                return [{'title': 'Book Club', 'event_date': '2025-10-16', 'source_event_id': '2'}]
+
+        sources = {'fast': FastScraper, 'slow': SlowScraper}
+        with patch.dict(EventOrchestrator.AVAILABLE_SOURCES, sources):
+            with EventOrchestrator(store=SQLiteClient(':memory:')) as orchestrator:
+                batches = orchestrator.iter_events(sources=['slow', 'fast'], use_cache=False)
+                first = next(batches)
+                self.assertFalse(release.is_set())
+                release.set()
+                rest = list(batches)
+
+        self.assertEqual((first.source, first.status), ('fast', 'success'))
+        self.assertEqual([e['title'] for e in first.events], ['Story Time'])
+        self.assertEqual([(b.source, len(b.events)) for b in rest], [('slow', 1)])
+
+    def test_stream_events(self):
+        """Test the async variant yields every source's batch"""
+        import asyncio
+        from src.storage.sqlite import SQLiteClient
+
+        class FakeScraper:
+            def fetch(self):
+                return [{'title': 'Story Time', 'event_date': '2025-10-15', 'source_event_id': '1'}]
+
+        class BrokenScraper:
+            def fetch(self):
+                raise RuntimeError('site down')
+
+        async def collect(orchestrator):
+            return [batch async for batch in orchestrator.stream_events(['fake', 'broken'], use_cache=False)]
+
+        sources = {'fake': FakeScraper, 'broken': BrokenScraper}
+        with patch.dict(EventOrchestrator.AVAILABLE_SOURCES, sources):
+            with EventOrchestrator(store=SQLiteClient(':memory:')) as orchestrator:
+                batches = asyncio.run(collect(orchestrator))
+
+        statuses = {batch.source: batch.status for batch in batches}
+        self.assertEqual(statuses, {'fake': 'success', 'broken': 'failed'})
+
+    def test_pipeline_end_to_end(self):
+        """Test sources scraped through the pipeline are stored and returned"""
+        from src.config import Config
+        from src.storage.sqlite import SQLiteClient
+        from src.scrapers.base import BaseScraper
+
+        class SplitScraper(BaseScraper):
+            def __init__(self):
+                super().__init__('split')
+
+            def fetch(self):
+                return self.parse_download(self.download())
+
+            def download(self):
+                return 'Story Time|2025-10-15'
+
+            def parse_download(self, payload):
+                title, date = payload.split('|')
+                return [{'title': title, 'event_date': date, 'source_event_id': '1'}]
+
+            def parse(self, raw_data):
+                return raw_data
+
+        class BrokenScraper(SplitScraper):
+            def download(self):
+                raise ConnectionError('unreachable')
+
+        store = SQLiteClient(':memory:')
+        sources = {'split': SplitScraper, 'broken': BrokenScraper}
+        with patch.dict(EventOrchestrator.AVAILABLE_SOURCES, sources), \
+                patch.object(Config, 'PIPELINE_CPU_EXECUTOR', 'thread'):
+            with EventOrchestrator(store=store) as orchestrator:
+                events = orchestrator.fetch_events(sources=['split', 'broken'], pipeline=True)
+                cached = store.get_cached_events('split', 6)
+
+        self.assertEqual([e['title'] for e in events], ['Story Time'])
+        self.assertEqual(len(cached), 1)
+
+    def test_sqlite_store_end_to_end(self):
+        """Test a scrape is stored in and then served from a real SQLite store"""
+        from src.storage.sqlite import SQLiteClient
+
+        class FakeScraper:
+            calls = 0
+
+            def fetch(self):
+                FakeScraper.calls += 1
+                return [{'title': 'Story Time', 'event_date': '2025-10-15', 'source_event_id': '1'}]
+
+        store = SQLiteClient(':memory:')
+        with patch.dict(EventOrchestrator.AVAILABLE_SOURCES, {'fake': FakeScraper}):
+            with EventOrchestrator(store=store) as orchestrator:
+                first = orchestrator.fetch_events(sources=['fake'], use_cache=True)
+                orchestrator.cache.memory.invalidate()
+                second = orchestrator.fetch_events(sources=['fake'], use_cache=True)
+
+        self.assertEqual(len(first), 1)
+        self.assertEqual(second[0]['title'], 'Story Time')
+        self.assertEqual(FakeScraper.calls, 1)
+
+    def test_run_history_recorded(self):
+        """Test each run's per-source outcome lands in scrape_runs"""
+        from src.storage.sqlite import SQLiteClient
+
+        class FakeScraper:
+            def fetch(self):
+                return [{'title': 'Story Time', 'event_date': '2025-10-15', 'source_event_id': '1'}]
+
+        class BrokenScraper:
+            def fetch(self):
+                raise RuntimeError('site down')
+
+        store = SQLiteClient(':memory:')
+        sources = {'fake': FakeScraper, 'broken': BrokenScraper}
+        with patch.dict(EventOrchestrator.AVAILABLE_SOURCES, sources):
+            with EventOrchestrator(store=store) as orchestrator:
+                orchestrator.fetch_events(sources=['fake', 'broken'], use_cache=True)
+                orchestrator.fetch_events(sources=['fake'], use_cache=True)
+                report = {row['source_name']: row for row in store.get_run_report(datetime(2000, 1, 1))}
+
+        self.assertEqual(report['fake']['runs'], 2)
+        self.assertEqual(report['fake']['success_rate'], 1.0)
+        self.assertEqual(report['fake']['cache_hit_ratio'], 0.5)
+        self.assertEqual(report['fake']['events_per_run'], 1.0)
+        self.assertIsNotNone(report['fake']['p50_seconds'])
+        self.assertEqual(report['broken']['failures'], 1)
+        self.assertEqual(report['broken']['success_rate'], 0.0)
+
+    def test_events_page_upcoming(self):
+        """Test pages default to upcoming events and follow cursors across sources"""
+        from datetime import timedelta
+        from src.storage.sqlite import SQLiteClient
+        from src.processors.normalizer import NormalizedEvent
+
+        from zoneinfo import ZoneInfo
+        from src.config import Config
+
+        # "Today" is the configured time zone's, whatever the machine's is
+        today = datetime.now(ZoneInfo(Config.TIMEZONE)).replace(tzinfo=None, hour=10, minute=0, second=0, microsecond=0)
+        store = SQLiteClient(':memory:')
+        store.upsert_events([
+            NormalizedEvent(
+                title=f'{source} {offset}', event_date=today + timedelta(days=offset), source_name=source,
+                content_hash=f'{source}{offset}', quality_score=80, source_event_id=f'{source}{offset}',
+            )
+            for offset in (-1, 1, 2)
+            for source in ('knco', 'library')
+        ])
+
+        with EventOrchestrator(store=store) as orchestrator:
+            first = orchestrator.events_page(page_size=3)
+            second = orchestrator.events_page(cursor=first.next_cursor, page_size=3)
+
+        self.assertEqual([e['title'] for e in first.events], ['knco 1', 'library 1', 'knco 2'])
+        self.assertEqual([e['title'] for e in second.events], ['library 2'])
+        self.assertIsNone(second.next_cursor)
+
+    @patch('src.daemon.EventDaemon')
+    @patch('src.orchestrator.EventOrchestrator')
+    def test_daemon_defaults_to_every_source(self, mock_orchestrator_class, mock_daemon_class):
+        """Test --daemon without --sources refreshes every source, and --sources narrows it"""
+        orchestrator = mock_orchestrator_class.return_value.__enter__.return_value
+
+        with patch('sys.argv', ['orchestrator', '--daemon']):
+            main()
+        mock_daemon_class.assert_called_once_with(orchestrator, None, timeout=None)
+
+        mock_daemon_class.reset_mock()
+        with patch('sys.argv', ['orchestrator', '--daemon', '--sources', 'knco,library']):
+            main()
+        mock_daemon_class.assert_called_once_with(orchestrator, ['knco', 'library'], timeout=None)
+
 
 if __name__ == '__main__':
     unittest.main()
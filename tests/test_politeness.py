@@ -0,0 +1,165 @@
+"""Tests for per-host politeness limits"""
+import time
+import threading
+import unittest
+from src.scheduling.politeness import PolitenessScheduler, TokenBucket
+
+
+def wait_until(condition, timeout=2.0):
+    end = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > end:
+            raise AssertionError('condition not met')
+        time.sleep(0.005)
+
+
+class TestTokenBucket(unittest.TestCase):
+    """Test cases for TokenBucket"""
+
+    def test_burst_then_rate(self):
+        """Test a full bucket allows a burst, then one request per 1/rate"""
+        bucket = TokenBucket(rate=10, burst=2)
+        self.assertTrue(bucket.try_take())
+        self.assertTrue(bucket.try_take())
+        self.assertFalse(bucket.try_take())
+        self.assertAlmostEqual(bucket.delay(), 0.1, delta=0.02)
+
+    def test_unlimited(self):
+        """Test a zero rate never limits"""
+        bucket = TokenBucket(rate=0)
+        self.assertTrue(all(bucket.try_take() for _ in range(100)))
+
+
+class TestPolitenessScheduler(unittest.TestCase):
+    """Test cases for PolitenessScheduler"""
+
+    def run_requests(self, scheduler, urls, duration=0.05):
+        """Make one request per url concurrently; return peak in-flight per host"""
+        lock = threading.Lock()
+        active, peak = {}, {}
+
+        def request(url):
+            host = scheduler.host_key(url)
+            with scheduler.slot(url):
+                with lock:
+                    active[host] = active.get(host, 0) + 1
+                    peak[host] = max(peak.get(host, 0), active[host])
+                time.sleep(duration)
+                with lock:
+                    active[host] -= 1
+
+        threads = [threading.Thread(target=request, args=(url,)) for url in urls]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return peak
+
+    def test_host_key(self):
+        """Test hosts are keyed without scheme, path or www."""
+        self.assertEqual(PolitenessScheduler.host_key('https://www.NevadaCountyCA.gov/Calendar.aspx'), 'nevadacountyca.gov')
+        self.assertEqual(PolitenessScheduler.host_key('nevadacountyca.gov'), 'nevadacountyca.gov')
+
+    def test_per_host_connection_limit(self):
+        """Test each host is limited separately"""
+        scheduler = PolitenessScheduler(max_concurrency=10, host_connections=2, host_qps=0)
+        urls = ['https://a.example/x'] * 5 + ['https://www.b.example/y'] * 5
+
+        peak = self.run_requests(scheduler, urls)
+
+        self.assertEqual(peak, {'a.example': 2, 'b.example': 2})
+
+    def test_global_limit(self):
+        """Test total requests in flight are capped across hosts"""
+        scheduler = PolitenessScheduler(max_concurrency=3, host_connections=5, host_qps=0)
+        lock = threading.Lock()
+        in_flight = [0, 0]
+
+        def request(url):
+            with scheduler.slot(url):
+                with lock:
+                    in_flight[0] += 1
+                    in_flight[1] = max(in_flight[1], in_flight[0])
+                time.sleep(0.05)
+                with lock:
+                    in_flight[0] -= 1
+
+        threads = [threading.Thread(target=request, args=(f'https://h{i}.example/',)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(in_flight[1], 3)
+
+    def test_rate_limit(self):
+        """Test a host starts requests no faster than its QPS after the burst"""
+        scheduler = PolitenessScheduler(host_connections=5, host_qps=20, host_burst=1)
+        start = time.monotonic()
+        for _ in range(4):
+            with scheduler.slot('https://a.example/'):
+                pass
+
+        self.assertGreaterEqual(time.monotonic() - start, 0.14)
+
+    def test_fair_queuing(self):
+        """Test waiting requests are admitted round-robin by source"""
+        scheduler = PolitenessScheduler(max_concurrency=1, host_connections=1, host_qps=0)
+        order = []
+        blocker = threading.Event()
+
+        def hold():
+            with scheduler.slot('https://a.example/', source='blocker'):
+                blocker.wait()
+
+        def request(source, name):
+            with scheduler.slot('https://a.example/', source=source):
+                order.append(name)
+
+        self.addCleanup(blocker.set)
+        threads = [threading.Thread(target=hold)]
+        threads[0].start()
+        wait_until(lambda: scheduler._active == 1)
+
+        requests = [('library', 'l1'), ('library', 'l2'), ('library', 'l3'), ('knco', 'k1')]
+        for queued, (source, name) in enumerate(requests, 1):
+            thread = threading.Thread(target=request, args=(source, name))
+            thread.start()
+            threads.append(thread)
+            wait_until(lambda: sum(len(q) for q in scheduler._waiting.values()) == queued)
+
+        blocker.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(order, ['l1', 'k1', 'l2', 'l3'])
+
+    def test_check_aborts_wait(self):
+        """Test a raising check stops waiting and frees the queue position"""
+        scheduler = PolitenessScheduler(max_concurrency=1, host_qps=0)
+        release = threading.Event()
+        self.addCleanup(release.set)
+
+        def hold():
+            with scheduler.slot('https://a.example/'):
+                release.wait()
+
+        holder = threading.Thread(target=hold)
+        holder.start()
+        wait_until(lambda: scheduler._active == 1)
+
+        def cancelled():
+            raise RuntimeError('cancelled')
+
+        with self.assertRaises(RuntimeError):
+            with scheduler.slot('https://a.example/', source='knco', check=cancelled):
+                pass
+
+        self.assertEqual(scheduler._waiting, {})
+        release.set()
+        holder.join()
+        self.assertEqual(scheduler._active, 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
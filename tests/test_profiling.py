@@ -0,0 +1,78 @@
+"""Tests for run profiling"""
+import pstats
+import tempfile
+import threading
+import unittest
+from src.profiling import Profiler
+
+
+def parse_work():
+    return sorted(str(i) for i in range(2000))
+
+
+def store_work():
+    return sum(i * i for i in range(2000))
+
+
+def function_names(path):
+    return {func for (_, _, func) in pstats.Stats(str(path)).stats}
+
+
+class TestProfiler(unittest.TestCase):
+    """Test cases for Profiler"""
+
+    def test_disabled_section_is_noop(self):
+        """Test sections do nothing until profiling starts"""
+        profiler = Profiler()
+        self.assertIs(profiler.section('a'), profiler.section('b'))
+        self.assertFalse(profiler.enabled)
+
+    def test_per_source_and_stage_profiles_across_threads(self):
+        """Test sections on worker threads are merged into per-source and per-stage files"""
+        profiler = Profiler()
+        profiler.start()
+
+        def scrape(source):
+            with profiler.section(source=source):
+                with profiler.section(stage='parse'):
+                    parse_work()
+                with profiler.section(stage='store'):
+                    store_work()
+
+        threads = [threading.Thread(target=scrape, args=(s,)) for s in ('knco', 'county')]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        with tempfile.TemporaryDirectory() as directory:
+            with self.assertLogs('src.profiling', level='INFO') as logs:
+                paths = profiler.stop(directory, top_n=5)
+            files = {p.name: p for p in paths}
+
+            self.assertTrue({'run.prof', 'source-knco.prof', 'source-county.prof',
+                             'stage-parse.prof', 'stage-store.prof'} <= set(files))
+            self.assertIn('parse_work', function_names(files['stage-parse.prof']))
+            self.assertNotIn('store_work', function_names(files['stage-parse.prof']))
+            self.assertTrue({'parse_work', 'store_work'} <= function_names(files['source-knco.prof']))
+
+        self.assertTrue(any('hotspots' in line for line in logs.output))
+        self.assertFalse(profiler.enabled)
+
+    def test_trace_memory(self):
+        """Test memory tracing logs the peak and dumps a snapshot"""
+        profiler = Profiler()
+        profiler.start(profile_cpu=False, trace_memory=True)
+        data = [bytearray(1024) for _ in range(100)]
+
+        with tempfile.TemporaryDirectory() as directory:
+            with self.assertLogs('src.profiling', level='INFO') as logs:
+                paths = profiler.stop(directory, top_n=3)
+            self.assertEqual([p.name for p in paths], ['memory.snapshot'])
+
+        self.assertTrue(any('peak' in line for line in logs.output))
+        del data
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,86 @@
+"""Tests for composable cached event queries"""
+import unittest
+from datetime import datetime, timezone
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+from src.config import Config
+from src.processors.window import DateWindow
+from src.storage.query import EventQuery, decode_cursor, encode_cursor
+
+
+class TestEventQuery(unittest.TestCase):
+    """Test EventQuery building, matching and compilation"""
+
+    def test_chaining_is_immutable(self):
+        """Test each builder returns a new query"""
+        base = EventQuery()
+        query = base.at_least(50).free().in_city_areas('Grass Valley')
+
+        self.assertEqual(base, EventQuery())
+        self.assertFalse(base.bounded)
+        self.assertEqual(query, EventQuery(min_quality_score=50, free_only=True, city_areas=('Grass Valley',)))
+        self.assertTrue(query.bounded)
+
+    def test_matches(self):
+        """Test every predicate must hold, with missing scores counted as 0"""
+        query = EventQuery().at_least(50).free().for_age_ranges('5-12')
+        event = {'quality_score': 80, 'is_free': True, 'age_range': '5-12'}
+
+        self.assertTrue(query.matches(event))
+        self.assertFalse(query.matches({**event, 'quality_score': None}))
+        self.assertFalse(query.matches({**event, 'is_free': False}))
+        self.assertFalse(query.matches({**event, 'age_range': 'Teens'}))
+
+    def test_filter_accepts_iso_dates(self):
+        """Test windows apply to events serialized with to_dict()"""
+        query = EventQuery().within(DateWindow(datetime(2025, 10, 15), datetime(2025, 10, 16)))
+        events = [{'event_date': '2025-10-15T10:00:00'}, {'event_date': '2025-10-16T10:00:00'}]
+
+        self.assertEqual(query.filter(events), events[:1])
+
+    def test_where(self):
+        """Test predicates compile to SQL in a fixed order with matching parameters"""
+        query = EventQuery(
+            window=DateWindow(start=datetime(2025, 10, 15)),
+            min_quality_score=50,
+            free_only=True,
+            city_areas=('Grass Valley', 'Truckee'),
+        )
+
+        sql, params = query.where('%s', lambda value: value.date().isoformat())
+
+        self.assertEqual(
+            sql,
+            " AND event_date >= %s AND quality_score >= %s AND is_free AND city_area IN (%s, %s)"
+        )
+        self.assertEqual(params, ['2025-10-15', 50, 'Grass Valley', 'Truckee'])
+        self.assertEqual(EventQuery().where(), ('', []))
+
+    def test_where_pins_window_to_time_zone(self):
+        """Test window bounds reach the backend as aware times in Config.TIMEZONE"""
+        la = ZoneInfo('America/Los_Angeles')
+        query = EventQuery().within(DateWindow(datetime(2025, 10, 15), datetime(2025, 10, 16, 7, tzinfo=timezone.utc)))
+
+        with patch.object(Config, 'TIMEZONE', 'America/Los_Angeles'):
+            _, params = query.where('%s')
+
+        self.assertEqual(params, [datetime(2025, 10, 15, tzinfo=la), datetime(2025, 10, 16, tzinfo=la)])
+        self.assertEqual([p.tzinfo for p in params], [la, la])
+
+
+    def test_cursor_round_trip(self):
+        """Test cursors carry the (event_date, id) sort key, offsets included"""
+        for event_date in (datetime(2025, 10, 15, 10, 30), datetime(2025, 10, 15, 10, 30, tzinfo=timezone.utc)):
+            cursor = encode_cursor(event_date, 42)
+            self.assertNotIn('=', cursor)
+            self.assertEqual(decode_cursor(cursor), (event_date, 42))
+
+    def test_invalid_cursor(self):
+        """Test malformed cursors raise ValueError"""
+        for cursor in ('not a cursor', encode_cursor(datetime(2025, 10, 15), 1)[:-3], 'W10'):
+            with self.assertRaises(ValueError):
+                decode_cursor(cursor)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,226 @@
+"""Tests for retries, hedging and circuit breakers"""
+import time
+import tempfile
+import threading
+import unittest
+from pathlib import Path
+from unittest.mock import patch, Mock
+import requests
+from src.scheduling.deadline import Deadline
+from src.scheduling.politeness import PolitenessScheduler
+from src.scheduling.resilience import (
+    CircuitBreaker, CircuitOpenError, LatencyTracker, Resilience, RetryPolicy
+)
+from src.scrapers.base import BaseScraper
+from src.storage.payloads import PayloadStore
+
+
+class Flaky:
+    """Callable failing the first `failures` calls"""
+
+    def __init__(self, failures, error=requests.ConnectionError):
+        self.failures = failures
+        self.error = error
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        if self.calls <= self.failures:
+            raise self.error('boom')
+        return 'ok'
+
+
+class TestResilience(unittest.TestCase):
+    """Test cases for Resilience"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.state_dir = Path(tmp.name)
+        self.breaker = CircuitBreaker(self.state_dir / 'circuits.json', failure_threshold=2, reset_seconds=60)
+        self.latencies = LatencyTracker(self.state_dir / 'latency.json')
+        self.sleeps = []
+        self.resilience = Resilience(RetryPolicy(attempts=3, base_delay=0.1), self.breaker, self.latencies)
+
+    def call(self, func, **kwargs):
+        kwargs.setdefault('retry_on', (requests.ConnectionError,))
+        return self.resilience.call('knco', func, sleep=self.sleeps.append, **kwargs)
+
+    def test_latencies_written_on_flush(self):
+        """Test latency samples are buffered until flush() writes them once"""
+        self.call(lambda: 'ok')
+        self.call(lambda: 'ok')
+
+        self.assertEqual(len(self.latencies.samples('knco')), 2)
+        self.assertFalse((self.state_dir / 'latency.json').exists())
+
+        self.latencies.flush()
+        self.assertEqual(len(LatencyTracker(self.state_dir / 'latency.json').samples('knco')), 2)
+
+    def test_latencies_from_two_processes_merge(self):
+        """Test a flush re-reads the file, keeping samples another process wrote since"""
+        other = LatencyTracker(self.state_dir / 'latency.json')
+        self.assertEqual(self.latencies.samples('knco'), [])
+        self.assertEqual(other.samples('knco'), [])
+
+        self.latencies.record('knco', 1.0)
+        other.record('knco', 2.0)
+        self.latencies.flush()
+        other.flush()
+
+        self.assertEqual(LatencyTracker(self.state_dir / 'latency.json').samples('knco'), [1.0, 2.0])
+
+    def test_backoff_is_bounded(self):
+        """Test jittered backoff stays under the exponential ceiling"""
+        policy = RetryPolicy(base_delay=0.5, max_delay=3)
+        self.assertTrue(all(0 <= policy.backoff(1) <= 0.5 for _ in range(50)))
+        self.assertTrue(all(0 <= policy.backoff(6) <= 3 for _ in range(50)))
+
+    def test_retries_then_succeeds(self):
+        """Test transient failures are retried with backoff"""
+        func = Flaky(2)
+
+        self.assertEqual(self.call(func), 'ok')
+        self.assertEqual(func.calls, 3)
+        self.assertEqual(len(self.sleeps), 2)
+        self.assertEqual(len(self.latencies.samples('knco')), 1)
+        self.assertEqual(self.breaker.state_of('knco'), 'closed')
+
+    def test_non_retryable_error_propagates(self):
+        """Test errors outside retry_on are raised at once"""
+        func = Flaky(1, error=ValueError)
+
+        with self.assertRaises(ValueError):
+            self.call(func)
+        self.assertEqual(func.calls, 1)
+        self.assertEqual(self.breaker.state_of('knco'), 'closed')
+
+    def test_no_retry_past_deadline(self):
+        """Test a retry is not started when the backoff would outlast the deadline"""
+        func = Flaky(5)
+
+        with self.assertRaises(requests.ConnectionError):
+            self.call(func, deadline=Deadline(0))
+        self.assertEqual(func.calls, 1)
+
+    def test_circuit_opens_and_serves_fallback(self):
+        """Test repeated failures open the circuit, which then skips the call"""
+        for _ in range(2):
+            with self.assertRaises(requests.ConnectionError):
+                self.call(Flaky(10))
+        self.assertEqual(self.breaker.state_of('knco'), 'open')
+
+        func = Flaky(0)
+        self.assertEqual(self.call(func, fallback=lambda: 'last good'), 'last good')
+        self.assertEqual(func.calls, 0)
+        with self.assertRaises(CircuitOpenError):
+            self.call(func)
+
+    def test_fallback_after_exhausting_retries(self):
+        """Test the fallback is served once every attempt fails"""
+        self.assertEqual(self.call(Flaky(10), fallback=lambda: 'last good'), 'last good')
+
+    def test_half_open_trial(self):
+        """Test one trial call is let through after the reset time"""
+        self.breaker.failure('knco')
+        self.breaker.failure('knco')
+        later = time.time() + 61
+
+        self.assertTrue(self.breaker.allow('knco', now=later))
+        self.assertFalse(self.breaker.allow('knco', now=later))
+        self.breaker.success('knco')
+        self.assertEqual(self.breaker.state_of('knco'), 'closed')
+
+    def test_circuit_state_persists(self):
+        """Test an open circuit is seen by a new breaker on the same file"""
+        self.breaker.failure('knco')
+        self.breaker.failure('knco')
+
+        self.assertFalse(CircuitBreaker(self.state_dir / 'circuits.json').allow('knco'))
+
+    def test_hedged_request(self):
+        """Test a call slower than the p95 is hedged and the faster attempt wins"""
+        for _ in range(Resilience.HEDGE_MIN_SAMPLES):
+            self.latencies.record('knco', 0.01)
+        self.resilience.hedge = True
+        release = threading.Event()
+        self.addCleanup(release.set)
+        calls = []
+
+        def func():
+            calls.append(1)
+            if len(calls) == 1:
+                release.wait(2)
+                return 'slow'
+            return 'fast'
+
+        start = time.monotonic()
+        self.assertEqual(self.call(func), 'fast')
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual(len(calls), 2)
+
+
+class FakeScraper(BaseScraper):
+    def __init__(self):
+        super().__init__('fake')
+
+    def fetch(self):
+        return []
+
+    def parse(self, raw_data):
+        return []
+
+
+class TestPoliteAdapter(unittest.TestCase):
+    """Test the scraper session adapter retries and falls back to the last good payload"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        state_dir = Path(tmp.name)
+        self.payloads = PayloadStore(state_dir / 'payloads')
+        self.resilience = Resilience(
+            RetryPolicy(attempts=2, base_delay=0),
+            CircuitBreaker(state_dir / 'circuits.json', failure_threshold=1),
+            LatencyTracker(state_dir / 'latency.json')
+        )
+        for target, value in [('src.scrapers.http.payloads', self.payloads),
+                              ('src.scrapers.http.resilience', self.resilience),
+                              ('src.scrapers.http.politeness', PolitenessScheduler(host_qps=0))]:
+            patcher = patch(target, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def response(self, status, body=b''):
+        response = requests.Response()
+        response.status_code = status
+        response._content = body
+        response.headers['Content-Type'] = 'text/plain'
+        return response
+
+    def test_retry_then_last_good_payload(self):
+        """Test a 503 is retried, the good body saved and served once the source fails"""
+        scraper = FakeScraper()
+        send = Mock(side_effect=[self.response(503), self.response(200, b'events')])
+
+        with patch('requests.adapters.HTTPAdapter.send', send):
+            self.assertEqual(scraper.session.get('https://example.com/feed').content, b'events')
+        self.assertEqual(send.call_count, 2)
+        self.assertEqual(self.payloads.get('https://example.com/feed')[0], b'events')
+        self.assertFalse(scraper.served_last_good)
+
+        send = Mock(side_effect=requests.ConnectionError('down'))
+        with patch('requests.adapters.HTTPAdapter.send', send):
+            response = scraper.session.get('https://example.com/feed')
+            self.assertEqual(response.content, b'events')
+            self.assertEqual(response.headers['X-Served-From'], 'last-good')
+            self.assertTrue(scraper.served_last_good)
+
+            # Circuit is now open: served without touching the network
+            send.reset_mock()
+            self.assertEqual(scraper.session.get('https://example.com/feed').content, b'events')
+            send.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
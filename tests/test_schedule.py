@@ -0,0 +1,80 @@
+"""Tests for interval and cron schedules"""
+import unittest
+from datetime import datetime
+from src.scheduling.schedule import IntervalSchedule, CronSchedule, parse_schedule
+
+
+def ts(*args):
+    """Local epoch timestamp for a datetime"""
+    return datetime(*args).timestamp()
+
+
+class TestParseSchedule(unittest.TestCase):
+    """Test cases for parse_schedule"""
+
+    def test_intervals(self):
+        """Test interval specs with and without units"""
+        self.assertEqual(parse_schedule('30m').seconds, 1800)
+        self.assertEqual(parse_schedule('6h').seconds, 21600)
+        self.assertEqual(parse_schedule('1d').seconds, 86400)
+        self.assertEqual(parse_schedule('90').seconds, 90)
+
+    def test_cron(self):
+        """Test five-field specs parse as cron"""
+        self.assertIsInstance(parse_schedule('0 */6 * * *'), CronSchedule)
+
+    def test_invalid(self):
+        """Test malformed specs are rejected"""
+        for spec in ('soon', '0 * * *', '61 * * * *', '*/0 * * * *', '0'):
+            with self.assertRaises(ValueError, msg=spec):
+                parse_schedule(spec)
+
+
+class TestIntervalSchedule(unittest.TestCase):
+    """Test cases for IntervalSchedule"""
+
+    def test_next_after(self):
+        """Test the next run is one interval later"""
+        self.assertEqual(IntervalSchedule(60).next_after(1000), 1060)
+
+
+class TestCronSchedule(unittest.TestCase):
+    """Test cases for CronSchedule"""
+
+    def test_step_hours(self):
+        """Test '*/6' hours fires at the next multiple of six"""
+        schedule = CronSchedule('0 */6 * * *')
+        self.assertEqual(schedule.next_after(ts(2025, 10, 7, 7, 30)), ts(2025, 10, 7, 12, 0))
+        self.assertEqual(schedule.next_after(ts(2025, 10, 7, 12, 0)), ts(2025, 10, 7, 18, 0))
+
+    def test_list_and_range(self):
+        """Test lists and ranges in the minute and hour fields"""
+        schedule = CronSchedule('15,45 9-17 * * *')
+        self.assertEqual(schedule.next_after(ts(2025, 10, 7, 9, 20)), ts(2025, 10, 7, 9, 45))
+        self.assertEqual(schedule.next_after(ts(2025, 10, 7, 17, 50)), ts(2025, 10, 8, 9, 15))
+
+    def test_weekday(self):
+        """Test day-of-week with Sunday as 0 or 7"""
+        # 2025-10-07 is a Tuesday
+        self.assertEqual(CronSchedule('0 8 * * 0').next_after(ts(2025, 10, 7)), ts(2025, 10, 12, 8, 0))
+        self.assertEqual(CronSchedule('0 8 * * 7').next_after(ts(2025, 10, 7)), ts(2025, 10, 12, 8, 0))
+
+    def test_day_or_weekday(self):
+        """Test a day matches either restricted day field, as in cron"""
+        schedule = CronSchedule('0 0 1 * 5')
+        # Friday 2025-10-10 comes before November 1st
+        self.assertEqual(schedule.next_after(ts(2025, 10, 7)), ts(2025, 10, 10))
+
+    def test_month_rollover(self):
+        """Test searching into the following year"""
+        schedule = CronSchedule('0 0 1 1 *')
+        self.assertEqual(schedule.next_after(ts(2025, 10, 7)), ts(2026, 1, 1))
+
+    def test_leap_day(self):
+        """Test a Feb 29 schedule finds the next leap year"""
+        schedule = CronSchedule('0 0 29 2 *')
+        self.assertEqual(schedule.next_after(ts(2025, 3, 1)), ts(2028, 2, 29))
+
+
+if __name__ == '__main__':
+    unittest.main()
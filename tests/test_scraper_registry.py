@@ -0,0 +1,86 @@
+"""Tests for the lazy scraper registry"""
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import patch, Mock
+from src.scrapers.base import BaseScraper
+from src.scrapers.registry import ScraperRegistry, load_scraper_class
+
+
+class PluginScraper(BaseScraper):
+    def __init__(self):
+        super().__init__('plugin')
+
+    def fetch(self):
+        return []
+
+    def parse(self, raw_data):
+        return []
+
+
+PLUGIN_SPEC = f'{__name__}:PluginScraper'
+
+
+class TestScraperRegistry(unittest.TestCase):
+    """Test cases for ScraperRegistry"""
+
+    def test_resolves_on_first_lookup(self):
+        """Test string specs are imported on lookup and cached"""
+        registry = ScraperRegistry({'plugin': PLUGIN_SPEC})
+
+        self.assertIn('plugin', registry)
+        self.assertFalse(registry.is_loaded('plugin'))
+        self.assertIs(registry['plugin'], PluginScraper)
+        self.assertTrue(registry.is_loaded('plugin'))
+        self.assertIsNone(registry.get('missing'))
+        self.assertEqual(list(registry), ['plugin'])
+
+    def test_invalid_spec(self):
+        """Test malformed and unknown specs raise"""
+        with self.assertRaises(ValueError):
+            load_scraper_class('no_colon_here')
+        with self.assertRaises(AttributeError):
+            load_scraper_class(f'{__name__}:Missing')
+
+    def test_patch_dict_does_not_import(self):
+        """Test patch.dict restores unresolved entries without importing them"""
+        registry = ScraperRegistry({'lazy': 'module_that_does_not_exist:Scraper'})
+
+        with patch.dict(registry, {'plugin': PluginScraper}):
+            self.assertIs(registry['plugin'], PluginScraper)
+
+        self.assertNotIn('plugin', registry)
+        self.assertFalse(registry.is_loaded('lazy'))
+
+    def test_entry_points(self):
+        """Test entry points add new sources but don't replace registered ones"""
+        entry_points = [Mock(value=PLUGIN_SPEC), Mock(value='other:Scraper')]
+        entry_points[0].name = 'plugin'
+        entry_points[1].name = 'knco'
+        registry = ScraperRegistry({'knco': 'src.scrapers.knco:KNCOScraper'}, 'test.scrapers')
+
+        with patch('importlib.metadata.entry_points', return_value=entry_points) as found:
+            self.assertIn('knco', registry)
+            found.assert_not_called()
+
+            self.assertIs(registry['plugin'], PluginScraper)
+            found.assert_called_once_with(group='test.scrapers')
+
+        self.assertEqual(registry.copy()['knco'], 'src.scrapers.knco:KNCOScraper')
+
+    def test_orchestrator_import_is_lazy(self):
+        """Test importing the orchestrator loads no scraper dependencies"""
+        code = (
+            "import sys, src.orchestrator; "
+            "print(sorted(m for m in ('selenium', 'icalendar', 'feedparser', 'src.scrapers.knco') if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', code], cwd=Path(__file__).parent.parent,
+            capture_output=True, text=True, check=True
+        )
+        self.assertEqual(result.stdout.strip(), '[]')
+
+
+if __name__ == '__main__':
+    unittest.main()
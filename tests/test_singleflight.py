@@ -0,0 +1,69 @@
+"""Unit tests for in-process request coalescing"""
+import time
+import threading
+import unittest
+from unittest.mock import Mock
+from src.storage.singleflight import SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+    """Test single-flight coalescing"""
+
+    def _run_concurrently(self, flight, key, func, count=4):
+        """Start one leader, then followers while it is in flight"""
+        results, errors = [], []
+
+        def call():
+            try:
+                results.append(flight.do(key, func))
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=call) for _ in range(count)]
+        threads[0].start()
+        while not flight.in_flight(key):
+            time.sleep(0.01)
+        for thread in threads[1:]:
+            thread.start()
+        for thread in threads:
+            thread.join(5)
+        return results, errors
+
+    def test_concurrent_calls_share_result(self):
+        """Test followers receive the leader's result without calling func"""
+        flight = SingleFlight()
+        func = Mock(side_effect=lambda: time.sleep(0.2) or 'events')
+
+        results, errors = self._run_concurrently(flight, 'library', func)
+
+        func.assert_called_once()
+        self.assertEqual(results, ['events'] * 4)
+        self.assertEqual(errors, [])
+        self.assertFalse(flight.in_flight('library'))
+
+    def test_exception_is_shared(self):
+        """Test followers see the leader's exception"""
+        flight = SingleFlight()
+
+        def fail():
+            time.sleep(0.2)
+            raise RuntimeError("scrape failed")
+
+        results, errors = self._run_concurrently(flight, 'library', fail, count=3)
+
+        self.assertEqual(results, [])
+        self.assertEqual(len(errors), 3)
+
+    def test_sequential_calls_run_again(self):
+        """Test a call after the previous one finished runs func again"""
+        flight = SingleFlight()
+        func = Mock(return_value=1)
+
+        flight.do('knco', func)
+        flight.do('knco', func)
+
+        self.assertEqual(func.call_count, 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,455 @@
+"""Tests for the local SQLite storage backend"""
+import unittest
+import tempfile
+from unittest.mock import patch
+from pathlib import Path
+from datetime import datetime, timedelta, timezone
+from src.config import Config
+from src.storage.sqlite import SQLiteClient, _to_text
+from src.storage.base import EventRow, ScrapeRun
+from src.processors.window import DateWindow
+from src.storage.query import EventQuery
+from src.processors.normalizer import NormalizedEvent
+
+
+def make_event(event_id: str, source: str = 'test', day: int = 15, title: str = None) -> NormalizedEvent:
+    """Build a NormalizedEvent for tests"""
+    return NormalizedEvent(
+        title=title or f"Event {event_id}",
+        event_date=datetime(2025, 10, day, 10, 0),
+        source_name=source,
+        content_hash=f"hash{event_id}",
+        quality_score=80,
+        source_event_id=event_id,
+        is_free=True,
+    )
+
+
+class TestSQLiteClient(unittest.TestCase):
+    """Test SQLite store against a real in-memory database"""
+
+    def setUp(self):
+        self.store = SQLiteClient(':memory:')
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_upsert_and_read(self):
+        """Test events round-trip with Python types restored"""
+        count = self.store.upsert_events([make_event('1', day=20), make_event('2', day=10)])
+        self.assertEqual(count, 2)
+
+        events = self.store.get_cached_events('test', ttl_hours=6)
+
+        self.assertEqual([e['source_event_id'] for e in events], ['2', '1'])  # ordered by date
+        self.assertEqual(events[0]['event_date'], datetime(2025, 10, 10, 10, 0))
+        self.assertIs(events[0]['is_free'], True)
+        self.assertIsNotNone(events[0]['id'])
+        self.assertEqual(events[0]['scraped_at'].tzinfo, timezone.utc)
+
+    def test_upsert_updates_existing(self):
+        """Test conflicting (source_name, source_event_id) updates in place"""
+        self.store.upsert_events([make_event('1', title='Original')])
+        self.store.upsert_events([make_event('1', title='Updated')])
+
+        events = self.store.get_cached_events('test')
+
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0]['title'], 'Updated')
+
+    def test_upsert_in_batches(self):
+        """Test batched writes store every row"""
+        events = [make_event(str(i)) for i in range(25)]
+        self.assertEqual(self.store.upsert_events(events, batch_size=7), 25)
+        self.assertEqual(len(self.store.get_cached_events('test')), 25)
+
+    def test_upsert_empty_list(self):
+        """Test upserting empty list"""
+        self.assertEqual(self.store.upsert_events([]), 0)
+
+    def test_ttl_excludes_stale_rows(self):
+        """Test rows scraped before the TTL window are not returned"""
+        self.store.upsert_events([make_event('1')])
+        stale = (datetime.now(timezone.utc) - timedelta(hours=7)).isoformat(timespec='microseconds')
+        self.store.conn.execute("UPDATE events SET scraped_at = ?", (stale,))
+
+        self.assertEqual(self.store.get_cached_events('test', ttl_hours=6), [])
+        self.assertEqual(len(self.store.get_cached_events('test', ttl_hours=8)), 1)
+
+    def test_get_cached_events_many(self):
+        """Test batched read groups by source"""
+        self.store.upsert_events([make_event('1', 'knco'), make_event('2', 'county')])
+
+        grouped = self.store.get_cached_events_many(['knco', 'library', 'county'])
+
+        self.assertEqual(len(grouped['knco']), 1)
+        self.assertEqual(grouped['library'], [])
+        self.assertEqual(grouped['county'][0]['source_event_id'], '2')
+
+    def test_iter_cached_events(self):
+        """Test streaming yields every row in the requested format"""
+        self.store.upsert_events([make_event(str(i)) for i in range(5)])
+
+        records = list(self.store.iter_cached_events('test', row_format='record', batch_size=2))
+
+        self.assertEqual(len(records), 5)
+        self.assertIsInstance(records[0], EventRow)
+        self.assertIsInstance(records[0].event_date, datetime)
+
+        with self.assertRaises(ValueError):
+            list(self.store.iter_cached_events(row_format='json'))
+
+    def test_event_dates_stored_in_one_format(self):
+        """Test ISO strings are stored like datetimes, and older rows are rewritten on open"""
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SQLiteClient(Path(tmp) / 'events.db')
+            event = make_event('1')
+            event.event_date = '2025-10-15T10:00:00'
+            store.upsert_events([event, make_event('2', day=16)])
+            stored = [row[0] for row in store.conn.execute("SELECT event_date FROM events ORDER BY id")]
+            self.assertEqual(stored, ['2025-10-15T10:00:00.000000', '2025-10-16T10:00:00.000000'])
+
+            store.conn.execute("UPDATE events SET event_date = '2025-10-15T10:00:00-07:00' WHERE source_event_id = '1'")
+            store.conn.commit()
+            store.close()
+
+            store = SQLiteClient(Path(tmp) / 'events.db')
+            stored = [row[0] for row in store.conn.execute("SELECT event_date FROM events ORDER BY id")]
+            store.close()
+            self.assertEqual(stored, ['2025-10-15T10:00:00.000000-07:00', '2025-10-16T10:00:00.000000'])
+
+    def test_uid_keyed_county_rows_dropped_on_open(self):
+        """Test county rows keyed by iCal UID are removed, EID-keyed rows kept"""
+        with tempfile.TemporaryDirectory() as tmp:
+            store = SQLiteClient(Path(tmp) / 'events.db')
+            old = make_event('12345@nevadacountyca.gov', 'county')
+            new = make_event('12345', 'county')
+            old.source_url = new.source_url = 'https://www.nevadacountyca.gov/calendar.aspx?EID=12345'
+            # No EID in its URL, so the scraper still keys it by UID
+            uid_only = make_event('67890@nevadacountyca.gov', 'county')
+            store.upsert_events([old, new, uid_only])
+            store.close()
+
+            store = SQLiteClient(Path(tmp) / 'events.db')
+            keys = [e['source_event_id'] for e in store.get_cached_events('county')]
+            store.close()
+            self.assertEqual(sorted(keys), ['12345', '67890@nevadacountyca.gov'])
+
+    def test_invalidate_events(self):
+        """Test per-event, per-source and global invalidation"""
+        self.store.upsert_events([make_event('1', 'knco'), make_event('2', 'knco'), make_event('3', 'county')])
+
+        self.assertEqual(self.store.invalidate_events('knco', '1'), 1)
+        self.assertEqual([e['source_event_id'] for e in self.store.get_cached_events('knco')], ['2'])
+
+        self.assertEqual(self.store.invalidate_events('knco'), 2)
+        self.assertEqual(self.store.get_cached_events('knco'), [])
+        self.assertEqual(len(self.store.get_cached_events('county')), 1)
+
+        self.assertEqual(self.store.invalidate_events(), 3)
+        self.assertEqual(self.store.get_cached_events('county', ttl_hours=10000), [])
+
+        with self.assertRaises(ValueError):
+            self.store.invalidate_events(source_event_id='1')
+
+    def test_source_lock_across_connections(self):
+        """Test a second store waits on the first store's source lock"""
+        with tempfile.TemporaryDirectory() as tmp:
+            path = Path(tmp) / 'events.db'
+            with SQLiteClient(path) as first, SQLiteClient(path) as second:
+                with first.source_lock('library') as contended:
+                    self.assertFalse(contended)
+                    # Held elsewhere: the second store times out but reports contention
+                    with second.source_lock('library', timeout=0.3) as second_contended:
+                        self.assertTrue(second_contended)
+                    # Other sources are independent
+                    with second.source_lock('knco', timeout=0) as other_contended:
+                        self.assertFalse(other_contended)
+
+                with second.source_lock('library', timeout=0) as contended:
+                    self.assertFalse(contended)
+
+    def test_query_filters_read(self):
+        """Test a query's predicates filter every read path in SQL"""
+        self.store.upsert_events([
+            make_event('1', day=10),
+            make_event('2', day=15),
+            make_event('3', day=20),
+            NormalizedEvent(
+                title='Paid', event_date=datetime(2025, 10, 16), source_name='test',
+                content_hash='hash4', quality_score=90, source_event_id='4', is_free=False,
+            ),
+            NormalizedEvent(
+                title='Sparse', event_date=datetime(2025, 10, 17), source_name='test',
+                content_hash='hash5', quality_score=20, source_event_id='5', is_free=True,
+            ),
+        ])
+        query = EventQuery().within(DateWindow(datetime(2025, 10, 15), datetime(2025, 10, 20))).at_least(50).free()
+
+        self.assertEqual([e['source_event_id'] for e in self.store.get_cached_events('test', query=query)], ['2'])
+        many = self.store.get_cached_events_many(['test'], query=query)
+        self.assertEqual([e['source_event_id'] for e in many['test']], ['2'])
+        rows = list(self.store.iter_cached_events(['test'], query=query))
+        self.assertEqual([e['source_event_id'] for e in rows], ['2'])
+
+    def test_aware_window_compares_local_wall_clock(self):
+        """Test an aware window is compared against stored local times in Config.TIMEZONE"""
+        self.store.upsert_events([make_event('1', day=15), make_event('2', day=16)])
+        # 17:00 UTC on the 15th is 10:00 in California, when event 1 starts
+        window = DateWindow(datetime(2025, 10, 15, 17, tzinfo=timezone.utc), datetime(2025, 10, 16, 7, tzinfo=timezone.utc))
+
+        with patch.object(Config, 'TIMEZONE', 'America/Los_Angeles'):
+            events = self.store.get_cached_events('test', query=EventQuery().within(window))
+
+        self.assertEqual([e['source_event_id'] for e in events], ['1'])
+
+    def test_window_includes_midnight_and_utc_events(self):
+        """Test a day's window holds a midnight event and a UTC-dated event on that local day"""
+        midnight = make_event('1', day=26)
+        midnight.event_date = '2026-10-26T00:00:00'
+        utc = make_event('2', day=26)
+        utc.event_date = datetime(2026, 10, 27, 2, tzinfo=timezone.utc)  # 19:00 on Oct 26 in California
+        next_day = make_event('3', day=27)
+        next_day.event_date = datetime(2026, 10, 27, 10)
+
+        with patch.object(Config, 'TIMEZONE', 'America/Los_Angeles'):
+            self.store.upsert_events([midnight, utc, next_day])
+            window = DateWindow(datetime(2026, 10, 26), datetime(2026, 10, 27))
+            events = self.store.get_cached_events('test', query=EventQuery().within(window))
+
+        self.assertEqual([e['source_event_id'] for e in events], ['1', '2'])
+
+    def test_city_area_filter(self):
+        """Test city areas match exactly"""
+        self.store.upsert_events([
+            NormalizedEvent(
+                title=f'In {area}', event_date=datetime(2025, 10, 15), source_name='test',
+                content_hash=f'hash{i}', quality_score=80, source_event_id=str(i), city_area=area,
+            )
+            for i, area in enumerate(['Grass Valley', 'Nevada City', 'Truckee'])
+        ])
+
+        events = self.store.get_cached_events('test', query=EventQuery().in_city_areas('Grass Valley', 'Truckee'))
+
+        self.assertEqual([e['city_area'] for e in events], ['Grass Valley', 'Truckee'])
+
+    def _plan(self, query: EventQuery, source_names=('test',)) -> str:
+        """EXPLAIN QUERY PLAN of a cached read"""
+        sql, params = self.store._fresh_query(list(source_names), 6, query)
+        return ' '.join(row[-1] for row in self.store.conn.execute(f"EXPLAIN QUERY PLAN {sql}", params))
+
+    def test_window_read_uses_source_date_index(self):
+        """Test a windowed read is a range scan of the source's dates, without a sort"""
+        plan = self._plan(EventQuery(window=DateWindow(datetime(2025, 10, 15), datetime(2025, 10, 20))))
+
+        self.assertIn('idx_events_source_date (source_name=? AND event_date>? AND event_date<?)', plan)
+        self.assertNotIn('TEMP B-TREE', plan)
+
+    def test_free_read_uses_partial_index(self):
+        """Test free-only reads use the partial index of free events"""
+        self.assertIn('idx_events_free', self._plan(EventQuery().free()))
+
+    def test_quality_read_uses_index(self):
+        """Test a quality threshold is a range scan of the source's scores"""
+        self.assertIn('idx_events_source_quality (source_name=? AND quality_score>?)', self._plan(EventQuery().at_least(50)))
+
+    def test_city_area_read_uses_index(self):
+        """Test city area reads look the areas up instead of scanning sources"""
+        plan = self._plan(EventQuery().in_city_areas('Grass Valley', 'Truckee'), ['knco', 'library', 'county'])
+        self.assertIn('idx_events_city_area (city_area=?)', plan)
+
+    def test_indexes_created(self):
+        """Test the same indexes as the Supabase schema exist"""
+        names = {row[0] for row in self.store.conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'"
+        )}
+        for index in ('idx_source_event_unique', 'idx_events_date', 'idx_events_scraped_at',
+                      'idx_events_source_date', 'idx_events_source_quality', 'idx_events_free', 'idx_events_city_area'):
+            self.assertIn(index, names)
+        # Superseded by idx_events_source_date
+        self.assertNotIn('idx_events_source', names)
+
+    def test_wal_mode_on_disk(self):
+        """Test WAL journal mode is enabled for file databases"""
+        with tempfile.TemporaryDirectory() as tmp:
+            with SQLiteClient(Path(tmp) / 'events.db', wal=True) as store:
+                mode = store.conn.execute("PRAGMA journal_mode").fetchone()[0]
+                self.assertEqual(mode, 'wal')
+
+
+class TestEventsPage(unittest.TestCase):
+    """Test keyset-paginated reads across sources"""
+
+    def setUp(self):
+        self.store = SQLiteClient(':memory:')
+        # Three events a day, from three sources, so pages split days
+        self.store.upsert_events([
+            make_event(f"{source}{day}", source=source, day=day)
+            for day in (10, 11, 12, 13)
+            for source in ('knco', 'library', 'county')
+        ])
+
+    def tearDown(self):
+        self.store.close()
+
+    def read_all(self, **kwargs):
+        """Follow cursors to the last page, returning the pages' event IDs"""
+        pages, cursor = [], None
+        while True:
+            page = self.store.get_events_page(cursor=cursor, **kwargs)
+            pages.append([e['source_event_id'] for e in page.events])
+            cursor = page.next_cursor
+            if cursor is None:
+                return pages
+
+    def test_pages_in_date_then_id_order(self):
+        """Test pages cover every event once, in (event_date, id) order, across ties"""
+        pages = self.read_all(page_size=5)
+
+        self.assertEqual([len(p) for p in pages], [5, 5, 2])
+        events = sorted(self.store.get_events_page(page_size=100).events, key=lambda e: (e['event_date'], e['id']))
+        self.assertEqual(sum(pages, []), [e['source_event_id'] for e in events])
+
+    def test_cursor_stable_across_writes(self):
+        """Test events added before the cursor do not shift the next page"""
+        first = self.store.get_events_page(page_size=4)
+        self.store.upsert_events([make_event('early', source='knco', day=1)])
+
+        second = self.store.get_events_page(cursor=first.next_cursor, page_size=4)
+
+        self.assertEqual([e['source_event_id'] for e in second.events], ['library11', 'county11', 'knco12', 'library12'])
+
+    def test_query_and_sources(self):
+        """Test pages apply the query and source filters"""
+        pages = self.read_all(
+            page_size=2,
+            source_names=['knco', 'county'],
+            query=EventQuery(window=DateWindow(datetime(2025, 10, 11), datetime(2025, 10, 13))),
+        )
+
+        self.assertEqual(pages, [['knco11', 'county11'], ['knco12', 'county12']])
+
+    def test_invalidated_and_expired_events_leave_pages(self):
+        """Test pages drop invalidated events, and events older than ttl_hours"""
+        self.store.invalidate_events('library')
+        ids = sum(self.read_all(page_size=5), [])
+        self.assertEqual(len(ids), 8)
+        self.assertFalse(any(i.startswith('library') for i in ids))
+
+        with self.store._lock:
+            self.store.conn.execute(
+                "UPDATE events SET scraped_at = ? WHERE source_name = 'county'",
+                (_to_text(datetime.now(timezone.utc) - timedelta(hours=12)),)
+            )
+        self.assertEqual(len(sum(self.read_all(page_size=5), [])), 8)
+        self.assertEqual(sum(self.read_all(page_size=5, ttl_hours=6), []), ['knco10', 'knco11', 'knco12', 'knco13'])
+
+    def test_pages_of_events_stored_through_cache(self):
+        """Test paging loses nothing among same-time events written through the cache and dedupe"""
+        from src.pipeline import dedupe_stage
+        from src.processors.normalizer import Normalizer
+        from src.storage.cache import CacheManager
+
+        titles = ['Lego Club', 'Baby Storytime', 'Chess for Kids', 'Knitting Circle', 'Science Saturday']
+        raw = [
+            {'title': title, 'event_date': '2026-10-25T10:00:00', 'source_event_id': str(i)}
+            for i, title in enumerate(titles)
+        ]
+        store = SQLiteClient(':memory:')
+        self.addCleanup(store.close)
+        CacheManager(store, memory_cache=None, ttl_policy=None).get_or_fetch('library', lambda: raw)
+        store.upsert_events(dedupe_stage('county', Normalizer('county').normalize(raw)))
+
+        pages, cursor = [], None
+        while True:
+            page = store.get_events_page(cursor=cursor, page_size=2)
+            pages.append([(e['source_name'], e['title']) for e in page.events])
+            cursor = page.next_cursor
+            if cursor is None:
+                break
+
+        self.assertEqual(len(pages), 5)
+        self.assertEqual(sorted(sum(pages, [])), sorted((s, t) for s in ('library', 'county') for t in titles))
+
+    def test_page_size_capped(self):
+        """Test page sizes default and are clamped to the configured maximum"""
+        with patch.object(Config, 'PAGE_SIZE', 3), patch.object(Config, 'PAGE_SIZE_MAX', 4):
+            self.assertEqual(len(self.store.get_events_page().events), 3)
+            self.assertEqual(len(self.store.get_events_page(page_size=1000).events), 4)
+            self.assertEqual(len(self.store.get_events_page(page_size=0).events), 1)
+
+    def test_invalid_cursor(self):
+        with self.assertRaises(ValueError):
+            self.store.get_events_page(cursor='garbage')
+
+    def test_deep_pages_use_index_without_sort(self):
+        """Test a page is an index range read in (event_date, id) order, not a sort or OFFSET scan"""
+        statements = []
+        self.store.conn.set_trace_callback(statements.append)
+        page = self.store.get_events_page(page_size=2)
+        self.store.get_events_page(cursor=page.next_cursor, page_size=2, source_names=['knco', 'library'])
+        self.store.conn.set_trace_callback(None)
+
+        for statement in statements:
+            self.assertNotIn('OFFSET', statement)
+            plan = ' '.join(row[-1] for row in self.store.conn.execute(f"EXPLAIN QUERY PLAN {statement}"))
+            self.assertIn('idx_events_date (event_date>?)', plan)
+            self.assertNotIn('TEMP B-TREE', plan)
+
+
+class TestRunHistory(unittest.TestCase):
+    """Test the scrape_runs history and its report"""
+
+    def setUp(self):
+        self.store = SQLiteClient(':memory:')
+        self.now = datetime.now(timezone.utc)
+
+    def tearDown(self):
+        self.store.close()
+
+    def record(self, source, status, duration, events=0, cache_hit=False, days_ago=0):
+        run = ScrapeRun('run', self.now - timedelta(days=days_ago), source, status, duration, events, cache_hit)
+        self.store.record_runs([run])
+
+    def test_report_aggregates(self):
+        """Test success rate, percentiles, events per run and cache hit ratio"""
+        for seconds in range(1, 21):
+            self.record('knco', 'success', float(seconds), events=10)
+        self.record('knco', 'success', None, events=10, cache_hit=True)
+        self.record('knco', 'failed', None)
+        self.record('knco', 'timed_out', 30.0)
+        self.record('library', 'success', 4.0, events=5)
+
+        report = self.store.get_run_report(self.now - timedelta(days=1))
+
+        self.assertEqual([row['source_name'] for row in report], ['knco', 'library'])
+        knco = report[0]
+        self.assertEqual((knco['runs'], knco['successes'], knco['failures'], knco['timeouts']), (23, 21, 1, 1))
+        self.assertAlmostEqual(knco['success_rate'], 21 / 23)
+        self.assertEqual(knco['p50_seconds'], 10.0)
+        self.assertEqual(knco['p95_seconds'], 19.0)
+        self.assertEqual(knco['events_per_run'], 10.0)
+        self.assertAlmostEqual(knco['cache_hit_ratio'], 1 / 23)
+
+    def test_report_window_and_sources(self):
+        """Test runs before the window and unrequested sources are left out"""
+        self.record('knco', 'success', 2.0, days_ago=10)
+        self.record('knco', 'failed', None)
+        self.record('library', 'success', 4.0)
+
+        report = self.store.get_run_report(self.now - timedelta(days=7), ['knco'])
+
+        self.assertEqual(len(report), 1)
+        self.assertEqual(report[0]['runs'], 1)
+        self.assertIsNone(report[0]['p50_seconds'])
+
+    def test_report_uses_index(self):
+        """Test the window filter is an index range scan, not a table scan"""
+        plan = ' '.join(row[-1] for row in self.store.conn.execute(
+            "EXPLAIN QUERY PLAN SELECT * FROM scrape_runs WHERE started_at >= ?", ('2025',)
+        ))
+        self.assertIn('idx_scrape_runs_started_at', plan)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -2,7 +2,7 @@
 import unittest
 from unittest.mock import Mock, patch, MagicMock
 from datetime import datetime
-from src.storage.supabase import SupabaseClient
+from src.storage.supabase import SupabaseClient, EventRow
 from src.processors.normalizer import NormalizedEvent
 
 
@@ -21,7 +21,7 @@ class TestSupabaseClient(unittest.TestCase):
 
         client = SupabaseClient()
 
-        self.assertIsNotNone(client.conn)
+        self.assertIsNotNone(client.pool)
         mock_connect.assert_called_once()
 
     @patch('src.storage.supabase.Config')
@@ -111,6 +111,173 @@ class TestSupabaseClient(unittest.TestCase):
         self.assertEqual(events[0]['title'], 'Test Event')
         self.assertEqual(events[0]['source_name'], 'test')
 
+    @patch('src.storage.supabase.Config')
+    @patch('src.storage.supabase.psycopg2.connect')
+    def test_get_cached_events_many(self, mock_connect, mock_config):
+        """Test batched retrieval groups rows by source in one query"""
+        mock_config.SUPABASE_URL = "https://test-project.supabase.co"
+        mock_config.SUPABASE_KEY = "test-key"
+        mock_config.SUPABASE_DB_PASSWORD = None
+
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+
+        def row(event_id, source):
+            return (
+                event_id, f'Event {event_id}', None, datetime(2025, 10, 15),
+                None, None, source, None, str(event_id), f'hash{event_id}',
+                None, None, False, 50, datetime(2025, 10, 7)
+            )
+
+        mock_cursor.fetchall.return_value = [row(1, 'knco'), row(2, 'county'), row(3, 'knco')]
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_connect.return_value = mock_conn
+
+        client = SupabaseClient()
+        grouped = client.get_cached_events_many(['knco', 'library', 'county'], ttl_hours=6)
+
+        mock_cursor.execute.assert_called_once()
+        query, params = mock_cursor.execute.call_args[0]
+        self.assertIn('ANY(%s)', query)
+        self.assertEqual(params, (['knco', 'library', 'county'], 6))
+
+        self.assertEqual([e['id'] for e in grouped['knco']], [1, 3])
+        self.assertEqual(grouped['library'], [])
+        self.assertEqual(grouped['county'][0]['source_name'], 'county')
+
+    @patch('src.storage.supabase.Config')
+    @patch('src.storage.supabase.psycopg2.connect')
+    def test_failed_reads_roll_back(self, mock_connect, mock_config):
+        """Test a failed read rolls back, so the connection is not left in an aborted transaction"""
+        import psycopg2
+        mock_config.SUPABASE_URL = "https://test-project.supabase.co"
+        mock_config.SUPABASE_KEY = "test-key"
+        mock_config.SUPABASE_DB_PASSWORD = None
+
+        mock_conn = MagicMock(closed=False)
+        mock_conn.info.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_INERROR
+        mock_conn.cursor.return_value.__enter__.return_value.execute.side_effect = psycopg2.Error('boom')
+        mock_connect.return_value = mock_conn
+
+        client = SupabaseClient()
+
+        self.assertEqual(client.get_cached_events_many(['knco', 'county']), {'knco': [], 'county': []})
+        self.assertEqual(client.get_cached_events('knco'), [])
+        self.assertEqual(client.get_last_scraped(['knco']), {'knco': None})
+        self.assertEqual(mock_conn.rollback.call_count, 3)
+
+    @patch('src.storage.supabase.Config')
+    @patch('src.storage.supabase.psycopg2.connect')
+    def test_reads_end_their_transaction(self, mock_connect, mock_config):
+        """Test a read's transaction is rolled back when its pooled connection is returned"""
+        import psycopg2
+        mock_config.SUPABASE_URL = "https://test-project.supabase.co"
+        mock_config.SUPABASE_KEY = "test-key"
+        mock_config.SUPABASE_DB_PASSWORD = None
+        mock_config.SUPABASE_POOL_SIZE = 4
+
+        mock_conn = MagicMock(closed=False)
+        mock_conn.info.transaction_status = psycopg2.extensions.TRANSACTION_STATUS_INTRANS
+        mock_conn.cursor.return_value.__enter__.return_value.fetchall.return_value = []
+        mock_connect.return_value = mock_conn
+
+        client = SupabaseClient()
+        client.get_last_scraped(['knco'])
+        client.get_last_scraped(['knco'])
+
+        # Both reads reused the pooled connection and neither left it idle in transaction
+        mock_connect.assert_called_once()
+        self.assertEqual(mock_conn.rollback.call_count, 2)
+
+    @patch('src.storage.supabase.Config')
+    @patch('src.storage.supabase.psycopg2.connect')
+    def test_iter_cached_events(self, mock_connect, mock_config):
+        """Test streaming uses a named cursor and yields rows lazily"""
+        mock_config.SUPABASE_URL = "https://test-project.supabase.co"
+        mock_config.SUPABASE_KEY = "test-key"
+        mock_config.SUPABASE_DB_PASSWORD = None
+
+        row = (
+            1, 'Test Event', 'Description', datetime(2025, 10, 15),
+            'Venue', 'Nevada City', 'test', 'http://example.com',
+            '12345', 'hash123', 'All Ages', 'Free', True, 90,
+            datetime(2025, 10, 7)
+        )
+
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.fetchmany.side_effect = [[row, row], [row], []]
+        mock_conn.cursor.return_value = mock_cursor
+        mock_connect.return_value = mock_conn
+
+        client = SupabaseClient()
+        stream = client.iter_cached_events(['test'], ttl_hours=6, row_format='record', batch_size=2)
+
+        # Nothing is queried until the generator is consumed
+        mock_conn.cursor.assert_not_called()
+
+        records = list(stream)
+
+        self.assertIn('name', mock_conn.cursor.call_args[1])
+        self.assertEqual(mock_cursor.itersize, 2)
+        mock_cursor.fetchmany.assert_called_with(2)
+        mock_cursor.close.assert_called_once()
+
+        self.assertEqual(len(records), 3)
+        self.assertIsInstance(records[0], EventRow)
+        self.assertEqual(records[0].title, 'Test Event')
+        self.assertFalse(hasattr(records[0], '__dict__'))
+
+    @patch('src.storage.supabase.Config')
+    @patch('src.storage.supabase.psycopg2.connect')
+    def test_iter_cached_events_row_formats(self, mock_connect, mock_config):
+        """Test dict and tuple row formats, and rejection of unknown formats"""
+        mock_config.SUPABASE_URL = "https://test-project.supabase.co"
+        mock_config.SUPABASE_KEY = "test-key"
+        mock_config.SUPABASE_DB_PASSWORD = None
+
+        row = tuple(range(15))
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_conn.cursor.return_value = mock_cursor
+        mock_connect.return_value = mock_conn
+
+        client = SupabaseClient()
+
+        mock_cursor.fetchmany.side_effect = [[row], []]
+        self.assertEqual(list(client.iter_cached_events(row_format='tuple')), [row])
+
+        mock_cursor.fetchmany.side_effect = [[row], []]
+        as_dict = list(client.iter_cached_events(row_format='dict'))[0]
+        self.assertEqual(as_dict['id'], 0)
+        self.assertEqual(as_dict['scraped_at'], 14)
+
+        with self.assertRaises(ValueError):
+            list(client.iter_cached_events(row_format='json'))
+
+    @patch('src.storage.supabase.Config')
+    @patch('src.storage.supabase.psycopg2.connect')
+    def test_invalidate_events(self, mock_connect, mock_config):
+        """Test invalidation expires rows instead of deleting them"""
+        mock_config.SUPABASE_URL = "https://test-project.supabase.co"
+        mock_config.SUPABASE_KEY = "test-key"
+        mock_config.SUPABASE_DB_PASSWORD = None
+
+        mock_conn = MagicMock()
+        mock_cursor = MagicMock()
+        mock_cursor.rowcount = 1
+        mock_conn.cursor.return_value.__enter__.return_value = mock_cursor
+        mock_connect.return_value = mock_conn
+
+        client = SupabaseClient()
+        count = client.invalidate_events('knco', '123')
+
+        self.assertEqual(count, 1)
+        query, params = mock_cursor.execute.call_args[0]
+        self.assertIn("scraped_at = 'epoch'", query)
+        self.assertEqual(params, ['knco', '123'])
+        mock_conn.commit.assert_called_once()
+
     @patch('src.storage.supabase.Config')
     @patch('src.storage.supabase.psycopg2.connect')
     def test_context_manager(self, mock_connect, mock_config):
@@ -0,0 +1,90 @@
+"""Tests for latency-tuned timeouts"""
+import tempfile
+import unittest
+from pathlib import Path
+from unittest.mock import patch
+from src.config import Config
+from src.scheduling.resilience import LatencyTracker
+from src.scheduling.timeouts import TimeoutTuner
+
+
+class TestTimeoutTuner(unittest.TestCase):
+    """Test cases for TimeoutTuner"""
+
+    def setUp(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        self.durations = LatencyTracker(Path(tmp.name) / 'durations.json')
+        self.requests = LatencyTracker(Path(tmp.name) / 'requests.json')
+        self.tuner = TimeoutTuner(self.durations, self.requests, enabled=True)
+
+        for name, value in [('SCRAPER_TIMEOUT', 30), ('SCRAPER_TIMEOUT_MIN', 10), ('SCRAPER_TIMEOUT_MAX', 300),
+                            ('AUTO_TIMEOUT_MIN_SAMPLES', 5), ('AUTO_TIMEOUT_MARGIN', 1.5),
+                            ('AUTO_TIMEOUT_PERCENTILE', 99), ('LATENCY_REGRESSION_RATIO', 1.5)]:
+            patcher = patch.object(Config, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def record(self, source, *seconds):
+        for value in seconds:
+            self.tuner.record_scrape(source, value)
+
+    def test_default_without_history(self):
+        """Test the fixed timeout is used until there are enough samples"""
+        self.record('knco', 2, 2, 2)
+        self.assertEqual(self.tuner.scrape_timeout('knco'), 30)
+
+    def test_derived_from_p99(self):
+        """Test the timeout is the p99 times the margin, clamped"""
+        self.record('library', 40, 42, 44, 46, 60)
+        self.record('knco', 1, 1, 1, 1, 2)
+        self.record('slow', 500, 500, 500, 500, 500)
+
+        self.assertEqual(self.tuner.scrape_timeout('library'), 90)
+        self.assertEqual(self.tuner.scrape_timeout('knco'), 10)
+        self.assertEqual(self.tuner.scrape_timeout('slow'), 300)
+
+    def test_request_timeout(self):
+        """Test request timeouts come from the request latency history"""
+        for _ in range(5):
+            self.requests.record('county', 8)
+        with patch.object(Config, 'REQUEST_TIMEOUT_MIN', 5), patch.object(Config, 'REQUEST_TIMEOUT_MAX', 60):
+            self.assertEqual(self.tuner.request_timeout('county'), 12)
+
+    def test_timeouts_raise_timeout(self):
+        """Test scrapes cut off at their timeout push the timeout up"""
+        self.record('library', 20, 20, 20, 20)
+        self.tuner.record_timeout('library', 30)
+        self.assertEqual(self.tuner.scrape_timeout('library'), 45)
+
+    def test_fixed_timeout_overrides(self):
+        """Test an explicit timeout applies to every source"""
+        self.record('library', 40, 42, 44, 46, 60)
+        self.assertEqual(self.tuner.scrape_timeouts(['library', 'knco'], 5), {'library': 5, 'knco': 5})
+        self.assertEqual(self.tuner.scrape_timeouts(['library', 'knco']), {'library': 90, 'knco': 30})
+
+    def test_disabled(self):
+        """Test a disabled tuner neither records nor derives"""
+        tuner = TimeoutTuner(self.durations, self.requests, enabled=False)
+        for _ in range(10):
+            tuner.record_scrape('library', 60)
+        self.assertEqual(self.durations.samples('library'), [])
+        self.assertEqual(tuner.scrape_timeout('library'), 30)
+
+    def test_report_flags_regression(self):
+        """Test the report flags a source whose recent scrapes slowed down"""
+        self.record('library', *[10] * 20 + [25] * 10)
+        self.record('knco', *[2] * 30)
+
+        rows = {row['source']: row for row in self.tuner.report()}
+
+        self.assertTrue(rows['library']['regressed'])
+        self.assertEqual(rows['library']['baseline_p95'], 10)
+        self.assertEqual(rows['library']['recent_p95'], 25)
+        self.assertFalse(rows['knco']['regressed'])
+        with self.assertLogs('src.scheduling.timeouts', level='WARNING'):
+            self.tuner.log_regressions(['library', 'knco'])
+
+
+if __name__ == '__main__':
+    unittest.main()
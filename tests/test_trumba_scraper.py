@@ -0,0 +1,106 @@
+"""Tests for the Trumba multi-calendar scraper engine"""
+import threading
+import unittest
+from pathlib import Path
+from datetime import datetime
+from unittest.mock import patch
+import requests
+from src.processors.window import DateWindow
+from src.scrapers.knco import KNCOScraper
+from src.scrapers.trumba import TrumbaScraper, extract_description
+
+
+def feed(*event_ids):
+    """Minimal Trumba RSS feed with one entry per event ID"""
+    items = ''.join(
+        f"<item><title>Event {event_id}</title>"
+        f"<guid>http://uid.trumba.com/event/{event_id}</guid>"
+        f"<category>2025/10/15 (Wed)</category>"
+        f"<description>&lt;b&gt;Price&lt;/b&gt;:&amp;nbsp;Free&lt;br/&gt;</description></item>"
+        for event_id in event_ids
+    )
+    return f'<?xml version="1.0"?><rss version="2.0"><channel>{items}</channel></rss>'.encode('utf-8')
+
+
+class TestTrumbaScraper(unittest.TestCase):
+    """Test TrumbaScraper against canned feeds"""
+
+    def test_calendars_fetched_concurrently(self):
+        """Test every calendar's download runs at the same time"""
+        scraper = TrumbaScraper('arts', ['Music', 'Theatre', 'Galleries'])
+        barrier = threading.Barrier(3, timeout=2)
+
+        def download(sub_source):
+            barrier.wait()  # Breaks (and fails the test) unless all three are in flight
+            return feed(sub_source)
+
+        with patch.object(scraper, '_download_feed', side_effect=download):
+            feeds = scraper.download()
+
+        self.assertEqual(list(feeds), ['music', 'theatre', 'galleries'])
+
+    def test_events_tagged_and_deduplicated(self):
+        """Test events carry their sub-source and shared events are kept once"""
+        scraper = TrumbaScraper('arts', {'music': 'Music', 'theatre': 'Theatre'})
+
+        events = scraper.parse_download({'music': feed('1', '2'), 'theatre': feed('2', '3')})
+
+        self.assertEqual(
+            [(e['source_event_id'], e['sub_source']) for e in events],
+            [('1', 'music'), ('2', 'music'), ('3', 'theatre')]
+        )
+        self.assertTrue(all(e['is_free'] for e in events))
+
+    def test_window_skips_entries_early(self):
+        """Test entries dated outside the window are dropped before their description is parsed"""
+        scraper = TrumbaScraper('arts', ['Music'])
+        scraper.window = DateWindow(datetime(2025, 11, 1), datetime(2025, 12, 1))
+
+        with patch('src.scrapers.trumba.extract_description') as extract:
+            events = scraper.parse_download(feed('1', '2'))
+
+        self.assertEqual(events, [])
+        extract.assert_not_called()
+
+    def test_failed_calendar_skipped(self):
+        """Test one failing calendar does not sink the others, but all failing does"""
+        scraper = TrumbaScraper('arts', ['Music', 'Theatre'])
+
+        def download(sub_source):
+            if sub_source == 'theatre':
+                raise requests.ConnectionError('down')
+            return feed('1')
+
+        with patch.object(scraper, '_download_feed', side_effect=download):
+            self.assertEqual(list(scraper.download()), ['music'])
+
+        with patch.object(scraper, '_download_feed', side_effect=requests.ConnectionError('down')):
+            with self.assertRaises(requests.ConnectionError):
+                scraper.download()
+
+    def test_knco_is_a_trumba_calendar(self):
+        """Test KNCO is the single-calendar case of the engine"""
+        scraper = KNCOScraper()
+        self.assertEqual(scraper.source_name, 'knco')
+        self.assertEqual(scraper.feed_url('knco'), KNCOScraper.RSS_URL)
+
+        sample_path = Path(__file__).parent.parent / "data" / "samples" / "knco_sample.xml"
+        events = scraper.parse_download(sample_path.read_bytes())
+        self.assertGreater(len(events), 0)
+        self.assertEqual({e['sub_source'] for e in events}, {'knco'})
+
+    def test_extract_description(self):
+        """Test links and images are dropped and labelled fields split apart"""
+        data = extract_description(
+            '<img src="x.png"/><b>Event location</b>:&nbsp;Madelyn Helling Library'
+            '<br/><b>Age range</b>:&nbsp;Ages 0-5<br/><a href="/more">More info</a>'
+        )
+
+        self.assertEqual(data['venue'], 'Madelyn Helling Library')
+        self.assertEqual(data['age_range'], 'Ages 0-5')
+        self.assertNotIn('More info', data['description'])
+        self.assertFalse(data['is_free'])
+
+
+if __name__ == '__main__':
+    unittest.main()
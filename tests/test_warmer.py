@@ -0,0 +1,82 @@
+"""Unit tests for refresh-ahead cache warming"""
+import time
+import unittest
+from unittest.mock import Mock
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import Future
+from src.storage.warmer import CacheWarmer
+
+
+class TestCacheWarmer(unittest.TestCase):
+    """Test refresh-ahead scheduling"""
+
+    def setUp(self):
+        self.mock_cache = Mock()
+        self.mock_cache.ttl_for.side_effect = lambda source, default: default
+        self.now = time.time()
+        self.mock_cache.db.get_last_scraped.return_value = {
+            'knco': datetime.fromtimestamp(self.now, timezone.utc) - timedelta(hours=5),   # 83% of TTL
+            'library': datetime.fromtimestamp(self.now, timezone.utc) - timedelta(hours=1),
+            'county': None,  # never scraped
+        }
+        self.scraper_funcs = {'knco': Mock(), 'library': Mock(), 'county': Mock()}
+
+    def make_warmer(self, **kwargs):
+        options = dict(ttl_hours=6, refresh_ratio=0.8, jitter_ratio=0.0, max_concurrent=5)
+        options.update(kwargs)
+        warmer = CacheWarmer(self.mock_cache, self.scraper_funcs, **options)
+        warmer.load_expiry()
+        return warmer
+
+    def test_due_sources(self):
+        """Test sources past the refresh-ahead point are due, most overdue first"""
+        warmer = self.make_warmer()
+        self.assertEqual(warmer.due_sources(self.now), ['county', 'knco'])
+
+    def test_run_once_refreshes_due_sources(self):
+        """Test due sources are refreshed through the cache manager"""
+        pending = Future()
+        self.mock_cache.refresh_in_background.return_value = pending
+        warmer = self.make_warmer()
+
+        started = warmer.run_once(self.now)
+
+        self.assertEqual(started, ['county', 'knco'])
+        self.mock_cache.refresh_in_background.assert_any_call('knco', self.scraper_funcs['knco'], 6)
+
+        # In-flight sources are not scheduled again
+        self.assertEqual(warmer.run_once(self.now + 7 * 3600), ['library'])
+
+    def test_concurrency_limit(self):
+        """Test at most max_concurrent refreshes are in flight"""
+        self.mock_cache.refresh_in_background.side_effect = lambda *args: Future()
+        warmer = self.make_warmer(max_concurrent=1)
+
+        self.assertEqual(warmer.run_once(self.now), ['county'])
+        self.assertEqual(warmer.run_once(self.now), [])
+
+    def test_jitter_bounds(self):
+        """Test jitter keeps refresh times within +/- jitter_ratio of the TTL"""
+        warmer = self.make_warmer(jitter_ratio=0.1)
+        scraped = self.now - 5 * 3600
+        base = scraped + 0.8 * 6 * 3600
+
+        for _ in range(50):
+            refresh_at = warmer._next_refresh(scraped, 'knco')
+            self.assertLessEqual(abs(refresh_at - base), 0.1 * 6 * 3600)
+
+    def test_cache_write_reschedules(self):
+        """Test the invalidation hook re-reads the source's scrape time"""
+        warmer = self.make_warmer()
+        hook = self.mock_cache.add_invalidation_hook.call_args[0][0]
+
+        self.mock_cache.db.get_last_scraped.return_value = {
+            'county': datetime.fromtimestamp(self.now, timezone.utc)
+        }
+        hook('county')
+
+        self.assertNotIn('county', warmer.due_sources(self.now))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+"""Tests for date windows"""
+import unittest
+from datetime import date, datetime, timezone
+from unittest.mock import patch
+from zoneinfo import ZoneInfo
+from src.config import Config
+from src.processors.window import DateWindow
+
+
+class TestDateWindow(unittest.TestCase):
+    """Test DateWindow bounds"""
+
+    def test_upcoming_starts_today(self):
+        """Test upcoming covers whole days from midnight today"""
+        window = DateWindow.upcoming(7, now=datetime(2025, 10, 15, 18, 30))
+
+        self.assertEqual(window, DateWindow(datetime(2025, 10, 15), datetime(2025, 10, 22)))
+        self.assertTrue(window.contains(datetime(2025, 10, 15, 9, 0)))
+        self.assertTrue(window.contains(datetime(2025, 10, 21, 23, 59)))
+        self.assertFalse(window.contains(datetime(2025, 10, 22)))  # end is exclusive
+        self.assertFalse(window.contains(datetime(2025, 10, 14, 23, 59)))
+        self.assertEqual(DateWindow.upcoming(None, now=datetime(2025, 10, 15, 18, 30)), DateWindow(datetime(2025, 10, 15)))
+
+    def test_contains_mixed_types(self):
+        """Test dates and aware datetimes compare as wall-clock times"""
+        window = DateWindow(datetime(2025, 10, 15), datetime(2025, 10, 16))
+
+        self.assertTrue(window.contains(date(2025, 10, 15)))
+        self.assertTrue(window.contains(datetime(2025, 10, 15, 10, tzinfo=timezone.utc)))
+        self.assertFalse(window.contains(None))
+        self.assertTrue(DateWindow().contains(None))
+
+    def test_open_ended(self):
+        """Test a missing bound leaves that side open"""
+        window = DateWindow(start=datetime(2025, 10, 15))
+
+        self.assertTrue(window.contains(datetime(2030, 1, 1)))
+        self.assertFalse(window.contains(datetime(2025, 10, 1)))
+        self.assertTrue(window.overlaps(date(2025, 10, 1), date(2025, 11, 1)))
+        self.assertFalse(window.overlaps(date(2025, 9, 1), date(2025, 10, 1)))
+
+    def test_localized(self):
+        """Test naive bounds are pinned to the zone's wall clock and aware ones converted"""
+        la = ZoneInfo('America/Los_Angeles')
+        window = DateWindow(datetime(2025, 10, 15), datetime(2025, 10, 16, 7, tzinfo=timezone.utc)).localized(la)
+
+        self.assertEqual(window.start, datetime(2025, 10, 15, tzinfo=la))
+        self.assertEqual(window.end.utcoffset(), la.utcoffset(datetime(2025, 10, 16)))
+        self.assertEqual(window.end.replace(tzinfo=None), datetime(2025, 10, 16))
+        self.assertEqual(DateWindow(start=datetime(2025, 10, 15)).localized(la).end, None)
+
+    def test_contains_converts_aware_times(self):
+        """Test an aware UTC time is compared as its wall-clock time in Config.TIMEZONE"""
+        window = DateWindow(datetime(2026, 10, 19), datetime(2026, 10, 20))
+        utc_evening = datetime(2026, 10, 20, 2, tzinfo=timezone.utc)  # 19:00 on Oct 19 in California
+
+        with patch.object(Config, 'TIMEZONE', 'America/Los_Angeles'):
+            self.assertTrue(window.contains(utc_evening))
+            self.assertTrue(window.contains('2026-10-20T02:00:00+00:00'))
+            self.assertFalse(DateWindow(datetime(2026, 10, 20)).contains(utc_evening))
+
+    def test_upcoming_uses_configured_time_zone(self):
+        """Test "today" is the configured zone's date, not the machine's"""
+        now = datetime(2025, 10, 16, 3, tzinfo=timezone.utc)  # Still the 15th in California
+        with patch.object(Config, 'TIMEZONE', 'America/Los_Angeles'):
+            self.assertEqual(DateWindow.upcoming(1, now=now), DateWindow(datetime(2025, 10, 15), datetime(2025, 10, 16)))
+
+    def test_filter(self):
+        """Test filter keeps events dated in the window"""
+        events = [
+            {'title': 'In', 'event_date': datetime(2025, 10, 15, 10)},
+            {'title': 'Out', 'event_date': datetime(2025, 11, 15, 10)},
+            {'title': 'Undated', 'event_date': None},
+        ]
+        window = DateWindow(datetime(2025, 10, 1), datetime(2025, 11, 1))
+
+        self.assertEqual([e['title'] for e in window.filter(events)], ['In'])
+        self.assertEqual(len(DateWindow().filter(events)), 3)
+
+
+if __name__ == '__main__':
+    unittest.main()